@@ -0,0 +1,32 @@
+from unittest import mock
+
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import SimpleTestCase
+
+from ..utils import cache_counter_increment
+
+
+class CacheCounterIncrementTestCase(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.cache = LocMemCache(name='test_counter', params={})
+        self.cache.clear()
+
+    def test_counter_create(self):
+        cache_counter_increment(cache=self.cache, key='test')
+
+        self.assertEqual(self.cache.get(key='test'), 1)
+
+    def test_counter_increment(self):
+        cache_counter_increment(cache=self.cache, key='test')
+        cache_counter_increment(cache=self.cache, delta=2, key='test')
+
+        self.assertEqual(self.cache.get(key='test'), 3)
+
+    def test_counter_evicted(self):
+        with mock.patch.object(
+            target=self.cache, attribute='incr', side_effect=ValueError
+        ):
+            cache_counter_increment(cache=self.cache, delta=2, key='test')
+
+        self.assertEqual(self.cache.get(key='test'), 2)
@@ -223,6 +223,22 @@ def any_to_bool(value):
     return value
 
 
+def cache_counter_increment(cache, key, delta=1):
+    """
+    Increment a counter stored in a Django cache. The counter is created
+    if it does not exist.
+    """
+    # `add` is a no-op if the key exists. Initialize the counter
+    # without a timeout so that `incr` is atomic on backends that
+    # support it.
+    cache.add(key=key, timeout=None, value=0)
+    try:
+        cache.incr(delta=delta, key=key)
+    except ValueError:
+        # Key evicted between the `add` and the `incr` calls.
+        cache.set(key=key, timeout=None, value=delta)
+
+
 def comma_splitter(string):
     splitter = shlex.shlex(string, posix=True)
     splitter.whitespace = ','
@@ -1,13 +1,22 @@
+import hashlib
+import logging
+
+from django.apps import apps
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.http import StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.encoding import force_bytes
+from django.utils.http import quote_etag
 from django.views.decorators.cache import patch_cache_control
 
 from rest_framework.exceptions import APIException
 
 from mayan.apps.mime_types.classes import MIMETypeBackend
 
-from .classes import AppImageErrorImage, ConverterBase
+from .classes import (
+    AppImageErrorImage, ConverterBase, ImageCacheStatistics
+)
 from .exceptions import AppImageError
 from .settings import (
     setting_image_cache_time, setting_image_generation_timeout
@@ -15,16 +24,108 @@ from .settings import (
 from .tasks import task_content_object_image_generate
 from .utils import IndexedDictionary, factory_file_generator
 
+logger = logging.getLogger(name=__name__)
+
 
 class APIImageViewMixin:
     """
     get: Returns an image representation of the selected object.
     """
+    def _get_stream_mime_type(self):
+        mime_type_backend = MIMETypeBackend.get_backend_instance()
+        with self.cache_file.open() as file_object:
+            mime_type, mime_encoding = mime_type_backend.get_mime_type(
+                file_object=file_object, mime_type_only=True
+            )
+            return mime_type
+
+    def get_cache_file_existing(self):
+        """
+        Return the cache file of the requested image if it was already
+        generated. Return `None` when the image needs to be generated or
+        when the cache filename can't be computed locally.
+        """
+        CachePartitionFile = apps.get_model(
+            app_label='file_caching', model_name='CachePartitionFile'
+        )
+
+        cache_filename = self.get_cache_filename()
+
+        if cache_filename:
+            try:
+                cache_file = self.obj.cache_partition.get_file(
+                    filename=cache_filename
+                )
+            except CachePartitionFile.DoesNotExist:
+                return None
+            else:
+                # The size is updated after the file is written. A file
+                # with a size of zero is still being generated.
+                if cache_file.file_size:
+                    return cache_file
+
+    def get_cache_filename(self):
+        """
+        Compute the name of the cache file for the requested
+        transformations without generating the image.
+        """
+        if not hasattr(self, '_cache_filename'):
+            try:
+                self._cache_filename = self.obj.get_combined_cache_filename(
+                    maximum_layer_order=self.maximum_layer_order,
+                    transformation_instance_list=self.transformation_instance_list,
+                    user=self.user
+                )
+            except Exception as exception:
+                # Errors are reported by the image generation task.
+                logger.debug(
+                    'Unable to compute the cache filename for %s; %s',
+                    self.obj, exception
+                )
+                self._cache_filename = None
+
+        return self._cache_filename
+
     def get_content_type(self):
         return ContentType.objects.get_for_model(model=self.obj)
 
+    def get_etag(self):
+        """
+        Return a strong entity tag derived from the cache filename. The
+        cache filename encodes the transformations hash, making it unique
+        for each image representation.
+        """
+        cache_filename = self.get_cache_filename()
+
+        if cache_filename:
+            full_filename = self.obj.cache_partition.get_full_filename(
+                filename=cache_filename
+            )
+            return quote_etag(
+                etag_str=hashlib.sha256(
+                    string=force_bytes(s=full_filename)
+                ).hexdigest()
+            )
+
     def get_file_generator(self):
-        return factory_file_generator(image_object=self.cache_file)
+        CachePartitionFile = apps.get_model(
+            app_label='file_caching', model_name='CachePartitionFile'
+        )
+
+        def file_generator():
+            try:
+                yield from factory_file_generator(
+                    image_object=self.cache_file
+                )()
+            except CachePartitionFile.DoesNotExist:
+                # Existing cache file pruned after the lookup. Handle it as
+                # a cache miss.
+                self.set_cache_file_generated(request=self.request)
+                yield from factory_file_generator(
+                    image_object=self.cache_file
+                )()
+
+        return file_generator
 
     def get_serializer(self, *args, **kwargs):
         return None
@@ -33,15 +134,39 @@ class APIImageViewMixin:
         return None
 
     def get_stream_mime_type(self):
-        mime_type_backend = MIMETypeBackend.get_backend_instance()
-        with self.cache_file.open() as file_object:
-            mime_type, mime_encoding = mime_type_backend.get_mime_type(
-                file_object=file_object, mime_type_only=True
+        CachePartitionFile = apps.get_model(
+            app_label='file_caching', model_name='CachePartitionFile'
+        )
+
+        try:
+            return self._get_stream_mime_type()
+        except CachePartitionFile.DoesNotExist:
+            # Existing cache file pruned after the lookup. Handle it as a
+            # cache miss.
+            self.set_cache_file_generated(request=self.request)
+            return self._get_stream_mime_type()
+
+    def patch_response(self, response, etag=None):
+        if etag:
+            response.headers['ETag'] = etag
+
+        if '_hash' in self.request.GET:
+            patch_cache_control(
+                max_age=setting_image_cache_time.value,
+                response=response
             )
-            return mime_type
 
     def retrieve(self, request, **kwargs):
         self.set_object()
+        self.set_image_arguments(request=request)
+
+        etag = self.get_etag()
+
+        if etag:
+            response = get_conditional_response(request=request, etag=etag)
+            if response is not None:
+                self.patch_response(etag=etag, response=response)
+                return response
 
         try:
             self.set_cache_file(request=request)
@@ -74,32 +199,28 @@ class APIImageViewMixin:
                 content_type=content_type, streaming_content=file_generator()
             )
 
-            if '_hash' in request.GET:
-                patch_cache_control(
-                    max_age=setting_image_cache_time.value,
-                    response=response
-                )
+            self.patch_response(etag=etag, response=response)
             return response
 
     def set_cache_file(self, request):
-        query_dict = request.GET
+        cache_file = self.get_cache_file_existing()
 
-        transformation_dictionary_list = IndexedDictionary(
-            dictionary=query_dict
-        ).as_dictionary_list()
+        if cache_file:
+            ImageCacheStatistics.hit()
+            self.cache_file = cache_file
+            return
 
-        # An empty string is not a valid value for maximum_layer_order.
-        # Fallback to None in case of a empty string.
-        maximum_layer_order = request.GET.get('maximum_layer_order') or None
-        if maximum_layer_order:
-            maximum_layer_order = int(maximum_layer_order)
+        ImageCacheStatistics.miss()
 
+        self.set_cache_file_generated(request=request)
+
+    def set_cache_file_generated(self, request):
         task = task_content_object_image_generate.apply_async(
             kwargs={
                 'content_type_id': self.get_content_type().pk,
                 'object_id': self.obj.pk,
-                'maximum_layer_order': maximum_layer_order,
-                'transformation_dictionary_list': transformation_dictionary_list,
+                'maximum_layer_order': self.maximum_layer_order,
+                'transformation_dictionary_list': self.transformation_dictionary_list,
                 'user_id': request.user.pk
             }
         )
@@ -117,5 +238,31 @@ class APIImageViewMixin:
             filename=cache_filename
         )
 
+    def set_image_arguments(self, request):
+        query_dict = request.GET
+
+        self.transformation_dictionary_list = IndexedDictionary(
+            dictionary=query_dict
+        ).as_dictionary_list()
+
+        # Use the same round trip as the task to obtain identical
+        # transformation instances.
+        self.transformation_instance_list = IndexedDictionary.from_dictionary_list(
+            dictionary_list=self.transformation_dictionary_list
+        ).as_instance_list()
+
+        # An empty string is not a valid value for maximum_layer_order.
+        # Fallback to None in case of a empty string.
+        maximum_layer_order = query_dict.get('maximum_layer_order') or None
+        if maximum_layer_order:
+            maximum_layer_order = int(maximum_layer_order)
+
+        self.maximum_layer_order = maximum_layer_order
+
+        if request.user.is_authenticated:
+            self.user = request.user
+        else:
+            self.user = None
+
     def set_object(self):
         self.obj = self.get_object()
@@ -9,10 +9,12 @@ from mayan.apps.app_manager.apps import MayanAppConfig
 from mayan.apps.common.menus import (
     menu_multi_item, menu_object, menu_return, menu_secondary, menu_setup
 )
+from mayan.apps.dashboards.dashboards import dashboard_administrator
 from mayan.apps.events.classes import EventModelRegistry, ModelEventType
 from mayan.apps.navigation.source_columns import SourceColumn
 
 from .classes import AppImageErrorImage
+from .dashboard_widgets import DashboardWidgetImageCacheHitRatio
 from .events import event_asset_edited
 from .handlers import handler_create_asset_cache
 from .links import (
@@ -93,6 +95,10 @@ class ConverterApp(MayanAppConfig):
             source=LayerTransformation
         )
 
+        dashboard_administrator.add_widget(
+            widget=DashboardWidgetImageCacheHitRatio, order=99
+        )
+
         menu_multi_item.bind_links(
             links=(link_asset_delete_multiple,), sources=(Asset,)
         )
@@ -1,5 +1,7 @@
 import io
 import logging
+import os
+import re
 import shutil
 import struct
 
@@ -9,13 +11,14 @@ import sh
 
 from django.utils.translation import gettext_lazy as _
 
-from mayan.apps.storage.utils import NamedTemporaryFile
+from mayan.apps.storage.utils import NamedTemporaryFile, TemporaryDirectory
 
 from ..classes import ConverterBase
 from ..exceptions import PageCountError
 from ..literals import (
     DEFAULT_PDFTOPPM_DPI, DEFAULT_PDFTOPPM_FORMAT, DEFAULT_PDFTOPPM_PATH,
-    DEFAULT_PDFINFO_PATH, DEFAULT_PILLOW_MAXIMUM_IMAGE_PIXELS
+    DEFAULT_PDFINFO_PATH, DEFAULT_PILLOW_MAXIMUM_IMAGE_PIXELS,
+    PDFTOPPM_OUTPUT_FILENAME_PREFIX, PDFTOPPM_OUTPUT_FILENAME_REGEX
 )
 from ..settings import setting_graphics_backend_arguments
 
@@ -95,6 +98,59 @@ class Python(ConverterBase):
         else:
             return self.get_pillow_page_count()
 
+    def get_pages(self, page_number_list, output_format=None):
+        if self.mime_type != 'application/pdf' or not command_pdftoppm or not page_number_list:
+            yield from super().get_pages(
+                output_format=output_format,
+                page_number_list=page_number_list
+            )
+            return
+
+        # Render the whole page range with a single pdftoppm call instead
+        # of copying the file and spawning a process for each page.
+        with TemporaryDirectory() as temporary_directory:
+            with NamedTemporaryFile() as new_file_object:
+                self.file_object.seek(0)
+                shutil.copyfileobj(
+                    fsrc=self.file_object, fdst=new_file_object
+                )
+                self.file_object.seek(0)
+                new_file_object.flush()
+
+                command_pdftoppm(
+                    new_file_object.name, os.path.join(
+                        temporary_directory, PDFTOPPM_OUTPUT_FILENAME_PREFIX
+                    ), f=min(page_number_list) + 1,
+                    l=max(page_number_list) + 1
+                )
+
+            page_image_path_dictionary = {}
+            for filename in os.listdir(temporary_directory):
+                match = re.match(
+                    pattern=PDFTOPPM_OUTPUT_FILENAME_REGEX, string=filename
+                )
+                if match:
+                    page_image_path_dictionary[
+                        int(
+                            match.group(1)
+                        ) - 1
+                    ] = os.path.join(temporary_directory, filename)
+
+            for page_number in page_number_list:
+                try:
+                    page_image_path = page_image_path_dictionary[page_number]
+                except KeyError:
+                    logger.warning(
+                        'pdftoppm did not render page %d, rendering it '
+                        'individually.', page_number
+                    )
+                    self.seek_page(page_number=page_number)
+                else:
+                    self.image = Image.open(fp=page_image_path)
+                    self.image.load()
+
+                yield page_number, self.get_page(output_format=output_format)
+
     def get_pillow_page_count(self):
         page_count = 1
 
@@ -1,8 +1,12 @@
+from contextlib import contextmanager
 import copy
 from io import BytesIO
 import logging
 import os
 import shutil
+import socket
+import subprocess
+import time
 
 import PIL
 from PIL import Image, ImageFile
@@ -10,13 +14,18 @@ import sh
 
 from django.apps import apps
 from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.cache import caches
 from django.core.exceptions import ImproperlyConfigured
 from django.db import transaction
 from django.template import loader
+from django.utils.encoding import force_str
 from django.utils.functional import cached_property
 from django.utils.module_loading import import_string
 from django.utils.translation import gettext_lazy as _
 
+from mayan.apps.common.utils import cache_counter_increment
+from mayan.apps.lock_manager.backends.base import LockingBackend
+from mayan.apps.lock_manager.exceptions import LockError
 from mayan.apps.mime_types.classes import MIMETypeBackend
 from mayan.apps.navigation.links import Link
 from mayan.apps.storage.compressed_files import MsgArchive
@@ -31,12 +40,22 @@ from .exceptions import (
 )
 from .literals import (
     CONVERTER_OFFICE_FILE_MIMETYPES, DEFAULT_LIBREOFFICE_PATH,
-    DEFAULT_PAGE_NUMBER, DEFAULT_PILLOW_FORMAT, MAP_PILLOW_FORMAT_TO_MIME_TYPE
+    DEFAULT_LIBREOFFICE_POOL_PORT, DEFAULT_LIBREOFFICE_POOL_SIZE,
+    DEFAULT_LIBREOFFICE_POOL_UNOCONVERT_PATH,
+    DEFAULT_LIBREOFFICE_POOL_UNOSERVER_PATH, DEFAULT_PAGE_NUMBER,
+    DEFAULT_PILLOW_FORMAT, MAP_PILLOW_FORMAT_TO_MIME_TYPE
+)
+from .literals import (
+    IMAGE_CACHE_STATISTICS_KEY_HITS, IMAGE_CACHE_STATISTICS_KEY_MISSES,
+    IMAGE_ERROR_BROKEN_FILE, LIBREOFFICE_POOL_CONVERSION_TIMEOUT,
+    LIBREOFFICE_POOL_PROFILE_DIRECTORY_NAME,
+    LIBREOFFICE_POOL_SERVER_START_TIMEOUT, LIBREOFFICE_POOL_SLOT_LOCK_NAME,
+    LIBREOFFICE_POOL_SLOT_LOCK_TIMEOUT, LIBREOFFICE_POOL_SLOT_WAIT_INTERVAL,
+    LIBREOFFICE_POOL_SLOT_WAIT_TIMEOUT, LIBREOFFICE_POOL_UNO_PORT_OFFSET
 )
-from .literals import IMAGE_ERROR_BROKEN_FILE
 from .settings import (
     setting_graphics_backend, setting_graphics_backend_arguments,
-    setting_load_truncated_images
+    setting_image_cache_statistics_cache_name, setting_load_truncated_images
 )
 
 logger = logging.getLogger(name=__name__)
@@ -146,6 +165,17 @@ class ConverterBase:
         except InvalidOfficeFormat as exception:
             logger.debug('Is not an office format document; %s', exception)
 
+    def get_pages(self, page_number_list, output_format=None):
+        """
+        Generator that returns a tuple of the page number and the image
+        buffer of each of the page numbers requested. Page numbers start
+        at 0. Backends can override this method to render several pages
+        in a single pass.
+        """
+        for page_number in page_number_list:
+            self.seek_page(page_number=page_number)
+            yield page_number, self.get_page(output_format=output_format)
+
     def seek_page(self, page_number):
         """
         Seek the specified page number from the source file object.
@@ -192,9 +222,65 @@ class ConverterBase:
                         error_name=IMAGE_ERROR_BROKEN_FILE
                     )
 
+    def _soffice_execute(
+        self, libreoffice_home_directory, temporary_file_object,
+        timeout=None
+    ):
+        args = (
+            temporary_file_object.name, '--outdir', setting_temporary_directory.value,
+            '-env:UserInstallation=file://{}'.format(
+                os.path.join(
+                    libreoffice_home_directory, 'LibreOffice_Conversion'
+                )
+            ),
+        )
+
+        kwargs = {
+            '_env': {'HOME': libreoffice_home_directory}
+        }
+
+        if self.mime_type == 'text/plain':
+            kwargs.update(
+                {'infilter': 'Text (encoded):UTF8,LF,,,'}
+            )
+
+        if timeout:
+            # Run LibreOffice in its own process group to be able to stop
+            # it and its child processes when the timeout expires.
+            kwargs.update(
+                {'_bg': True, '_new_group': True}
+            )
+
+        try:
+            process = self.command_libreoffice(*args, **kwargs)
+
+            if timeout:
+                try:
+                    process.wait(timeout=timeout)
+                except sh.TimeoutException:
+                    process.kill_group()
+                    raise OfficeConversionError(
+                        'LibreOffice conversion did not finish in {} '
+                        'seconds.'.format(timeout)
+                    )
+        except sh.ErrorReturnCode as exception:
+            temporary_file_object.close()
+            raise OfficeConversionError(exception)
+        except OfficeConversionError:
+            temporary_file_object.close()
+            raise
+        except Exception as exception:
+            temporary_file_object.close()
+            logger.error(
+                'Exception launching LibreOffice; %s', exception,
+                exc_info=True
+            )
+            raise
+
     def soffice(self):
         """
-        Executes LibreOffice as a sub process.
+        Executes LibreOffice as a sub process or using a conversion server
+        from the LibreOffice pool.
         """
         if not self.command_libreoffice:
             raise OfficeConversionError(
@@ -212,39 +298,6 @@ class ConverterBase:
             self.file_object.seek(0)
             temporary_file_object.seek(0)
 
-            with TemporaryDirectory() as libreoffice_home_directory:
-                args = (
-                    temporary_file_object.name, '--outdir', setting_temporary_directory.value,
-                    '-env:UserInstallation=file://{}'.format(
-                        os.path.join(
-                            libreoffice_home_directory,
-                            'LibreOffice_Conversion'
-                        )
-                    ),
-                )
-
-                kwargs = {
-                    '_env': {'HOME': libreoffice_home_directory}
-                }
-
-                if self.mime_type == 'text/plain':
-                    kwargs.update(
-                        {'infilter': 'Text (encoded):UTF8,LF,,,'}
-                    )
-
-                try:
-                    self.command_libreoffice(*args, **kwargs)
-                except sh.ErrorReturnCode as exception:
-                    temporary_file_object.close()
-                    raise OfficeConversionError(exception)
-                except Exception as exception:
-                    temporary_file_object.close()
-                    logger.error(
-                        'Exception launching LibreOffice; %s', exception,
-                        exc_info=True
-                    )
-                    raise
-
             # LibreOffice return a PDF file with the same name as the input
             # provided but with the .pdf extension.
 
@@ -265,6 +318,31 @@ class ConverterBase:
             )
             logger.debug('converted_file_path: %s', converted_file_path)
 
+            with LibreOfficePool.reserve_slot() as slot:
+                if slot is None:
+                    with TemporaryDirectory() as libreoffice_home_directory:
+                        self._soffice_execute(
+                            libreoffice_home_directory=libreoffice_home_directory,
+                            temporary_file_object=temporary_file_object
+                        )
+                elif self.mime_type != 'text/plain' and LibreOfficePool.is_server_enabled():
+                    # The text input filter can't be passed to the
+                    # conversion server, text files use the sub process.
+                    LibreOfficePool.server_convert(
+                        slot=slot, source_path=temporary_file_object.name,
+                        target_path=converted_file_path
+                    )
+                else:
+                    libreoffice_home_directory = LibreOfficePool.get_profile_path(
+                        slot=slot
+                    )
+                    os.makedirs(name=libreoffice_home_directory, exist_ok=True)
+                    self._soffice_execute(
+                        libreoffice_home_directory=libreoffice_home_directory,
+                        temporary_file_object=temporary_file_object,
+                        timeout=LIBREOFFICE_POOL_CONVERSION_TIMEOUT
+                    )
+
         # Don't use context manager with the NamedTemporaryFile on purpose
         # so that it is deleted when the caller closes the file and not
         # before.
@@ -321,6 +399,231 @@ class ConverterBase:
             self.image = transformation.execute_on(image=self.image)
 
 
+class ImageCacheStatistics:
+    """
+    Counters of the API image requests served directly from an existing
+    cache file (hits) and of those that required dispatching the image
+    generation task (misses).
+    """
+    @staticmethod
+    def get_cache():
+        return caches[setting_image_cache_statistics_cache_name.value]
+
+    @classmethod
+    def get_hit_ratio(cls):
+        hits = cls.get_hits()
+        total = hits + cls.get_misses()
+
+        if total:
+            return hits / total
+        else:
+            return 0
+
+    @classmethod
+    def get_hits(cls):
+        return cls.get_value(key=IMAGE_CACHE_STATISTICS_KEY_HITS)
+
+    @classmethod
+    def get_misses(cls):
+        return cls.get_value(key=IMAGE_CACHE_STATISTICS_KEY_MISSES)
+
+    @classmethod
+    def get_value(cls, key):
+        return cls.get_cache().get(default=0, key=key)
+
+    @classmethod
+    def hit(cls):
+        cls.increment(key=IMAGE_CACHE_STATISTICS_KEY_HITS)
+
+    @classmethod
+    def increment(cls, key):
+        cache_counter_increment(cache=cls.get_cache(), key=key)
+
+    @classmethod
+    def miss(cls):
+        cls.increment(key=IMAGE_CACHE_STATISTICS_KEY_MISSES)
+
+    @classmethod
+    def reset(cls):
+        cls.get_cache().delete_many(
+            keys=(
+                IMAGE_CACHE_STATISTICS_KEY_HITS,
+                IMAGE_CACHE_STATISTICS_KEY_MISSES
+            )
+        )
+
+
+class LibreOfficePool:
+    """
+    Pool of reusable LibreOffice slots. Each slot has a persistent user
+    profile to avoid the profile initialization LibreOffice performs when
+    started with a new one. When unoserver is configured, each slot also
+    keeps a long lived headless LibreOffice instance that receives the
+    conversion requests instead of launching a new process each time.
+    Slots are reserved using locks so they are shared safely between
+    worker processes.
+    """
+    _server_processes = {}
+
+    @staticmethod
+    def get_argument(name, default):
+        return setting_graphics_backend_arguments.value.get(name, default)
+
+    @classmethod
+    def get_profile_path(cls, slot):
+        return os.path.join(
+            setting_temporary_directory.value,
+            LIBREOFFICE_POOL_PROFILE_DIRECTORY_NAME.format(slot)
+        )
+
+    @classmethod
+    def get_server_port(cls, slot):
+        """
+        Return the port of the conversion server of the slot, starting the
+        server if it is not running.
+        """
+        port = cls.get_argument(
+            default=DEFAULT_LIBREOFFICE_POOL_PORT,
+            name='libreoffice_pool_port'
+        ) + slot
+
+        if cls.is_port_open(port=port):
+            # Server running, might have been started by another worker
+            # process.
+            return port
+
+        process = cls._server_processes.get(slot)
+        if process is None or process.poll() is not None:
+            logger.debug('Starting LibreOffice server for slot: %d', slot)
+
+            cls._server_processes[slot] = subprocess.Popen(
+                args=(
+                    cls.get_argument(
+                        default=DEFAULT_LIBREOFFICE_POOL_UNOSERVER_PATH,
+                        name='libreoffice_pool_unoserver_path'
+                    ), '--interface', '127.0.0.1', '--port', str(port),
+                    '--uno-port', str(port + LIBREOFFICE_POOL_UNO_PORT_OFFSET),
+                    '--executable', libreoffice_path
+                ), close_fds=True, env={
+                    **os.environ, 'HOME': cls.get_profile_path(slot=slot)
+                }, stderr=subprocess.DEVNULL, stdout=subprocess.DEVNULL
+            )
+
+        time_start = time.monotonic()
+        while not cls.is_port_open(port=port):
+            if time.monotonic() - time_start > LIBREOFFICE_POOL_SERVER_START_TIMEOUT:
+                raise OfficeConversionError(
+                    'LibreOffice server for slot {} did not start.'.format(
+                        slot
+                    )
+                )
+            time.sleep(LIBREOFFICE_POOL_SLOT_WAIT_INTERVAL)
+
+        return port
+
+    @classmethod
+    def get_size(cls):
+        return cls.get_argument(
+            default=DEFAULT_LIBREOFFICE_POOL_SIZE,
+            name='libreoffice_pool_size'
+        )
+
+    @classmethod
+    def is_port_open(cls, port):
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as connection:
+            return connection.connect_ex(('127.0.0.1', port)) == 0
+
+    @classmethod
+    def is_server_enabled(cls):
+        unoconvert_path = cls.get_argument(
+            default=DEFAULT_LIBREOFFICE_POOL_UNOCONVERT_PATH,
+            name='libreoffice_pool_unoconvert_path'
+        )
+        unoserver_path = cls.get_argument(
+            default=DEFAULT_LIBREOFFICE_POOL_UNOSERVER_PATH,
+            name='libreoffice_pool_unoserver_path'
+        )
+
+        return cls.get_size() > 0 and all(
+            path and os.path.exists(path) for path in (
+                unoconvert_path, unoserver_path
+            )
+        )
+
+    @classmethod
+    @contextmanager
+    def reserve_slot(cls):
+        """
+        Context manager that reserves a free slot and returns its number.
+        Returns None if the pool is disabled.
+        """
+        pool_size = cls.get_size()
+
+        if pool_size < 1:
+            yield None
+            return
+
+        locking_backend = LockingBackend.get_backend()
+        time_start = time.monotonic()
+
+        while True:
+            for slot in range(pool_size):
+                try:
+                    lock = locking_backend.acquire_lock(
+                        name=LIBREOFFICE_POOL_SLOT_LOCK_NAME.format(slot),
+                        timeout=LIBREOFFICE_POOL_SLOT_LOCK_TIMEOUT
+                    )
+                except LockError:
+                    continue
+                else:
+                    try:
+                        yield slot
+                    finally:
+                        lock.release()
+                    return
+
+            if time.monotonic() - time_start > LIBREOFFICE_POOL_SLOT_WAIT_TIMEOUT:
+                raise OfficeConversionError(
+                    _(message='Timeout waiting for a free LibreOffice slot.')
+                )
+
+            time.sleep(LIBREOFFICE_POOL_SLOT_WAIT_INTERVAL)
+
+    @classmethod
+    def server_convert(cls, slot, source_path, target_path):
+        port = cls.get_server_port(slot=slot)
+
+        command = (
+            cls.get_argument(
+                default=DEFAULT_LIBREOFFICE_POOL_UNOCONVERT_PATH,
+                name='libreoffice_pool_unoconvert_path'
+            ), '--host', '127.0.0.1', '--port', str(port), '--convert-to',
+            'pdf', source_path, target_path
+        )
+
+        try:
+            process = subprocess.run(
+                args=command, capture_output=True, close_fds=True,
+                timeout=LIBREOFFICE_POOL_CONVERSION_TIMEOUT
+            )
+        except subprocess.TimeoutExpired:
+            # Stop the server of the slot if this process started it. The
+            # next conversion of the slot starts a new one.
+            server_process = cls._server_processes.pop(slot, None)
+            if server_process is not None:
+                server_process.kill()
+
+            raise OfficeConversionError(
+                'LibreOffice server conversion did not finish in {} '
+                'seconds.'.format(LIBREOFFICE_POOL_CONVERSION_TIMEOUT)
+            )
+
+        if process.returncode != 0:
+            raise OfficeConversionError(
+                force_str(s=process.stderr)
+            )
+
+
 class Layer:
     _registry = {}
 
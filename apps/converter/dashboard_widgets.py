@@ -0,0 +1,23 @@
+from django.urls import reverse_lazy
+from django.utils.text import format_lazy
+from django.utils.translation import gettext_lazy as _
+
+from mayan.apps.dashboards.classes import DashboardWidgetNumeric
+from mayan.apps.file_caching.icons import icon_file_caching
+
+from .classes import ImageCacheStatistics
+
+
+class DashboardWidgetImageCacheHitRatio(DashboardWidgetNumeric):
+    icon = icon_file_caching
+    label = _(message='Image cache hits')
+    link = reverse_lazy(viewname='file_caching:cache_list')
+
+    def get_count(self):
+        hits = ImageCacheStatistics.get_hits()
+        misses = ImageCacheStatistics.get_misses()
+
+        return format_lazy(
+            '{} / {} ({:0.1f}%)', hits, hits + misses,
+            ImageCacheStatistics.get_hit_ratio() * 100
+        )
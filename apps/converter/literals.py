@@ -69,12 +69,18 @@ DEFAULT_CONVERTER_ASSET_STORAGE_BACKEND_ARGUMENTS = {
 }
 DEFAULT_CONVERTER_GRAPHICS_BACKEND = 'mayan.apps.converter.backends.python.Python'
 
+DEFAULT_CONVERTER_IMAGE_CACHE_STATISTICS_CACHE_NAME = 'default'
 DEFAULT_CONVERTER_IMAGE_CACHE_TIME = '31556926'
 DEFAULT_CONVERTER_IMAGE_GENERATION_MAX_RETRIES = 7
 DEFAULT_CONVERTER_IMAGE_GENERATION_TIMEOUT = 120  # seconds
 
 DEFAULT_CONVERTER_LOAD_TRUNCATED_IMAGES = False
 
+DEFAULT_LIBREOFFICE_POOL_PORT = 2103
+DEFAULT_LIBREOFFICE_POOL_SIZE = 0
+DEFAULT_LIBREOFFICE_POOL_UNOCONVERT_PATH = ''
+DEFAULT_LIBREOFFICE_POOL_UNOSERVER_PATH = ''
+
 DEFAULT_PAGE_NUMBER = 1
 DEFAULT_PDFTOPPM_DPI = 300
 DEFAULT_PDFTOPPM_FORMAT = 'jpeg'  # Possible values jpeg, png, tiff
@@ -85,6 +91,10 @@ DEFAULT_ZOOM_LEVEL = 100
 
 DEFAULT_CONVERTER_GRAPHICS_BACKEND_ARGUMENTS = {
     'libreoffice_path': DEFAULT_LIBREOFFICE_PATH,
+    'libreoffice_pool_port': DEFAULT_LIBREOFFICE_POOL_PORT,
+    'libreoffice_pool_size': DEFAULT_LIBREOFFICE_POOL_SIZE,
+    'libreoffice_pool_unoconvert_path': DEFAULT_LIBREOFFICE_POOL_UNOCONVERT_PATH,
+    'libreoffice_pool_unoserver_path': DEFAULT_LIBREOFFICE_POOL_UNOSERVER_PATH,
     'pdftoppm_dpi': DEFAULT_PDFTOPPM_DPI,
     'pdftoppm_format': DEFAULT_PDFTOPPM_FORMAT,
     'pdftoppm_path': DEFAULT_PDFTOPPM_PATH,
@@ -93,12 +103,32 @@ DEFAULT_CONVERTER_GRAPHICS_BACKEND_ARGUMENTS = {
     'pillow_maximum_image_pixels': DEFAULT_PILLOW_MAXIMUM_IMAGE_PIXELS
 }
 
+IMAGE_CACHE_STATISTICS_KEY_HITS = 'converter_image_cache_statistics_hits'
+IMAGE_CACHE_STATISTICS_KEY_MISSES = 'converter_image_cache_statistics_misses'
+
 IMAGE_ERROR_BROKEN_FILE = 'converter_image_error_broken_file'
 
+# Conversions using a slot are stopped before the slot lock expires. The
+# sum of the conversion and server start timeouts must be lower than the
+# slot lock timeout.
+LIBREOFFICE_POOL_CONVERSION_TIMEOUT = 540  # seconds
+LIBREOFFICE_POOL_PROFILE_DIRECTORY_NAME = 'libreoffice_pool_profile_{}'
+LIBREOFFICE_POOL_SERVER_START_TIMEOUT = 30  # seconds
+LIBREOFFICE_POOL_SLOT_LOCK_NAME = 'converter_libreoffice_pool_slot_{}'
+LIBREOFFICE_POOL_SLOT_LOCK_TIMEOUT = 600  # seconds
+LIBREOFFICE_POOL_SLOT_WAIT_INTERVAL = 0.5  # seconds
+LIBREOFFICE_POOL_SLOT_WAIT_TIMEOUT = 300  # seconds
+LIBREOFFICE_POOL_UNO_PORT_OFFSET = 100
+
 MAP_PILLOW_FORMAT_TO_MIME_TYPE = {
     'JPEG': 'image/jpeg'
 }
 
+PDFTOPPM_OUTPUT_FILENAME_PREFIX = 'page'
+PDFTOPPM_OUTPUT_FILENAME_REGEX = r'^{}-(\d+)\.\w+$'.format(
+    PDFTOPPM_OUTPUT_FILENAME_PREFIX
+)
+
 STORAGE_NAME_ASSETS = 'converter__assets'
 STORAGE_NAME_ASSETS_CACHE = 'converter__assets_cache'
 
@@ -43,9 +43,7 @@ class AssetBusinessLogicMixin:
         # The parameters 'maximum_layer_order',
         # `transformation_instance_list`, `user` are not used, but added
         # to retain interface compatibility.
-        cache_filename = '{}'.format(
-            self.get_hash()
-        )
+        cache_filename = self.get_combined_cache_filename()
 
         try:
             self.cache_partition.get_file(filename=cache_filename)
@@ -76,6 +74,16 @@ class AssetBusinessLogicMixin:
 
         return final_url.tostr()
 
+    def get_combined_cache_filename(
+        self, maximum_layer_order=None, transformation_instance_list=None,
+        user=None
+    ):
+        # The arguments are not used, but added to retain interface
+        # compatibility.
+        return '{}'.format(
+            self.get_hash()
+        )
+
     def get_hash(self):
         with self.open() as file_object:
             hash_object = hashlib.sha256(
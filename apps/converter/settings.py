@@ -10,6 +10,7 @@ from .literals import (
     DEFAULT_CONVERTER_ASSET_STORAGE_BACKEND_ARGUMENTS,
     DEFAULT_CONVERTER_GRAPHICS_BACKEND,
     DEFAULT_CONVERTER_GRAPHICS_BACKEND_ARGUMENTS,
+    DEFAULT_CONVERTER_IMAGE_CACHE_STATISTICS_CACHE_NAME,
     DEFAULT_CONVERTER_IMAGE_CACHE_TIME,
     DEFAULT_CONVERTER_IMAGE_GENERATION_MAX_RETRIES,
     DEFAULT_CONVERTER_IMAGE_GENERATION_TIMEOUT,
@@ -73,6 +74,15 @@ setting_graphics_backend_arguments = setting_namespace.do_setting_add(
         message='Configuration options for the graphics conversion backend.'
     )
 )
+setting_image_cache_statistics_cache_name = setting_namespace.do_setting_add(
+    default=DEFAULT_CONVERTER_IMAGE_CACHE_STATISTICS_CACHE_NAME,
+    global_name='CONVERTER_IMAGE_CACHE_STATISTICS_CACHE_NAME',
+    help_text=_(
+        message='Name of the Django cache used to keep the image cache hit '
+        'and miss counters. Use a cache shared by all processes, like '
+        'Redis, to get installation wide values.'
+    )
+)
 setting_image_cache_time = setting_namespace.do_setting_add(
     default=DEFAULT_CONVERTER_IMAGE_CACHE_TIME,
     global_name='CONVERTER_IMAGE_CACHE_TIME',
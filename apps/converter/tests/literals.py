@@ -0,0 +1,4 @@
+TEST_ENVIRONMENT = {'LANG': 'test.UTF-8', 'PATH': '/test/bin'}
+TEST_PDF_PAGE_COUNT = 4
+TEST_PDF_PAGE_NUMBER_LIST = [1, 3]
+TEST_PDF_PAGE_WIDTH_MULTIPLIER = 10
@@ -0,0 +1,114 @@
+from io import BytesIO
+from unittest import mock
+
+from PIL import Image
+
+from django.test import SimpleTestCase
+
+from ..backends.python import Python
+
+from .literals import (
+    TEST_PDF_PAGE_COUNT, TEST_PDF_PAGE_NUMBER_LIST,
+    TEST_PDF_PAGE_WIDTH_MULTIPLIER
+)
+
+
+class PythonBackendPagesTestCase(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.test_page_number_missing = None
+
+        patcher = mock.patch(
+            new=mock.Mock(side_effect=self._test_pdftoppm),
+            target='mayan.apps.converter.backends.python.command_pdftoppm'
+        )
+        self.mock_pdftoppm = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        file_object = BytesIO()
+        pages = [
+            Image.new(mode='RGB', size=(10, 10))
+            for page_number in range(TEST_PDF_PAGE_COUNT)
+        ]
+        pages[0].save(
+            file_object, append_images=pages[1:], format='PDF',
+            save_all=True
+        )
+        file_object.seek(0)
+
+        self.test_converter = Python(
+            file_object=file_object, mime_type='application/pdf'
+        )
+
+    def _get_test_page_width(self, page_number):
+        return (page_number + 1) * TEST_PDF_PAGE_WIDTH_MULTIPLIER
+
+    def _test_pdftoppm(self, source_path, output_prefix, f, l):
+        """
+        Write one image per page like pdftoppm does. The width of each
+        image identifies the page.
+        """
+        for page_number in range(f - 1, l):
+            if page_number != self.test_page_number_missing:
+                Image.new(
+                    mode='RGB', size=(
+                        self._get_test_page_width(page_number=page_number),
+                        10
+                    )
+                ).save(
+                    '{}-{:02d}.jpg'.format(output_prefix, page_number + 1)
+                )
+
+    def _get_test_page_widths(self):
+        return [
+            (page_number, Image.open(fp=page_image).size[0])
+            for page_number, page_image in self.test_converter.get_pages(
+                page_number_list=TEST_PDF_PAGE_NUMBER_LIST
+            )
+        ]
+
+    def test_get_pages(self):
+        self.assertEqual(
+            self._get_test_page_widths(), [
+                (
+                    page_number,
+                    self._get_test_page_width(page_number=page_number)
+                ) for page_number in TEST_PDF_PAGE_NUMBER_LIST
+            ]
+        )
+        self.assertEqual(self.mock_pdftoppm.call_count, 1)
+        self.assertEqual(
+            self.mock_pdftoppm.call_args.kwargs, {
+                'f': min(TEST_PDF_PAGE_NUMBER_LIST) + 1,
+                'l': max(TEST_PDF_PAGE_NUMBER_LIST) + 1
+            }
+        )
+
+    def test_get_pages_missing_page(self):
+        self.test_page_number_missing = TEST_PDF_PAGE_NUMBER_LIST[0]
+
+        def seek_page(page_number):
+            self.test_converter.image = Image.new(mode='RGB', size=(1, 1))
+
+        with mock.patch.object(
+            attribute='seek_page', new=mock.Mock(side_effect=seek_page),
+            target=self.test_converter
+        ) as mock_seek_page:
+            with self.assertLogs(
+                level='WARNING', logger='mayan.apps.converter.backends.python'
+            ):
+                page_widths = self._get_test_page_widths()
+
+        mock_seek_page.assert_called_once_with(
+            page_number=self.test_page_number_missing
+        )
+        self.assertEqual(
+            page_widths, [
+                (TEST_PDF_PAGE_NUMBER_LIST[0], 1), (
+                    TEST_PDF_PAGE_NUMBER_LIST[1],
+                    self._get_test_page_width(
+                        page_number=TEST_PDF_PAGE_NUMBER_LIST[1]
+                    )
+                )
+            ]
+        )
@@ -0,0 +1,57 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from mayan.apps.lock_manager.backends.base import LockingBackend
+
+from ..classes import LibreOfficePool
+from ..literals import LIBREOFFICE_POOL_SLOT_LOCK_NAME
+
+from .literals import TEST_ENVIRONMENT
+
+
+class LibreOfficePoolTestCase(SimpleTestCase):
+    def test_pool_disabled_by_default(self):
+        self.assertEqual(LibreOfficePool.get_size(), 0)
+
+        with LibreOfficePool.reserve_slot() as slot:
+            self.assertEqual(slot, None)
+
+    def test_reserve_slot(self):
+        with mock.patch.object(
+            attribute='get_size', new=mock.Mock(return_value=2),
+            target=LibreOfficePool
+        ):
+            with LibreOfficePool.reserve_slot() as slot_first:
+                with LibreOfficePool.reserve_slot() as slot_second:
+                    self.assertNotEqual(slot_first, slot_second)
+
+            # Slots are released on exit.
+            lock = LockingBackend.get_backend().acquire_lock(
+                name=LIBREOFFICE_POOL_SLOT_LOCK_NAME.format(slot_first)
+            )
+            lock.release()
+
+    def test_server_environment(self):
+        with mock.patch.dict(
+            in_dict=LibreOfficePool._server_processes, clear=True
+        ):
+            with mock.patch.dict(
+                in_dict='os.environ', values=TEST_ENVIRONMENT
+            ):
+                with mock.patch.object(
+                    attribute='is_port_open', side_effect=(False, True),
+                    target=LibreOfficePool
+                ):
+                    with mock.patch(
+                        target='mayan.apps.converter.classes.subprocess.Popen'
+                    ) as mock_popen:
+                        LibreOfficePool.get_server_port(slot=0)
+
+        environment = mock_popen.call_args.kwargs['env']
+
+        self.assertEqual(
+            environment['HOME'], LibreOfficePool.get_profile_path(slot=0)
+        )
+        for key, value in TEST_ENVIRONMENT.items():
+            self.assertEqual(environment[key], value)
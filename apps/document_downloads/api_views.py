@@ -1,3 +1,5 @@
+from django.utils.http import quote_etag
+
 from mayan.apps.documents.api_views.api_view_mixins import (
     ParentObjectDocumentAPIViewMixin
 )
@@ -25,6 +27,15 @@ class APIDocumentFileDownloadView(
     lookup_url_kwarg = 'document_file_id'
     mayan_object_permission_map = {'GET': permission_document_file_download}
 
+    def get_download_etag(self):
+        checksum = self.get_object().checksum
+
+        if checksum:
+            return quote_etag(etag_str=checksum)
+
+    def get_download_file_size(self):
+        return self.get_object().size
+
     def get_download_filename(self):
         return self.get_object().filename
 
@@ -0,0 +1,3 @@
+TEST_DOWNLOAD_RANGE_INVALID = 'bytes=0-1,3-4'
+TEST_DOWNLOAD_RANGE_SIZE = 10
+TEST_ETAG_OTHER = '"test etag"'
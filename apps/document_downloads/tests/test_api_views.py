@@ -0,0 +1,139 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from django.utils.http import quote_etag
+
+from mayan.apps.documents.tests.mixins import DocumentTestMixin
+
+from .literals import (
+    TEST_DOWNLOAD_RANGE_INVALID, TEST_DOWNLOAD_RANGE_SIZE, TEST_ETAG_OTHER
+)
+
+
+class APIDocumentFileDownloadViewTestCase(DocumentTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.test_user = get_user_model().objects.create_superuser(
+            email='test@example.com', password='test', username='test'
+        )
+        self.client.force_login(user=self.test_user)
+
+        with self.test_document_file.open() as file_object:
+            self.test_document_file_content = file_object.read()
+
+        self.test_etag = quote_etag(
+            etag_str=self.test_document_file.checksum
+        )
+
+    def _request_test_document_file_download_api_view(self, **headers):
+        return self.client.get(
+            headers=headers, path=reverse(
+                kwargs={
+                    'document_id': self.test_document.pk,
+                    'document_file_id': self.test_document_file.pk
+                }, viewname='rest_api:documentfile-download'
+            )
+        )
+
+    def test_download(self):
+        response = self._request_test_document_file_download_api_view()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['Accept-Ranges'], 'bytes')
+        self.assertEqual(response.headers['ETag'], self.test_etag)
+        self.assertEqual(
+            response.getvalue(), self.test_document_file_content
+        )
+
+    def test_download_if_none_match(self):
+        response = self._request_test_document_file_download_api_view(
+            if_none_match=self.test_etag
+        )
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers['ETag'], self.test_etag)
+
+    def test_download_if_none_match_other(self):
+        response = self._request_test_document_file_download_api_view(
+            if_none_match=TEST_ETAG_OTHER
+        )
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_download_range(self):
+        response = self._request_test_document_file_download_api_view(
+            range='bytes=1-{}'.format(TEST_DOWNLOAD_RANGE_SIZE)
+        )
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(
+            response.headers['Content-Range'], 'bytes 1-{}/{}'.format(
+                TEST_DOWNLOAD_RANGE_SIZE, self.test_document_file.size
+            )
+        )
+        self.assertEqual(
+            response.getvalue(),
+            self.test_document_file_content[1:TEST_DOWNLOAD_RANGE_SIZE + 1]
+        )
+
+    def test_download_range_if_range_other(self):
+        response = self._request_test_document_file_download_api_view(
+            if_range=TEST_ETAG_OTHER,
+            range='bytes=0-{}'.format(TEST_DOWNLOAD_RANGE_SIZE)
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.getvalue(), self.test_document_file_content
+        )
+
+    def test_download_range_invalid(self):
+        response = self._request_test_document_file_download_api_view(
+            range=TEST_DOWNLOAD_RANGE_INVALID
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.getvalue(), self.test_document_file_content
+        )
+
+    def test_download_range_open_ended(self):
+        response = self._request_test_document_file_download_api_view(
+            range='bytes={}-'.format(TEST_DOWNLOAD_RANGE_SIZE)
+        )
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(
+            response.getvalue(),
+            self.test_document_file_content[TEST_DOWNLOAD_RANGE_SIZE:]
+        )
+
+    def test_download_range_suffix(self):
+        response = self._request_test_document_file_download_api_view(
+            range='bytes=-{}'.format(TEST_DOWNLOAD_RANGE_SIZE)
+        )
+
+        size = self.test_document_file.size
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(
+            response.headers['Content-Range'], 'bytes {}-{}/{}'.format(
+                size - TEST_DOWNLOAD_RANGE_SIZE, size - 1, size
+            )
+        )
+        self.assertEqual(
+            response.getvalue(),
+            self.test_document_file_content[-TEST_DOWNLOAD_RANGE_SIZE:]
+        )
+
+    def test_download_range_unsatisfiable(self):
+        size = self.test_document_file.size
+
+        response = self._request_test_document_file_download_api_view(
+            range='bytes={}-'.format(size)
+        )
+
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(
+            response.headers['Content-Range'], 'bytes */{}'.format(size)
+        )
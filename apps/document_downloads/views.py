@@ -1,3 +1,4 @@
+from django.utils.http import quote_etag
 from django.utils.translation import gettext_lazy as _
 
 from mayan.apps.documents.models.document_file_models import DocumentFile
@@ -134,5 +135,12 @@ class DocumentFileDownloadView(ViewSingleObjectBackendDownload):
     source_queryset = DocumentFile.valid.all()
     view_icon = icon_document_file_download_quick
 
+    def get_download_etag(self):
+        if self.object.checksum:
+            return quote_etag(etag_str=self.object.checksum)
+
     def get_download_event_action_object(self):
         return self.object.document
+
+    def get_download_file_size(self):
+        return self.object.size
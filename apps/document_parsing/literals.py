@@ -8,3 +8,5 @@ else:
 DEFAULT_DOCUMENT_PARSING_AUTO_PARSING = True
 
 ERROR_LOG_DOMAIN_NAME = 'document_parsing'
+
+PDFTOTEXT_PAGE_SEPARATOR = b'\x0c'
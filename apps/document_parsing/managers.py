@@ -17,6 +17,84 @@ logger = logging.getLogger(name=__name__)
 
 
 class DocumentFilePageContentManager(models.Manager):
+    def bulk_upsert(self, content_dictionary):
+        """
+        Create or update the content of several document file pages using
+        a fixed number of queries. `content_dictionary` maps document file
+        page instances to their parsed content.
+        """
+        ContentType = apps.get_model(
+            app_label='contenttypes', model_name='ContentType'
+        )
+        DocumentFile = apps.get_model(
+            app_label='documents', model_name='DocumentFile'
+        )
+        ErrorLogPartitionEntry = apps.get_model(
+            app_label='logging', model_name='ErrorLogPartitionEntry'
+        )
+        SearchIndexQueueEntry = apps.get_model(
+            app_label='dynamic_search', model_name='SearchIndexQueueEntry'
+        )
+
+        queryset_existing = self.filter(
+            document_file_page__in=content_dictionary.keys()
+        )
+        existing_dictionary = {
+            instance.document_file_page_id: instance
+            for instance in queryset_existing
+        }
+
+        instance_create_list = []
+        instance_update_list = []
+
+        for document_file_page, content in content_dictionary.items():
+            instance = existing_dictionary.get(document_file_page.pk)
+            if instance is None:
+                instance_create_list.append(
+                    self.model(
+                        content=content, document_file_page=document_file_page
+                    )
+                )
+            else:
+                instance.content = content
+                instance_update_list.append(instance)
+
+        with transaction.atomic():
+            if instance_update_list:
+                self.bulk_update(
+                    fields=('content',), objs=instance_update_list
+                )
+            if instance_create_list:
+                self.bulk_create(objs=instance_create_list)
+
+            # Same as the page by page path, a successful parse clears
+            # the previous parsing errors of the document files.
+            content_type = ContentType.objects.get_for_model(
+                model=DocumentFile
+            )
+
+            queryset_error_logs = ErrorLogPartitionEntry.objects.filter(
+                domain_name=ERROR_LOG_DOMAIN_NAME,
+                error_log_partition__content_type=content_type,
+                error_log_partition__object_id__in={
+                    document_file_page.document_file_id for document_file_page in content_dictionary
+                }
+            )
+            queryset_error_logs.delete()
+
+        # Bulk queries do not emit the model signals used by the search
+        # backend to update the index, request it explicitly.
+        document_file_pages = tuple(content_dictionary.keys())
+        document_files = {
+            document_file_page.document_file for document_file_page in document_file_pages
+        }
+        documents = {
+            document_file.document for document_file in document_files
+        }
+
+        for instance in document_file_pages + tuple(document_files) + tuple(documents):
+            SearchIndexQueueEntry.objects.index_request(instance=instance)
+
     def delete_content_for(self, document_file, user=None):
         with transaction.atomic():
             for document_file_page in document_file.pages.all():
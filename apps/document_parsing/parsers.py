@@ -7,11 +7,11 @@ from django.apps import apps
 from django.utils.encoding import force_str
 from django.utils.translation import gettext_lazy as _
 
-from mayan.apps.converter.classes import ConverterBase
 from mayan.apps.converter.literals import CONVERTER_OFFICE_FILE_MIMETYPES
 from mayan.apps.storage.utils import NamedTemporaryFile
 
 from .exceptions import ParserError
+from .literals import PDFTOTEXT_PAGE_SEPARATOR
 from .settings import setting_pdftotext_path
 
 logger = logging.getLogger(name=__name__)
@@ -67,17 +67,72 @@ class Parser:
                     mimetype, []
                 ).append(parser_class)
 
+    def open_document_file(self, document_file):
+        return document_file.open()
+
     def process_document_file(self, document_file):
+        DocumentFilePageContent = apps.get_model(
+            app_label='document_parsing',
+            model_name='DocumentFilePageContent'
+        )
+
         logger.info(
             'Starting parsing for document file: %s', document_file
         )
         logger.debug('document file: %d', document_file.pk)
 
-        for document_file_page in document_file.pages.all():
-            self.process_document_file_page(
-                document_file_page=document_file_page
+        with self.open_document_file(document_file=document_file) as file_object:
+            try:
+                page_content_list = self.execute_document(
+                    file_object=file_object
+                )
+            except NotImplementedError:
+                page_content_list = None
+            except Exception as exception:
+                error_message = _(
+                    message='Exception parsing document file; %s'
+                ) % exception
+                logger.error(error_message, exc_info=True)
+                raise ParserError(error_message)
+            finally:
+                file_object.close()
+
+        if page_content_list is None:
+            # Parser does not support whole document parsing, fall back
+            # to the page by page method.
+            for document_file_page in document_file.pages.all():
+                self.process_document_file_page(
+                    document_file_page=document_file_page
+                )
+        else:
+            document_file_pages = tuple(
+                document_file.pages.all()
             )
 
+            if len(page_content_list) != len(document_file_pages):
+                logger.warning(
+                    'Parser returned %d pages for document file: %d with '
+                    '%d pages.', len(page_content_list), document_file.pk,
+                    len(document_file_pages)
+                )
+
+            content_dictionary = {}
+            for index, document_file_page in enumerate(document_file_pages):
+                try:
+                    content = page_content_list[index]
+                except IndexError:
+                    content = ''
+
+                content_dictionary[document_file_page] = content
+
+            DocumentFilePageContent.objects.bulk_upsert(
+                content_dictionary=content_dictionary
+            )
+
+        logger.info(
+            'Finished parsing document file: %s', document_file
+        )
+
     def process_document_file_page(self, document_file_page):
         DocumentFilePageContent = apps.get_model(
             app_label='document_parsing',
@@ -89,7 +144,7 @@ class Parser:
             document_file_page.page_number, document_file_page.document_file
         )
 
-        with document_file_page.document_file.open() as file_object:
+        with self.open_document_file(document_file=document_file_page.document_file) as file_object:
             try:
                 parsed_content = self.execute(
                     file_object=file_object,
@@ -120,6 +175,16 @@ class Parser:
             self.__class__.__name__
         )
 
+    def execute_document(self, file_object):
+        """
+        Optional method to parse all the pages of a file in a single pass.
+        Must return a list with the content of each page in order.
+        """
+        raise NotImplementedError(
+            'Your %s class has not defined the optional '
+            'execute_document() method.' % self.__class__.__name__
+        )
+
 
 class PopplerParser(Parser):
     """
@@ -136,23 +201,27 @@ class PopplerParser(Parser):
 
         logger.debug('self.pdftotext_path: %s', self.pdftotext_path)
 
-    def execute(self, file_object, page_number):
-        logger.debug('Parsing PDF page: %d', page_number)
+    def _clean_output(self, output):
+        if output in (b'', b'\x0c'):
+            logger.debug('Parser didn\'t return any output')
+            return ''
+
+        if output[-1:] == b'\x0c':
+            output = output[:-1]
+
+        if output[-2:] == b'\x0a\x0a':
+            output = output[:-2]
 
+        return force_str(s=output)
+
+    def _command_call(self, file_object, arguments=None):
         with NamedTemporaryFile() as temporary_file_object:
             copyfileobj(fsrc=file_object, fdst=temporary_file_object)
             temporary_file_object.seek(0)
 
             command = []
             command.append(self.pdftotext_path)
-            command.append('-f')
-            command.append(
-                str(page_number)
-            )
-            command.append('-l')
-            command.append(
-                str(page_number)
-            )
+            command.extend(arguments or ())
             command.append(temporary_file_object.name)
             command.append('-')
 
@@ -160,37 +229,49 @@ class PopplerParser(Parser):
                 command, close_fds=True, stderr=subprocess.PIPE,
                 stdout=subprocess.PIPE
             )
-            return_code = proc.wait()
-            if return_code != 0:
+            output, error = proc.communicate()
+            if proc.returncode != 0:
                 logger.error(
-                    proc.stderr.readline()
+                    force_str(s=error)
                 )
 
                 raise ParserError
 
-            output = proc.stdout.read()
+            return output
 
-            if output == b'\x0c':
-                logger.debug('Parser didn\'t return any output')
-                return ''
+    def execute(self, file_object, page_number):
+        logger.debug('Parsing PDF page: %d', page_number)
 
-            if output[-3:] == b'\x0a\x0a\x0c':
-                return force_str(
-                    s=output[:-3]
-                )
+        output = self._command_call(
+            arguments=(
+                '-f', str(page_number), '-l', str(page_number)
+            ), file_object=file_object
+        )
+
+        return self._clean_output(output=output)
+
+    def execute_document(self, file_object):
+        logger.debug('Parsing all PDF pages')
 
-            return force_str(s=output)
+        output = self._command_call(file_object=file_object)
+
+        # pdftotext terminates every page with a form feed. Splitting
+        # produces an extra empty trailing element which is discarded.
+        page_output_list = output.split(PDFTOTEXT_PAGE_SEPARATOR)
+        if page_output_list and page_output_list[-1] == b'':
+            page_output_list.pop()
+
+        return [
+            self._clean_output(output=page_output)
+            for page_output in page_output_list
+        ]
 
 
 class OfficePopplerParser(PopplerParser):
-    def execute(self, file_object, page_number):
-        converter = ConverterBase.get_converter_class()(
-            file_object=file_object
-        )
-        with converter.to_pdf() as pdf_file_object:
-            return super().execute(
-                file_object=pdf_file_object, page_number=page_number
-            )
+    def open_document_file(self, document_file):
+        # The intermediate file is the cached PDF conversion of the office
+        # file, use it to avoid converting the file again.
+        return document_file.get_intermediate_file()
 
 
 Parser.register(
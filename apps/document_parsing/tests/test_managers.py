@@ -0,0 +1,81 @@
+from unittest import mock
+
+from django.test import TestCase
+
+from mayan.apps.documents.tests.mixins import DocumentTestMixin
+
+from ..literals import ERROR_LOG_DOMAIN_NAME
+from ..models import DocumentFilePageContent
+
+TEST_PARSING_CONTENT = 'test parsing content {}'
+
+
+class DocumentFilePageContentManagerTestCase(DocumentTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.test_document_file_pages = list(
+            self.test_document_file.pages.all()
+        )
+
+    def _bulk_upsert(self):
+        with mock.patch(
+            target='mayan.apps.dynamic_search.managers.SearchIndexQueueEntryManager.index_request'
+        ) as mock_index_request:
+            DocumentFilePageContent.objects.bulk_upsert(
+                content_dictionary={
+                    document_file_page: TEST_PARSING_CONTENT.format(
+                        document_file_page.pk
+                    ) for document_file_page in self.test_document_file_pages
+                }
+            )
+
+        return mock_index_request
+
+    def test_bulk_upsert(self):
+        mock_index_request = self._bulk_upsert()
+
+        for document_file_page in self.test_document_file_pages:
+            self.assertEqual(
+                document_file_page.content.content,
+                TEST_PARSING_CONTENT.format(document_file_page.pk)
+            )
+
+        self.assertEqual(
+            [
+                call.kwargs['instance'] for call in mock_index_request.call_args_list
+            ], self.test_document_file_pages + [
+                self.test_document_file, self.test_document
+            ]
+        )
+
+    def test_bulk_upsert_clear_error_log(self):
+        self.test_document_file.error_log.create(
+            domain_name=ERROR_LOG_DOMAIN_NAME, text='test error'
+        )
+
+        self._bulk_upsert()
+
+        self.assertFalse(
+            self.test_document_file.error_log.filter(
+                domain_name=ERROR_LOG_DOMAIN_NAME
+            ).exists()
+        )
+
+    def test_bulk_upsert_update(self):
+        DocumentFilePageContent.objects.create(
+            content='old content',
+            document_file_page=self.test_document_file_pages[0]
+        )
+
+        self._bulk_upsert()
+
+        self.assertEqual(
+            DocumentFilePageContent.objects.filter(
+                document_file_page__in=self.test_document_file_pages
+            ).count(), len(self.test_document_file_pages)
+        )
+        self.test_document_file_pages[0].content.refresh_from_db()
+        self.assertEqual(
+            self.test_document_file_pages[0].content.content,
+            TEST_PARSING_CONTENT.format(self.test_document_file_pages[0].pk)
+        )
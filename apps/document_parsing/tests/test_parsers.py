@@ -0,0 +1,66 @@
+import io
+import os
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from mayan.apps.storage.utils import TemporaryDirectory
+
+from ..exceptions import ParserError
+from ..parsers import PopplerParser
+
+TEST_PDFTOTEXT_SCRIPT_ERROR = '''#!/bin/sh
+head -c 131072 /dev/zero | tr '\\000' 'e' >&2
+echo test error >&2
+exit 1
+'''
+TEST_PDFTOTEXT_SCRIPT_OUTPUT = '''#!/bin/sh
+printf 'test page 1\\014test page 2\\014'
+'''
+
+
+class PopplerParserTestCase(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        temporary_directory = TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+
+        self.test_pdftotext_path = os.path.join(
+            temporary_directory.name, 'pdftotext'
+        )
+
+        patcher = mock.patch(
+            new=mock.Mock(value=self.test_pdftotext_path),
+            target='mayan.apps.document_parsing.parsers.setting_pdftotext_path'
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _create_test_pdftotext(self, script):
+        with open(file=self.test_pdftotext_path, mode='w') as file_object:
+            file_object.write(script)
+
+        os.chmod(path=self.test_pdftotext_path, mode=0o700)
+
+    def test_command_error(self):
+        self._create_test_pdftotext(script=TEST_PDFTOTEXT_SCRIPT_ERROR)
+
+        parser = PopplerParser()
+
+        with self.assertLogs(
+            level='ERROR', logger='mayan.apps.document_parsing.parsers'
+        ) as logs:
+            with self.assertRaises(expected_exception=ParserError):
+                parser.execute_document(file_object=io.BytesIO())
+
+        self.assertIn('test error', logs.output[0])
+
+    def test_execute_document(self):
+        self._create_test_pdftotext(script=TEST_PDFTOTEXT_SCRIPT_OUTPUT)
+
+        parser = PopplerParser()
+
+        self.assertEqual(
+            parser.execute_document(file_object=io.BytesIO()),
+            ['test page 1', 'test page 2']
+        )
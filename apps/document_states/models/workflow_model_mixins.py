@@ -79,9 +79,7 @@ class WorkflowBusinessLogicMixin:
         user=None
     ):
         # `user` argument added for compatibility.
-        cache_filename = '{}'.format(
-            self.get_hash()
-        )
+        cache_filename = self.get_combined_cache_filename()
 
         try:
             self.cache_partition.get_file(filename=cache_filename)
@@ -111,6 +109,16 @@ class WorkflowBusinessLogicMixin:
 
         return final_url.tostr()
 
+    def get_combined_cache_filename(
+        self, maximum_layer_order=None, transformation_instance_list=None,
+        user=None
+    ):
+        # The arguments are not used, but added to retain interface
+        # compatibility.
+        return '{}'.format(
+            self.get_hash()
+        )
+
     def get_document_types_not_in_workflow(self):
         DocumentType = apps.get_model(
             app_label='documents', model_name='DocumentType'
@@ -1,9 +1,15 @@
+from io import BytesIO
+import os
 import uuid
 
+from django.core.files import File
 from django.utils.text import format_lazy
 from django.utils.translation import gettext_lazy as _
 
 from mayan.apps.backends.classes import BaseBackend
+from mayan.apps.mime_types.classes import MIMETypeBackend
+
+from .literals import DOCUMENT_FILE_INTROSPECTION_HEAD_SIZE
 
 __all__ = (
     'BaseDocumentFilenameGenerator', 'OriginalDocumentFilenameGenerator',
@@ -56,6 +62,66 @@ class DocumentFileAction(BaseBackend):
     _loader_module_name = 'document_file_actions'
 
 
+class DocumentFileIntrospectionFile(File):
+    """
+    Wrap the file object of a new document file to compute the checksum
+    while the storage reads the content to save the file. The start of the
+    content is kept in memory for the MIME type detection, which only
+    inspects the first bytes of a file. The results are only valid if the
+    storage read the entire content sequentially from the start. Otherwise
+    `is_complete` is False and the stored file must be read again.
+    """
+    def __init__(self, file, hash_function, name=None):
+        super().__init__(file=file, name=name)
+        self.hash_function = hash_function
+        self._restart()
+
+    def _restart(self):
+        self.hash_object = self.hash_function()
+        self.head = BytesIO()
+        self.is_complete = False
+        self.is_sequential = True
+
+    def get_checksum(self):
+        return self.hash_object.hexdigest()
+
+    def get_mime_type(self):
+        """
+        Return the MIME type and encoding of the content.
+        """
+        mimetype_backend = MIMETypeBackend.get_backend_instance()
+
+        return mimetype_backend.get_mime_type(file_object=self.head)
+
+    def read(self, size=-1):
+        data = self.file.read(size)
+
+        if self.is_sequential and not self.is_complete and size != 0:
+            if data:
+                self.hash_object.update(data)
+
+                head_size_remaining = DOCUMENT_FILE_INTROSPECTION_HEAD_SIZE - self.head.tell()
+                if head_size_remaining > 0:
+                    self.head.write(data[:head_size_remaining])
+
+            if not data or size is None or size < 0:
+                self.is_complete = True
+
+        return data
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        result = self.file.seek(offset, whence)
+
+        # Results are kept once the entire content was read.
+        if not self.is_complete:
+            if offset == 0 and whence == os.SEEK_SET:
+                self._restart()
+            else:
+                self.is_sequential = False
+
+        return result
+
+
 class DocumentVersionModification(BaseBackend):
     _loader_module_name = 'document_version_modifications'
 
@@ -7,9 +7,11 @@ from .literals import (
 )
 from .settings import (
     setting_document_file_page_image_cache_maximum_size,
+    setting_document_file_page_image_cache_warm_on_upload,
     setting_document_version_page_image_cache_maximum_size
 )
 from .signals import signal_post_initial_document_type
+from .tasks import task_document_file_page_image_cache_warm
 
 
 def handler_create_default_document_type(sender, **kwargs):
@@ -45,6 +47,13 @@ def handler_create_document_version_page_image_cache(sender, **kwargs):
     )
 
 
+def handler_document_file_page_image_cache_warm(sender, instance, **kwargs):
+    if setting_document_file_page_image_cache_warm_on_upload.value:
+        task_document_file_page_image_cache_warm.apply_async(
+            kwargs={'document_file_id': instance.pk}
+        )
+
+
 def handler_document_event_on_save(sender, instance, created, **kwargs):
     _event_ignore = getattr(instance, '_event_ignore', False)
     if not _event_ignore:
@@ -3,11 +3,16 @@ import logging
 
 from django.apps import apps
 from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
 from django.db import models
 from django.utils.timezone import now
 
 from mayan.apps.databases.classes import ModelQueryFields
 
+from .literals import (
+    STORAGE_NAME_DOCUMENT_FILE_PAGE_IMAGE_CACHE,
+    STORAGE_NAME_DOCUMENT_VERSION_PAGE_IMAGE_CACHE
+)
 from .settings import (
     setting_favorite_count, setting_recently_accessed_document_count,
     setting_recently_created_document_count
@@ -39,6 +44,50 @@ class DocumentFileManager(models.Manager):
 
 
 class DocumentFilePageManager(models.Manager):
+    def delete_bulk(self, **kwargs):
+        """
+        Delete the pages matching the filter arguments and the document
+        version pages that reference them with a constant number of
+        queries. The cache partitions of the pages are deleted in bulk and
+        no page events are committed. Returns the IDs of the document
+        versions that lost pages.
+        """
+        Cache = apps.get_model(app_label='file_caching', model_name='Cache')
+        DocumentVersionPage = apps.get_model(
+            app_label='documents', model_name='DocumentVersionPage'
+        )
+
+        queryset = self.filter(**kwargs)
+
+        # Load only the fields used by `DocumentFilePage.uuid`.
+        pages = tuple(
+            queryset.select_related('document_file__document').only(
+                'document_file__document__uuid', 'document_file_id'
+            )
+        )
+
+        if not pages:
+            return set()
+
+        content_type = ContentType.objects.get_for_model(model=self.model)
+
+        document_version_id_list = DocumentVersionPage.objects.delete_bulk(
+            content_type=content_type, object_id__in=[
+                page.pk for page in pages
+            ]
+        )
+
+        cache = Cache.objects.get(
+            defined_storage_name=STORAGE_NAME_DOCUMENT_FILE_PAGE_IMAGE_CACHE
+        )
+        cache.partitions_delete(
+            name_list=[page.uuid for page in pages]
+        )
+
+        queryset.delete()
+
+        return document_version_id_list
+
     def get_by_natural_key(self, page_number, document_file_natural_key):
         DocumentFile = apps.get_model(
             app_label='documents', model_name='DocumentFile'
@@ -158,6 +207,40 @@ class DocumentTypeManager(models.Manager):
         return self.get(label=label)
 
 
+class DocumentVersionPageManager(models.Manager):
+    def delete_bulk(self, **kwargs):
+        """
+        Delete the pages matching the filter arguments with a constant
+        number of queries. The cache partitions of the pages are deleted in
+        bulk and no page events are committed. Returns the IDs of the
+        document versions that lost pages.
+        """
+        Cache = apps.get_model(app_label='file_caching', model_name='Cache')
+
+        queryset = self.filter(**kwargs)
+
+        # Load only the fields used by `DocumentVersionPage.uuid`.
+        pages = tuple(
+            queryset.select_related('document_version__document').only(
+                'document_version__document__uuid', 'document_version_id'
+            )
+        )
+
+        if not pages:
+            return set()
+
+        cache = Cache.objects.get(
+            defined_storage_name=STORAGE_NAME_DOCUMENT_VERSION_PAGE_IMAGE_CACHE
+        )
+        cache.partitions_delete(
+            name_list=[page.uuid for page in pages]
+        )
+
+        queryset.delete()
+
+        return {page.document_version_id for page in pages}
+
+
 class FavoriteDocumentManager(models.Manager):
     def get_by_natural_key(
         self, datetime_accessed, document_natural_key, user_natural_key
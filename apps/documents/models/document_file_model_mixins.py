@@ -21,9 +21,14 @@ from mayan.apps.file_caching.models import CachePartitionFile
 from mayan.apps.mime_types.classes import MIMETypeBackend
 from mayan.apps.storage.model_mixins import ModelMixinFileFieldOpen
 
-from ..classes import DocumentFileAction
-from ..events import event_document_file_created, event_document_file_edited
+from ..classes import DocumentFileAction, DocumentFileIntrospectionFile
+from ..events import (
+    event_document_file_created, event_document_file_edited,
+    event_document_version_edited
+)
 from ..literals import (
+    DOCUMENT_FILE_INTERMEDIATE_FILE_CACHE_FILENAME,
+    DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME,
     DOCUMENT_FILE_PAGE_CREATE_BATCH_SIZE, ERROR_LOG_DOMAIN_NAME,
     IMAGE_ERROR_DOCUMENT_FILE_HAS_NO_PAGES,
     STORAGE_NAME_DOCUMENT_FILE_PAGE_IMAGE_CACHE
@@ -88,6 +93,16 @@ class DocumentFileBusinessLogicMixin(ModelMixinFileFieldOpen):
         self._event_keep_attributes = ('_event_actor',)
         user = getattr(self, '_event_actor', None)
 
+        if not self.file._committed:
+            # Compute the file attributes while the storage reads the
+            # content to avoid reading the stored file again.
+            self._introspection_file = DocumentFileIntrospectionFile(
+                file=self.file.file,
+                hash_function=DocumentFile.hash_function,
+                name=self.file.name
+            )
+            self.file = self._introspection_file
+
         logger.info('Creating new file for document: %s', self.document)
         DocumentFile.execute_pre_create_hooks(
             kwargs={
@@ -117,6 +132,8 @@ class DocumentFileBusinessLogicMixin(ModelMixinFileFieldOpen):
                 update_fields=('file_latest', 'is_stub', 'label')
             )
         except Exception as exception:
+            self._introspection_file = None
+
             logger.error(
                 'Error creating new document file for document "%s"; %s',
                 self.document, exception, exc_info=True
@@ -129,19 +146,9 @@ class DocumentFileBusinessLogicMixin(ModelMixinFileFieldOpen):
         actor = getattr(self, '_event_actor', None)
 
         try:
-            self.checksum_update(save=False)
-            super().save(
-                update_fields=('checksum',)
-            )
-
-            self.mimetype_update(save=False)
-            super().save(
-                update_fields=('encoding', 'mimetype',)
-            )
-
-            self.size_update(save=False)
+            self.file_attributes_update(save=False)
             super().save(
-                update_fields=('size',)
+                update_fields=('checksum', 'encoding', 'mimetype', 'size')
             )
 
             self.page_count_update(save=False)
@@ -295,6 +302,39 @@ class DocumentFileBusinessLogicMixin(ModelMixinFileFieldOpen):
 
         return self.file.storage.exists(name=name)
 
+    def file_attributes_update(self, save=True):
+        """
+        Update the checksum, MIME type and size of the document file. The
+        checksum and MIME type computed while the new file was saved to the
+        storage are used when available, otherwise the stored file is read.
+        """
+        introspection_file = getattr(self, '_introspection_file', None)
+        self._introspection_file = None
+
+        if introspection_file and introspection_file.is_complete:
+            self.checksum = introspection_file.get_checksum()
+
+            try:
+                self.mimetype, self.encoding = introspection_file.get_mime_type()
+            except Exception as exception:
+                logger.warning(
+                    'Unable to detect the MIME type of document file: %s '
+                    'from the start of the upload; %s. Reading the stored '
+                    'file.', self, exception, exc_info=True
+                )
+                self.mimetype_update(save=False)
+        else:
+            self.checksum_update(save=False)
+            self.mimetype_update(save=False)
+
+        # Metadata lookup of the storage, the content is not read.
+        self.size_update(save=False)
+
+        if save:
+            self.save(
+                update_fields=('checksum', 'encoding', 'mimetype', 'size')
+            )
+
     def get_api_image_url(
         self, maximum_layer_order=None, transformation_instance_list=None,
         user=None
@@ -322,7 +362,7 @@ class DocumentFileBusinessLogicMixin(ModelMixinFileFieldOpen):
         return self.document.files.exclude(pk=self.pk).order_by('timestamp').only('id').last()
 
     def get_intermediate_file(self):
-        cache_filename = 'intermediate_file'
+        cache_filename = DOCUMENT_FILE_INTERMEDIATE_FILE_CACHE_FILENAME
 
         try:
             cache_file = self.cache_partition.get_file(
@@ -363,6 +403,20 @@ class DocumentFileBusinessLogicMixin(ModelMixinFileFieldOpen):
             logger.debug(msg='Intermediate file found.')
             return cache_file.open()
 
+    def get_intermediate_file_mime_type(self):
+        """
+        Files converted by LibreOffice have a PDF intermediate file, the
+        other files are their own intermediate file.
+        """
+        queryset = self.cache_partition.files.filter(
+            filename=DOCUMENT_FILE_INTERMEDIATE_FILE_CACHE_FILENAME
+        )
+
+        if queryset.exists():
+            return 'application/pdf'
+        else:
+            return self.mimetype
+
     def get_label(self):
         return self.filename
     get_label.short_description = _(message='Label')
@@ -409,10 +463,13 @@ class DocumentFileBusinessLogicMixin(ModelMixinFileFieldOpen):
 
     def page_count_update(self, save=True, user=None):
         try:
-            with self.open() as file_object:
+            # Use the intermediate file to have office files converted only
+            # once and the result reused when rendering and parsing pages.
+            with self.get_intermediate_file() as file_object:
                 converter_class = ConverterBase.get_converter_class()
                 converter = converter_class(
-                    file_object=file_object, mime_type=self.mimetype
+                    file_object=file_object,
+                    mime_type=self.get_intermediate_file_mime_type()
                 )
                 detected_pages = converter.get_page_count()
         except PageCountError as exception:
@@ -424,16 +481,30 @@ class DocumentFileBusinessLogicMixin(ModelMixinFileFieldOpen):
             DocumentFilePage = apps.get_model(
                 app_label='documents', model_name='DocumentFilePage'
             )
+            DocumentVersion = apps.get_model(
+                app_label='documents', model_name='DocumentVersion'
+            )
 
             queryset_error_logs = self.error_log.filter(
                 domain_name=ERROR_LOG_DOMAIN_NAME
             )
             queryset_error_logs.delete()
 
-            for page in self.pages.all():
-                page._event_actor = user
-                page._event_ignore = True
-                page.delete()
+            document_version_id_list = DocumentFilePage.objects.delete_bulk(
+                document_file=self
+            )
+
+            # Record the pages removed from the document versions with a
+            # single event per version.
+            queryset_document_versions = DocumentVersion.objects.filter(
+                pk__in=document_version_id_list
+            )
+
+            for document_version in queryset_document_versions:
+                event_document_version_edited.commit(
+                    action_object=self.document, actor=user,
+                    target=document_version
+                )
 
             document_file_pages = (
                 DocumentFilePage(
@@ -477,6 +548,70 @@ class DocumentFileBusinessLogicMixin(ModelMixinFileFieldOpen):
     def pages_first(self):
         return self.pages.first()
 
+    def pages_image_cache_warm(self):
+        """
+        Generate the base image of all the pages that don't have one yet
+        using a single converter pass. Returns the number of page images
+        generated.
+        """
+        document_file_page_dictionary = {}
+
+        for document_file_page in self.file_pages.all():
+            try:
+                document_file_page.cache_partition.get_file(
+                    filename=DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME
+                )
+            except CachePartitionFile.DoesNotExist:
+                document_file_page_dictionary[
+                    document_file_page.page_number - 1
+                ] = document_file_page
+
+        if not document_file_page_dictionary:
+            return 0
+
+        generated_count = 0
+
+        with self.get_intermediate_file() as file_object:
+            converter = ConverterBase.get_converter_class()(
+                file_object=file_object
+            )
+
+            page_images = converter.get_pages(
+                page_number_list=sorted(document_file_page_dictionary)
+            )
+
+            for page_number, page_image in page_images:
+                document_file_page = document_file_page_dictionary[
+                    page_number
+                ]
+
+                try:
+                    document_file_page.cache_partition.get_file(
+                        filename=DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME
+                    )
+                except CachePartitionFile.DoesNotExist:
+                    """Not created by a page view meanwhile, continue."""
+                else:
+                    continue
+
+                try:
+                    with document_file_page.cache_partition.create_file(filename=DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME) as cache_file_object:
+                        cache_file_object.write(
+                            page_image.getvalue()
+                        )
+                except Exception as exception:
+                    # The page image might have been created concurrently
+                    # by a page view. Not fatal, continue with the rest of
+                    # the pages.
+                    logger.warning(
+                        'Unable to store the base image of document file '
+                        'page: %s; %s', document_file_page, exception
+                    )
+                else:
+                    generated_count += 1
+
+        return generated_count
+
     def save_to_file(self, file_object):
         """
         Save a copy of the document from the document storage backend
@@ -15,7 +15,8 @@ from mayan.apps.file_caching.models import CachePartitionFile
 from mayan.apps.lock_manager.backends.base import LockingBackend
 
 from ..literals import (
-    ERROR_LOG_DOMAIN_NAME, IMAGE_ERROR_DOCUMENT_FILE_PAGE_TRANSFORMATION_ERROR
+    DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME, ERROR_LOG_DOMAIN_NAME,
+    IMAGE_ERROR_DOCUMENT_FILE_PAGE_TRANSFORMATION_ERROR
 )
 
 logger = logging.getLogger(name=__name__)
@@ -173,11 +174,32 @@ class DocumentFilePageBusinessLogicMixin:
         return result
 
     def get_image(self, transformation_instance_list=None):
-        cache_filename = 'base_image'
+        cache_filename = DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME
         logger.debug('Page cache filename: %s', cache_filename)
 
         try:
             cache_file = self.cache_partition.get_file(filename=cache_filename)
+            logger.debug('Page cache file "%s" found', cache_filename)
+
+            # The cache file can be pruned between the lookup and the
+            # opening, both are handled as a cache miss.
+            with cache_file.open() as file_object:
+                converter_class = ConverterBase.get_converter_class()
+                converter_instance = converter_class(
+                    file_object=file_object
+                )
+
+                converter_instance.seek_page(page_number=0)
+
+                # This code is also repeated below to allow using a context
+                # manager with cache_file.open and close it automatically.
+                # Apply runtime transformations.
+                for transformation in transformation_instance_list or ():
+                    converter_instance.transform(
+                        transformation=transformation
+                    )
+
+                return converter_instance.get_page()
         except CachePartitionFile.DoesNotExist:
             logger.debug('Page cache file "%s" not found', cache_filename)
 
@@ -221,26 +243,6 @@ class DocumentFilePageBusinessLogicMixin:
                     domain_name=ERROR_LOG_DOMAIN_NAME, text=error_log_text
                 )
                 raise
-        else:
-            logger.debug('Page cache file "%s" found', cache_filename)
-
-            with cache_file.open() as file_object:
-                converter_class = ConverterBase.get_converter_class()
-                converter_instance = converter_class(
-                    file_object=file_object
-                )
-
-                converter_instance.seek_page(page_number=0)
-
-                # This code is also repeated below to allow using a context
-                # manager with cache_file.open and close it automatically.
-                # Apply runtime transformations.
-                for transformation in transformation_instance_list or ():
-                    converter_instance.transform(
-                        transformation=transformation
-                    )
-
-                return converter_instance.get_page()
 
     def get_label(self):
         return _(
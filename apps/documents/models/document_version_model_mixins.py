@@ -16,9 +16,7 @@ from mayan.apps.events.decorators import method_event
 from mayan.apps.events.event_managers import EventManagerMethodAfter
 from mayan.apps.templating.template_backends import Template
 
-from ..events import (
-    event_document_version_page_created, event_document_version_edited
-)
+from ..events import event_document_version_edited
 from ..literals import (
     DOCUMENT_VERSION_PAGE_CREATE_BATCH_SIZE,
     IMAGE_ERROR_DOCUMENT_VERSION_HAS_NO_PAGES,
@@ -232,9 +230,9 @@ class DocumentVersionBusinessLogicMixin:
 
         self._event_actor = user
 
-        for page in self.pages.all():
-            page._event_actor = user
-            page.delete()
+        # The pages are deleted and created in bulk, the remap is recorded
+        # by a single document version edited event.
+        DocumentVersionPage.objects.delete_bulk(document_version=self)
 
         if not annotated_content_object_list:
             annotated_content_object_list = ()
@@ -263,11 +261,6 @@ class DocumentVersionBusinessLogicMixin:
                 objs=batch
             )
 
-        for page in self.pages.all().only('pk'):
-            event_document_version_page_created.commit(
-                action_object=self, actor=user, target=page
-            )
-
         signal_post_document_version_remap.send(
             instance=self, sender=DocumentVersion
         )
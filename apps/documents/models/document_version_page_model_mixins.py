@@ -216,6 +216,27 @@ class DocumentVersionPageBusinessLogicMixin:
             cache_file = self.cache_partition.get_file(
                 filename=cache_filename
             )
+            logger.debug('Page cache version "%s" found', cache_filename)
+
+            # The cache file can be pruned between the lookup and the
+            # opening, both are handled as a cache miss.
+            with cache_file.open() as file_object:
+                converter_class = ConverterBase.get_converter_class()
+                converter_instance = converter_class(
+                    file_object=file_object
+                )
+
+                converter_instance.seek_page(page_number=0)
+
+                # This code is also repeated below to allow using a context
+                # manager with cache_version.open and close it automatically.
+                # Apply runtime transformations.
+                for transformation in transformation_instance_list or ():
+                    converter_instance.transform(
+                        transformation=transformation
+                    )
+
+                return converter_instance.get_page()
         except CachePartitionFile.DoesNotExist:
             logger.debug('Page cache version "%s" not found', cache_filename)
 
@@ -258,26 +279,6 @@ class DocumentVersionPageBusinessLogicMixin:
                     exc_info=True
                 )
                 raise
-        else:
-            logger.debug('Page cache version "%s" found', cache_filename)
-
-            with cache_file.open() as file_object:
-                converter_class = ConverterBase.get_converter_class()
-                converter_instance = converter_class(
-                    file_object=file_object
-                )
-
-                converter_instance.seek_page(page_number=0)
-
-                # This code is also repeated below to allow using a context
-                # manager with cache_version.open and close it automatically.
-                # Apply runtime transformations.
-                for transformation in transformation_instance_list or ():
-                    converter_instance.transform(
-                        transformation=transformation
-                    )
-
-                return converter_instance.get_page()
 
     def get_label(self):
         return _(
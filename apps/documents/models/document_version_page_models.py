@@ -14,7 +14,9 @@ from ..events import (
     event_document_version_page_created, event_document_version_page_deleted,
     event_document_version_page_edited
 )
-from ..managers import ValidDocumentVersionPageManager
+from ..managers import (
+    DocumentVersionPageManager, ValidDocumentVersionPageManager
+)
 
 from .document_version_models import DocumentVersion
 from .document_version_page_model_mixins import (
@@ -59,7 +61,7 @@ class DocumentVersionPage(
         verbose_name = _(message='Document version page')
         verbose_name_plural = _(message='Document version pages')
 
-    objects = models.Manager()
+    objects = DocumentVersionPageManager()
     valid = ValidDocumentVersionPageManager()
 
     def __str__(self):
@@ -79,6 +79,10 @@ queue_documents_file_slow.add_task_type(
     dotted_path='mayan.apps.documents.tasks.document_file_tasks.task_document_file_delete',
     label=_(message='Delete a document file')
 )
+queue_documents_file_slow.add_task_type(
+    dotted_path='mayan.apps.documents.tasks.document_file_tasks.task_document_file_page_image_cache_warm',
+    label=_(message='Generate the page images of a document file')
+)
 
 queue_documents_periodic.add_task_type(
     dotted_path='mayan.apps.documents.tasks.document_type_tasks.task_document_type_document_trash_periods_check',
@@ -8,6 +8,7 @@ from .literals import (
     DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_MAXIMUM_SIZE,
     DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_STORAGE_BACKEND,
     DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_STORAGE_BACKEND_ARGUMENTS,
+    DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_WARM_ON_UPLOAD,
     DEFAULT_DOCUMENTS_FILE_STORAGE_BACKEND,
     DEFAULT_DOCUMENTS_FILE_STORAGE_BACKEND_ARGUMENTS,
     DEFAULT_DOCUMENTS_HASH_BLOCK_SIZE, DEFAULT_DOCUMENTS_LIST_THUMBNAIL_WIDTH,
@@ -54,6 +55,16 @@ setting_document_file_page_image_cache_maximum_size = setting_namespace.do_setti
         'the size in bytes.'
     ), post_edit_function=callback_update_document_file_page_image_cache_size
 )
+setting_document_file_page_image_cache_warm_on_upload = setting_namespace.do_setting_add(
+    default=DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_WARM_ON_UPLOAD,
+    global_name='DOCUMENTS_FILE_PAGE_IMAGE_CACHE_WARM_ON_UPLOAD',
+    help_text=_(
+        message='Generate the base image of all the pages of a document '
+        'file in a single pass after it is uploaded. Makes the first '
+        'display of the document faster at the cost of additional '
+        'processing and cache space.'
+    )
+)
 setting_document_file_storage_backend = setting_namespace.do_setting_add(
     default=DEFAULT_DOCUMENTS_FILE_STORAGE_BACKEND,
     global_name='DOCUMENTS_FILE_STORAGE_BACKEND', help_text=_(
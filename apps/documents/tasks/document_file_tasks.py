@@ -135,15 +135,39 @@ def task_document_file_create(
                 name='post_document_file_create'
             )
 
-            task_document_file_size_update.apply_async(
-                kwargs={
-                    'action_name': action_name,
-                    'callback_dict': callback_dict,
-                    'document_file_id': document_file.pk,
-                    'is_document_upload_sequence': is_document_upload_sequence,
-                    'user_id': user_id
-                }
-            )
+            try:
+                document_file.file_attributes_update(save=False)
+                document_file._event_actor = user
+                document_file.save(
+                    update_fields=('checksum', 'encoding', 'mimetype', 'size')
+                )
+            except Exception as exception:
+                logger.warning(
+                    'Unable to update the attributes of document file: %s '
+                    'while uploading; %s. Updating them from the stored '
+                    'file.', document_file, exception
+                )
+
+                task_document_file_size_update.apply_async(
+                    kwargs={
+                        'action_name': action_name,
+                        'callback_dict': callback_dict,
+                        'document_file_id': document_file.pk,
+                        'is_document_upload_sequence': is_document_upload_sequence,
+                        'user_id': user_id
+                    }
+                )
+            else:
+                if is_document_upload_sequence:
+                    task_document_file_page_count_update.apply_async(
+                        kwargs={
+                            'action_name': action_name,
+                            'callback_dict': callback_dict,
+                            'document_file_id': document_file.pk,
+                            'is_document_upload_sequence': is_document_upload_sequence,
+                            'user_id': user_id
+                        }
+                    )
 
 
 @app.task(bind=True, ignore_result=True, retry_backoff=True)
@@ -275,6 +299,33 @@ def task_document_file_page_count_update(
             )
 
 
+@app.task(bind=True, ignore_result=True, retry_backoff=True)
+def task_document_file_page_image_cache_warm(self, document_file_id):
+    DocumentFile = apps.get_model(
+        app_label='documents', model_name='DocumentFile'
+    )
+
+    try:
+        document_file = DocumentFile.objects.get(pk=document_file_id)
+    except OperationalError as exception:
+        raise self.retry(exc=exception)
+
+    try:
+        document_file.pages_image_cache_warm()
+    except OperationalError as exception:
+        logger.warning(
+            'Operational error during attempt to generate the page images '
+            'of document file: %s; %s. Retrying.', document_file,
+            exception
+        )
+        raise self.retry(exc=exception)
+    except Exception as exception:
+        logger.error(
+            'Unexpected exception generating the page images of document '
+            'file: %s; %s.', document_file, exception
+        )
+
+
 @app.task(bind=True, ignore_result=True, retry_backoff=True)
 def task_document_file_size_update(
     self, document_file_id, action_name=None, callback_dict=None,
@@ -0,0 +1,13 @@
+TEST_DOCUMENT_FILE_CONTENT = b'test document file content'
+TEST_DOCUMENT_FILE_INTROSPECTION_HEAD_SIZE = 8
+TEST_DOCUMENT_FILE_MIMETYPE = 'application/pdf'
+TEST_DOCUMENT_FILENAME = 'test_document.pdf'
+TEST_DOCUMENT_LABEL = 'test document'
+TEST_DOCUMENT_PAGE_COUNT = 2
+TEST_DOCUMENT_PAGE_IMAGE_CONTENT = 'test page image {}'
+TEST_DOCUMENT_PAGE_SIZE = (100, 100)
+TEST_DOCUMENT_TYPE_LABEL = 'test document type'
+TEST_TRANSFORMATION_QUERY = {
+    'transformation_0_argument__degrees': 90,
+    'transformation_0_name': 'rotate'
+}
@@ -0,0 +1,61 @@
+from io import BytesIO
+
+from PIL import Image
+
+from ..models.document_type_models import DocumentType
+
+from .literals import (
+    TEST_DOCUMENT_FILENAME, TEST_DOCUMENT_LABEL, TEST_DOCUMENT_PAGE_COUNT,
+    TEST_DOCUMENT_PAGE_SIZE, TEST_DOCUMENT_TYPE_LABEL
+)
+
+
+class DocumentTestMixin:
+    """
+    Create a document type and a document with a PDF file of
+    `TEST_DOCUMENT_PAGE_COUNT` blank pages. The pages are created
+    synchronously instead of by the background tasks.
+    """
+    def setUp(self):
+        super().setUp()
+        self._create_test_document_type()
+        self._upload_test_document()
+
+    def _create_test_document_type(self):
+        self.test_document_type = DocumentType.objects.create(
+            label=TEST_DOCUMENT_TYPE_LABEL
+        )
+
+    def _get_test_document_file_object(
+        self, page_count=TEST_DOCUMENT_PAGE_COUNT
+    ):
+        pages = [
+            Image.new(mode='RGB', size=TEST_DOCUMENT_PAGE_SIZE)
+            for page_number in range(page_count)
+        ]
+
+        file_object = BytesIO()
+        file_object.name = TEST_DOCUMENT_FILENAME
+        pages[0].save(
+            file_object, append_images=pages[1:], format='PDF',
+            save_all=True
+        )
+        file_object.seek(0)
+
+        return file_object
+
+    def _upload_test_document(self, page_count=TEST_DOCUMENT_PAGE_COUNT):
+        self.test_document = self.test_document_type.documents.create(
+            label=TEST_DOCUMENT_LABEL
+        )
+        self.test_document.files_upload(
+            file_object=self._get_test_document_file_object(
+                page_count=page_count
+            ), filename=TEST_DOCUMENT_FILENAME
+        )
+
+        self.test_document_file = self.test_document.file_latest
+        self.test_document_file.page_count_update()
+
+        self.test_document_version = self.test_document.version_active
+        self.test_document_version.pages_reset()
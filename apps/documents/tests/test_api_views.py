@@ -0,0 +1,71 @@
+import hashlib
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from django.utils.encoding import force_bytes
+from django.utils.http import quote_etag
+
+from .literals import TEST_TRANSFORMATION_QUERY
+from .mixins import DocumentTestMixin
+
+
+class APIDocumentVersionPageImageViewTestCase(DocumentTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.test_user = get_user_model().objects.create_superuser(
+            email='test@example.com', password='test', username='test'
+        )
+        self.client.force_login(user=self.test_user)
+
+        self.test_document_version_page = self.test_document_version.pages.first()
+
+        cache_filename = self.test_document_version_page.get_combined_cache_filename(
+            transformation_instance_list=[], user=self.test_user
+        )
+        full_filename = self.test_document_version_page.cache_partition.get_full_filename(
+            filename=cache_filename
+        )
+        self.test_etag = quote_etag(
+            etag_str=hashlib.sha256(
+                string=force_bytes(s=full_filename)
+            ).hexdigest()
+        )
+
+        patcher = mock.patch(
+            side_effect=ValueError,
+            target='mayan.apps.converter.api_view_mixins.APIImageViewMixin.set_cache_file'
+        )
+        self.mock_set_cache_file = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _request_test_document_version_page_image_api_view(
+        self, data=None
+    ):
+        return self.client.get(
+            data=data, headers={'if_none_match': self.test_etag},
+            path=reverse(
+                kwargs={
+                    'document_id': self.test_document.pk,
+                    'document_version_id': self.test_document_version.pk,
+                    'document_version_page_id': self.test_document_version_page.pk
+                }, viewname='rest_api:documentversionpage-image'
+            )
+        )
+
+    def test_if_none_match(self):
+        response = self._request_test_document_version_page_image_api_view()
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers['ETag'], self.test_etag)
+        self.assertFalse(self.mock_set_cache_file.called)
+
+    def test_if_none_match_transformation(self):
+        with self.assertLogs(level='ERROR', logger='mayan.apps.logging.middleware.error_logging'):
+            with self.assertRaises(expected_exception=ValueError):
+                self._request_test_document_version_page_image_api_view(
+                    data=TEST_TRANSFORMATION_QUERY
+                )
+
+        self.assertTrue(self.mock_set_cache_file.called)
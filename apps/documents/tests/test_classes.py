@@ -0,0 +1,62 @@
+import hashlib
+from io import BytesIO
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from ..classes import DocumentFileIntrospectionFile
+
+from .literals import (
+    TEST_DOCUMENT_FILE_CONTENT, TEST_DOCUMENT_FILE_INTROSPECTION_HEAD_SIZE
+)
+
+
+class DocumentFileIntrospectionFileTestCase(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch(
+            new=TEST_DOCUMENT_FILE_INTROSPECTION_HEAD_SIZE,
+            target='mayan.apps.documents.classes.DOCUMENT_FILE_INTROSPECTION_HEAD_SIZE'
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.test_introspection_file = DocumentFileIntrospectionFile(
+            file=BytesIO(TEST_DOCUMENT_FILE_CONTENT),
+            hash_function=hashlib.sha256
+        )
+
+    def test_sequential_read(self):
+        while self.test_introspection_file.read(5):
+            """Read the whole content in small chunks."""
+
+        self.assertTrue(self.test_introspection_file.is_complete)
+        self.assertEqual(
+            self.test_introspection_file.get_checksum(),
+            hashlib.sha256(TEST_DOCUMENT_FILE_CONTENT).hexdigest()
+        )
+        self.assertEqual(
+            self.test_introspection_file.head.getvalue(),
+            TEST_DOCUMENT_FILE_CONTENT[:TEST_DOCUMENT_FILE_INTROSPECTION_HEAD_SIZE]
+        )
+
+    def test_non_sequential_read(self):
+        self.test_introspection_file.seek(5)
+        self.test_introspection_file.read()
+
+        self.assertFalse(self.test_introspection_file.is_sequential)
+
+    def test_restart(self):
+        self.test_introspection_file.read(5)
+        self.test_introspection_file.seek(0)
+        self.test_introspection_file.read()
+
+        self.assertTrue(self.test_introspection_file.is_complete)
+        self.assertEqual(
+            self.test_introspection_file.get_checksum(),
+            hashlib.sha256(TEST_DOCUMENT_FILE_CONTENT).hexdigest()
+        )
+        self.assertEqual(
+            self.test_introspection_file.head.getvalue(),
+            TEST_DOCUMENT_FILE_CONTENT[:TEST_DOCUMENT_FILE_INTROSPECTION_HEAD_SIZE]
+        )
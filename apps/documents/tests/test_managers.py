@@ -0,0 +1,89 @@
+from django.test import TestCase
+
+from mayan.apps.file_caching.models import CachePartition
+
+from ..models.document_file_page_models import DocumentFilePage
+from ..models.document_version_page_models import DocumentVersionPage
+
+from .literals import TEST_DOCUMENT_PAGE_COUNT
+from .mixins import DocumentTestMixin
+
+
+class DocumentPageManagerTestCase(DocumentTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.test_document_file_pages = tuple(
+            self.test_document_file.pages.all()
+        )
+        self.test_document_version_pages = tuple(
+            self.test_document_version.version_pages.all()
+        )
+
+        self.test_cache_partition_id_list = [
+            page.cache_partition.pk for page in self.test_document_file_pages
+        ] + [
+            page.cache_partition.pk for page in self.test_document_version_pages
+        ]
+
+    def test_document_file_page_delete_bulk(self):
+        self.assertEqual(
+            len(self.test_document_file_pages), TEST_DOCUMENT_PAGE_COUNT
+        )
+
+        document_version_id_list = DocumentFilePage.objects.delete_bulk(
+            document_file=self.test_document_file
+        )
+
+        self.assertEqual(
+            document_version_id_list, {self.test_document_version.pk}
+        )
+        self.assertFalse(
+            DocumentFilePage.objects.filter(
+                document_file=self.test_document_file
+            ).exists()
+        )
+        self.assertFalse(
+            self.test_document_version.version_pages.exists()
+        )
+        self.assertFalse(
+            CachePartition.objects.filter(
+                pk__in=self.test_cache_partition_id_list
+            ).exists()
+        )
+
+    def test_document_version_page_delete_bulk(self):
+        self.assertEqual(
+            len(self.test_document_version_pages), TEST_DOCUMENT_PAGE_COUNT
+        )
+
+        document_version_id_list = DocumentVersionPage.objects.delete_bulk(
+            document_version=self.test_document_version
+        )
+
+        self.assertEqual(
+            document_version_id_list, {self.test_document_version.pk}
+        )
+        self.assertFalse(
+            self.test_document_version.version_pages.exists()
+        )
+        self.assertFalse(
+            CachePartition.objects.filter(
+                pk__in=[
+                    page.cache_partition.pk
+                    for page in self.test_document_version_pages
+                ]
+            ).exists()
+        )
+        self.assertEqual(
+            DocumentFilePage.objects.filter(
+                document_file=self.test_document_file
+            ).count(), TEST_DOCUMENT_PAGE_COUNT
+        )
+
+    def test_delete_bulk_no_match(self):
+        self.assertEqual(
+            DocumentFilePage.objects.delete_bulk(pk__in=()), set()
+        )
+        self.assertEqual(
+            DocumentVersionPage.objects.delete_bulk(pk__in=()), set()
+        )
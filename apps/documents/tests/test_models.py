@@ -0,0 +1,109 @@
+from io import BytesIO
+from unittest import mock
+
+from django.test import TestCase
+
+from mayan.apps.converter.classes import ConverterBase
+from mayan.apps.file_caching.models import CachePartitionFile
+
+from ..literals import DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME
+from ..models.document_file_models import DocumentFile
+
+from .literals import TEST_DOCUMENT_PAGE_IMAGE_CONTENT
+from .mixins import DocumentTestMixin
+
+
+class DocumentFilePageImageCacheWarmTestCase(DocumentTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.test_document_file_pages = list(
+            self.test_document_file.pages.order_by('page_number')
+        )
+
+        self.mock_converter_class = mock.Mock()
+        self.mock_converter_class.return_value.get_pages.side_effect = self._get_test_pages
+
+        for attribute, target, new in (
+            (
+                'get_converter_class', ConverterBase, mock.Mock(return_value=self.mock_converter_class)
+            ),
+            (
+                'get_intermediate_file', DocumentFile,
+                mock.Mock(side_effect=BytesIO)
+            )
+        ):
+            patcher = mock.patch.object(
+                attribute=attribute, new=new, target=target
+            )
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _get_test_pages(self, page_number_list, output_format=None):
+        for page_number in page_number_list:
+            yield page_number, BytesIO(
+                TEST_DOCUMENT_PAGE_IMAGE_CONTENT.format(page_number).encode()
+            )
+
+    def _get_test_page_image_content(self, document_file_page):
+        cache_file = document_file_page.cache_partition.get_file(
+            filename=DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME
+        )
+
+        with cache_file.open() as file_object:
+            return file_object.read()
+
+    def test_pages_image_cache_warm(self):
+        self.assertEqual(
+            self.test_document_file.pages_image_cache_warm(),
+            len(self.test_document_file_pages)
+        )
+
+        self.mock_converter_class.return_value.get_pages.assert_called_once_with(
+            page_number_list=list(
+                range(len(self.test_document_file_pages))
+            )
+        )
+
+        for page_number, document_file_page in enumerate(self.test_document_file_pages):
+            self.assertEqual(
+                self._get_test_page_image_content(
+                    document_file_page=document_file_page
+                ), TEST_DOCUMENT_PAGE_IMAGE_CONTENT.format(
+                    page_number
+                ).encode()
+            )
+
+    def test_pages_image_cache_warm_existing(self):
+        with self.test_document_file_pages[0].cache_partition.create_file(filename=DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME) as file_object:
+            file_object.write(b'existing')
+
+        self.assertEqual(
+            self.test_document_file.pages_image_cache_warm(),
+            len(self.test_document_file_pages) - 1
+        )
+
+        self.mock_converter_class.return_value.get_pages.assert_called_once_with(
+            page_number_list=list(
+                range(1, len(self.test_document_file_pages))
+            )
+        )
+        self.assertEqual(
+            self._get_test_page_image_content(
+                document_file_page=self.test_document_file_pages[0]
+            ), b'existing'
+        )
+
+    def test_pages_image_cache_warm_complete(self):
+        self.test_document_file.pages_image_cache_warm()
+        self.mock_converter_class.reset_mock()
+
+        self.assertEqual(self.test_document_file.pages_image_cache_warm(), 0)
+        self.assertFalse(self.mock_converter_class.called)
+        self.assertEqual(
+            CachePartitionFile.objects.filter(
+                filename=DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME,
+                partition__in=[
+                    document_file_page.cache_partition for document_file_page in self.test_document_file_pages
+                ]
+            ).count(), len(self.test_document_file_pages)
+        )
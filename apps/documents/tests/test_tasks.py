@@ -0,0 +1,98 @@
+from unittest import mock
+
+from django.core.files import File
+from django.test import TestCase
+
+from mayan.apps.storage.models import SharedUploadedFile
+
+from ..classes import DocumentFileIntrospectionFile
+from ..models.document_file_models import DocumentFile
+from ..tasks.document_file_tasks import task_document_file_create
+
+from .literals import TEST_DOCUMENT_FILE_MIMETYPE
+from .mixins import DocumentTestMixin
+
+
+class DocumentFileCreateTaskTestCase(DocumentTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.test_shared_uploaded_file = SharedUploadedFile.objects.create(
+            file=File(file=self._get_test_document_file_object())
+        )
+
+        self.mock_task_list = []
+        for task_name in (
+            'task_document_file_page_count_update',
+            'task_document_file_size_update', 'task_shared_upload_delete'
+        ):
+            patcher = mock.patch(
+                target='mayan.apps.documents.tasks.document_file_tasks.{}.apply_async'.format(
+                    task_name
+                )
+            )
+            self.mock_task_list.append(patcher.start())
+            self.addCleanup(patcher.stop)
+
+        (
+            self.mock_task_page_count_update,
+            self.mock_task_size_update,
+            self.mock_task_shared_upload_delete
+        ) = self.mock_task_list
+
+    def _execute_task_document_file_create(self):
+        task_document_file_create.apply(
+            kwargs={
+                'document_id': self.test_document.pk,
+                'is_document_upload_sequence': True,
+                'shared_uploaded_file_id': self.test_shared_uploaded_file.pk
+            }
+        )
+
+        return self.test_document.files.order_by('pk').last()
+
+    def test_attributes_from_upload(self):
+        with mock.patch.object(
+            attribute='open', autospec=True, side_effect=DocumentFile.open,
+            target=DocumentFile
+        ) as mock_open:
+            document_file = self._execute_task_document_file_create()
+
+        self.assertEqual(mock_open.call_count, 0)
+        self.assertEqual(document_file.mimetype, TEST_DOCUMENT_FILE_MIMETYPE)
+        self.assertEqual(document_file.size, document_file.file.size)
+
+        checksum = document_file.checksum
+        document_file.checksum_update(save=False)
+        self.assertEqual(checksum, document_file.checksum)
+
+        self.assertTrue(self.mock_task_page_count_update.called)
+        self.assertFalse(self.mock_task_size_update.called)
+
+    def test_attributes_update_error(self):
+        with mock.patch.object(
+            attribute='file_attributes_update', side_effect=ValueError,
+            target=DocumentFile
+        ):
+            with self.assertLogs(
+                level='WARNING', logger='mayan.apps.documents.tasks'
+            ):
+                document_file = self._execute_task_document_file_create()
+
+        self.assertFalse(self.mock_task_page_count_update.called)
+        self.assertEqual(
+            self.mock_task_size_update.call_args.kwargs['kwargs']['document_file_id'],
+            document_file.pk
+        )
+
+    def test_mime_type_error(self):
+        with mock.patch.object(
+            attribute='get_mime_type', side_effect=ValueError,
+            target=DocumentFileIntrospectionFile
+        ):
+            with self.assertLogs(
+                level='WARNING', logger='mayan.apps.documents.models'
+            ):
+                document_file = self._execute_task_document_file_create()
+
+        self.assertEqual(document_file.mimetype, TEST_DOCUMENT_FILE_MIMETYPE)
+        self.assertTrue(self.mock_task_page_count_update.called)
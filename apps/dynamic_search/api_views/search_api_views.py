@@ -1,13 +1,23 @@
 from rest_framework.exceptions import ParseError
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 from mayan.apps.rest_api import generics
+from mayan.apps.rest_api.literals import DEFAULT_PAGE_SIZE_QUERY_PARAMETER
+from mayan.apps.rest_api.settings import (
+    setting_maximum_page_size, setting_page_size
+)
 
 from ..exceptions import DynamicSearchException
+from ..search_backends import SearchBackend
+from ..search_interpreters import SearchInterpreter
 from ..search_models import SearchModel
 from ..serializers import (
     DummySearchResultModelSerializer, SearchModelSerializer
 )
-from ..views.view_mixins import SearchResultViewMixin
+from ..views.view_mixins import (
+    SearchQueryViewMixin, SearchResultViewMixin
+)
 
 from .api_view_mixins import SearchModelAPIViewMixin
 
@@ -38,6 +48,101 @@ class APISearchModelList(generics.ListAPIView):
         return SearchModel.all()
 
 
+class APISearchRankedView(
+    SearchQueryViewMixin, SearchModelAPIViewMixin, generics.GenericAPIView
+):
+    """
+    get: Perform a search operation returning results ordered by relevance.
+    """
+    page_query_parameter = 'page'
+
+    def get(self, request, *args, **kwargs):
+        query_dict = self.get_search_query()
+        page_number = self.get_query_parameter_integer(
+            default=1, name=self.page_query_parameter,
+            query_dict=query_dict
+        )
+        page_size = min(
+            self.get_query_parameter_integer(
+                default=setting_page_size.value,
+                name=DEFAULT_PAGE_SIZE_QUERY_PARAMETER, query_dict=query_dict
+            ), setting_maximum_page_size.value
+        )
+
+        try:
+            search_interpreter = SearchInterpreter.init(
+                query=query_dict, search_model=self.search_model
+            )
+
+            query_clean = search_interpreter.do_query_cleanup()
+
+            if query_clean and not search_interpreter.is_empty:
+                search_backend = SearchBackend.get_instance()
+
+                # Fetch one extra result to know if there is a next page.
+                object_list = search_backend.search_page(
+                    limit=page_size + 1,
+                    offset=(page_number - 1) * page_size, query=query_clean,
+                    search_model=self.search_model, user=request.user
+                )
+            else:
+                object_list = []
+        except DynamicSearchException as exception:
+            raise ParseError(
+                detail=str(exception)
+            )
+
+        url = request.build_absolute_uri()
+
+        if len(object_list) > page_size:
+            url_next = replace_query_param(
+                key=self.page_query_parameter, url=url, val=page_number + 1
+            )
+        else:
+            url_next = None
+
+        if page_number == 1:
+            url_previous = None
+        elif page_number == 2:
+            url_previous = remove_query_param(
+                key=self.page_query_parameter, url=url
+            )
+        else:
+            url_previous = replace_query_param(
+                key=self.page_query_parameter, url=url, val=page_number - 1
+            )
+
+        serializer = self.get_serializer(
+            instance=object_list[:page_size], many=True
+        )
+
+        return Response(
+            data={
+                'next': url_next, 'previous': url_previous,
+                'results': serializer.data
+            }
+        )
+
+    def get_query_parameter_integer(self, default, name, query_dict):
+        value = query_dict.pop(name, None)
+
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            return default
+        else:
+            if value > 0:
+                return value
+            else:
+                return default
+
+    def get_serializer_class(self):
+        if getattr(self, 'swagger_fake_view', False):
+            return DummySearchResultModelSerializer
+        else:
+            return self.search_model.serializer
+
+
 class APISearchView(
     SearchResultViewMixin, SearchModelAPIViewMixin, generics.ListAPIView
 ):
@@ -1,3 +1,5 @@
+from django.apps import apps
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.utils.translation import gettext_lazy as _
 
 from mayan.apps.acls.classes import ModelPermission
@@ -12,7 +14,8 @@ from mayan.apps.common.signals import (
 from mayan.apps.navigation.source_columns import SourceColumn
 
 from .handlers import (
-    handler_search_backend_initialize, handler_search_backend_upgrade
+    handler_search_backend_initialize, handler_search_backend_upgrade,
+    handler_search_result_cache_acl_generation_increment
 )
 from .links import (
     link_saved_resultset_delete_single, link_saved_resultset_list,
@@ -43,6 +46,10 @@ class DynamicSearchApp(MayanAppConfig):
         SearchModel.load_modules()
         SearchBackend._enable()
 
+        AccessControlList = apps.get_model(
+            app_label='acls', model_name='AccessControlList'
+        )
+        Role = apps.get_model(app_label='permissions', model_name='Role')
         SavedResultset = self.get_model(model_name='SavedResultset')
 
         ModelPermission.register(
@@ -170,3 +177,24 @@ class DynamicSearchApp(MayanAppConfig):
             dispatch_uid='search_handler_search_backend_upgrade',
             receiver=handler_search_backend_upgrade
         )
+
+        m2m_changed.connect(
+            dispatch_uid='search_handler_search_result_cache_acl_permissions',
+            receiver=handler_search_result_cache_acl_generation_increment,
+            sender=AccessControlList.permissions.through
+        )
+        m2m_changed.connect(
+            dispatch_uid='search_handler_search_result_cache_role_permissions',
+            receiver=handler_search_result_cache_acl_generation_increment,
+            sender=Role.permissions.through
+        )
+        post_delete.connect(
+            dispatch_uid='search_handler_search_result_cache_acl_delete',
+            receiver=handler_search_result_cache_acl_generation_increment,
+            sender=AccessControlList
+        )
+        post_save.connect(
+            dispatch_uid='search_handler_search_result_cache_acl_save',
+            receiver=handler_search_result_cache_acl_generation_increment,
+            sender=AccessControlList
+        )
@@ -1,19 +1,44 @@
+from django.apps import apps
 from django.core.exceptions import ValidationError
-from django.db import models
-from django.db.models import Value
+from django.db import connection, models
+from django.db.models import Q, Value
 from django.db.models.functions import Cast, Replace
 
+from mayan.apps.common.utils import any_to_bool
+
 from ...exceptions import DynamicSearchValueTransformationError
 from ...search_backends import SearchBackend
 from ...search_fields import SearchFieldVirtualAllFields
 from ...search_models import SearchModel
 
-from .literals import DJANGO_TO_DJANGO_FIELD_MAP
+from .classes import FullTextSearchVendor
+from .literals import DJANGO_TO_DJANGO_FIELD_MAP, FULL_TEXT_SEARCH_FIELD_TYPES
 
 
 class DjangoSearchBackend(SearchBackend):
+    """
+    Searches the models directly. With `full_text_search` enabled, the
+    values of the text search fields are stored in a table that is
+    indexed for full text search by PostgreSQL and SQLite. Exact and
+    partial searches of text fields then use the index instead of
+    scanning the model tables. Other databases and query types keep
+    using the model tables.
+
+    Entries are created when the instances are indexed. After enabling
+    `full_text_search` the search models must be reindexed with the
+    `search_reindex` command. Until a search model has entries its model
+    tables are searched.
+    """
+    _full_text_search_populated = set()
+
+    feature_reindex = True
     field_type_mapping = DJANGO_TO_DJANGO_FIELD_MAP
 
+    def __init__(self, full_text_search=False, **kwargs):
+        super().__init__(**kwargs)
+
+        self.full_text_search = any_to_bool(value=full_text_search)
+
     def _do_search_model_filter(self, filter_kwargs, search_field):
         if search_field.field_class == models.UUIDField:
             # Remove hyphens when searching UUID fields.
@@ -41,17 +66,82 @@ class DjangoSearchBackend(SearchBackend):
 
         try:
             queryset = queryset.filter(filter_kwargs)
-            values = queryset.values_list('pk', flat=True)
+            # Filters of related fields return duplicates, remove them in
+            # the database.
+            values = queryset.order_by().values_list(
+                'pk', flat=True
+            ).distinct()
 
-            values_unique = tuple(
-                set(values)
-            )
-
-            for entry in values_unique:
+            for entry in values:
                 yield entry
         except ValidationError:
             return ()
 
+    def _get_full_text_search_field_name_list(self, search_model):
+        field_type_map = self.get_resolved_field_type_map(
+            search_model=search_model
+        )
+
+        return [
+            field_name for field_name, field_type in field_type_map.items()
+            if field_type['field'] in FULL_TEXT_SEARCH_FIELD_TYPES
+        ]
+
+    def _get_full_text_search_populated(self, search_model):
+        """
+        Return True if the search model has full text entries. Search
+        models stay populated once entries are found, until they are
+        reset.
+        """
+        if search_model.full_name not in self.__class__._full_text_search_populated:
+            SearchFullTextEntry = apps.get_model(
+                app_label='dynamic_search', model_name='SearchFullTextEntry'
+            )
+
+            queryset = SearchFullTextEntry.objects.filter(
+                search_model_name=search_model.full_name
+            )
+
+            if not queryset.exists():
+                return False
+
+            self.__class__._full_text_search_populated.add(
+                search_model.full_name
+            )
+
+        return True
+
+    def _get_full_text_search_values(self, field_name_list, instance_data):
+        result = {}
+
+        for field_name in field_name_list:
+            value = instance_data.get(field_name)
+
+            if value:
+                result[field_name] = value
+
+        return result
+
+    def _get_full_text_search_vendor(self):
+        """
+        Return the full text search vendor of the database or None if full
+        text search is disabled or not supported by the database.
+        """
+        if self.full_text_search:
+            SearchFullTextEntry = apps.get_model(
+                app_label='dynamic_search', model_name='SearchFullTextEntry'
+            )
+
+            try:
+                vendor = FullTextSearchVendor.get(connection=connection)
+            except KeyError:
+                return None
+            else:
+                if vendor.is_available(
+                    table_name=SearchFullTextEntry._meta.db_table
+                ):
+                    return vendor
+
     def _get_status(self):
         result = []
 
@@ -64,6 +154,17 @@ class DjangoSearchBackend(SearchBackend):
                 )
             )
 
+        if self._get_full_text_search_vendor():
+            SearchFullTextEntry = apps.get_model(
+                app_label='dynamic_search', model_name='SearchFullTextEntry'
+            )
+
+            result.append(
+                'Full text entries: {}'.format(
+                    SearchFullTextEntry.objects.count()
+                )
+            )
+
         return '\n'.join(result)
 
     def _search(
@@ -112,3 +213,147 @@ class DjangoSearchBackend(SearchBackend):
                     return self._do_search_model_filter(
                         filter_kwargs=filter_kwargs, search_field=search_field
                     )
+
+    def deindex_instance(self, instance):
+        search_model = SearchModel.get_for_model(instance=instance)
+
+        self.deindex_instances(
+            id_list=(instance.pk,), search_model=search_model
+        )
+
+    def deindex_instances(self, search_model, id_list):
+        if self.full_text_search:
+            SearchFullTextEntry = apps.get_model(
+                app_label='dynamic_search', model_name='SearchFullTextEntry'
+            )
+
+            SearchFullTextEntry.objects.instances_delete(
+                id_list=id_list, search_model=search_model
+            )
+
+    def do_native_type_conversion(self, value):
+        # Only used to store the full text search values.
+        if isinstance(value, (list, tuple)):
+            return ' '.join(
+                map(str, value)
+            )
+        else:
+            return value
+
+    def get_full_text_search_query(self, search_field, value, is_prefix=False):
+        """
+        Return a filter of the search model instances whose full text
+        entries of the search field match the value. See
+        `FullTextSearchVendor.get_condition` for the meaning of
+        `is_prefix`.
+        """
+        SearchFullTextEntry = apps.get_model(
+            app_label='dynamic_search', model_name='SearchFullTextEntry'
+        )
+
+        condition = self._get_full_text_search_vendor().get_condition(
+            is_prefix=is_prefix, table_name=SearchFullTextEntry._meta.db_table,
+            value=value
+        )
+
+        if condition is None:
+            # Value without searchable tokens.
+            return Q(pk__in=())
+        else:
+            queryset = SearchFullTextEntry.objects.filter(
+                field_name=search_field.field_name,
+                search_model_name=search_field.search_model.full_name
+            ).filter(condition)
+
+            return Q(
+                pk__in=queryset.values('object_id')
+            )
+
+    def get_full_text_search_field_enabled(self, search_field):
+        field_type = self.get_search_field_backend_field_type(
+            search_field=search_field
+        )
+
+        if field_type in FULL_TEXT_SEARCH_FIELD_TYPES:
+            if self._get_full_text_search_vendor() is None:
+                return False
+            else:
+                return self._get_full_text_search_populated(
+                    search_model=search_field.search_model
+                )
+        else:
+            return False
+
+    def index_instance(self, instance, exclude_model=None, exclude_kwargs=None):
+        if self._get_full_text_search_vendor():
+            SearchFullTextEntry = apps.get_model(
+                app_label='dynamic_search', model_name='SearchFullTextEntry'
+            )
+
+            search_model = SearchModel.get_for_model(instance=instance)
+
+            instance_data = search_model.populate(
+                exclude_kwargs=exclude_kwargs, exclude_model=exclude_model,
+                instance=instance, search_backend=self
+            )
+
+            field_name_list = self._get_full_text_search_field_name_list(
+                search_model=search_model
+            )
+
+            SearchFullTextEntry.objects.instances_update(
+                instance_values={
+                    instance.pk: self._get_full_text_search_values(
+                        field_name_list=field_name_list,
+                        instance_data=instance_data
+                    )
+                }, search_model=search_model
+            )
+
+    def index_instances(self, search_model, id_list):
+        if self._get_full_text_search_vendor():
+            SearchFullTextEntry = apps.get_model(
+                app_label='dynamic_search', model_name='SearchFullTextEntry'
+            )
+
+            field_name_list = self._get_full_text_search_field_name_list(
+                search_model=search_model
+            )
+
+            queryset = search_model.get_queryset().filter(pk__in=id_list)
+
+            instance_values = {}
+
+            populate_generator = search_model.populate_bulk(
+                queryset=queryset, search_backend=self
+            )
+            for instance, instance_data in populate_generator:
+                instance_values[
+                    instance.pk
+                ] = self._get_full_text_search_values(
+                    field_name_list=field_name_list,
+                    instance_data=instance_data
+                )
+
+            SearchFullTextEntry.objects.instances_update(
+                instance_values=instance_values, search_model=search_model
+            )
+
+    def reset(self, search_model=None):
+        SearchFullTextEntry = apps.get_model(
+            app_label='dynamic_search', model_name='SearchFullTextEntry'
+        )
+
+        queryset = SearchFullTextEntry.objects.all()
+
+        if search_model:
+            queryset = queryset.filter(
+                search_model_name=search_model.full_name
+            )
+            self.__class__._full_text_search_populated.discard(
+                search_model.full_name
+            )
+        else:
+            self.__class__._full_text_search_populated.clear()
+
+        queryset.delete()
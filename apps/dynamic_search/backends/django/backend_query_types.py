@@ -50,6 +50,12 @@ class BackendQueryTypeExact(BackendQueryType):
                 if self.is_quoted_value and self.value == '':
                     lookup_template = '{field_name}__exact'
                     value_template = '{}'
+                elif self.search_backend.get_full_text_search_field_enabled(
+                    search_field=self.search_field
+                ):
+                    return self.search_backend.get_full_text_search_query(
+                        search_field=self.search_field, value=self.value
+                    )
                 else:
                     lookup_template = '{field_name}_clean__iregex'
                     if connection.vendor == 'postgresql':
@@ -91,7 +97,7 @@ class BackendQueryFuzzy(BackendQueryType):
             for entry in fuzzy_options[:MAXIMUM_FUZZY_OPTIONS]:
                 backend_query_type = BackendQueryTypeExact(
                     is_quoted_value=self.is_quoted_value,
-                    search_backend=self.search_field,
+                    search_backend=self.search_backend,
                     search_field=self.search_field, value=entry,
                     extra_kwargs=self.extra_kwargs
                 )
@@ -167,6 +173,16 @@ class BackendQueryTypePartial(BackendQueryType):
 
     def do_resolve(self):
         if self.value is not None:
+            is_full_text_search_enabled = self.search_backend.get_full_text_search_field_enabled(
+                search_field=self.search_field
+            )
+
+            if is_full_text_search_enabled:
+                return self.search_backend.get_full_text_search_query(
+                    is_prefix=True, search_field=self.search_field,
+                    value=self.value
+                )
+
             return Q(
                 **{
                     '{field_name}_clean__icontains'.format(
@@ -0,0 +1,132 @@
+import re
+
+from django.db.models import BooleanField, F, Func, Q, Value
+from django.db.models.expressions import RawSQL
+
+from .literals import (
+    FULL_TEXT_SEARCH_POSTGRESQL_CONDITION_ARGUMENT_JOINER,
+    FULL_TEXT_SEARCH_POSTGRESQL_CONDITION_TEMPLATE,
+    FULL_TEXT_SEARCH_SQLITE_CONDITION, FULL_TEXT_SEARCH_SQLITE_TABLE_NAME,
+    FULL_TEXT_SEARCH_TOKEN_REGEX
+)
+
+
+class FullTextSearchVendor:
+    """
+    Database specific full text search conditions. Values are reduced to
+    their alphanumeric tokens before being converted to the query syntax
+    of the database. This avoids escaping and syntax errors from user
+    provided values.
+    """
+    _registry = {}
+    vendor = None
+
+    @classmethod
+    def get(cls, connection):
+        return cls._registry[connection.vendor](connection=connection)
+
+    @classmethod
+    def register(cls, klass):
+        cls._registry[klass.vendor] = klass
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def get_condition(self, table_name, value, is_prefix=False):
+        """
+        Return a filter of the rows of the full text entry table
+        containing all the tokens of the value or None if the value has
+        no tokens. `is_prefix` matches tokens that start with each of the
+        value tokens, otherwise the tokens must appear consecutively.
+        """
+        tokens = re.findall(
+            pattern=FULL_TEXT_SEARCH_TOKEN_REGEX, string=str(value)
+        )
+
+        if tokens:
+            return self.get_condition_expression(
+                query_string=self.get_query_string(
+                    is_prefix=is_prefix, tokens=tokens
+                ), table_name=table_name
+            )
+
+    def get_condition_expression(self, query_string, table_name):
+        """
+        The entry table is aliased when the filter is used in a subquery,
+        the filter must not reference the columns by the table name.
+        """
+        raise NotImplementedError
+
+    def get_query_string(self, tokens, is_prefix):
+        raise NotImplementedError
+
+    def is_available(self, table_name):
+        return True
+
+
+class FullTextSearchVendorPostgreSQL(FullTextSearchVendor):
+    vendor = 'postgresql'
+
+    def get_condition_expression(self, query_string, table_name):
+        # Matches the expression of the index of the entry table.
+        return Func(
+            F('value'), Value(query_string),
+            arg_joiner=FULL_TEXT_SEARCH_POSTGRESQL_CONDITION_ARGUMENT_JOINER,
+            output_field=BooleanField(),
+            template=FULL_TEXT_SEARCH_POSTGRESQL_CONDITION_TEMPLATE
+        )
+
+    def get_query_string(self, tokens, is_prefix):
+        if is_prefix:
+            return ' & '.join(
+                '{}:*'.format(token) for token in tokens
+            )
+        else:
+            return ' <-> '.join(tokens)
+
+
+class FullTextSearchVendorSQLite(FullTextSearchVendor):
+    _availability = {}
+    vendor = 'sqlite'
+
+    def get_condition_expression(self, query_string, table_name):
+        return Q(
+            pk__in=RawSQL(
+                params=(query_string,),
+                sql=FULL_TEXT_SEARCH_SQLITE_CONDITION.format(
+                    table_fts=FULL_TEXT_SEARCH_SQLITE_TABLE_NAME.format(
+                        table_name
+                    )
+                )
+            )
+        )
+
+    def get_query_string(self, tokens, is_prefix):
+        if is_prefix:
+            return ' '.join(
+                '"{}"*'.format(token) for token in tokens
+            )
+        else:
+            return '"{}"'.format(
+                ' '.join(tokens)
+            )
+
+    def is_available(self, table_name):
+        # The full text table is not created when SQLite is compiled
+        # without the FTS5 extension.
+        key = (self.connection.alias, table_name)
+
+        try:
+            return self.__class__._availability[key]
+        except KeyError:
+            result = FULL_TEXT_SEARCH_SQLITE_TABLE_NAME.format(
+                table_name
+            ) in self.connection.introspection.table_names()
+
+            self.__class__._availability[key] = result
+
+            return result
+
+
+FullTextSearchVendor.register(klass=FullTextSearchVendorPostgreSQL)
+FullTextSearchVendor.register(klass=FullTextSearchVendorSQLite)
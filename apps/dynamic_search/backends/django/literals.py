@@ -142,4 +142,19 @@ DJANGO_TO_DJANGO_FIELD_MAP = {
     }
 }
 
+FULL_TEXT_SEARCH_FIELD_TYPES = (
+    models.CharField, models.EmailField, models.TextField
+)
+FULL_TEXT_SEARCH_POSTGRESQL_CONDITION_ARGUMENT_JOINER = (
+    ') @@ to_tsquery(\'simple\'::regconfig, '
+)
+FULL_TEXT_SEARCH_POSTGRESQL_CONDITION_TEMPLATE = (
+    'to_tsvector(\'simple\'::regconfig, %(expressions)s)'
+)
+FULL_TEXT_SEARCH_SQLITE_CONDITION = (
+    'SELECT rowid FROM {table_fts} WHERE {table_fts} MATCH %s'
+)
+FULL_TEXT_SEARCH_SQLITE_TABLE_NAME = '{}_fts'
+FULL_TEXT_SEARCH_TOKEN_REGEX = r'[^\W_]+'
+
 MAXIMUM_FUZZY_OPTIONS = 50
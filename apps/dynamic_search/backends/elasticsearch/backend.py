@@ -1,35 +1,222 @@
 from collections import deque
+import atexit
 import functools
+import logging
+import os
+import threading
 
 import elasticsearch
 from elasticsearch import Elasticsearch, helpers
-from elasticsearch_dsl import Search
+from elasticsearch_dsl import Q, Search
 
 from ...exceptions import (
-    DynamicSearchBackendException, DynamicSearchValueTransformationError
+    DynamicSearchBackendException, DynamicSearchRetry,
+    DynamicSearchValueTransformationError
 )
 from ...search_backends import SearchBackend
 from ...search_fields import SearchFieldVirtualAllFields
 from ...search_models import SearchModel
 
 from .literals import (
+    BULK_ACTION_RETRY_STATUS_CODES,
+    DEFAULT_ELASTICSEARCH_BULK_BUFFER_FLUSH_INTERVAL,
+    DEFAULT_ELASTICSEARCH_BULK_BUFFER_SIZE,
     DEFAULT_ELASTICSEARCH_CLIENT_MAXSIZE,
     DEFAULT_ELASTICSEARCH_CLIENT_SNIFF_ON_CONNECTION_FAIL,
     DEFAULT_ELASTICSEARCH_CLIENT_SNIFF_ON_START,
     DEFAULT_ELASTICSEARCH_CLIENT_SNIFFER_TIMEOUT, DEFAULT_ELASTICSEARCH_HOST,
     DEFAULT_ELASTICSEARCH_CLIENT_VERIFY_CERTS,
     DEFAULT_ELASTICSEARCH_INDICES_NAMESPACE,
+    DEFAULT_ELASTICSEARCH_MAX_RESULT_WINDOW,
     DEFAULT_ELASTICSEARCH_SEARCH_PAGE_SIZE,
     DJANGO_TO_ELASTICSEARCH_FIELD_MAP, MAXIMUM_API_ATTEMPT_COUNT
 )
 
+logger = logging.getLogger(name=__name__)
+
+
+class ElasticSearchBulkBuffer:
+    """
+    Accumulate index and delete actions and send them to the server
+    with the bulk API. The buffer is sent when it reaches its size or
+    when the flush interval elapses after the first action is added.
+    Actions that fail with a transient error are placed back in the
+    buffer. Explicit flushes raise DynamicSearchRetry to the caller. The
+    buffer holds the actions of several callers, so the sends triggered
+    by adding an action do not raise and leave the retry to the timer.
+    """
+    _registry = []
+
+    @classmethod
+    def flush_all(cls):
+        process_id = os.getpid()
+
+        for bulk_buffer in cls._registry:
+            # Buffers inherited from a parent process are sent by the
+            # parent.
+            if bulk_buffer.process_id == process_id:
+                try:
+                    bulk_buffer.flush()
+                except DynamicSearchRetry as exception:
+                    logger.error(
+                        'Unable to send %d search index bulk actions at '
+                        'exit; %s', len(bulk_buffer.actions), exception
+                    )
+
+    def __init__(self, client, flush_interval, size):
+        self.actions = []
+        self.client = client
+        self.flush_interval = flush_interval
+        self.lock = threading.Lock()
+        self.process_id = os.getpid()
+        self.size = size
+        self.timer = None
+
+        self.__class__._registry.append(self)
+
+    def _flush_timer(self):
+        try:
+            self.flush()
+        except DynamicSearchRetry as exception:
+            logger.warning(
+                'Unable to send the search index bulk actions, retrying '
+                'in %d seconds; %s', self.flush_interval, exception
+            )
+
+    def _pop(self):
+        # Must be called with the lock held.
+        actions = self.actions
+        self.actions = []
+
+        if self.timer:
+            self.timer.cancel()
+            self.timer = None
+
+        return actions
+
+    def _requeue(self, actions):
+        """
+        Place failed actions back at the front of the buffer to be sent
+        again by the next flush.
+        """
+        with self.lock:
+            self.actions[0:0] = actions
+            self._timer_start()
+
+    def _send(self, actions):
+        """
+        Send the actions and return the list of the actions that failed
+        with a transient error.
+        """
+        action_dictionary = {
+            (action['_index'], str(action['_id'])): action
+            for action in actions
+        }
+        actions_failed = []
+
+        try:
+            bulk_generator = helpers.streaming_bulk(
+                actions=actions, client=self.client, raise_on_error=False,
+                yield_ok=False
+            )
+
+            for is_ok, item in bulk_generator:
+                ((operation_type, result),) = item.items()
+
+                if operation_type == 'delete' and result.get('status') == 404:
+                    # Instances that were never indexed.
+                    continue
+
+                if result.get('status') in BULK_ACTION_RETRY_STATUS_CODES:
+                    actions_failed.append(
+                        action_dictionary[
+                            (result['_index'], str(result['_id']))
+                        ]
+                    )
+                else:
+                    logger.error(
+                        'Search index bulk action failed; %s', item
+                    )
+        except elasticsearch.exceptions.TransportError as exception:
+            logger.warning(
+                'Unable to send %d search index bulk actions; %s',
+                len(actions), exception
+            )
+            # Actions are idempotent, resend all of them.
+            return actions
+
+        return actions_failed
+
+    def _timer_start(self):
+        # Must be called with the lock held.
+        if not self.timer:
+            self.timer = threading.Timer(
+                function=self._flush_timer, interval=self.flush_interval
+            )
+            self.timer.daemon = True
+            self.timer.start()
+
+    def add(self, action):
+        with self.lock:
+            self.actions.append(action)
+
+            if len(self.actions) >= self.size:
+                actions = self._pop()
+            else:
+                actions = None
+                self._timer_start()
+
+        if actions:
+            actions_failed = self._send(actions=actions)
+
+            if actions_failed:
+                self._requeue(actions=actions_failed)
+
+                logger.warning(
+                    'Unable to send %d search index bulk actions, retrying '
+                    'in %d seconds.', len(actions_failed),
+                    self.flush_interval
+                )
+
+    def flush(self):
+        with self.lock:
+            actions = self._pop()
+
+        if actions:
+            self.send(actions=actions)
+
+    def send(self, actions):
+        actions_failed = self._send(actions=actions)
+
+        if actions_failed:
+            self._requeue(actions=actions_failed)
+
+            raise DynamicSearchRetry(
+                'Unable to send {} search index bulk actions.'.format(
+                    len(actions_failed)
+                )
+            )
+
 
 class ElasticSearchBackend(SearchBackend):
+    """
+    The client and the bulk buffer are shared by all the backend instances
+    of a process that use the same client arguments. They are recreated
+    after a fork to avoid sharing connections between processes.
+    """
+    _bulk_buffers = {}
+    _clients = {}
+    _clients_lock = threading.Lock()
+
     feature_reindex = True
+    feature_reindex_shadow = True
     field_type_mapping = DJANGO_TO_ELASTICSEARCH_FIELD_MAP
 
     def __init__(
-        self, client_http_auth=None, client_host=DEFAULT_ELASTICSEARCH_HOST,
+        self,
+        bulk_buffer_flush_interval=DEFAULT_ELASTICSEARCH_BULK_BUFFER_FLUSH_INTERVAL,
+        bulk_buffer_size=DEFAULT_ELASTICSEARCH_BULK_BUFFER_SIZE,
+        client_http_auth=None, client_host=DEFAULT_ELASTICSEARCH_HOST,
         client_hosts=None,
         client_maxsize=DEFAULT_ELASTICSEARCH_CLIENT_MAXSIZE,
         client_port=None, client_scheme=None,
@@ -38,11 +225,15 @@ class ElasticSearchBackend(SearchBackend):
         client_sniffer_timeout=DEFAULT_ELASTICSEARCH_CLIENT_SNIFFER_TIMEOUT,
         client_verify_certs=DEFAULT_ELASTICSEARCH_CLIENT_VERIFY_CERTS,
         indices_namespace=DEFAULT_ELASTICSEARCH_INDICES_NAMESPACE,
+        max_result_window=DEFAULT_ELASTICSEARCH_MAX_RESULT_WINDOW,
         **kwargs
     ):
         super().__init__(**kwargs)
 
+        self.bulk_buffer_flush_interval = bulk_buffer_flush_interval
+        self.bulk_buffer_size = bulk_buffer_size
         self.indices_namespace = indices_namespace
+        self.max_result_window = max_result_window
 
         self.client_kwargs = {
             'hosts': client_hosts or (client_host,),
@@ -55,6 +246,7 @@ class ElasticSearchBackend(SearchBackend):
         }
 
         if self._test_mode:
+            self.bulk_buffer_size = 0
             self.indices_namespace = 'mayan-test'
 
     def do_search_execute(self, index_name, search):
@@ -102,12 +294,72 @@ class ElasticSearchBackend(SearchBackend):
                 'it already existed.'
             ) from exception
 
+    def _get_bulk_buffer(self):
+        """
+        Return the shared bulk buffer or None if buffering is disabled.
+        """
+        if self.bulk_buffer_size:
+            key = self._get_client_key()
+
+            with self.__class__._clients_lock:
+                try:
+                    bulk_buffer = self.__class__._bulk_buffers[key]
+                except KeyError:
+                    bulk_buffer = ElasticSearchBulkBuffer(
+                        client=self._get_client(),
+                        flush_interval=self.bulk_buffer_flush_interval,
+                        size=self.bulk_buffer_size
+                    )
+                    self.__class__._bulk_buffers[key] = bulk_buffer
+
+            return bulk_buffer
+
     def _get_client(self):
-        return Elasticsearch(**self.client_kwargs)
+        key = self._get_client_key()
+
+        # Double checked to avoid taking the lock on each call.
+        try:
+            return self.__class__._clients[key]
+        except KeyError:
+            with self.__class__._clients_lock:
+                try:
+                    client = self.__class__._clients[key]
+                except KeyError:
+                    client = Elasticsearch(**self.client_kwargs)
+                    self.__class__._clients[key] = client
+
+            return client
+
+    def _get_client_key(self):
+        return (
+            os.getpid(), repr(
+                sorted(
+                    self.client_kwargs.items()
+                )
+            )
+        )
+
+    def _get_index_list(self, index_name):
+        """
+        Return the concrete indices of an index name. Index names become
+        aliases after shadow indices are activated.
+        """
+        client = self._get_client()
+
+        try:
+            return tuple(
+                client.indices.get_alias(name=index_name).keys()
+            )
+        except elasticsearch.exceptions.NotFoundError:
+            if client.indices.exists(index=index_name):
+                return (index_name,)
+            else:
+                return ()
 
-    def _get_index_name(self, search_model):
+    def _get_index_name(self, search_model, indices_namespace=None):
         return '{}-{}'.format(
-            self.indices_namespace, search_model.model_name.lower()
+            indices_namespace or self.indices_namespace,
+            search_model.model_name.lower()
         )
 
     @functools.cache
@@ -127,6 +379,9 @@ class ElasticSearchBackend(SearchBackend):
 
         return mappings
 
+    def _get_shadow_indices_namespace(self, name):
+        return '{}-{}'.format(self.indices_namespace, name)
+
     def _get_status(self):
         client = self._get_client()
         result = []
@@ -154,6 +409,15 @@ class ElasticSearchBackend(SearchBackend):
 
         return '\n'.join(result)
 
+    def _index_delete(self, index_name):
+        client = self._get_client()
+
+        for index in self._get_index_list(index_name=index_name):
+            try:
+                client.indices.delete(index=index)
+            except elasticsearch.exceptions.NotFoundError:
+                """Ignore indices deleted in the meantime."""
+
     def _initialize(self):
         self._update_mappings()
 
@@ -217,6 +481,71 @@ class ElasticSearchBackend(SearchBackend):
                         index_name=index_name, search=search
                     )
 
+    def _search_page(
+        self, search_field, query_type, value, limit, offset=0,
+        is_quoted_value=False, is_raw_value=False
+    ):
+        self.do_query_type_verify(
+            query_type=query_type, search_field=search_field
+        )
+
+        if isinstance(search_field, SearchFieldVirtualAllFields):
+            search_fields = search_field.field_composition
+        else:
+            search_fields = (search_field,)
+
+        search_field_queries = []
+
+        for search_field in search_fields:
+            try:
+                search_field_query = query_type.resolve_for_backend(
+                    is_quoted_value=is_quoted_value,
+                    is_raw_value=is_raw_value, search_backend=self,
+                    search_field=search_field, value=value
+                )
+            except DynamicSearchValueTransformationError:
+                """Skip the search field."""
+            else:
+                if search_field_query is not None:
+                    search_field_queries.append(search_field_query)
+
+        if not search_field_queries:
+            return []
+
+        # The server rejects pages that end past the maximum result window
+        # of the index. Clamp the page to the window, results beyond it
+        # are not reachable by paging.
+        if offset >= self.max_result_window:
+            return []
+
+        limit = min(limit, self.max_result_window - offset)
+
+        index_name = self._get_index_name(
+            search_model=search_field.search_model
+        )
+
+        # Use a query context instead of a filter context to have the
+        # results scored and sorted by relevance.
+        search = Search(index=index_name, using=self._get_client())
+        search = search.query(
+            Q(
+                'bool', minimum_should_match=1, should=search_field_queries
+            )
+        )
+        search = search.source(False)
+        search = search[offset:offset + limit]
+
+        try:
+            response = search.execute()
+        except elasticsearch.exceptions.NotFoundError as exception:
+            raise DynamicSearchBackendException(
+                'Index not found. Make sure the search engine '
+                'was properly initialized or upgraded if '
+                'it already existed.'
+            ) from exception
+
+        return [hit.meta.id for hit in response]
+
     def _update_mappings(self, search_model=None):
         client = self._get_client()
 
@@ -232,13 +561,7 @@ class ElasticSearchBackend(SearchBackend):
                 search_model=search_model
             )
 
-            try:
-                client.indices.delete(index=index_name)
-            except elasticsearch.exceptions.NotFoundError:
-                """
-                Non fatal, might be that this is the first time
-                the method is executed. Proceed.
-                """
+            self._index_delete(index_name=index_name)
 
             try:
                 client.indices.create(
@@ -267,12 +590,47 @@ class ElasticSearchBackend(SearchBackend):
 
     def deindex_instance(self, instance):
         search_model = SearchModel.get_for_model(instance=instance)
-        client = self._get_client()
-        client.delete(
-            id=instance.pk,
-            index=self._get_index_name(search_model=search_model)
+        index_name = self._get_index_name(search_model=search_model)
+
+        bulk_buffer = self._get_bulk_buffer()
+
+        if bulk_buffer:
+            bulk_buffer.add(
+                action={
+                    '_id': instance.pk, '_index': index_name,
+                    '_op_type': 'delete'
+                }
+            )
+        else:
+            client = self._get_client()
+            client.delete(id=instance.pk, index=index_name)
+
+    def deindex_instances(self, search_model, id_list):
+        index_name = self._get_index_name(search_model=search_model)
+
+        actions = (
+            {
+                '_id': instance_id, '_index': index_name,
+                '_op_type': 'delete'
+            } for instance_id in id_list
         )
 
+        bulk_generator = helpers.streaming_bulk(
+            actions=actions, client=self._get_client(),
+            raise_on_error=False, yield_ok=False
+        )
+
+        for is_ok, item in bulk_generator:
+            # Instances that were never indexed return a not found error.
+            logger.debug('Search index delete action failed; %s', item)
+
+    def get_shadow_kwargs(self, name):
+        return {
+            'indices_namespace': self._get_shadow_indices_namespace(
+                name=name
+            )
+        }
+
     def index_instance(
         self, instance, exclude_model=None, exclude_kwargs=None
     ):
@@ -282,10 +640,19 @@ class ElasticSearchBackend(SearchBackend):
             exclude_kwargs=exclude_kwargs, exclude_model=exclude_model,
             instance=instance, search_backend=self
         )
-        self._get_client().index(
-            index=self._get_index_name(search_model=search_model),
-            id=instance.pk, document=document
-        )
+        index_name = self._get_index_name(search_model=search_model)
+
+        bulk_buffer = self._get_bulk_buffer()
+
+        if bulk_buffer:
+            document.update(
+                {'_id': instance.pk, '_index': index_name}
+            )
+            bulk_buffer.add(action=document)
+        else:
+            self._get_client().index(
+                index=index_name, id=instance.pk, document=document
+            )
 
     def index_instances(self, search_model, id_list):
         client = self._get_client()
@@ -296,10 +663,11 @@ class ElasticSearchBackend(SearchBackend):
 
             queryset = queryset.filter(pk__in=id_list)
 
-            for instance in queryset:
-                kwargs = search_model.populate(
-                    search_backend=self, instance=instance
-                )
+            populate_generator = search_model.populate_bulk(
+                queryset=queryset, search_backend=self
+            )
+
+            for instance, kwargs in populate_generator:
                 kwargs['_id'] = kwargs['id']
 
                 yield kwargs
@@ -312,6 +680,11 @@ class ElasticSearchBackend(SearchBackend):
         deque(iterable=bulk_indexing_generator, maxlen=0)
 
     def refresh(self):
+        bulk_buffer = self._get_bulk_buffer()
+
+        if bulk_buffer:
+            bulk_buffer.flush()
+
         attempt_count = 0
         client = self._get_client()
         search_model_index = 0
@@ -343,18 +716,78 @@ class ElasticSearchBackend(SearchBackend):
         self.tear_down(search_model=search_model)
         self._update_mappings(search_model=search_model)
 
-    def tear_down(self, search_model=None):
+    def shadow_activate(self, name):
+        """
+        Point the index name of each search model to its shadow index.
+        All the alias changes are applied in a single atomic request. The
+        previous indices are deleted afterwards.
+        """
         client = self._get_client()
+        indices_namespace = self._get_shadow_indices_namespace(name=name)
+
+        actions = []
+        index_list_previous = []
+
+        for search_model in SearchModel.all():
+            index_name = self._get_index_name(search_model=search_model)
 
+            for index_previous in self._get_index_list(index_name=index_name):
+                if index_previous == index_name:
+                    # An index with the name of the alias must be removed
+                    # in the same request that creates the alias.
+                    actions.append(
+                        {'remove_index': {'index': index_previous}}
+                    )
+                else:
+                    actions.append(
+                        {
+                            'remove': {
+                                'alias': index_name, 'index': index_previous
+                            }
+                        }
+                    )
+                    index_list_previous.append(index_previous)
+
+            actions.append(
+                {
+                    'add': {
+                        'alias': index_name,
+                        'index': self._get_index_name(
+                            indices_namespace=indices_namespace,
+                            search_model=search_model
+                        )
+                    }
+                }
+            )
+
+        client.indices.update_aliases(
+            body={'actions': actions}
+        )
+
+        for index_previous in index_list_previous:
+            self._index_delete(index_name=index_previous)
+
+    def shadow_delete(self, name):
+        indices_namespace = self._get_shadow_indices_namespace(name=name)
+
+        for search_model in SearchModel.all():
+            self._index_delete(
+                index_name=self._get_index_name(
+                    indices_namespace=indices_namespace,
+                    search_model=search_model
+                )
+            )
+
+    def tear_down(self, search_model=None):
         if search_model:
             search_models = (search_model,)
         else:
             search_models = SearchModel.all()
 
         for search_model in search_models:
-            try:
-                client.indices.delete(
-                    index=self._get_index_name(search_model=search_model)
-                )
-            except elasticsearch.exceptions.NotFoundError:
-                """Ignore non existent indexes."""
+            self._index_delete(
+                index_name=self._get_index_name(search_model=search_model)
+            )
+
+
+atexit.register(ElasticSearchBulkBuffer.flush_all)
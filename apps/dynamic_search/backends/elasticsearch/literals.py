@@ -17,6 +17,12 @@ from ...value_transformations import (
     ValueTransformationToString
 )
 
+# Bulk action errors that are retried: too many requests and server side
+# unavailability.
+BULK_ACTION_RETRY_STATUS_CODES = (429, 502, 503, 504)
+
+DEFAULT_ELASTICSEARCH_BULK_BUFFER_FLUSH_INTERVAL = 1  # 1 second.
+DEFAULT_ELASTICSEARCH_BULK_BUFFER_SIZE = 0
 DEFAULT_ELASTICSEARCH_CLIENT_MAXSIZE = 10
 DEFAULT_ELASTICSEARCH_CLIENT_SNIFF_ON_START = False
 DEFAULT_ELASTICSEARCH_CLIENT_SNIFF_ON_CONNECTION_FAIL = False
@@ -24,6 +30,8 @@ DEFAULT_ELASTICSEARCH_CLIENT_SNIFFER_TIMEOUT = None
 DEFAULT_ELASTICSEARCH_CLIENT_VERIFY_CERTS = True
 DEFAULT_ELASTICSEARCH_HOST = 'http://127.0.0.1:9200'
 DEFAULT_ELASTICSEARCH_INDICES_NAMESPACE = 'mayan'
+# Must match the `index.max_result_window` setting of the indices.
+DEFAULT_ELASTICSEARCH_MAX_RESULT_WINDOW = 10000
 DEFAULT_ELASTICSEARCH_SEARCH_PAGE_SIZE = 10000
 
 """
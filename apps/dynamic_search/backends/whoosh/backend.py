@@ -1,6 +1,8 @@
+from contextlib import contextmanager
 import functools
 import logging
 from pathlib import Path
+import shutil
 
 import whoosh
 from whoosh import qparser
@@ -8,13 +10,11 @@ from whoosh.filedb.filestore import FileStorage
 from whoosh.index import EmptyIndexError
 from whoosh.qparser import MultifieldParser, OrGroup
 from whoosh.query import Every
-from whoosh.writing import BufferedWriter
 
 from django.conf import settings
 
 from mayan.apps.common.utils import any_to_bool
 from mayan.apps.lock_manager.backends.base import LockingBackend
-from mayan.apps.lock_manager.exceptions import LockError
 from mayan.apps.storage.utils import TemporaryDirectory
 
 from ...exceptions import (
@@ -26,21 +26,32 @@ from ...search_fields import SearchFieldVirtualAllFields
 from ...search_models import SearchModel
 
 from .literals import (
-    DJANGO_TO_WHOOSH_FIELD_MAP, TEXT_LOCK_INSTANCE_DEINDEX,
-    TEXT_LOCK_INSTANCE_INDEX, WHOOSH_INDEX_DIRECTORY_NAME
+    DJANGO_TO_WHOOSH_FIELD_MAP, TEXT_LOCK_INDEX_WRITE,
+    WHOOSH_INDEX_DIRECTORY_NAME, WHOOSH_INDEX_DIRECTORY_PREVIOUS_NAME,
+    WHOOSH_INDEX_DIRECTORY_SHADOW_NAME,
+    WHOOSH_INDEX_WRITER_LOCK_OPTIMIZE_TIMEOUT
 )
 
 logger = logging.getLogger(name=__name__)
 
 
 class WhooshSearchBackend(SearchBackend):
+    """
+    Each search model has its own index and its own write lock, models are
+    indexed in parallel. `writer_commit_merge` set to False skips the
+    segment merge on each commit, segments are then merged when the
+    backend is optimized. Shadow indices are sibling directories of the
+    index directory.
+    """
     _local_attribute_backend_temporary_directory = None
     feature_reindex = True
+    feature_reindex_shadow = True
     field_type_mapping = DJANGO_TO_WHOOSH_FIELD_MAP
 
     def __init__(
-        self, index_path=None, writer_limitmb=128, writer_multisegment=False,
-        writer_procs=1, **kwargs
+        self, index_path=None, writer_commit_merge=True,
+        writer_commit_optimize=False, writer_limitmb=128,
+        writer_multisegment=False, writer_procs=1, **kwargs
     ):
         super().__init__(**kwargs)
 
@@ -64,6 +75,10 @@ class WhooshSearchBackend(SearchBackend):
         if writer_procs:
             writer_procs = int(writer_procs)
 
+        self.writer_commit_kwargs = {
+            'merge': any_to_bool(value=writer_commit_merge),
+            'optimize': any_to_bool(value=writer_commit_optimize)
+        }
         self.writer_kwargs = {
             'limitmb': writer_limitmb, 'multisegment': writer_multisegment,
             'procs': writer_procs
@@ -116,47 +131,14 @@ class WhooshSearchBackend(SearchBackend):
 
         return whoosh.fields.Schema(**schema_kwargs)
 
-    def _get_status(self):
-        result = []
-
-        title = 'Whoosh search model indexing status'
-        result.append(title)
-        result.append(
-            len(title) * '='
-        )
-
-        for search_model in SearchModel.all():
-            index = self._get_or_create_index(search_model=search_model)
-
-            with index.searcher() as searcher:
-                search_results = searcher.search(
-                    q=Every('id')
-                )
-
-                result.append(
-                    '{}: {}'.format(
-                        search_model.label, search_results.estimated_length()
-                    )
-                )
-
-        return '\n'.join(result)
-
-    def _get_storage(self):
-        return FileStorage(path=self.index_path)
-
-    def _get_writer(self, search_model):
-        index = self._get_or_create_index(search_model=search_model)
-
-        return index.writer(**self.writer_kwargs)
-
-    def _initialize(self):
-        if not settings.COMMON_DISABLE_LOCAL_STORAGE:
-            self.index_path.mkdir(exist_ok=True)
-
-    def _search(
+    def _get_search_query(
         self, search_field, query_type, value, is_quoted_value=False,
         is_raw_value=False
     ):
+        """
+        Return the index and the parsed query of a search field or None if
+        there is nothing to search.
+        """
         self.do_query_type_verify(
             query_type=query_type, search_field=search_field
         )
@@ -208,19 +190,129 @@ class WhooshSearchBackend(SearchBackend):
                         }
                     )
                 except DynamicSearchValueTransformationError:
-                    return ()
+                    return None
                 else:
                     if search_string is None:
-                        return ()
+                        return None
 
                 logger.debug('search_string: %s', search_string)
 
                 query = parser.parse(text=search_string)
 
+            return index, query
+
+    def _get_shadow_path(self, name):
+        return self.index_path.with_name(
+            WHOOSH_INDEX_DIRECTORY_SHADOW_NAME.format(
+                self.index_path.name, name
+            )
+        )
+
+    def _get_status(self):
+        result = []
+
+        title = 'Whoosh search model indexing status'
+        result.append(title)
+        result.append(
+            len(title) * '='
+        )
+
+        for search_model in SearchModel.all():
+            index = self._get_or_create_index(search_model=search_model)
+
+            with index.searcher() as searcher:
+                search_results = searcher.search(
+                    q=Every('id')
+                )
+
+                result.append(
+                    '{}: {}'.format(
+                        search_model.label, search_results.estimated_length()
+                    )
+                )
+
+        return '\n'.join(result)
+
+    def _get_storage(self):
+        return FileStorage(path=self.index_path)
+
+    @contextmanager
+    def _get_writer(
+        self, search_model, commit_kwargs=None, lock_timeout=None
+    ):
+        """
+        Hold the write lock of the search model index while the writer
+        is open. The changes are committed when the context exits without
+        errors.
+        """
+        lock = LockingBackend.get_backend().acquire_lock(
+            name=TEXT_LOCK_INDEX_WRITE.format(search_model.full_name),
+            timeout=lock_timeout
+        )
+
+        try:
+            index = self._get_or_create_index(search_model=search_model)
+
+            try:
+                writer = index.writer(**self.writer_kwargs)
+            except whoosh.index.LockError:
+                raise DynamicSearchRetry
+
+            try:
+                yield writer
+            except Exception:
+                writer.cancel()
+                raise
+            else:
+                writer.commit(
+                    **(commit_kwargs or self.writer_commit_kwargs)
+                )
+        finally:
+            lock.release()
+
+    def _initialize(self):
+        if not settings.COMMON_DISABLE_LOCAL_STORAGE:
+            self.index_path.mkdir(exist_ok=True)
+
+    def _search(
+        self, search_field, query_type, value, is_quoted_value=False,
+        is_raw_value=False
+    ):
+        result = self._get_search_query(
+            is_quoted_value=is_quoted_value, is_raw_value=is_raw_value,
+            query_type=query_type, search_field=search_field, value=value
+        )
+
+        if result:
+            index, query = result
             return self._do_query_resolve(index=index, query=query)
         else:
             return ()
 
+    def _search_page(
+        self, search_field, query_type, value, limit, offset=0,
+        is_quoted_value=False, is_raw_value=False
+    ):
+        result = self._get_search_query(
+            is_quoted_value=is_quoted_value, is_raw_value=is_raw_value,
+            query_type=query_type, search_field=search_field, value=value
+        )
+
+        if result:
+            index, query = result
+
+            with index.searcher() as searcher:
+                # Whoosh only scores the top `limit` documents.
+                results = searcher.search(limit=offset + limit, q=query)
+
+                return [
+                    int(
+                        hit['id']
+                    ) for hit in results[offset:]
+                ]
+        else:
+            return []
+
     def _update_mappings(self, search_model=None):
         if search_model:
             search_models = (search_model,)
@@ -232,24 +324,19 @@ class WhooshSearchBackend(SearchBackend):
                 self._get_or_create_index(search_model=search_model)
 
     def deindex_instance(self, instance):
-        try:
-            lock = LockingBackend.get_backend().acquire_lock(
-                name=TEXT_LOCK_INSTANCE_DEINDEX
-            )
-        except LockError:
-            raise
-        else:
-            try:
-                search_model = SearchModel.get_for_model(instance=instance)
-                index = self._get_or_create_index(search_model=search_model)
+        search_model = SearchModel.get_for_model(instance=instance)
 
-                if not settings.COMMON_DISABLE_LOCAL_STORAGE:
-                    with index.writer(**self.writer_kwargs) as writer:
-                        writer.delete_by_term(
-                            'id', str(instance.pk)
-                        )
-            finally:
-                lock.release()
+        self.deindex_instances(
+            id_list=(instance.pk,), search_model=search_model
+        )
+
+    def deindex_instances(self, search_model, id_list):
+        if not settings.COMMON_DISABLE_LOCAL_STORAGE:
+            with self._get_writer(search_model=search_model) as writer:
+                for instance_id in id_list:
+                    writer.delete_by_term(
+                        'id', str(instance_id)
+                    )
 
     def do_native_type_conversion(self, value):
         if isinstance(value, (list, tuple)):
@@ -257,142 +344,183 @@ class WhooshSearchBackend(SearchBackend):
         else:
             return value
 
-    def index_instance(self, instance, exclude_model=None, exclude_kwargs=None):
-        try:
-            lock = LockingBackend.get_backend().acquire_lock(
-                name=TEXT_LOCK_INSTANCE_INDEX
+    def get_shadow_kwargs(self, name):
+        return {
+            'index_path': str(
+                self._get_shadow_path(name=name)
             )
-        except LockError:
-            raise
-        else:
-            try:
-                search_model = SearchModel.get_for_model(instance=instance)
-                if not settings.COMMON_DISABLE_LOCAL_STORAGE:
-                    with self._get_writer(search_model=search_model) as writer:
-                        try:
-                            writer.delete_by_term(
-                                'id', str(instance.pk)
-                            )
-                        except Exception as exception:
-                            # The parenthesis is used to define a multi
-                            # line error message not a translatable string.
-                            error_text = (
-                                'Unexpected exception while '
-                                'deleting search object id: {id}, '
-                                'search model: {search_model}, '
-                                'raw data: {raw_data}, '
-                                'field map: {field_map}; '
-                                '{exception}'
-                            ).format(
-                                exception=exception,
-                                field_map=self.get_resolved_field_type_map(
-                                    search_model=search_model
-                                ), id=instance.pk,
-                                raw_data=instance.__dict__,
-                                search_model=search_model.full_name
-                            )
+        }
 
-                            logger.error(error_text, exc_info=True)
-                            raise DynamicSearchBackendException(
-                                error_text
-                            ) from exception
-                        else:
-                            kwargs = search_model.populate(
-                                search_backend=self, instance=instance,
-                                exclude_model=exclude_model,
-                                exclude_kwargs=exclude_kwargs
-                            )
+    def index_instance(self, instance, exclude_model=None, exclude_kwargs=None):
+        """
+        Opens and commits a writer for a single instance. The index
+        requests of the signal handlers are coalesced by the index queue
+        and sent in batches to `index_instances`. This method is only used
+        when the coalescing window is disabled and for the requests that
+        exclude a related object, which `index_instances` does not
+        support.
+        """
+        search_model = SearchModel.get_for_model(instance=instance)
+
+        if not settings.COMMON_DISABLE_LOCAL_STORAGE:
+            with self._get_writer(search_model=search_model) as writer:
+                try:
+                    writer.delete_by_term(
+                        'id', str(instance.pk)
+                    )
+                except Exception as exception:
+                    # The parenthesis is used to define a multi
+                    # line error message not a translatable string.
+                    error_text = (
+                        'Unexpected exception while '
+                        'deleting search object id: {id}, '
+                        'search model: {search_model}, '
+                        'raw data: {raw_data}, '
+                        'field map: {field_map}; '
+                        '{exception}'
+                    ).format(
+                        exception=exception,
+                        field_map=self.get_resolved_field_type_map(
+                            search_model=search_model
+                        ), id=instance.pk,
+                        raw_data=instance.__dict__,
+                        search_model=search_model.full_name
+                    )
 
-                            try:
-                                writer.add_document(**kwargs)
-                            except Exception as exception:
-                                # The parenthesis is used to define a multi
-                                # line error message not a translatable
-                                # string.
-                                error_text = (
-                                    'Unexpected exception while '
-                                    'indexing search object id: {id}, '
-                                    'search model: {search_model}, '
-                                    'index data: {index_data}, '
-                                    'raw data: {raw_data}, '
-                                    'field map: {field_map}; '
-                                    '{exception}'
-                                ).format(
-                                    exception=exception,
-                                    field_map=self.get_resolved_field_type_map(
-                                        search_model=search_model
-                                    ), id=instance.pk, index_data=kwargs,
-                                    raw_data=instance.__dict__,
-                                    search_model=search_model.full_name
-                                )
-
-                                logger.error(error_text, exc_info=True)
-                                raise DynamicSearchBackendException(
-                                    error_text
-                                ) from exception
+                    logger.error(error_text, exc_info=True)
+                    raise DynamicSearchBackendException(
+                        error_text
+                    ) from exception
+                else:
+                    kwargs = search_model.populate(
+                        search_backend=self, instance=instance,
+                        exclude_model=exclude_model,
+                        exclude_kwargs=exclude_kwargs
+                    )
 
-            except whoosh.index.LockError:
-                raise DynamicSearchRetry
-            finally:
-                lock.release()
+                    try:
+                        writer.add_document(**kwargs)
+                    except Exception as exception:
+                        # The parenthesis is used to define a multi
+                        # line error message not a translatable
+                        # string.
+                        error_text = (
+                            'Unexpected exception while '
+                            'indexing search object id: {id}, '
+                            'search model: {search_model}, '
+                            'index data: {index_data}, '
+                            'raw data: {raw_data}, '
+                            'field map: {field_map}; '
+                            '{exception}'
+                        ).format(
+                            exception=exception,
+                            field_map=self.get_resolved_field_type_map(
+                                search_model=search_model
+                            ), id=instance.pk, index_data=kwargs,
+                            raw_data=instance.__dict__,
+                            search_model=search_model.full_name
+                        )
+
+                        logger.error(error_text, exc_info=True)
+                        raise DynamicSearchBackendException(
+                            error_text
+                        ) from exception
 
     def index_instances(self, search_model, id_list):
         queryset = search_model.get_queryset()
         queryset = queryset.filter(pk__in=id_list)
 
-        try:
-            lock = LockingBackend.get_backend().acquire_lock(
-                name=TEXT_LOCK_INSTANCE_INDEX
-            )
-        except LockError:
-            raise
-        else:
-            try:
-                if not settings.COMMON_DISABLE_LOCAL_STORAGE:
-                    index = self._get_or_create_index(search_model=search_model)
-
-                    writer = BufferedWriter(index=index)
-                    for instance in queryset:
-                        kwargs = search_model.populate(
-                            search_backend=self, instance=instance
+        if not settings.COMMON_DISABLE_LOCAL_STORAGE:
+            # A single writer and commit for the whole ID list.
+            with self._get_writer(search_model=search_model) as writer:
+                populate_generator = search_model.populate_bulk(
+                    queryset=queryset, search_backend=self
+                )
+                for instance, kwargs in populate_generator:
+                    try:
+                        writer.update_document(**kwargs)
+                    except Exception as exception:
+                        # The parenthesis is used to define a multi
+                        # line error message not a translatable string.
+                        error_text = (
+                            'Unexpected exception while '
+                            'indexing search model: {search_model}, '
+                            'id_list: {id_list}, '
+                            'index data: {index_data}, '
+                            'raw data: {raw_data}, '
+                            'field map: {field_map}; '
+                            '{exception}'
+                        ).format(
+                            exception=exception,
+                            field_map=self.get_resolved_field_type_map(
+                                search_model=search_model
+                            ), id_list=id_list, index_data=kwargs,
+                            raw_data=instance.__dict__,
+                            search_model=search_model.full_name
                         )
 
-                        try:
-                            writer.update_document(**kwargs)
-                        except Exception as exception:
-                            # The parenthesis is used to define a multi
-                            # line error message not a translatable string.
-                            error_text = (
-                                'Unexpected exception while '
-                                'indexing search model: {search_model}, '
-                                'id_list: {id_list}',
-                                'index data: {index_data}, '
-                                'raw data: {raw_data}, '
-                                'field map: {field_map}; '
-                                '{exception}'
-                            ).format(
-                                exception=exception,
-                                field_map=self.get_resolved_field_type_map(
-                                    search_model=search_model
-                                ), id_list=id_list, index_data=kwargs,
-                                raw_data=instance.__dict__,
-                                search_model=search_model.full_name
-                            )
+                        logger.error(error_text, exc_info=True)
+                        raise DynamicSearchBackendException(
+                            error_text
+                        ) from exception
 
-                            logger.error(error_text, exc_info=True)
-                            raise DynamicSearchBackendException(
-                                error_text
-                            ) from exception
-                    writer.close()
-            except whoosh.index.LockError:
-                raise DynamicSearchRetry
-            finally:
-                lock.release()
+    def optimize(self):
+        if not settings.COMMON_DISABLE_LOCAL_STORAGE:
+            for search_model in SearchModel.all():
+                with self._get_writer(
+                    commit_kwargs={'optimize': True},
+                    lock_timeout=WHOOSH_INDEX_WRITER_LOCK_OPTIMIZE_TIMEOUT,
+                    search_model=search_model
+                ):
+                    """Committing with `optimize` merges all the segments."""
 
     def reset(self, search_model=None):
         self.tear_down(search_model=search_model)
         self._update_mappings(search_model=search_model)
 
+    def shadow_activate(self, name):
+        """
+        Replace the index directory with the shadow directory. The write
+        locks of all the search models are held to keep writers out while
+        the directories are renamed.
+        """
+        if not settings.COMMON_DISABLE_LOCAL_STORAGE:
+            index_path_previous = self.index_path.with_name(
+                WHOOSH_INDEX_DIRECTORY_PREVIOUS_NAME.format(
+                    self.index_path.name
+                )
+            )
+            locking_backend = LockingBackend.get_backend()
+            locks = []
+
+            try:
+                for search_model in SearchModel.all():
+                    locks.append(
+                        locking_backend.acquire_lock(
+                            name=TEXT_LOCK_INDEX_WRITE.format(
+                                search_model.full_name
+                            )
+                        )
+                    )
+
+                shutil.rmtree(path=index_path_previous, ignore_errors=True)
+                if self.index_path.exists():
+                    self.index_path.rename(target=index_path_previous)
+                self._get_shadow_path(name=name).rename(
+                    target=self.index_path
+                )
+            finally:
+                for lock in locks:
+                    lock.release()
+
+            shutil.rmtree(path=index_path_previous, ignore_errors=True)
+
+    def shadow_delete(self, name):
+        if not settings.COMMON_DISABLE_LOCAL_STORAGE:
+            shutil.rmtree(
+                path=self._get_shadow_path(name=name), ignore_errors=True
+            )
+
     def tear_down(self, search_model=None):
         if search_model:
             search_models = (search_model,)
@@ -208,7 +208,11 @@ DJANGO_TO_WHOOSH_FIELD_MAP = {
     }
 }
 
-TEXT_LOCK_INSTANCE_DEINDEX = 'dynamic_search_deindex_instance'
-TEXT_LOCK_INSTANCE_INDEX = 'dynamic_search_index_instance'
+TEXT_LOCK_INDEX_WRITE = 'dynamic_search_whoosh_index_write_{}'
 
 WHOOSH_INDEX_DIRECTORY_NAME = 'whoosh'
+WHOOSH_INDEX_DIRECTORY_PREVIOUS_NAME = '{}-previous'
+WHOOSH_INDEX_DIRECTORY_SHADOW_NAME = '{}-{}'
+# Expiration of the index writer lock while the index is optimized.
+# Merging all the segments takes longer than regular writes.
+WHOOSH_INDEX_WRITER_LOCK_OPTIMIZE_TIMEOUT = 10 * 60  # 10 minutes.
@@ -0,0 +1,652 @@
+import math
+import random
+import string
+import time
+import uuid
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+from mayan.apps.documents.permissions import permission_document_view
+
+from .exceptions import DynamicSearchException
+from .literals import (
+    SEARCH_BENCHMARK_BACKEND_LIST, SEARCH_BENCHMARK_CABINET_COUNT,
+    SEARCH_BENCHMARK_DOCUMENT_BATCH_SIZE, SEARCH_BENCHMARK_DOCUMENT_COUNT,
+    SEARCH_BENCHMARK_FILE_NAME, SEARCH_BENCHMARK_METADATA_TYPE_COUNT,
+    SEARCH_BENCHMARK_OCR_WORD_COUNT, SEARCH_BENCHMARK_PAGE_COUNT,
+    SEARCH_BENCHMARK_PAGINATION_PAGE_COUNT,
+    SEARCH_BENCHMARK_PAGINATION_PAGE_SIZE, SEARCH_BENCHMARK_REPETITIONS,
+    SEARCH_BENCHMARK_SEARCH_MODEL_NAME, SEARCH_BENCHMARK_SEED,
+    SEARCH_BENCHMARK_SHADOW_NAME, SEARCH_BENCHMARK_TAG_COUNT,
+    SEARCH_BENCHMARK_VOCABULARY_SIZE
+)
+from .search_backends import SearchBackend
+from .search_models import SearchModel
+from .settings import setting_backend, setting_backend_arguments
+
+
+def get_percentile(values, percentile):
+    """
+    Nearest rank percentile of a list of values.
+    """
+    if values:
+        values = sorted(values)
+        index = math.ceil(percentile / 100 * len(values)) - 1
+
+        return values[max(index, 0)]
+
+
+def get_timing_summary(timings):
+    return {
+        'count': len(timings),
+        'p50': get_percentile(percentile=50, values=timings),
+        'p95': get_percentile(percentile=95, values=timings)
+    }
+
+
+class SearchBenchmark:
+    """
+    Create a synthetic corpus of documents with metadata, tags, cabinets
+    and OCR content and measure the indexing throughput, the latency of
+    each query type and the latency of access control restricted result
+    pages of the search backends. The corpus is created inside a
+    transaction that is rolled back at the end. Backends that support
+    shadow indices use a separate set of indices that is deleted
+    afterwards. Progress messages are written to the optional `stdout`
+    and `stderr` streams.
+    """
+    def __init__(
+        self, cabinet_count=SEARCH_BENCHMARK_CABINET_COUNT,
+        document_count=SEARCH_BENCHMARK_DOCUMENT_COUNT,
+        metadata_type_count=SEARCH_BENCHMARK_METADATA_TYPE_COUNT,
+        ocr_word_count=SEARCH_BENCHMARK_OCR_WORD_COUNT,
+        page_count=SEARCH_BENCHMARK_PAGE_COUNT,
+        pagination_page_count=SEARCH_BENCHMARK_PAGINATION_PAGE_COUNT,
+        pagination_page_size=SEARCH_BENCHMARK_PAGINATION_PAGE_SIZE,
+        repetitions=SEARCH_BENCHMARK_REPETITIONS,
+        seed=SEARCH_BENCHMARK_SEED, stderr=None, stdout=None,
+        tag_count=SEARCH_BENCHMARK_TAG_COUNT
+    ):
+        self.cabinet_count = cabinet_count
+        self.document_count = document_count
+        self.metadata_type_count = metadata_type_count
+        self.ocr_word_count = ocr_word_count
+        self.page_count = page_count
+        self.pagination_page_count = pagination_page_count
+        self.pagination_page_size = pagination_page_size
+        self.random = random.Random(seed)
+        self.repetitions = repetitions
+        self.search_model = SearchModel.get(
+            name=SEARCH_BENCHMARK_SEARCH_MODEL_NAME
+        )
+        self.seed = seed
+        self.stderr = stderr
+        self.stdout = stdout
+        self.tag_count = tag_count
+
+    def _write_error(self, message):
+        if self.stderr is not None:
+            self.stderr.write(message)
+
+    def _write_output(self, message):
+        if self.stdout is not None:
+            self.stdout.write(message)
+
+    def backend_benchmark(self, dotted_path):
+        try:
+            search_backend_class = import_string(dotted_path=dotted_path)
+        except ImportError as exception:
+            return self.backend_skip(
+                dotted_path=dotted_path, exception=exception
+            )
+
+        if dotted_path == setting_backend.value:
+            kwargs = setting_backend_arguments.value.copy()
+        else:
+            kwargs = {}
+
+        search_backend = search_backend_class(**kwargs)
+
+        if search_backend.feature_reindex_shadow:
+            # Leave the live indices untouched.
+            search_backend_live = search_backend
+            kwargs.update(
+                search_backend.get_shadow_kwargs(
+                    name=SEARCH_BENCHMARK_SHADOW_NAME
+                )
+            )
+            search_backend = search_backend_class(**kwargs)
+        else:
+            search_backend_live = None
+
+        try:
+            try:
+                search_backend.initialize()
+
+                if search_backend_live:
+                    search_backend.reset()
+            except Exception as exception:
+                return self.backend_skip(
+                    dotted_path=dotted_path, exception=exception
+                )
+
+            result = {'status': 'ok'}
+            result['index'] = self.benchmark_index(
+                search_backend=search_backend
+            )
+            self._write_output(
+                message='{}: indexed {} objects in {:0.2f} seconds, {:0.2f} '
+                'objects/second.'.format(
+                    dotted_path, result['index']['count'],
+                    result['index']['seconds'],
+                    result['index']['objects_per_second']
+                )
+            )
+
+            result['queries'] = self.benchmark_queries(
+                search_backend=search_backend
+            )
+            for name, entry in result['queries'].items():
+                if 'error' in entry:
+                    self._write_output(
+                        message='{}: {} query not supported; {}'.format(
+                            dotted_path, name, entry['error']
+                        )
+                    )
+                else:
+                    self._write_output(
+                        message='{}: {} query p50 {:0.4f}, p95 {:0.4f} '
+                        'seconds.'.format(
+                            dotted_path, name, entry['p50'], entry['p95']
+                        )
+                    )
+
+            result['pagination'] = self.benchmark_pagination(
+                search_backend=search_backend
+            )
+            self._write_output(
+                message='{}: restricted page p50 {:0.4f}, p95 {:0.4f} '
+                'seconds.'.format(
+                    dotted_path, result['pagination']['p50'],
+                    result['pagination']['p95']
+                )
+            )
+
+            return result
+        finally:
+            if search_backend_live:
+                search_backend_live.shadow_delete(
+                    name=SEARCH_BENCHMARK_SHADOW_NAME
+                )
+
+    def backend_skip(self, dotted_path, exception):
+        self._write_error(
+            message='{}: skipped; {}'.format(dotted_path, exception)
+        )
+
+        return {'reason': str(exception), 'status': 'skipped'}
+
+    def benchmark_index(self, search_backend):
+        batch_size = SEARCH_BENCHMARK_DOCUMENT_BATCH_SIZE
+        object_count = len(self.document_id_list)
+
+        time_start = time.monotonic()
+
+        for index in range(0, object_count, batch_size):
+            search_backend.index_instances(
+                id_list=self.document_id_list[index:index + batch_size],
+                search_model=self.search_model
+            )
+
+        # Include the time needed to make the changes searchable.
+        search_backend.refresh()
+
+        time_elapsed = time.monotonic() - time_start
+
+        if time_elapsed:
+            objects_per_second = object_count / time_elapsed
+        else:
+            objects_per_second = 0
+
+        return {
+            'count': object_count, 'objects_per_second': objects_per_second,
+            'seconds': time_elapsed
+        }
+
+    def benchmark_pagination(self, search_backend):
+        limit = self.pagination_page_size
+        timings = []
+
+        for repetition in range(self.repetitions):
+            query = {
+                'versions__version_pages__ocr_content__content': '*{}'.format(
+                    self.word_get()
+                )
+            }
+
+            for page_number in range(self.pagination_page_count):
+                time_start = time.monotonic()
+                search_backend.search_page(
+                    limit=limit, offset=page_number * limit, query=query,
+                    search_model=self.search_model, user=self.user_restricted
+                )
+                timings.append(time.monotonic() - time_start)
+
+        return get_timing_summary(timings=timings)
+
+    def benchmark_queries(self, search_backend):
+        result = {}
+
+        query_factories = (
+            ('exact', self.query_get_exact),
+            ('fuzzy', self.query_get_fuzzy),
+            ('partial', self.query_get_partial),
+            ('range', self.query_get_range),
+            ('regular_expression', self.query_get_regular_expression)
+        )
+
+        for name, query_factory in query_factories:
+            result_counts = []
+            timings = []
+
+            try:
+                for repetition in range(self.repetitions):
+                    query = query_factory()
+
+                    time_start = time.monotonic()
+                    # Passing the queryset bypasses the search result
+                    # cache.
+                    saved_resultset, queryset = search_backend.search(
+                        query=query,
+                        queryset=self.search_model.get_queryset(),
+                        search_model=self.search_model, user=self.user
+                    )
+                    pk_list = list(
+                        queryset.values_list('pk', flat=True)
+                    )
+                    timings.append(time.monotonic() - time_start)
+
+                    result_counts.append(
+                        len(pk_list)
+                    )
+            except DynamicSearchException as exception:
+                result[name] = {'error': str(exception)}
+            else:
+                result[name] = get_timing_summary(timings=timings)
+                result[name]['results_p50'] = get_percentile(
+                    percentile=50, values=result_counts
+                )
+
+        return result
+
+    def corpus_create(self):
+        AccessControlList = apps.get_model(
+            app_label='acls', model_name='AccessControlList'
+        )
+        Cabinet = apps.get_model(app_label='cabinets', model_name='Cabinet')
+        DocumentType = apps.get_model(
+            app_label='documents', model_name='DocumentType'
+        )
+        DocumentTypeMetadataType = apps.get_model(
+            app_label='metadata', model_name='DocumentTypeMetadataType'
+        )
+        MetadataType = apps.get_model(
+            app_label='metadata', model_name='MetadataType'
+        )
+        Role = apps.get_model(app_label='permissions', model_name='Role')
+        Tag = apps.get_model(app_label='tags', model_name='Tag')
+        User = get_user_model()
+
+        token = uuid.uuid4().hex[:8]
+        label = 'search-benchmark-{}'.format(token)
+
+        self.vocabulary_create()
+
+        # Documents alternate between two document types. Only the
+        # documents of the first type are visible to the restricted user.
+        self.document_type_list = [
+            DocumentType.objects.create(
+                label='{}-{}'.format(label, index)
+            ) for index in range(2)
+        ]
+
+        self.metadata_type_list = []
+        for index in range(self.metadata_type_count):
+            metadata_type = MetadataType.objects.create(
+                label='{}-{}'.format(label, index),
+                name='search_benchmark_{}_{}'.format(token, index)
+            )
+            self.metadata_type_list.append(metadata_type)
+
+            for document_type in self.document_type_list:
+                DocumentTypeMetadataType.objects.create(
+                    document_type=document_type, metadata_type=metadata_type
+                )
+
+        self.cabinet_list = [
+            Cabinet.objects.create(
+                label='{}-{}'.format(label, index)
+            ) for index in range(self.cabinet_count)
+        ]
+        self.tag_list = [
+            Tag.objects.create(
+                color='#{:06x}'.format(
+                    self.random.randrange(0x1000000)
+                ), label='{}-{}'.format(label, index)
+            ) for index in range(self.tag_count)
+        ]
+
+        self.document_id_list = []
+        self.document_uuid_list = []
+
+        batch_size = SEARCH_BENCHMARK_DOCUMENT_BATCH_SIZE
+        document_count = self.document_count
+
+        for index in range(0, document_count, batch_size):
+            self.corpus_create_documents(
+                count=min(batch_size, document_count - index), label=label,
+                offset=index
+            )
+
+        self.user = User.objects.create(
+            is_superuser=True, username='{}-superuser'.format(label)
+        )
+        self.user_restricted = User.objects.create(
+            username='{}-restricted'.format(label)
+        )
+        group = Group.objects.create(name=label)
+        group.user_set.add(self.user_restricted)
+        role = Role.objects.create(label=label)
+        role.groups.add(group)
+
+        AccessControlList.objects.grant(
+            obj=self.document_type_list[0],
+            permission=permission_document_view, role=role
+        )
+
+    def corpus_create_documents(self, count, label, offset):
+        Document = apps.get_model(
+            app_label='documents', model_name='Document'
+        )
+        DocumentMetadata = apps.get_model(
+            app_label='metadata', model_name='DocumentMetadata'
+        )
+        DocumentFile = apps.get_model(
+            app_label='documents', model_name='DocumentFile'
+        )
+        DocumentFilePage = apps.get_model(
+            app_label='documents', model_name='DocumentFilePage'
+        )
+        DocumentVersion = apps.get_model(
+            app_label='documents', model_name='DocumentVersion'
+        )
+        DocumentVersionPage = apps.get_model(
+            app_label='documents', model_name='DocumentVersionPage'
+        )
+        DocumentVersionPageOCRContent = apps.get_model(
+            app_label='ocr', model_name='DocumentVersionPageOCRContent'
+        )
+        Cabinet = apps.get_model(app_label='cabinets', model_name='Cabinet')
+        Tag = apps.get_model(app_label='tags', model_name='Tag')
+
+        # Bulk creation does not trigger the model signals and does not
+        # rely on the database returning the primary keys. Objects are
+        # queried back by their parent instead.
+        document_uuid_list = [
+            uuid.uuid4() for index in range(count)
+        ]
+        Document.objects.bulk_create(
+            objs=[
+                Document(
+                    description=self.text_get(word_count=10),
+                    document_type=self.document_type_list[index % 2],
+                    is_stub=False,
+                    label='{} {}'.format(label, offset + index),
+                    uuid=document_uuid
+                ) for index, document_uuid in enumerate(
+                    iterable=document_uuid_list
+                )
+            ]
+        )
+        document_id_list = list(
+            Document.objects.filter(
+                uuid__in=document_uuid_list
+            ).order_by('pk').values_list('pk', flat=True)
+        )
+        self.document_id_list.extend(document_id_list)
+        self.document_uuid_list.extend(document_uuid_list)
+
+        # Synthetic files have no stored content, only the database rows
+        # are created. The pages of the document versions point to the
+        # pages of the document files, as with uploaded documents.
+        DocumentFile.objects.bulk_create(
+            objs=[
+                DocumentFile(
+                    document_id=document_id,
+                    file=SEARCH_BENCHMARK_FILE_NAME.format(document_uuid),
+                    filename='{} {}.pdf'.format(label, offset + index)
+                ) for index, (document_id, document_uuid) in enumerate(
+                    iterable=zip(document_id_list, document_uuid_list)
+                )
+            ]
+        )
+        DocumentFilePage.objects.bulk_create(
+            objs=[
+                DocumentFilePage(
+                    document_file_id=document_file_id,
+                    page_number=page_number
+                ) for document_file_id in DocumentFile.objects.filter(
+                    document_id__in=document_id_list
+                ).values_list('pk', flat=True)
+                for page_number in range(1, self.page_count + 1)
+            ]
+        )
+
+        DocumentVersion.objects.bulk_create(
+            objs=[
+                DocumentVersion(active=True, document_id=document_id)
+                for document_id in document_id_list
+            ]
+        )
+        document_version_id_dictionary = dict(
+            DocumentVersion.objects.filter(
+                document_id__in=document_id_list
+            ).values_list('document_id', 'pk')
+        )
+
+        content_type = ContentType.objects.get_for_model(
+            model=DocumentFilePage
+        )
+        queryset_document_file_pages = DocumentFilePage.objects.filter(
+            document_file__document_id__in=document_id_list
+        ).values_list('pk', 'document_file__document_id', 'page_number')
+
+        DocumentVersionPage.objects.bulk_create(
+            objs=[
+                DocumentVersionPage(
+                    content_type=content_type,
+                    document_version_id=document_version_id_dictionary[
+                        document_id
+                    ], object_id=document_file_page_id,
+                    page_number=page_number
+                ) for (
+                    document_file_page_id, document_id, page_number
+                ) in queryset_document_file_pages
+            ]
+        )
+        document_version_id_list = list(
+            document_version_id_dictionary.values()
+        )
+        document_version_page_id_list = DocumentVersionPage.objects.filter(
+            document_version_id__in=document_version_id_list
+        ).values_list('pk', flat=True)
+
+        DocumentVersionPageOCRContent.objects.bulk_create(
+            objs=[
+                DocumentVersionPageOCRContent(
+                    content=self.text_get(
+                        word_count=self.ocr_word_count
+                    ), document_version_page_id=document_version_page_id
+                ) for document_version_page_id in document_version_page_id_list
+            ]
+        )
+
+        DocumentMetadata.objects.bulk_create(
+            objs=[
+                DocumentMetadata(
+                    document_id=document_id, metadata_type=metadata_type,
+                    value=self.text_get(word_count=2)
+                ) for document_id in document_id_list
+                for metadata_type in self.metadata_type_list
+            ]
+        )
+
+        # Each document is added to a random cabinet and tag.
+        if self.cabinet_list:
+            Cabinet.documents.through.objects.bulk_create(
+                objs=[
+                    Cabinet.documents.through(
+                        cabinet_id=self.random.choice(
+                            seq=self.cabinet_list
+                        ).pk, document_id=document_id
+                    ) for document_id in document_id_list
+                ]
+            )
+
+        if self.tag_list:
+            Tag.documents.through.objects.bulk_create(
+                objs=[
+                    Tag.documents.through(
+                        document_id=document_id, tag_id=self.random.choice(
+                            seq=self.tag_list
+                        ).pk
+                    ) for document_id in document_id_list
+                ]
+            )
+
+    def execute(self, backend_list=SEARCH_BENCHMARK_BACKEND_LIST):
+        """
+        Create the corpus, benchmark each backend of the list and return
+        the report.
+        """
+        report = {
+            'backends': {},
+            'corpus': {
+                key: getattr(self, key) for key in (
+                    'cabinet_count', 'document_count', 'metadata_type_count',
+                    'ocr_word_count', 'page_count', 'seed', 'tag_count'
+                )
+            }
+        }
+
+        # The corpus is indexed explicitly for each backend.
+        SearchBackend._disable()
+
+        try:
+            with transaction.atomic():
+                time_start = time.monotonic()
+                self.corpus_create()
+                report['corpus']['seconds'] = time.monotonic() - time_start
+
+                self._write_output(
+                    message='Corpus of {} documents created in {:0.2f} '
+                    'seconds.'.format(
+                        len(self.document_id_list),
+                        report['corpus']['seconds']
+                    )
+                )
+
+                for dotted_path in backend_list:
+                    report['backends'][dotted_path] = self.backend_benchmark(
+                        dotted_path=dotted_path
+                    )
+
+                transaction.set_rollback(rollback=True)
+        finally:
+            SearchBackend._enable()
+
+        return report
+
+    def query_get_exact(self):
+        return {
+            'uuid': '={}'.format(
+                self.random.choice(seq=self.document_uuid_list)
+            )
+        }
+
+    def query_get_fuzzy(self):
+        # Replace a letter of the word to require an edit.
+        word = list(
+            self.word_get()
+        )
+        word[
+            len(word) // 2
+        ] = self.random.choice(seq=string.ascii_lowercase)
+
+        return {
+            'versions__version_pages__ocr_content__content': '~{}'.format(
+                ''.join(word)
+            )
+        }
+
+    def query_get_partial(self):
+        return {
+            'versions__version_pages__ocr_content__content': '*{}'.format(
+                self.word_get()
+            )
+        }
+
+    def query_get_range(self):
+        return {
+            'document_type__id': '[]{}..{}'.format(
+                self.document_type_list[0].pk, self.document_type_list[-1].pk
+            )
+        }
+
+    def query_get_regular_expression(self):
+        return {
+            'description': '%{}.*'.format(
+                self.word_get()[:3]
+            )
+        }
+
+    def text_get(self, word_count):
+        return ' '.join(
+            self.random.choices(
+                cum_weights=self.vocabulary_cumulative_weights,
+                k=word_count, population=self.vocabulary
+            )
+        )
+
+    def vocabulary_create(self):
+        """
+        Random words with a Zipf distribution to approximate the frequency
+        of the words of natural language text.
+        """
+        vocabulary = set()
+        while len(vocabulary) < SEARCH_BENCHMARK_VOCABULARY_SIZE:
+            vocabulary.add(
+                ''.join(
+                    self.random.choices(
+                        k=self.random.randint(a=4, b=10),
+                        population=string.ascii_lowercase
+                    )
+                )
+            )
+
+        self.vocabulary = sorted(vocabulary)
+        self.random.shuffle(x=self.vocabulary)
+
+        total = 0
+        self.vocabulary_cumulative_weights = []
+        for rank in range(1, len(self.vocabulary) + 1):
+            total += 1 / rank
+            self.vocabulary_cumulative_weights.append(total)
+
+    def word_get(self):
+        return self.text_get(word_count=1)
@@ -0,0 +1,142 @@
+import hashlib
+
+from django.apps import apps
+from django.core.cache import caches
+
+from mayan.apps.common.utils import cache_counter_increment
+
+from .literals import (
+    INDEX_QUEUE_STATISTICS_KEY, SEARCH_RESULT_CACHE_GENERATION_ACL,
+    SEARCH_RESULT_CACHE_GENERATION_KEY, SEARCH_RESULT_CACHE_KEY
+)
+from .settings import (
+    setting_indexing_queue_cache_name, setting_results_cache_name,
+    setting_results_cache_time_to_live
+)
+
+
+class SearchIndexQueueStatistics:
+    """
+    Counters of the index queue. Requests are the index and deindex
+    requests received from the model signals. Flushed are the objects
+    that were sent to the search backend after coalescing.
+    """
+    @staticmethod
+    def get_cache():
+        return caches[setting_indexing_queue_cache_name.value]
+
+    @classmethod
+    def get_coalescing_ratio(cls):
+        flushed = cls.get_value(name='flushed')
+
+        if flushed:
+            return cls.get_value(name='requests') / flushed
+        else:
+            return 0
+
+    @staticmethod
+    def get_key(name):
+        return INDEX_QUEUE_STATISTICS_KEY.format(name)
+
+    @classmethod
+    def get_value(cls, name):
+        return cls.get_cache().get(
+            default=0, key=cls.get_key(name=name)
+        )
+
+    @classmethod
+    def increment(cls, name, delta=1):
+        cache_counter_increment(
+            cache=cls.get_cache(), delta=delta, key=cls.get_key(name=name)
+        )
+
+    @classmethod
+    def reset(cls):
+        cls.get_cache().delete_many(
+            keys=[
+                cls.get_key(name=name) for name in ('flushed', 'requests')
+            ]
+        )
+
+
+class SearchResultCache:
+    """
+    Cache of the primary keys of search results. Entries are keyed by the
+    search model, the canonical query and the access control fingerprint
+    of the user. The fingerprint is shared by users with the same roles.
+    Indexing a search model increases its generation and changing the
+    access control lists increases the access control generation. Both
+    are part of the key, which makes the existing entries unreachable.
+    """
+    @staticmethod
+    def get_cache():
+        return caches[setting_results_cache_name.value]
+
+    @classmethod
+    def generation_increment(cls, name):
+        cache_counter_increment(
+            cache=cls.get_cache(),
+            key=SEARCH_RESULT_CACHE_GENERATION_KEY.format(name)
+        )
+
+    @classmethod
+    def get(cls, key):
+        return cls.get_cache().get(key=key)
+
+    @classmethod
+    def get_acl_fingerprint(cls, user):
+        Role = apps.get_model(app_label='permissions', model_name='Role')
+
+        if user.is_authenticated:
+            role_id_list = Role.objects.filter(groups__user=user).order_by(
+                'pk'
+            ).values_list('pk', flat=True).distinct()
+
+            user_fingerprint = '{}-{}-{}'.format(
+                int(user.is_superuser), int(user.is_staff),
+                ','.join(
+                    map(str, role_id_list)
+                )
+            )
+        else:
+            user_fingerprint = 'anonymous'
+
+        return '{}-{}'.format(
+            user_fingerprint, cls.get_generation(
+                name=SEARCH_RESULT_CACHE_GENERATION_ACL
+            )
+        )
+
+    @classmethod
+    def get_generation(cls, name):
+        return cls.get_cache().get(
+            default=0, key=SEARCH_RESULT_CACHE_GENERATION_KEY.format(name)
+        )
+
+    @classmethod
+    def get_key(cls, query_string, search_model, user):
+        """
+        Return the cache key of a search or None if the cache is disabled.
+        """
+        if setting_results_cache_time_to_live.value:
+            key_source = '|'.join(
+                (
+                    search_model.full_name,
+                    str(
+                        cls.get_generation(name=search_model.full_name)
+                    ), cls.get_acl_fingerprint(user=user), query_string
+                )
+            )
+
+            return SEARCH_RESULT_CACHE_KEY.format(
+                hashlib.sha256(
+                    key_source.encode()
+                ).hexdigest()
+            )
+
+    @classmethod
+    def set(cls, key, pk_list):
+        cls.get_cache().set(
+            key=key, timeout=setting_results_cache_time_to_live.value,
+            value=pk_list
+        )
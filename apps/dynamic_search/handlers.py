@@ -1,24 +1,23 @@
+from django.apps import apps
+
 from mayan.apps.common.compatibility import Iterable
 from mayan.apps.common.utils import (
     ResolverPipelineModelAttribute, flatten_list
 )
 
+from .classes import SearchResultCache
+from .literals import SEARCH_RESULT_CACHE_GENERATION_ACL
 from .search_backends import SearchBackend
-from .tasks import (
-    task_deindex_instance, task_index_instance,
-    task_index_related_instance_m2m
-)
+from .tasks import task_index_instance, task_index_related_instance_m2m
 
 
 def handler_deindex_instance(sender, **kwargs):
-    instance = kwargs['instance']
+    SearchIndexQueueEntry = apps.get_model(
+        app_label='dynamic_search', model_name='SearchIndexQueueEntry'
+    )
 
-    task_deindex_instance.apply_async(
-        kwargs={
-            'app_label': instance._meta.app_label,
-            'model_name': instance._meta.model_name,
-            'object_id': instance.pk
-        }
+    SearchIndexQueueEntry.objects.deindex_request(
+        instance=kwargs['instance']
     )
 
 
@@ -55,6 +54,10 @@ def handler_factory_index_related_instance_delete(reverse_field_path):
 
 def handler_factory_index_related_instance_save(reverse_field_path):
     def handler_index_by_related_instance(sender, **kwargs):
+        SearchIndexQueueEntry = apps.get_model(
+            app_label='dynamic_search', model_name='SearchIndexQueueEntry'
+        )
+
         related_instance = kwargs['instance']
 
         result = ResolverPipelineModelAttribute.resolve(
@@ -64,13 +67,7 @@ def handler_factory_index_related_instance_save(reverse_field_path):
         entries = flatten_list(value=result)
 
         def call_task(instance):
-            task_index_instance.apply_async(
-                kwargs={
-                    'app_label': instance._meta.app_label,
-                    'model_name': instance._meta.model_name,
-                    'object_id': instance.pk
-                }
-            )
+            SearchIndexQueueEntry.objects.index_request(instance=instance)
 
         if isinstance(entries, Iterable):
             for instance in entries:
@@ -116,14 +113,12 @@ def handler_factory_index_related_instance_m2m(data):
 
 
 def handler_index_instance(sender, **kwargs):
-    instance = kwargs['instance']
+    SearchIndexQueueEntry = apps.get_model(
+        app_label='dynamic_search', model_name='SearchIndexQueueEntry'
+    )
 
-    task_index_instance.apply_async(
-        kwargs={
-            'app_label': instance._meta.app_label,
-            'model_name': instance._meta.model_name,
-            'object_id': instance.pk
-        }
+    SearchIndexQueueEntry.objects.index_request(
+        instance=kwargs['instance']
     )
 
 
@@ -137,3 +132,11 @@ def handler_search_backend_upgrade(sender, **kwargs):
     backend = SearchBackend.get_instance()
 
     backend.upgrade()
+
+
+def handler_search_result_cache_acl_generation_increment(sender, **kwargs):
+    # Ignore the `pre_` actions of `m2m_changed`.
+    if not kwargs.get('action', 'post').startswith('pre_'):
+        SearchResultCache.generation_increment(
+            name=SEARCH_RESULT_CACHE_GENERATION_ACL
+        )
@@ -6,10 +6,17 @@ COMMAND_NAME_SEARCH_STATUS = 'search_status'
 
 DEFAULT_SEARCH_BACKEND = 'mayan.apps.dynamic_search.backends.whoosh.WhooshSearchBackend'
 DEFAULT_SEARCH_BACKEND_ARGUMENTS = {}
+DEFAULT_SEARCH_BACKEND_OPTIMIZE_INTERVAL = 0
 DEFAULT_SEARCH_DISABLE_SIMPLE_SEARCH = False
+DEFAULT_SEARCH_INDEXING_COALESCE_WINDOW = 0
 DEFAULT_SEARCH_INDEXING_CHUNK_SIZE = 25
+DEFAULT_SEARCH_INDEXING_QUEUE_CACHE_NAME = 'default'
 DEFAULT_SEARCH_MATCH_ALL_DEFAULT_VALUE = 'False'
 DEFAULT_SEARCH_QUERY_RESULTS_LIMIT = 100000
+DEFAULT_SEARCH_REINDEX_CHUNK_SIZE = 1000
+DEFAULT_SEARCH_REINDEX_CONCURRENCY = 4
+DEFAULT_SEARCH_RESULTS_CACHE_NAME = 'default'
+DEFAULT_SEARCH_RESULTS_CACHE_TIME_TO_LIVE = 0
 DEFAULT_SEARCH_RESULTS_LIMIT = 1000
 DEFAULT_SEARCH_SAVED_RESULTSET_RESULTS_LIMIT = 1000
 DEFAULT_SEARCH_SAVED_RESULTSETS_PER_USER_LIMIT = 10
@@ -23,6 +30,17 @@ ERROR_TEXT_NO_RESULT_SCOPE = 'No result scope has been specified.'
 
 FILTER_PREFIX = 'filter_'
 
+INDEX_QUEUE_ACTION_DEINDEX = 'deindex'
+INDEX_QUEUE_ACTION_INDEX = 'index'
+INDEX_QUEUE_ACTION_CHOICES = (
+    (INDEX_QUEUE_ACTION_DEINDEX, _(message='Deindex')),
+    (INDEX_QUEUE_ACTION_INDEX, _(message='Index'))
+)
+INDEX_QUEUE_FLUSH_LOCK_NAME = 'dynamic_search_index_queue_flush'
+INDEX_QUEUE_FLUSH_LOCK_TIMEOUT = 5 * 60  # 5 minutes.
+INDEX_QUEUE_FLUSH_SCHEDULED_KEY = 'dynamic_search_index_queue_flush_scheduled'
+INDEX_QUEUE_STATISTICS_KEY = 'dynamic_search_index_queue_statistics_{}'
+
 MATCH_ALL_FIELD_CHOICES = (
     (True, _(message='Yes')),
     (False, _(message='No'))
@@ -32,6 +50,36 @@ MESSAGE_FEATURE_NO_STATUS = 'This backend does not provide status information.'
 
 QUERY_PARAMETER_ANY_FIELD = 'q'
 
+REINDEX_CHUNK_STATE_DONE = 'done'
+REINDEX_CHUNK_STATE_ERROR = 'error'
+REINDEX_CHUNK_STATE_PENDING = 'pending'
+REINDEX_CHUNK_STATE_QUEUED = 'queued'
+REINDEX_CHUNK_STATE_CHOICES = (
+    (REINDEX_CHUNK_STATE_DONE, _(message='Done')),
+    (REINDEX_CHUNK_STATE_ERROR, _(message='Error')),
+    (REINDEX_CHUNK_STATE_PENDING, _(message='Pending')),
+    (REINDEX_CHUNK_STATE_QUEUED, _(message='Queued'))
+)
+REINDEX_DISPATCH_LOCK_NAME = 'dynamic_search_reindex_dispatch_{}'
+REINDEX_DISPATCH_LOCK_TIMEOUT = 60  # 60 seconds.
+REINDEX_SHADOW_NAME = 'reindex-{}'
+REINDEX_STATE_CANCELLED = 'cancelled'
+REINDEX_STATE_ERROR = 'error'
+REINDEX_STATE_FINISHED = 'finished'
+REINDEX_STATE_PLANNING = 'planning'
+REINDEX_STATE_RUNNING = 'running'
+REINDEX_STATE_CHOICES = (
+    (REINDEX_STATE_CANCELLED, _(message='Cancelled')),
+    (REINDEX_STATE_ERROR, _(message='Error')),
+    (REINDEX_STATE_FINISHED, _(message='Finished')),
+    (REINDEX_STATE_PLANNING, _(message='Planning')),
+    (REINDEX_STATE_RUNNING, _(message='Running'))
+)
+REINDEX_STATE_ACTIVE_LIST = (
+    REINDEX_STATE_ERROR, REINDEX_STATE_PLANNING, REINDEX_STATE_RUNNING
+)
+REINDEX_THROUGHPUT_WINDOW = 10 * 60  # 10 minutes.
+
 SCOPE_DELIMITER = '_'
 SCOPE_MARKER = '__'
 SCOPE_RESULT_MARKER = 'result'
@@ -80,11 +128,43 @@ SCOPE_OPERATOR_CHOICES = {
 DEFAULT_SEARCH_DEFAULT_OPERATOR = SCOPE_OPERATOR_AND
 DEFAULT_SEARCH_MODEL_FIELD_DISABLE = {}
 
+SEARCH_BENCHMARK_BACKEND_LIST = (
+    'mayan.apps.dynamic_search.backends.django.DjangoSearchBackend',
+    'mayan.apps.dynamic_search.backends.elasticsearch.ElasticSearchBackend',
+    'mayan.apps.dynamic_search.backends.whoosh.WhooshSearchBackend'
+)
+SEARCH_BENCHMARK_CABINET_COUNT = 10
+SEARCH_BENCHMARK_DOCUMENT_BATCH_SIZE = 500
+SEARCH_BENCHMARK_DOCUMENT_COUNT = 1000
+SEARCH_BENCHMARK_FILE_NAME = 'search-benchmark-{}'
+SEARCH_BENCHMARK_METADATA_TYPE_COUNT = 5
+SEARCH_BENCHMARK_OCR_WORD_COUNT = 250
+SEARCH_BENCHMARK_PAGE_COUNT = 2
+SEARCH_BENCHMARK_PAGINATION_PAGE_COUNT = 5
+SEARCH_BENCHMARK_PAGINATION_PAGE_SIZE = 20
+SEARCH_BENCHMARK_REPETITIONS = 20
+SEARCH_BENCHMARK_SEARCH_MODEL_NAME = 'documents.documentsearchresult'
+SEARCH_BENCHMARK_SEED = 0
+SEARCH_BENCHMARK_SHADOW_NAME = 'benchmark'
+SEARCH_BENCHMARK_TAG_COUNT = 20
+SEARCH_BENCHMARK_VOCABULARY_SIZE = 5000
+# Values are stored in chunks to stay under the PostgreSQL limit of 1 MB
+# per `tsvector`. The limit is in bytes, the chunk size is in characters.
+SEARCH_FULL_TEXT_ENTRY_VALUE_CHUNK_SIZE = 128 * 1024
+SEARCH_FULL_TEXT_ENTRY_VALUE_SEPARATORS = (' ', '\n', '\t')
+SEARCH_INTERPRETER_CACHE_SIZE = 512
 SEARCH_MODEL_NAME_KWARG = 'search_model_pk'
+SEARCH_PAGE_BACKEND_PAGE_SIZE_MINIMUM = 100
+SEARCH_RESULT_CACHE_GENERATION_ACL = 'acl'
+SEARCH_RESULT_CACHE_GENERATION_KEY = 'dynamic_search_result_cache_generation_{}'
+SEARCH_RESULT_CACHE_KEY = 'dynamic_search_result_cache_{}'
 
 TASK_DEINDEX_INSTANCE_MAX_RETRIES = 40
 TASK_DEINDEX_INSTANCE_RETRY_BACKOFF_MAX = 60
 
+TASK_DEINDEX_INSTANCES_MAX_RETRIES = 40
+TASK_DEINDEX_INSTANCES_RETRY_BACKOFF_MAX = 60
+
 TASK_INDEX_INSTANCE_MAX_RETRIES = 40
 TASK_INDEX_INSTANCE_RETRY_BACKOFF_MAX = 60
 
@@ -94,6 +174,14 @@ TASK_INDEX_INSTANCES_RETRY_BACKOFF_MAX = 60
 TASK_INDEX_RELATED_INSTANCE_M2M_MAX_RETRIES = 40
 TASK_INDEX_RELATED_INSTANCE_M2M_RETRY_BACKOFF_MAX = 60
 
+TASK_INDEX_QUEUE_FLUSH_INTERVAL = 60  # 60 seconds.
+
+TASK_REINDEX_CHUNK_MAX_RETRIES = 40
+TASK_REINDEX_CHUNK_RETRY_BACKOFF_MAX = 60
+
+TASK_REINDEX_DISPATCH_MAX_RETRIES = 40
+TASK_REINDEX_DISPATCH_RETRY_BACKOFF_MAX = 60
+
 TASK_SAVED_RESULTSET_EXPIRED_DELETE_INTERVAL = 5 * 60  # 5 minutes.
 
 TERM_OPERATOR_AND = 'AND'
@@ -0,0 +1,111 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from ...benchmarks import SearchBenchmark
+from ...literals import (
+    SEARCH_BENCHMARK_BACKEND_LIST, SEARCH_BENCHMARK_CABINET_COUNT,
+    SEARCH_BENCHMARK_DOCUMENT_COUNT, SEARCH_BENCHMARK_METADATA_TYPE_COUNT,
+    SEARCH_BENCHMARK_OCR_WORD_COUNT, SEARCH_BENCHMARK_PAGE_COUNT,
+    SEARCH_BENCHMARK_PAGINATION_PAGE_COUNT,
+    SEARCH_BENCHMARK_PAGINATION_PAGE_SIZE, SEARCH_BENCHMARK_REPETITIONS,
+    SEARCH_BENCHMARK_SEED, SEARCH_BENCHMARK_TAG_COUNT
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Create a synthetic corpus of documents with metadata, tags, '
+        'cabinets and OCR content and measure the indexing throughput, '
+        'the latency of each query type and the latency of access control '
+        'restricted result pages of the search backends. The corpus is '
+        'created inside a transaction that is rolled back at the end. '
+        'Backends that support shadow indices use a separate set of '
+        'indices that is deleted afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--backend', action='append', dest='backend_list',
+            help='Dotted path of a search backend class to benchmark. Can '
+            'be repeated. Defaults to the Django, Elasticsearch and Whoosh '
+            'backends. The search backend arguments setting is used for the '
+            'configured backend.'
+        )
+        parser.add_argument(
+            '--cabinet-count', default=SEARCH_BENCHMARK_CABINET_COUNT,
+            dest='cabinet_count', help='Number of cabinets.', type=int
+        )
+        parser.add_argument(
+            '--document-count', default=SEARCH_BENCHMARK_DOCUMENT_COUNT,
+            dest='document_count', help='Number of documents.', type=int
+        )
+        parser.add_argument(
+            '--metadata-type-count',
+            default=SEARCH_BENCHMARK_METADATA_TYPE_COUNT,
+            dest='metadata_type_count', help='Number of metadata types. '
+            'Every document has a value for each metadata type.', type=int
+        )
+        parser.add_argument(
+            '--ocr-word-count', default=SEARCH_BENCHMARK_OCR_WORD_COUNT,
+            dest='ocr_word_count', help='Number of words of the OCR '
+            'content of each page.', type=int
+        )
+        parser.add_argument(
+            '--output', dest='output', help='Path of the file where the '
+            'report will be written in JSON format.'
+        )
+        parser.add_argument(
+            '--page-count', default=SEARCH_BENCHMARK_PAGE_COUNT,
+            dest='page_count', help='Number of pages of each document.',
+            type=int
+        )
+        parser.add_argument(
+            '--pagination-page-count',
+            default=SEARCH_BENCHMARK_PAGINATION_PAGE_COUNT,
+            dest='pagination_page_count', help='Number of consecutive '
+            'result pages to fetch for each access control restricted '
+            'query.', type=int
+        )
+        parser.add_argument(
+            '--pagination-page-size',
+            default=SEARCH_BENCHMARK_PAGINATION_PAGE_SIZE,
+            dest='pagination_page_size', help='Number of results of each '
+            'access control restricted result page.', type=int
+        )
+        parser.add_argument(
+            '--repetitions', default=SEARCH_BENCHMARK_REPETITIONS,
+            dest='repetitions', help='Number of queries of each query '
+            'type. Each query uses a different value.', type=int
+        )
+        parser.add_argument(
+            '--seed', default=SEARCH_BENCHMARK_SEED, dest='seed',
+            help='Seed of the random generator used for the corpus and the '
+            'query values.', type=int
+        )
+        parser.add_argument(
+            '--tag-count', default=SEARCH_BENCHMARK_TAG_COUNT,
+            dest='tag_count', help='Number of tags.', type=int
+        )
+
+    def handle(self, *args, **options):
+        search_benchmark = SearchBenchmark(
+            cabinet_count=options['cabinet_count'],
+            document_count=options['document_count'],
+            metadata_type_count=options['metadata_type_count'],
+            ocr_word_count=options['ocr_word_count'],
+            page_count=options['page_count'],
+            pagination_page_count=options['pagination_page_count'],
+            pagination_page_size=options['pagination_page_size'],
+            repetitions=options['repetitions'], seed=options['seed'],
+            stderr=self.stderr, stdout=self.stdout,
+            tag_count=options['tag_count']
+        )
+
+        report = search_benchmark.execute(
+            backend_list=options['backend_list'] or SEARCH_BENCHMARK_BACKEND_LIST
+        )
+
+        if options['output']:
+            with open(file=options['output'], mode='w') as file_object:
+                json.dump(fp=file_object, indent=2, obj=report)
@@ -0,0 +1,86 @@
+from collections import deque
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ...search_backends import SearchBackend
+from ...search_models import SearchModel
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare the throughput in objects per second of the per instance '
+        'index data population against the bulk population for a search '
+        'model. Only the index data is generated, the search backend is '
+        'not modified.'
+    )
+    missing_args_message = 'You must provide a search model name.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            dest='model_name', help='Name of search model to benchmark.',
+            metavar='<model name>'
+        )
+        parser.add_argument(
+            '--id-range', dest='id_range_string', help='Range of IDs to '
+            'process. Defaults to all the instances of the search model.'
+        )
+
+    def handle(self, model_name, **options):
+        try:
+            search_model = SearchModel.get(name=model_name)
+        except KeyError:
+            self.stderr.write(
+                msg='Unknown search model `{}`'.format(model_name)
+            )
+            exit(1)
+
+        search_backend = SearchBackend.get_instance()
+
+        id_groups = [
+            list(id_list) for id_list in search_model.get_id_groups(
+                range_string=options['id_range_string']
+            )
+        ]
+
+        def populate():
+            for id_list in id_groups:
+                queryset = search_model.get_queryset().filter(pk__in=id_list)
+                for instance in queryset:
+                    search_model.populate(
+                        instance=instance, search_backend=search_backend
+                    )
+
+        def populate_bulk():
+            for id_list in id_groups:
+                queryset = search_model.get_queryset().filter(pk__in=id_list)
+                deque(
+                    iterable=search_model.populate_bulk(
+                        queryset=queryset, search_backend=search_backend
+                    ), maxlen=0
+                )
+
+        object_count = sum(
+            len(id_list) for id_list in id_groups
+        )
+
+        benchmarks = (
+            ('Per instance', populate), ('Bulk', populate_bulk)
+        )
+
+        for label, function in benchmarks:
+            with CaptureQueriesContext(connection=connection) as context:
+                time_start = time.monotonic()
+                function()
+                time_elapsed = time.monotonic() - time_start
+
+            self.stdout.write(
+                msg='{}: {} objects in {:0.2f} seconds, {:0.2f} '
+                'objects/second, {} queries.'.format(
+                    label, object_count, time_elapsed,
+                    object_count / time_elapsed if time_elapsed else 0,
+                    len(context.captured_queries)
+                )
+            )
@@ -1,10 +1,38 @@
 from django.core.management.base import BaseCommand
 
-from ...tasks import task_reindex_backend
+from ...tasks import task_reindex_backend, task_reindex_resume
 
 
 class Command(BaseCommand):
     help = 'Erases and populates the search backend internal indexes.'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--concurrency', dest='concurrency', help='Maximum number of '
+            'chunks queued or being indexed at the same time. Defaults to '
+            'the SEARCH_REINDEX_CONCURRENCY setting.', type=int
+        )
+        parser.add_argument(
+            '--resume', dest='search_reindex_id', help='ID of an '
+            'interrupted reindex to resume. Chunks already indexed are '
+            'skipped.', type=int
+        )
+        parser.add_argument(
+            '--shadow', action='store_true', dest='shadow', help='Index '
+            'into new indices and switch to them when the reindex finishes. '
+            'Searches use the current indices in the meantime. Ignored if '
+            'the search backend does not support it.'
+        )
+
     def handle(self, *args, **options):
-        task_reindex_backend.apply_async()
+        if options['search_reindex_id']:
+            task_reindex_resume.apply_async(
+                kwargs={'search_reindex_id': options['search_reindex_id']}
+            )
+        else:
+            task_reindex_backend.apply_async(
+                kwargs={
+                    'concurrency': options['concurrency'],
+                    'shadow': options['shadow']
+                }
+            )
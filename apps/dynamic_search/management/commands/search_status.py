@@ -1,5 +1,7 @@
+from django.apps import apps
 from django.core.management.base import BaseCommand
 
+from ...classes import SearchIndexQueueStatistics
 from ...search_backends import SearchBackend
 
 
@@ -7,8 +9,60 @@ class Command(BaseCommand):
     help = 'Show search backend statistics.'
 
     def handle(self, *args, **options):
+        SearchReindex = apps.get_model(
+            app_label='dynamic_search', model_name='SearchReindex'
+        )
+
         backend = SearchBackend.get_instance()
 
         result = backend.get_status()
 
         self.stdout.write(msg=result)
+
+        self.stdout.write(
+            msg='Index queue requests: {}'.format(
+                SearchIndexQueueStatistics.get_value(name='requests')
+            )
+        )
+        self.stdout.write(
+            msg='Index queue objects flushed: {}'.format(
+                SearchIndexQueueStatistics.get_value(name='flushed')
+            )
+        )
+        self.stdout.write(
+            msg='Index queue coalescing ratio: {:.2f}'.format(
+                SearchIndexQueueStatistics.get_coalescing_ratio()
+            )
+        )
+
+        search_reindex = SearchReindex.objects.first()
+
+        if search_reindex:
+            progress = search_reindex.get_progress()
+
+            self.stdout.write(
+                msg='Reindex {}: {}, shadow: {}, started: {}'.format(
+                    search_reindex.pk, search_reindex.get_state_display(),
+                    search_reindex.shadow, search_reindex.datetime_created
+                )
+            )
+            self.stdout.write(
+                msg='Reindex objects: {} of {}'.format(
+                    progress['object_count_done'], progress['object_count']
+                )
+            )
+            self.stdout.write(
+                msg='Reindex chunks: {}'.format(
+                    ', '.join(
+                        '{}: {}'.format(state, count)
+                        for state, count in progress['chunk_counts'].items()
+                    )
+                )
+            )
+            self.stdout.write(
+                msg='Reindex throughput: {:.2f} objects/second, estimated '
+                'time remaining: {}'.format(
+                    progress['throughput'],
+                    progress['time_remaining'] or 'Unknown'
+                )
+            )
@@ -1,14 +1,25 @@
+from functools import partial
 import json
 
 from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
-from django.db import models
+from django.core.cache import caches
+from django.db import connections, models, transaction
 from django.db.models import F, Value
 from django.utils.timezone import now
 
 from mayan.apps.databases.manager_mixins import ManagerMinixCreateBulk
 
+from .classes import SearchIndexQueueStatistics
+from .literals import (
+    INDEX_QUEUE_ACTION_DEINDEX, INDEX_QUEUE_ACTION_INDEX,
+    INDEX_QUEUE_FLUSH_SCHEDULED_KEY, REINDEX_STATE_ACTIVE_LIST,
+    SEARCH_FULL_TEXT_ENTRY_VALUE_CHUNK_SIZE,
+    SEARCH_FULL_TEXT_ENTRY_VALUE_SEPARATORS
+)
 from .settings import (
+    setting_indexing_chunk_size, setting_indexing_coalesce_window,
+    setting_indexing_queue_cache_name, setting_reindex_concurrency,
     setting_saved_resultset_results_limit,
     setting_saved_resultset_time_to_live,
     setting_saved_resultsets_per_user_limit
@@ -84,3 +95,240 @@ class SavedResultsetManager(models.Manager):
         coroutine.close()
 
         return saved_resultset
+
+
+class SearchFullTextEntryManager(models.Manager):
+    def instances_delete(self, search_model, id_list):
+        self.filter(
+            object_id__in=id_list, search_model_name=search_model.full_name
+        ).delete()
+
+    def instances_update(self, search_model, instance_values):
+        """
+        Replace the entries of several instances. `instance_values` is a
+        dictionary of field values dictionaries keyed by instance ID.
+        """
+        with transaction.atomic():
+            self.instances_delete(
+                id_list=instance_values.keys(), search_model=search_model
+            )
+
+            self.bulk_create(
+                objs=[
+                    self.model(
+                        chunk_number=chunk_number, field_name=field_name,
+                        object_id=object_id,
+                        search_model_name=search_model.full_name,
+                        value=chunk
+                    ) for object_id, field_values in instance_values.items()
+                    for field_name, value in field_values.items()
+                    for chunk_number, chunk in enumerate(
+                        self.value_split(value=value)
+                    )
+                ]
+            )
+
+    @staticmethod
+    def value_split(value):
+        """
+        Split a value in chunks of up to the chunk size. Chunks end at a
+        whitespace when possible to keep words in a single chunk.
+        """
+        chunk_size = SEARCH_FULL_TEXT_ENTRY_VALUE_CHUNK_SIZE
+        value = str(value)
+
+        while len(value) > chunk_size:
+            position = max(
+                value.rfind(character, 0, chunk_size)
+                for character in SEARCH_FULL_TEXT_ENTRY_VALUE_SEPARATORS
+            )
+
+            if position <= 0:
+                position = chunk_size
+
+            yield value[:position]
+            value = value[position:].lstrip()
+
+        if value:
+            yield value
+
+
+class SearchIndexQueueEntryManager(models.Manager):
+    def deindex_request(self, instance):
+        # Hidden import
+        from .tasks import task_deindex_instance
+
+        if setting_indexing_coalesce_window.value:
+            self.request_add(
+                action=INDEX_QUEUE_ACTION_DEINDEX, instance=instance
+            )
+        else:
+            task_deindex_instance.apply_async(
+                kwargs={
+                    'app_label': instance._meta.app_label,
+                    'model_name': instance._meta.model_name,
+                    'object_id': instance.pk
+                }
+            )
+
+    def flush(self):
+        """
+        Send the pending requests to the search backend in batches. Each
+        batch is grouped by model and action. Entries are deleted only if
+        their action did not change since they were read, otherwise they
+        are processed again by the next batch.
+        """
+        # Hidden import
+        from .search_models import SearchModel
+        from .tasks import task_deindex_instances, task_index_instances
+
+        chunk_size = setting_indexing_chunk_size.value
+
+        while True:
+            entries = tuple(
+                self.order_by('id').values_list(
+                    'id', 'app_label', 'model_name', 'object_id', 'action'
+                )[:chunk_size]
+            )
+
+            if not entries:
+                break
+
+            groups = {}
+            for entry_id, app_label, model_name, object_id, action in entries:
+                groups.setdefault(
+                    (app_label, model_name, action), {}
+                )[entry_id] = object_id
+
+            for (app_label, model_name, action), group in groups.items():
+                id_list = tuple(
+                    group.values()
+                )
+
+                if action == INDEX_QUEUE_ACTION_INDEX:
+                    Model = apps.get_model(
+                        app_label=app_label, model_name=model_name
+                    )
+                    search_model = SearchModel.get_for_model(instance=Model)
+
+                    task = task_index_instances
+                    task_kwargs = {
+                        'id_list': id_list,
+                        'search_model_full_name': search_model.full_name
+                    }
+                else:
+                    task = task_deindex_instances
+                    task_kwargs = {
+                        'app_label': app_label, 'id_list': id_list,
+                        'model_name': model_name
+                    }
+
+                # The task is dispatched only if the entries are deleted.
+                # If the deletion fails the entries are kept and processed
+                # by the next flush.
+                with transaction.atomic():
+                    self.filter(action=action, pk__in=group.keys()).delete()
+
+                    transaction.on_commit(
+                        func=partial(task.apply_async, kwargs=task_kwargs)
+                    )
+
+                SearchIndexQueueStatistics.increment(
+                    delta=len(id_list), name='flushed'
+                )
+
+    def index_request(self, instance):
+        # Hidden import
+        from .tasks import task_index_instance
+
+        if setting_indexing_coalesce_window.value:
+            self.request_add(
+                action=INDEX_QUEUE_ACTION_INDEX, instance=instance
+            )
+        else:
+            task_index_instance.apply_async(
+                kwargs={
+                    'app_label': instance._meta.app_label,
+                    'model_name': instance._meta.model_name,
+                    'object_id': instance.pk
+                }
+            )
+
+    def request_add(self, action, instance):
+        """
+        Add or update the pending request of an object and schedule a
+        flush at the end of the coalescing window if none is scheduled.
+        """
+        # Hidden import
+        from .tasks import task_index_queue_flush
+
+        connection = connections[self.db]
+
+        if connection.features.supports_update_conflicts_with_target:
+            self.bulk_create(
+                objs=(
+                    self.model(
+                        action=action, app_label=instance._meta.app_label,
+                        model_name=instance._meta.model_name,
+                        object_id=instance.pk
+                    ),
+                ), unique_fields=('app_label', 'model_name', 'object_id'),
+                update_conflicts=True, update_fields=('action',)
+            )
+        else:
+            # MySQL and MariaDB do not support conflict targets.
+            self.update_or_create(
+                app_label=instance._meta.app_label,
+                defaults={'action': action},
+                model_name=instance._meta.model_name, object_id=instance.pk
+            )
+
+        SearchIndexQueueStatistics.increment(name='requests')
+
+        coalesce_window = setting_indexing_coalesce_window.value
+
+        # `add` only succeeds for the first request of the window.
+        is_flush_required = caches[
+            setting_indexing_queue_cache_name.value
+        ].add(
+            key=INDEX_QUEUE_FLUSH_SCHEDULED_KEY, timeout=coalesce_window,
+            value=True
+        )
+
+        if is_flush_required:
+            task_index_queue_flush.apply_async(countdown=coalesce_window)
+
+
+class SearchReindexChunkManager(ManagerMinixCreateBulk, models.Manager):
+    """
+    Nothing additional required, this is just to add the create bulk mixing
+    to the manager.
+    """
+
+
+class SearchReindexManager(models.Manager):
+    def get_shadow_active(self):
+        """
+        Return the reindex that is building shadow indices or None.
+        """
+        return self.filter(
+            shadow=True, state__in=REINDEX_STATE_ACTIVE_LIST
+        ).first()
+
+    def reindex_start(self, concurrency=None, shadow=False):
+        """
+        Create a new reindex and cancel the unfinished ones. Shadow
+        indices are only used if the search backend supports them.
+        """
+        # Hidden import.
+        from .search_backends import SearchBackend
+
+        for reindex in self.filter(state__in=REINDEX_STATE_ACTIVE_LIST):
+            reindex.do_cancel()
+
+        search_backend_class = SearchBackend.get_class()
+
+        return self.create(
+            concurrency=concurrency or setting_reindex_concurrency.value,
+            shadow=shadow and search_backend_class.feature_reindex_shadow
+        )
@@ -0,0 +1,49 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('dynamic_search', '0004_create_saved_resultsets')
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchIndexQueueEntry',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                (
+                    'app_label', models.CharField(
+                        max_length=64, verbose_name='App label'
+                    )
+                ),
+                (
+                    'model_name', models.CharField(
+                        max_length=64, verbose_name='Model name'
+                    )
+                ),
+                (
+                    'object_id', models.BigIntegerField(
+                        verbose_name='Object ID'
+                    )
+                ),
+                (
+                    'action', models.CharField(
+                        choices=[
+                            ('deindex', 'Deindex'), ('index', 'Index')
+                        ], max_length=8, verbose_name='Action'
+                    )
+                )
+            ],
+            options={
+                'verbose_name': 'Search index queue entry',
+                'verbose_name_plural': 'Search index queue entries',
+                'ordering': ('id',),
+                'unique_together': {('app_label', 'model_name', 'object_id')}
+            }
+        )
+    ]
@@ -0,0 +1,116 @@
+import logging
+
+from django.db import migrations, models
+from django.db.utils import OperationalError
+
+logger = logging.getLogger(name=__name__)
+
+SQL_POSTGRESQL_INDEX_CREATE = (
+    'CREATE INDEX dynamic_search_searchfulltextentry_value_fts ON '
+    'dynamic_search_searchfulltextentry USING GIN '
+    '(to_tsvector(\'simple\'::regconfig, value));'
+)
+SQL_POSTGRESQL_INDEX_DROP = (
+    'DROP INDEX IF EXISTS dynamic_search_searchfulltextentry_value_fts;'
+)
+SQL_SQLITE_TABLE_CREATE = (
+    'CREATE VIRTUAL TABLE dynamic_search_searchfulltextentry_fts USING '
+    'fts5(value, content=\'dynamic_search_searchfulltextentry\', '
+    'content_rowid=\'id\');',
+    'CREATE TRIGGER dynamic_search_searchfulltextentry_fts_insert AFTER '
+    'INSERT ON dynamic_search_searchfulltextentry BEGIN INSERT INTO '
+    'dynamic_search_searchfulltextentry_fts(rowid, value) VALUES '
+    '(new.id, new.value); END;',
+    'CREATE TRIGGER dynamic_search_searchfulltextentry_fts_delete AFTER '
+    'DELETE ON dynamic_search_searchfulltextentry BEGIN INSERT INTO '
+    'dynamic_search_searchfulltextentry_fts'
+    '(dynamic_search_searchfulltextentry_fts, rowid, value) VALUES '
+    '(\'delete\', old.id, old.value); END;',
+    'CREATE TRIGGER dynamic_search_searchfulltextentry_fts_update AFTER '
+    'UPDATE ON dynamic_search_searchfulltextentry BEGIN INSERT INTO '
+    'dynamic_search_searchfulltextentry_fts'
+    '(dynamic_search_searchfulltextentry_fts, rowid, value) VALUES '
+    '(\'delete\', old.id, old.value); INSERT INTO '
+    'dynamic_search_searchfulltextentry_fts(rowid, value) VALUES '
+    '(new.id, new.value); END;'
+)
+SQL_SQLITE_TABLE_DROP = (
+    'DROP TRIGGER IF EXISTS dynamic_search_searchfulltextentry_fts_insert;',
+    'DROP TRIGGER IF EXISTS dynamic_search_searchfulltextentry_fts_delete;',
+    'DROP TRIGGER IF EXISTS dynamic_search_searchfulltextentry_fts_update;',
+    'DROP TABLE IF EXISTS dynamic_search_searchfulltextentry_fts;'
+)
+
+
+def code_full_text_index_create(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(sql=SQL_POSTGRESQL_INDEX_CREATE)
+    elif schema_editor.connection.vendor == 'sqlite':
+        try:
+            for sql in SQL_SQLITE_TABLE_CREATE:
+                schema_editor.execute(sql=sql)
+        except OperationalError as exception:
+            # SQLite compiled without the FTS5 extension. The Django
+            # search backend falls back to the non indexed search.
+            logger.warning(
+                'Unable to create the full text search table; %s',
+                exception
+            )
+
+
+def code_full_text_index_delete(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(sql=SQL_POSTGRESQL_INDEX_DROP)
+    elif schema_editor.connection.vendor == 'sqlite':
+        for sql in SQL_SQLITE_TABLE_DROP:
+            schema_editor.execute(sql=sql)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('dynamic_search', '0005_searchindexqueueentry')
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchFullTextEntry',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                (
+                    'search_model_name', models.CharField(
+                        max_length=128, verbose_name='Search model name'
+                    )
+                ),
+                (
+                    'object_id', models.BigIntegerField(
+                        verbose_name='Object ID'
+                    )
+                ),
+                (
+                    'field_name', models.CharField(
+                        max_length=255, verbose_name='Field name'
+                    )
+                ),
+                (
+                    'value', models.TextField(verbose_name='Value')
+                )
+            ],
+            options={
+                'verbose_name': 'Search full text entry',
+                'verbose_name_plural': 'Search full text entries',
+                'ordering': ('id',),
+                'unique_together': {
+                    ('search_model_name', 'object_id', 'field_name')
+                }
+            }
+        ),
+        migrations.RunPython(
+            code=code_full_text_index_create,
+            reverse_code=code_full_text_index_delete
+        )
+    ]
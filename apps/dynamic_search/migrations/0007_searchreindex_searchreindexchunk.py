@@ -0,0 +1,125 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('dynamic_search', '0006_searchfulltextentry')
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchReindex',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                (
+                    'datetime_created', models.DateTimeField(
+                        auto_now_add=True, db_index=True,
+                        help_text='The server date and time when the '
+                        'reindex was started.',
+                        verbose_name='Date and time created'
+                    )
+                ),
+                (
+                    'datetime_finished', models.DateTimeField(
+                        blank=True, help_text='The server date and time '
+                        'when the reindex finished.', null=True,
+                        verbose_name='Date and time finished'
+                    )
+                ),
+                (
+                    'concurrency', models.PositiveIntegerField(
+                        help_text='Maximum number of chunks queued or being '
+                        'indexed at the same time.',
+                        verbose_name='Concurrency'
+                    )
+                ),
+                (
+                    'shadow', models.BooleanField(
+                        default=False, help_text='Index into new search '
+                        'backend indices and switch to them when the '
+                        'reindex finishes. The current indices are used by '
+                        'searches in the meantime.', verbose_name='Shadow'
+                    )
+                ),
+                (
+                    'state', models.CharField(
+                        choices=[
+                            ('cancelled', 'Cancelled'), ('error', 'Error'),
+                            ('finished', 'Finished'),
+                            ('planning', 'Planning'), ('running', 'Running')
+                        ], default='planning', max_length=16,
+                        verbose_name='State'
+                    )
+                )
+            ],
+            options={
+                'verbose_name': 'Search reindex',
+                'verbose_name_plural': 'Search reindexes',
+                'ordering': ('-datetime_created',)
+            }
+        ),
+        migrations.CreateModel(
+            name='SearchReindexChunk',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                (
+                    'search_model_name', models.CharField(
+                        max_length=128, verbose_name='Search model name'
+                    )
+                ),
+                (
+                    'id_start', models.BigIntegerField(
+                        verbose_name='ID start'
+                    )
+                ),
+                (
+                    'id_end', models.BigIntegerField(verbose_name='ID end')
+                ),
+                (
+                    'object_count', models.PositiveIntegerField(
+                        help_text='Number of objects when the chunk was '
+                        'planned.', verbose_name='Object count'
+                    )
+                ),
+                (
+                    'state', models.CharField(
+                        choices=[
+                            ('done', 'Done'), ('error', 'Error'),
+                            ('pending', 'Pending'), ('queued', 'Queued')
+                        ], db_index=True, default='pending', max_length=16,
+                        verbose_name='State'
+                    )
+                ),
+                (
+                    'datetime_finished', models.DateTimeField(
+                        blank=True, null=True,
+                        verbose_name='Date and time finished'
+                    )
+                ),
+                (
+                    'reindex', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='chunks',
+                        to='dynamic_search.searchreindex',
+                        verbose_name='Reindex'
+                    )
+                )
+            ],
+            options={
+                'verbose_name': 'Search reindex chunk',
+                'verbose_name_plural': 'Search reindex chunks',
+                'ordering': ('id',)
+            }
+        )
+    ]
@@ -0,0 +1,83 @@
+from django.db import migrations, models
+
+SQL_SQLITE_TABLE_FTS_EXISTS = (
+    'SELECT COUNT(*) FROM sqlite_master WHERE type = \'table\' AND '
+    'name = \'dynamic_search_searchfulltextentry_fts\';'
+)
+SQL_SQLITE_TABLE_FTS_REBUILD = (
+    'INSERT INTO dynamic_search_searchfulltextentry_fts'
+    '(dynamic_search_searchfulltextentry_fts) VALUES (\'rebuild\');'
+)
+SQL_SQLITE_TRIGGER_CREATE = (
+    'DROP TRIGGER IF EXISTS dynamic_search_searchfulltextentry_fts_insert;',
+    'DROP TRIGGER IF EXISTS dynamic_search_searchfulltextentry_fts_delete;',
+    'DROP TRIGGER IF EXISTS dynamic_search_searchfulltextentry_fts_update;',
+    'CREATE TRIGGER dynamic_search_searchfulltextentry_fts_insert AFTER '
+    'INSERT ON dynamic_search_searchfulltextentry BEGIN INSERT INTO '
+    'dynamic_search_searchfulltextentry_fts(rowid, value) VALUES '
+    '(new.id, new.value); END;',
+    'CREATE TRIGGER dynamic_search_searchfulltextentry_fts_delete AFTER '
+    'DELETE ON dynamic_search_searchfulltextentry BEGIN INSERT INTO '
+    'dynamic_search_searchfulltextentry_fts'
+    '(dynamic_search_searchfulltextentry_fts, rowid, value) VALUES '
+    '(\'delete\', old.id, old.value); END;',
+    'CREATE TRIGGER dynamic_search_searchfulltextentry_fts_update AFTER '
+    'UPDATE ON dynamic_search_searchfulltextentry BEGIN INSERT INTO '
+    'dynamic_search_searchfulltextentry_fts'
+    '(dynamic_search_searchfulltextentry_fts, rowid, value) VALUES '
+    '(\'delete\', old.id, old.value); INSERT INTO '
+    'dynamic_search_searchfulltextentry_fts(rowid, value) VALUES '
+    '(new.id, new.value); END;'
+)
+
+
+def code_full_text_trigger_create(apps, schema_editor):
+    """
+    SQLite rebuilds the entry table when altering it, which drops the
+    triggers that keep the full text table synchronized. Recreate them
+    and rebuild the full text table from the entry table.
+    """
+    if schema_editor.connection.vendor == 'sqlite':
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute(SQL_SQLITE_TABLE_FTS_EXISTS)
+            is_table_fts_present = cursor.fetchone()[0]
+
+        # SQLite compiled without the FTS5 extension, the table was not
+        # created by the migration 0006.
+        if is_table_fts_present:
+            for sql in SQL_SQLITE_TRIGGER_CREATE:
+                schema_editor.execute(sql=sql)
+
+            schema_editor.execute(sql=SQL_SQLITE_TABLE_FTS_REBUILD)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('dynamic_search', '0007_searchreindex_searchreindexchunk')
+    ]
+
+    operations = [
+        migrations.RunPython(
+            code=migrations.RunPython.noop,
+            reverse_code=code_full_text_trigger_create
+        ),
+        migrations.AddField(
+            model_name='searchfulltextentry',
+            name='chunk_number',
+            field=models.PositiveIntegerField(
+                default=0, help_text='Order of the value chunk. Long values '
+                'are split in several entries.',
+                verbose_name='Chunk number'
+            )
+        ),
+        migrations.AlterUniqueTogether(
+            name='searchfulltextentry',
+            unique_together={
+                ('search_model_name', 'object_id', 'field_name', 'chunk_number')
+            }
+        ),
+        migrations.RunPython(
+            code=code_full_text_trigger_create,
+            reverse_code=migrations.RunPython.noop
+        )
+    ]
@@ -1,11 +1,30 @@
+from datetime import timedelta
 import json
+import logging
 
 from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import F
+from django.db import transaction
+from django.db.models import Count, F, Sum
+from django.utils.timezone import now
 
+from mayan.apps.common.utils import group_iterator
+
+from .classes import SearchResultCache
+from .literals import (
+    REINDEX_CHUNK_STATE_DONE, REINDEX_CHUNK_STATE_ERROR,
+    REINDEX_CHUNK_STATE_PENDING, REINDEX_CHUNK_STATE_QUEUED,
+    REINDEX_SHADOW_NAME, REINDEX_STATE_CANCELLED, REINDEX_STATE_ERROR,
+    REINDEX_STATE_FINISHED, REINDEX_STATE_PLANNING, REINDEX_STATE_RUNNING,
+    REINDEX_THROUGHPUT_WINDOW
+)
 from .search_models import SearchModel
-from .settings import setting_saved_resultset_time_to_live_increment
+from .settings import (
+    setting_reindex_chunk_size,
+    setting_saved_resultset_time_to_live_increment
+)
+
+logger = logging.getLogger(name=__name__)
 
 
 class SavedResultsetBusinessLogicModelMixin:
@@ -48,3 +67,291 @@ class SavedResultsetBusinessLogicModelMixin:
         obj = json.loads(s=self.search_query_text)
 
         return obj
+
+
+class SearchReindexBusinessLogicModelMixin:
+    def do_cancel(self):
+        self.state = REINDEX_STATE_CANCELLED
+        self.save(update_fields=('state',))
+
+        if self.shadow:
+            # Hidden import.
+            from .search_backends import SearchBackend
+
+            search_backend = SearchBackend.get_instance()
+            search_backend.shadow_delete(name=self.get_shadow_name())
+
+    def do_dispatch(self):
+        """
+        Queue pending chunks up to the concurrency limit. Chunks that
+        failed do not stop the dispatch of the other chunks. When no
+        chunks are left to index, the reindex is finished if all chunks
+        are done, otherwise it is marked as failed to be resumed. Must be
+        called with the dispatch lock held.
+        """
+        # Hidden import.
+        from .tasks import task_reindex_chunk
+
+        if self.state != REINDEX_STATE_RUNNING:
+            return
+
+        queued_count = self.chunks.filter(
+            state=REINDEX_CHUNK_STATE_QUEUED
+        ).count()
+
+        available_count = self.concurrency - queued_count
+
+        if available_count > 0:
+            chunk_id_list = tuple(
+                self.chunks.filter(
+                    state=REINDEX_CHUNK_STATE_PENDING
+                ).values_list('pk', flat=True)[:available_count]
+            )
+
+            self.chunks.filter(pk__in=chunk_id_list).update(
+                state=REINDEX_CHUNK_STATE_QUEUED
+            )
+
+            for chunk_id in chunk_id_list:
+                task_reindex_chunk.apply_async(
+                    kwargs={'search_reindex_chunk_id': chunk_id}
+                )
+
+        is_chunk_left = self.chunks.filter(
+            state__in=(REINDEX_CHUNK_STATE_PENDING, REINDEX_CHUNK_STATE_QUEUED)
+        ).exists()
+
+        if is_chunk_left:
+            progress = self.get_progress()
+
+            logger.info(
+                'Reindex %d: %d of %d objects, %.2f objects/second, '
+                'estimated time remaining: %s', self.pk,
+                progress['object_count_done'], progress['object_count'],
+                progress['throughput'], progress['time_remaining']
+            )
+        else:
+            error_count = self.chunks.filter(
+                state=REINDEX_CHUNK_STATE_ERROR
+            ).count()
+
+            if error_count:
+                self.state = REINDEX_STATE_ERROR
+                self.save(update_fields=('state',))
+
+                logger.error(
+                    'Reindex %d: %d chunks failed, resume the reindex to '
+                    'index them again', self.pk, error_count
+                )
+            else:
+                self.do_finish()
+
+    def do_finish(self):
+        # Hidden import.
+        from .search_backends import SearchBackend
+
+        if self.shadow:
+            # Send the buffered changes before making the shadow indices
+            # the live indices.
+            self.get_search_backend().refresh()
+
+            search_backend = SearchBackend.get_instance()
+            search_backend.shadow_activate(name=self.get_shadow_name())
+
+        for search_model in SearchModel.all():
+            SearchResultCache.generation_increment(
+                name=search_model.full_name
+            )
+
+        self.datetime_finished = now()
+        self.state = REINDEX_STATE_FINISHED
+        self.save(update_fields=('datetime_finished', 'state'))
+
+        logger.info('Reindex %d finished', self.pk)
+
+    def do_plan(self):
+        """
+        Split the instances of every search model into chunks of
+        consecutive IDs. Search models are planned in their own
+        transaction. Models with chunks are skipped which allows resuming
+        an interrupted planning.
+        """
+        SearchReindexChunk = apps.get_model(
+            app_label='dynamic_search', model_name='SearchReindexChunk'
+        )
+
+        search_backend = self.get_search_backend()
+
+        if not self.chunks.exists():
+            search_backend.initialize()
+            search_backend.reset()
+
+            if not self.shadow:
+                for search_model in SearchModel.all():
+                    SearchResultCache.generation_increment(
+                        name=search_model.full_name
+                    )
+
+        for search_model in SearchModel.all():
+            is_planned = self.chunks.filter(
+                search_model_name=search_model.full_name
+            ).exists()
+
+            if is_planned:
+                continue
+
+            id_iterator = search_model.get_queryset().order_by(
+                'pk'
+            ).values_list('pk', flat=True).iterator()
+
+            with transaction.atomic():
+                coroutine = SearchReindexChunk.objects.create_bulk()
+                next(coroutine)
+
+                id_groups = group_iterator(
+                    group_size=setting_reindex_chunk_size.value,
+                    iterable=id_iterator
+                )
+                for id_list in id_groups:
+                    coroutine.send(
+                        {
+                            'id_end': id_list[-1], 'id_start': id_list[0],
+                            'object_count': len(id_list),
+                            'reindex_id': self.pk,
+                            'search_model_name': search_model.full_name,
+                            'state': REINDEX_CHUNK_STATE_PENDING
+                        }
+                    )
+                coroutine.close()
+
+        self.state = REINDEX_STATE_RUNNING
+        self.save(update_fields=('state',))
+
+    def do_resume(self):
+        """
+        Queue again the chunks that were queued or failed. Chunks that
+        are done are not indexed again.
+        """
+        if self.state == REINDEX_STATE_PLANNING:
+            self.do_plan()
+
+        self.chunks.filter(
+            state__in=(REINDEX_CHUNK_STATE_ERROR, REINDEX_CHUNK_STATE_QUEUED)
+        ).update(state=REINDEX_CHUNK_STATE_PENDING)
+
+        if self.state == REINDEX_STATE_ERROR:
+            self.state = REINDEX_STATE_RUNNING
+            self.save(update_fields=('state',))
+
+    def get_progress(self):
+        """
+        Return the object and chunk counts of the reindex. The throughput
+        is calculated from the chunks finished during the throughput
+        window and is used to estimate the time remaining.
+        """
+        chunk_counts = dict.fromkeys(
+            (
+                REINDEX_CHUNK_STATE_DONE, REINDEX_CHUNK_STATE_ERROR,
+                REINDEX_CHUNK_STATE_PENDING, REINDEX_CHUNK_STATE_QUEUED
+            ), 0
+        )
+        object_counts = chunk_counts.copy()
+
+        queryset = self.chunks.order_by().values('state').annotate(
+            chunk_count=Count('pk'), object_count_total=Sum('object_count')
+        ).values_list('state', 'chunk_count', 'object_count_total')
+
+        for state, chunk_count, object_count in queryset:
+            chunk_counts[state] = chunk_count
+            object_counts[state] = object_count
+
+        datetime_window_start = now() - timedelta(
+            seconds=REINDEX_THROUGHPUT_WINDOW
+        )
+
+        object_count_window = self.chunks.filter(
+            datetime_finished__gte=datetime_window_start,
+            state=REINDEX_CHUNK_STATE_DONE
+        ).aggregate(
+            object_count_total=Sum('object_count')
+        )['object_count_total'] or 0
+
+        throughput = object_count_window / REINDEX_THROUGHPUT_WINDOW
+
+        object_count = sum(
+            object_counts.values()
+        )
+        object_count_done = object_counts[REINDEX_CHUNK_STATE_DONE]
+
+        if throughput:
+            time_remaining = timedelta(
+                seconds=int(
+                    (object_count - object_count_done) / throughput
+                )
+            )
+        else:
+            time_remaining = None
+
+        return {
+            'chunk_counts': chunk_counts, 'object_count': object_count,
+            'object_count_done': object_count_done,
+            'throughput': throughput, 'time_remaining': time_remaining
+        }
+
+    def get_search_backend(self):
+        """
+        Return the search backend instance that receives the index data of
+        this reindex.
+        """
+        # Hidden import.
+        from .search_backends import SearchBackend
+
+        if self.shadow:
+            search_backend = SearchBackend.get_instance()
+
+            return SearchBackend.get_instance(
+                extra_kwargs=search_backend.get_shadow_kwargs(
+                    name=self.get_shadow_name()
+                )
+            )
+        else:
+            return SearchBackend.get_instance()
+
+    def get_shadow_name(self):
+        return REINDEX_SHADOW_NAME.format(self.pk)
+
+
+class SearchReindexChunkBusinessLogicModelMixin:
+    def do_error(self):
+        self.state = REINDEX_CHUNK_STATE_ERROR
+        self.save(update_fields=('state',))
+
+    def do_index(self):
+        if self.reindex.state not in (
+            REINDEX_STATE_ERROR, REINDEX_STATE_RUNNING
+        ):
+            return
+
+        search_model = SearchModel.get(name=self.search_model_name)
+
+        # Instances created after the planning are included.
+        id_list = tuple(
+            search_model.get_queryset().filter(
+                pk__gte=self.id_start, pk__lte=self.id_end
+            ).values_list('pk', flat=True)
+        )
+
+        if id_list:
+            search_backend = self.reindex.get_search_backend()
+            search_backend.index_instances(
+                id_list=id_list, search_model=search_model
+            )
+
+            if not self.reindex.shadow:
+                SearchResultCache.generation_increment(
+                    name=search_model.full_name
+                )
+
+        self.datetime_finished = now()
+        self.state = REINDEX_CHUNK_STATE_DONE
+        self.save(update_fields=('datetime_finished', 'state'))
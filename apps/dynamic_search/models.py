@@ -9,8 +9,21 @@ from mayan.apps.events.event_managers import EventManagerSave
 from mayan.apps.templating.template_backends import Template
 
 from .events import event_saved_resultset_created
-from .managers import SavedResultsetEntryManager, SavedResultsetManager
-from .model_mixins import SavedResultsetBusinessLogicModelMixin
+from .literals import (
+    INDEX_QUEUE_ACTION_CHOICES, REINDEX_CHUNK_STATE_CHOICES,
+    REINDEX_CHUNK_STATE_PENDING, REINDEX_STATE_CHOICES,
+    REINDEX_STATE_PLANNING
+)
+from .managers import (
+    SavedResultsetEntryManager, SavedResultsetManager,
+    SearchFullTextEntryManager, SearchIndexQueueEntryManager,
+    SearchReindexChunkManager, SearchReindexManager
+)
+from .model_mixins import (
+    SavedResultsetBusinessLogicModelMixin,
+    SearchReindexBusinessLogicModelMixin,
+    SearchReindexChunkBusinessLogicModelMixin
+)
 
 
 class SavedResultset(
@@ -102,3 +115,144 @@ class SavedResultsetEntry(models.Model):
         verbose_name_plural = _(message='Saved resultset entries')
 
     objects = SavedResultsetEntryManager()
+
+
+class SearchFullTextEntry(models.Model):
+    """
+    Text value of a search field of a model instance. Used by the Django
+    search backend when full text search is enabled. The database indexes
+    the `value` column for full text search.
+    """
+    search_model_name = models.CharField(
+        max_length=128, verbose_name=_(message='Search model name')
+    )
+    object_id = models.BigIntegerField(verbose_name=_(message='Object ID'))
+    field_name = models.CharField(
+        max_length=255, verbose_name=_(message='Field name')
+    )
+    chunk_number = models.PositiveIntegerField(
+        default=0, help_text=_(
+            message='Order of the value chunk. Long values are split in '
+            'several entries.'
+        ), verbose_name=_(message='Chunk number')
+    )
+    value = models.TextField(verbose_name=_(message='Value'))
+
+    class Meta:
+        ordering = ('id',)
+        unique_together = (
+            'search_model_name', 'object_id', 'field_name', 'chunk_number'
+        )
+        verbose_name = _(message='Search full text entry')
+        verbose_name_plural = _(message='Search full text entries')
+
+    objects = SearchFullTextEntryManager()
+
+
+class SearchIndexQueueEntry(models.Model):
+    """
+    Pending index or deindex request of a model instance. There is only
+    one entry per object, repeated requests update the action of the
+    existing entry.
+    """
+    app_label = models.CharField(
+        max_length=64, verbose_name=_(message='App label')
+    )
+    model_name = models.CharField(
+        max_length=64, verbose_name=_(message='Model name')
+    )
+    object_id = models.BigIntegerField(verbose_name=_(message='Object ID'))
+    action = models.CharField(
+        choices=INDEX_QUEUE_ACTION_CHOICES, max_length=8,
+        verbose_name=_(message='Action')
+    )
+
+    class Meta:
+        ordering = ('id',)
+        unique_together = ('app_label', 'model_name', 'object_id')
+        verbose_name = _(message='Search index queue entry')
+        verbose_name_plural = _(message='Search index queue entries')
+
+    objects = SearchIndexQueueEntryManager()
+
+
+class SearchReindex(SearchReindexBusinessLogicModelMixin, models.Model):
+    """
+    Full reindex of the search backend. The instances of the search
+    models are split into chunks that are indexed independently. The
+    state of each chunk is recorded to allow resuming the reindex.
+    """
+    datetime_created = models.DateTimeField(
+        auto_now_add=True, db_index=True, help_text=_(
+            message='The server date and time when the reindex was started.'
+        ), verbose_name=_(message='Date and time created')
+    )
+    datetime_finished = models.DateTimeField(
+        blank=True, help_text=_(
+            message='The server date and time when the reindex finished.'
+        ), null=True, verbose_name=_(message='Date and time finished')
+    )
+    concurrency = models.PositiveIntegerField(
+        help_text=_(
+            message='Maximum number of chunks queued or being indexed at the '
+            'same time.'
+        ), verbose_name=_(message='Concurrency')
+    )
+    shadow = models.BooleanField(
+        default=False, help_text=_(
+            message='Index into new search backend indices and switch to '
+            'them when the reindex finishes. The current indices are used '
+            'by searches in the meantime.'
+        ), verbose_name=_(message='Shadow')
+    )
+    state = models.CharField(
+        choices=REINDEX_STATE_CHOICES, default=REINDEX_STATE_PLANNING,
+        max_length=16, verbose_name=_(message='State')
+    )
+
+    class Meta:
+        ordering = ('-datetime_created',)
+        verbose_name = _(message='Search reindex')
+        verbose_name_plural = _(message='Search reindexes')
+
+    objects = SearchReindexManager()
+
+    def __str__(self):
+        return str(self.datetime_created)
+
+
+class SearchReindexChunk(
+    SearchReindexChunkBusinessLogicModelMixin, models.Model
+):
+    """
+    Range of consecutive IDs of a search model to index as a unit of work
+    of a reindex.
+    """
+    reindex = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='chunks', to=SearchReindex,
+        verbose_name=_(message='Reindex')
+    )
+    search_model_name = models.CharField(
+        max_length=128, verbose_name=_(message='Search model name')
+    )
+    id_start = models.BigIntegerField(verbose_name=_(message='ID start'))
+    id_end = models.BigIntegerField(verbose_name=_(message='ID end'))
+    object_count = models.PositiveIntegerField(
+        help_text=_(message='Number of objects when the chunk was planned.'),
+        verbose_name=_(message='Object count')
+    )
+    state = models.CharField(
+        choices=REINDEX_CHUNK_STATE_CHOICES, db_index=True,
+        default=REINDEX_CHUNK_STATE_PENDING, max_length=16,
+        verbose_name=_(message='State')
+    )
+    datetime_finished = models.DateTimeField(
+        blank=True, null=True, verbose_name=_(message='Date and time finished')
+    )
+
+    class Meta:
+        ordering = ('id',)
+        verbose_name = _(message='Search reindex chunk')
+        verbose_name_plural = _(message='Search reindex chunks')
+
+    objects = SearchReindexChunkManager()
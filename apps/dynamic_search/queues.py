@@ -5,7 +5,11 @@ from django.utils.translation import gettext_lazy as _
 from mayan.apps.task_manager.classes import CeleryQueue
 from mayan.apps.task_manager.workers import worker_e
 
-from .literals import TASK_SAVED_RESULTSET_EXPIRED_DELETE_INTERVAL
+from .literals import (
+    TASK_INDEX_QUEUE_FLUSH_INTERVAL,
+    TASK_SAVED_RESULTSET_EXPIRED_DELETE_INTERVAL
+)
+from .settings import setting_backend_optimize_interval
 
 queue_search = CeleryQueue(
     label=_(message='Search'), name='search', worker=worker_e
@@ -19,6 +23,13 @@ queue_search.add_task_type(
     label=_(message='Remove a model instance from the search engine.'),
     name='task_deindex_instance'
 )
+queue_search.add_task_type(
+    dotted_path='mayan.apps.dynamic_search.tasks.task_deindex_instances',
+    label=_(
+        message='Remove a list of model instances from the search engine.'
+    ),
+    name='task_deindex_instances'
+)
 queue_search.add_task_type(
     dotted_path='mayan.apps.dynamic_search.tasks.task_index_instance',
     label=_(message='Index a model instance to the search engine.'),
@@ -30,6 +41,14 @@ queue_search.add_task_type(
         message='Index all instances of a search model to the search engine.'
     ), name='task_index_instances'
 )
+queue_search.add_task_type(
+    dotted_path='mayan.apps.dynamic_search.tasks.task_index_queue_flush',
+    label=_(
+        message='Send the pending index and deindex requests to the search '
+        'engine.'
+    ), name='task_index_queue_flush',
+    schedule=timedelta(seconds=TASK_INDEX_QUEUE_FLUSH_INTERVAL)
+)
 queue_search.add_task_type(
     dotted_path='mayan.apps.dynamic_search.tasks.task_index_related_instance_m2m',
     label=_(
@@ -38,6 +57,18 @@ queue_search.add_task_type(
     ), name='task_index_related_instance_m2m'
 )
 
+if setting_backend_optimize_interval.value:
+    schedule_backend_optimize = timedelta(
+        seconds=setting_backend_optimize_interval.value
+    )
+else:
+    schedule_backend_optimize = None
+
+queue_search_slow.add_task_type(
+    dotted_path='mayan.apps.dynamic_search.tasks.task_backend_optimize',
+    label=_(message='Optimize the search backend indices.'),
+    name='task_backend_optimize', schedule=schedule_backend_optimize
+)
 queue_search_slow.add_task_type(
     dotted_path='mayan.apps.dynamic_search.tasks.task_reindex_backend',
     label=_(
@@ -45,6 +76,23 @@ queue_search_slow.add_task_type(
         'again.'
     ), name='task_reindex_backend'
 )
+queue_search_slow.add_task_type(
+    dotted_path='mayan.apps.dynamic_search.tasks.task_reindex_chunk',
+    label=_(
+        message='Index a chunk of instances of a search backend reindex.'
+    ), name='task_reindex_chunk'
+)
+queue_search_slow.add_task_type(
+    dotted_path='mayan.apps.dynamic_search.tasks.task_reindex_dispatch',
+    label=_(
+        message='Queue the pending chunks of a search backend reindex.'
+    ), name='task_reindex_dispatch'
+)
+queue_search_slow.add_task_type(
+    dotted_path='mayan.apps.dynamic_search.tasks.task_reindex_resume',
+    label=_(message='Resume an interrupted search backend reindex.'),
+    name='task_reindex_resume'
+)
 
 queue_search.add_task_type(
     dotted_path='mayan.apps.dynamic_search.tasks.task_saved_resultset_expired_delete',
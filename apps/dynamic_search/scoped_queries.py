@@ -82,6 +82,24 @@ class ScopedQuery:
             'No scope found with identifier `{}`'.format(scope_identifier)
         )
 
+    def get_single_filter_scope_entry(self):
+        """
+        Return the data filter scope entry when the result of the query is
+        a single filter. Returns None for queries that combine scopes.
+        """
+        if self.entry_point:
+            result_scope_identifier = getattr(
+                self.entry_point, 'result_scope_identifier', None
+            )
+
+            if result_scope_identifier:
+                scope_entry = self.get_scope_entry_by_identifier(
+                    scope_identifier=result_scope_identifier
+                )
+
+                if isinstance(scope_entry, ScopedQueryEntryDataFilter):
+                    return scope_entry
+
     def get_scope_identifier_list(self):
         result = []
 
@@ -325,7 +343,7 @@ class ScopedQueryEntryDataFilter(ScopedQueryEntryData):
         scope_limit = setting_query_results_limit.value
 
         if self.value:
-            query_type, value = QueryType.check_all(value=self.value)
+            query_type, value = self.query_type_value
 
             try:
                 results = search_backend._search(
@@ -369,10 +387,41 @@ class ScopedQueryEntryDataFilter(ScopedQueryEntryData):
         else:
             return ()
 
+    def do_resolve_page(self, search_backend, limit, offset=0):
+        """
+        Return a list of up to `limit` IDs ordered by relevance starting
+        at `offset`. Raises `NotImplementedError` if the search backend
+        does not support ranked pages.
+        """
+        if self.value:
+            query_type, value = self.query_type_value
+
+            try:
+                return search_backend._search_page(
+                    is_quoted_value=self.is_quoted_value,
+                    is_raw_value=self.is_raw_value, limit=limit,
+                    offset=offset, query_type=query_type,
+                    search_field=self.search_field, value=value
+                )
+            except (DynamicSearchBackendException, NotImplementedError):
+                """Raise as is."""
+                raise
+            except Exception as exception:
+                """Wrap any other exception raised by the backend."""
+                raise DynamicSearchBackendException(
+                    _(
+                        message='Search backend error. Verify that the '
+                        'search service is available and that the search '
+                        'syntax is valid for the active search backend; %s'
+                    ) % exception
+                ) from exception
+        else:
+            return []
+
     def get_template_explain_context(self):
         context = super().get_template_explain_context()
 
-        query_type, value = QueryType.check_all(value=self.value)
+        query_type, value = self.query_type_value
 
         if self.is_quoted_value:
             value = '"{}"'.format(value)
@@ -404,6 +453,14 @@ class ScopedQueryEntryDataFilter(ScopedQueryEntryData):
     def is_empty(self):
         return not self.value and not self.is_quoted_value and not self.is_raw_value
 
+    @cached_property
+    def query_type_value(self):
+        """
+        Query type and value without the query type alias. Resolved once
+        per entry as the entry can be resolved several times.
+        """
+        return QueryType.check_all(value=self.value)
+
     @cached_property
     def search_field(self):
         return self.scoped_query.search_model.get_search_field(
@@ -9,8 +9,14 @@ from mayan.apps.common.utils import (
     ResolverPipelineModelAttribute, flatten_list, get_class_full_name
 )
 
-from .exceptions import DynamicSearchModelException, DynamicSearchQueryError
-from .literals import MESSAGE_FEATURE_NO_STATUS
+from .classes import SearchResultCache
+from .exceptions import (
+    DynamicSearchModelException, DynamicSearchQueryError,
+    DynamicSearchScopedQueryError
+)
+from .literals import (
+    MESSAGE_FEATURE_NO_STATUS, SEARCH_PAGE_BACKEND_PAGE_SIZE_MINIMUM
+)
 from .search_interpreters import SearchInterpreter
 from .search_models import SearchModel
 from .settings import (
@@ -23,6 +29,7 @@ logger = logging.getLogger(name=__name__)
 class SearchBackend:
     _initialized = False
     feature_reindex = False
+    feature_reindex_shadow = False
     field_type_mapping = None
 
     @staticmethod
@@ -143,6 +150,29 @@ class SearchBackend:
 
         return SearchBackend.get_class()(**kwargs)
 
+    @staticmethod
+    def get_instance_list():
+        """
+        Return the search backend instances that must receive the index
+        changes. While a reindex builds shadow indices, this includes an
+        instance for the shadow indices to keep them current.
+        """
+        SearchReindex = apps.get_model(
+            app_label='dynamic_search', model_name='SearchReindex'
+        )
+
+        search_backend = SearchBackend.get_instance()
+        result = [search_backend]
+
+        search_reindex = SearchReindex.objects.get_shadow_active()
+
+        if search_reindex:
+            result.append(
+                search_reindex.get_search_backend()
+            )
+
+        return result
+
     @staticmethod
     def limit_queryset(queryset):
         pk_list = queryset.values('pk')[:setting_results_limit.value]
@@ -155,6 +185,27 @@ class SearchBackend:
         # Hidden import
         from .tasks import task_index_instance
 
+        SearchIndexQueueEntry = apps.get_model(
+            app_label='dynamic_search', model_name='SearchIndexQueueEntry'
+        )
+
+        def call_task(entry, exclude_kwargs):
+            if exclude_kwargs:
+                # Requests that exclude a related object are specific to
+                # this event and cannot be coalesced.
+                task_kwargs = {
+                    'app_label': entry._meta.app_label,
+                    'model_name': entry._meta.model_name,
+                    'object_id': entry.pk
+                }
+                task_kwargs.update(exclude_kwargs)
+
+                task_index_instance.apply_async(
+                    kwargs=task_kwargs
+                )
+            else:
+                SearchIndexQueueEntry.objects.index_request(instance=entry)
+
         if action in ('post_add', 'pre_remove'):
             instance_paths = search_model_related_paths.get(
                 instance._meta.model, ()
@@ -188,16 +239,7 @@ class SearchBackend:
                 entries = flatten_list(value=result)
 
                 for entry in entries:
-                    task_kwargs = {
-                        'app_label': entry._meta.app_label,
-                        'model_name': entry._meta.model_name,
-                        'object_id': entry.pk
-                    }
-                    task_kwargs.update(exclude_kwargs)
-
-                    task_index_instance.apply_async(
-                        kwargs=task_kwargs
-                    )
+                    call_task(entry=entry, exclude_kwargs=exclude_kwargs)
 
             if action == 'pre_remove':
                 exclude_kwargs = {
@@ -217,16 +259,7 @@ class SearchBackend:
                     entries = flatten_list(value=result)
 
                     for entry in entries:
-                        task_kwargs = {
-                            'app_label': entry._meta.app_label,
-                            'model_name': entry._meta.model_name,
-                            'object_id': entry.pk
-                        }
-                        task_kwargs.update(exclude_kwargs)
-
-                        task_index_instance.apply_async(
-                            kwargs=task_kwargs
-                        )
+                        call_task(entry=entry, exclude_kwargs=exclude_kwargs)
 
     def __init__(self, _test_mode=False):
         self._test_mode = _test_mode
@@ -234,11 +267,34 @@ class SearchBackend:
     def _search(self, limit, query, search_model, user):
         raise NotImplementedError
 
+    def _search_page(
+        self, search_field, query_type, value, limit, offset=0,
+        is_quoted_value=False, is_raw_value=False
+    ):
+        """
+        Optional method to return a list of up to `limit` IDs ordered by
+        relevance starting at `offset`.
+        """
+        raise NotImplementedError
+
     def deindex_instance(self, instance):
         """
         Optional method to remove an model instance from the search index.
         """
 
+    def deindex_instances(self, search_model, id_list):
+        """
+        Remove several instances from the search index. Backends can
+        override this method to remove all the instances at once.
+        """
+        for instance_id in id_list:
+            # The instances are usually deleted already. An unsaved
+            # instance with the same primary key is enough to locate the
+            # index entry.
+            self.deindex_instance(
+                instance=search_model.model(pk=instance_id)
+            )
+
     def do_native_type_conversion(self, value):
         return value
 
@@ -290,6 +346,14 @@ class SearchBackend:
             search_model=search_field.search_model
         )[search_field.field_name]['field']
 
+    def get_shadow_kwargs(self, name):
+        """
+        Optional method to return the backend arguments of an instance
+        that uses the shadow indices `name` instead of the current
+        indices. Required by `feature_reindex_shadow`.
+        """
+        raise NotImplementedError
+
     def get_status(self):
         """
         Backend specific method to provide status and statistics information.
@@ -318,6 +382,12 @@ class SearchBackend:
         Optional method to setup the backend. Executed once on every boot up.
         """
 
+    def optimize(self):
+        """
+        Optional method to compact or merge the search indices. Executed
+        periodically.
+        """
+
     def refresh(self):
         """
         Forces all indexes to update and present an actual view of the
@@ -343,19 +413,52 @@ class SearchBackend:
             query=query, search_model=search_model
         )
 
-        id_list = search_interpreter.do_resolve(search_backend=self)
+        # Only searches of the entire search model are cached. Results
+        # of a custom queryset are specific to the caller.
+        if queryset is None:
+            try:
+                cache_key = SearchResultCache.get_key(
+                    query_string=search_interpreter.to_string(),
+                    search_model=search_model, user=user
+                )
+            except DynamicSearchScopedQueryError:
+                cache_key = None
+        else:
+            cache_key = None
 
-        queryset = queryset or search_model.get_queryset()
+        if cache_key:
+            pk_list = SearchResultCache.get(key=cache_key)
+        else:
+            pk_list = None
 
-        queryset = queryset.filter(pk__in=id_list)
+        if pk_list is not None:
+            queryset = search_model.get_queryset().filter(pk__in=pk_list)
+        else:
+            id_list = search_interpreter.do_resolve(search_backend=self)
 
-        if search_model.permission:
-            queryset = AccessControlList.objects.restrict_queryset(
-                permission=search_model.permission, queryset=queryset,
-                user=user
-            )
+            # Avoid `queryset or ...`, it evaluates the queryset.
+            if queryset is None:
+                queryset = search_model.get_queryset()
+
+            queryset = queryset.filter(pk__in=id_list)
+
+            if search_model.permission:
+                queryset = AccessControlList.objects.restrict_queryset(
+                    permission=search_model.permission, queryset=queryset,
+                    user=user
+                )
 
-        queryset = SearchBackend.limit_queryset(queryset=queryset)
+            queryset = SearchBackend.limit_queryset(queryset=queryset)
+
+            if cache_key:
+                pk_list = list(
+                    queryset.values_list('pk', flat=True)
+                )
+                SearchResultCache.set(key=cache_key, pk_list=pk_list)
+
+                queryset = search_model.get_queryset().filter(
+                    pk__in=pk_list
+                )
 
         if store_resultset:
             search_explainer_text = search_interpreter.to_explain()
@@ -370,6 +473,108 @@ class SearchBackend:
 
         return (saved_resultset, queryset)
 
+    def search_page(
+        self, query, search_model, user, limit, offset=0, queryset=None
+    ):
+        """
+        Return a list of up to `limit` instances starting at `offset`.
+        Queries of a single filter are ordered by relevance and fetched
+        in pages from the backend, if the backend supports it. Access
+        control is then applied to each page. The cost depends on the
+        size of the page and not on the total number of results. Other
+        queries are resolved with `search` and sliced.
+        """
+        AccessControlList = apps.get_model(
+            app_label='acls', model_name='AccessControlList'
+        )
+
+        if queryset is None:
+            queryset = search_model.get_queryset()
+
+        search_interpreter = SearchInterpreter.init(
+            query=query, search_model=search_model
+        )
+
+        scope_entry = search_interpreter.get_single_filter_scope_entry()
+
+        if scope_entry:
+            queryset_restricted = queryset
+
+            if search_model.permission:
+                queryset_restricted = AccessControlList.objects.restrict_queryset(
+                    permission=search_model.permission,
+                    queryset=queryset_restricted, user=user
+                )
+
+            try:
+                return self.search_page_ranked(
+                    limit=limit, offset=offset, queryset=queryset_restricted,
+                    scope_entry=scope_entry
+                )
+            except NotImplementedError:
+                """Backend does not support ranked pages."""
+
+        saved_resultset, queryset = self.search(
+            query=query, queryset=queryset, search_model=search_model,
+            user=user
+        )
+
+        return list(
+            queryset[offset:offset + limit]
+        )
+
+    def search_page_ranked(self, limit, offset, queryset, scope_entry):
+        backend_page_size = max(limit, SEARCH_PAGE_BACKEND_PAGE_SIZE_MINIMUM)
+        backend_offset = 0
+        result = []
+        skip_count = offset
+
+        while len(result) < limit:
+            id_list = scope_entry.do_resolve_page(
+                limit=backend_page_size, offset=backend_offset,
+                search_backend=self
+            )
+            backend_offset += len(id_list)
+
+            instances = {
+                str(instance.pk): instance for instance in queryset.filter(
+                    pk__in=id_list
+                )
+            }
+
+            for pk in id_list:
+                # Backend IDs are not always integers.
+                instance = instances.get(
+                    str(pk)
+                )
+
+                if instance is not None:
+                    if skip_count:
+                        skip_count -= 1
+                    else:
+                        result.append(instance)
+
+                        if len(result) == limit:
+                            break
+
+            if len(id_list) < backend_page_size:
+                # Backend results are exhausted.
+                break
+
+        return result
+
+    def shadow_activate(self, name):
+        """
+        Optional method to replace the current indices with the shadow
+        indices `name`. Required by `feature_reindex_shadow`.
+        """
+        raise NotImplementedError
+
+    def shadow_delete(self, name):
+        """
+        Optional method to remove the shadow indices `name`.
+        """
+
     def tear_down(self):
         """
         Optional method to clean up and/or destroy search backend structures
@@ -276,30 +276,43 @@ class SearchFieldRelated(SearchFieldConcrete):
         self, instance, search_backend, exclude_kwargs=None,
         exclude_model=None, instance_field_data=None
     ):
-        last_field = self.field_name.split(LOOKUP_SEP)[-1]
+        queryset = self.get_value_queryset(
+            exclude_kwargs=exclude_kwargs, exclude_model=exclude_model,
+            filter_kwargs={self.reverse_path: instance.pk}
+        ).values_list(self.last_field_name, flat=True)
 
-        sub_queryset = self.related_model._meta.default_manager.filter(
-            **{
-                '{}'.format(self.reverse_path): instance.pk
-            }
-        ).values_list(last_field, flat=True)
+        return self.get_value_from_items(
+            items=queryset, search_backend=search_backend
+        )
 
-        sub_queryset = sub_queryset.filter(
-            **{
-                '{field_name}{lookup_separator}isnull'.format(
-                    field_name=last_field, lookup_separator=LOOKUP_SEP
-                ): False
+    def get_instance_value_bulk(self, id_list, search_backend):
+        """
+        Resolve the value of the field for several instances with a single
+        query. Returns a dictionary of values keyed by instance ID.
+        Instances without related values get the value of an empty list.
+        """
+        queryset = self.get_value_queryset(
+            filter_kwargs={
+                '{}{}in'.format(self.reverse_path, LOOKUP_SEP): id_list
             }
-        )
+        ).values_list(self.reverse_path, self.last_field_name)
 
-        if exclude_model and self.related_model == exclude_model:
-            sub_queryset = sub_queryset.exclude(**exclude_kwargs)
+        items_per_instance = {}
 
-        result = []
+        for instance_id, item in queryset:
+            items_per_instance.setdefault(instance_id, []).append(item)
+
+        return {
+            instance_id: self.get_value_from_items(
+                items=items_per_instance.get(instance_id, ()),
+                search_backend=search_backend
+            ) for instance_id in id_list
+        }
 
-        sub_queryset = sub_queryset.distinct()
+    def get_value_from_items(self, items, search_backend):
+        result = []
 
-        for item in sub_queryset:
+        for item in items:
             item_value = self.do_value_index_transform(
                 search_backend=search_backend, value=item
             )
@@ -308,6 +321,31 @@ class SearchFieldRelated(SearchFieldConcrete):
 
         return search_backend.do_native_type_conversion(value=result)
 
+    def get_value_queryset(
+        self, filter_kwargs, exclude_kwargs=None, exclude_model=None
+    ):
+        queryset = self.related_model._meta.default_manager.filter(
+            **filter_kwargs
+        )
+
+        queryset = queryset.filter(
+            **{
+                '{field_name}{lookup_separator}isnull'.format(
+                    field_name=self.last_field_name,
+                    lookup_separator=LOOKUP_SEP
+                ): False
+            }
+        )
+
+        if exclude_model and self.related_model == exclude_model:
+            queryset = queryset.exclude(**exclude_kwargs)
+
+        return queryset.distinct()
+
+    @cached_property
+    def last_field_name(self):
+        return self.field_name.split(LOOKUP_SEP)[-1]
+
 
 class SearchFieldVirtual(SearchField):
     """
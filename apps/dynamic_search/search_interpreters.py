@@ -1,10 +1,15 @@
+from collections import OrderedDict
+import threading
+
 from mayan.apps.views.utils import is_url_query_positive
 
 from .exceptions import (
     DynamicSearchInterpreterError, DynamicSearchInterpreterUnknownSearchType,
     DynamicSearchScopedQueryError
 )
-from .literals import MATCH_ALL_FIELD_NAME, SCOPE_MARKER
+from .literals import (
+    MATCH_ALL_FIELD_NAME, SCOPE_MARKER, SEARCH_INTERPRETER_CACHE_SIZE
+)
 from .scoped_queries import (
     ScopedQuery, ScopedQueryEntryControlResult, ScopedQueryEntryDataFilter,
     ScopedQueryEntryDataOperator
@@ -14,8 +19,32 @@ from .settings import setting_default_operator
 
 
 class SearchInterpreter:
+    """
+    Interpreters are cached by query and search model. The decoded scoped
+    query and the values derived from it are calculated once per
+    interpreter. Cached interpreters are shared and must not be modified
+    after initialization.
+    """
+    _cache = OrderedDict()
+    _cache_lock = threading.Lock()
     _registry = {}
 
+    @classmethod
+    def _init(cls, query, search_model, prefix=''):
+        for klass in cls.all():
+            checked_query = klass.check(prefix=prefix, query=query)
+
+            if checked_query is not None:
+                return klass(
+                    query=checked_query, search_model=search_model,
+                    prefix=''
+                )
+
+        raise DynamicSearchInterpreterUnknownSearchType(
+            'No `SearchInterpreter` subclass available that can handle '
+            'this search syntax.'
+        )
+
     @classmethod
     def all(cls):
         sorted_keys = sorted(
@@ -25,27 +54,50 @@ class SearchInterpreter:
             cls._registry[key] for key in sorted_keys
         ]
 
+    @classmethod
+    def get_cache_key(cls, query, search_model, prefix=''):
+        return (
+            prefix, search_model.full_name,
+            setting_default_operator.value, repr(
+                sorted(
+                    query.items()
+                )
+            )
+        )
+
     @classmethod
     def init(cls, query, search_model, prefix=''):
         """
         Initialization router. Calling this method will cycle all possible
         subclasses and return an instance of the subclass that can handle
-        the query type based on the arguments.
+        the query type based on the arguments. Instances are returned from
+        a least recently used cache when available.
         """
-        for klass in cls.all():
-            checked_query = klass.check(prefix=prefix, query=query)
+        cache_key = cls.get_cache_key(
+            prefix=prefix, query=query, search_model=search_model
+        )
 
-            if checked_query is not None:
-                return klass(
-                    query=checked_query, search_model=search_model,
-                    prefix=''
-                )
+        with cls._cache_lock:
+            try:
+                search_interpreter = cls._cache[cache_key]
+            except KeyError:
+                """Not cached, initialize a new interpreter."""
+            else:
+                cls._cache.move_to_end(key=cache_key)
+                return search_interpreter
 
-        raise DynamicSearchInterpreterUnknownSearchType(
-            'No `SearchInterpreter` subclass available that can handle '
-            'this search syntax.'
+        search_interpreter = cls._init(
+            prefix=prefix, query=query, search_model=search_model
         )
 
+        with cls._cache_lock:
+            cls._cache[cache_key] = search_interpreter
+
+            if len(cls._cache) > SEARCH_INTERPRETER_CACHE_SIZE:
+                cls._cache.popitem(last=False)
+
+        return search_interpreter
+
     @classmethod
     def register(cls, klass, priority):
         if priority in cls._registry:
@@ -68,6 +120,16 @@ class SearchInterpreter:
             search_field.field_name for search_field in self.search_model.search_fields
         ]
 
+        self._cached_values = {}
+
+    def _get_cached_value(self, function, name):
+        try:
+            return self._cached_values[name]
+        except KeyError:
+            value = function()
+            self._cached_values[name] = value
+            return value
+
     @classmethod
     def do_prefix_remove(cls, prefix, value):
         if value.startswith(prefix):
@@ -75,8 +137,21 @@ class SearchInterpreter:
                 len(prefix):
             ]
 
+    def do_query_cleanup(self):
+        """
+        Return the query without the empty values and the invalid keys.
+        """
+        return self._get_cached_value(
+            function=self._do_query_cleanup, name='query_clean'
+        ).copy()
+
     def do_query_decode(self, query=None):
-        return self._do_query_decode(query=query)
+        if query is None:
+            return self._get_cached_value(
+                function=self._do_query_decode, name='scoped_query'
+            )
+        else:
+            return self._do_query_decode(query=query)
 
     def do_resolve(self, search_backend):
         scoped_query = self.do_query_decode()
@@ -86,6 +161,13 @@ class SearchInterpreter:
     def get_scoped_query_instance(self):
         return self.scoped_query_class(search_model=self.search_model)
 
+    def get_single_filter_scope_entry(self):
+        try:
+            scoped_query = self.do_query_decode()
+            return scoped_query.get_single_filter_scope_entry()
+        except DynamicSearchScopedQueryError:
+            return None
+
     @property
     def is_empty(self):
         return self.do_query_decode().is_empty
@@ -94,13 +176,23 @@ class SearchInterpreter:
         """
         Generate a human readable version of the query.
         """
-        clean_query = self.do_query_cleanup()
+        def function():
+            clean_query = self.do_query_cleanup()
+
+            search_interpreter = self.__class__(
+                query=clean_query, search_model=self.search_model
+            )
+
+            scoped_query = search_interpreter.do_query_decode()
+            return scoped_query.to_explain()
 
-        scoped_query = self.do_query_decode(query=clean_query)
-        return scoped_query.to_explain()
+        return self._get_cached_value(function=function, name='explain')
 
     def to_string(self):
-        raise NotImplementedError
+        return self._get_cached_value(
+            function=lambda: self.do_query_decode().to_string(),
+            name='string'
+        )
 
 
 class SearchInterpreterAdvanced(SearchInterpreter):
@@ -121,16 +213,41 @@ class SearchInterpreterAdvanced(SearchInterpreter):
         if result:
             return result
 
+    def _do_query_cleanup(self):
+        result = {}
+
+        scoped_query = self.get_scoped_query_instance()
+
+        for key, value in self.query.items():
+            if value:
+                key = self.do_prefix_remove(prefix=self.prefix, value=key)
+
+                if key in scoped_query.search_model.search_field_name_list or key == MATCH_ALL_FIELD_NAME:
+                    result[key] = value
+
+        return result
+
     def _do_query_decode(self, query=None):
+        scoped_query, result_scope = self._do_query_decode_result_scope(
+            query=query
+        )
+        return scoped_query
+
+    def _do_query_decode_result_scope(self, query=None):
+        """
+        Return the scoped query and its result scope. The state of the
+        decoding is kept in local variables, cached interpreters are
+        decoded concurrently by several threads.
+        """
         query = query or self.query.copy()
 
         query_match_all_value = query.pop(MATCH_ALL_FIELD_NAME, 'no')
 
-        self.global_and_search = is_url_query_positive(
+        global_and_search = is_url_query_positive(
             value=query_match_all_value
         )
 
-        if self.global_and_search:
+        if global_and_search:
             inter_field_operator = 'AND'
         else:
             inter_field_operator = 'OR'
@@ -139,14 +256,14 @@ class SearchInterpreterAdvanced(SearchInterpreter):
 
         scoped_query = self.get_scoped_query_instance()
 
-        self.do_scope_search_compose(
+        result_scope = self.do_scope_search_compose(
             inter_field_operator=inter_field_operator,
             query_field_term_dictionary=query_field_term_dictionary,
             scoped_query=scoped_query
         )
 
-        if self.result_scope is not None:
-            result_scope_identifier = str(self.result_scope)
+        if result_scope is not None:
+            result_scope_identifier = str(result_scope)
 
             scoped_query_entry = ScopedQueryEntryControlResult(
                 result_scope_identifier=result_scope_identifier,
@@ -154,13 +271,28 @@ class SearchInterpreterAdvanced(SearchInterpreter):
             )
             scoped_query.do_scope_entry_add(scope_entry=scoped_query_entry)
 
-        return scoped_query
+        return scoped_query, result_scope
+
+    def do_query_decode(self, query=None):
+        if query is None:
+            scoped_query, result_scope = self._get_cached_value(
+                function=self._do_query_decode_result_scope,
+                name='scoped_query_result_scope'
+            )
+            return scoped_query
+        else:
+            return self._do_query_decode(query=query)
 
     def do_resolve(self, search_backend):
         try:
             return super().do_resolve(search_backend=search_backend)
         except DynamicSearchScopedQueryError:
-            if not self.result_scope:
+            scoped_query, result_scope = self._get_cached_value(
+                function=self._do_query_decode_result_scope,
+                name='scoped_query_result_scope'
+            )
+
+            if not result_scope:
                 return self.search_model.get_queryset().none()
             else:
                 raise
@@ -168,8 +300,11 @@ class SearchInterpreterAdvanced(SearchInterpreter):
     def do_scope_search_compose(
         self, inter_field_operator, query_field_term_dictionary, scoped_query
     ):
-        self.result_scope = None
-
+        """
+        Add the scope entries of the query terms to the scoped query.
+        Returns the identifier of the result scope or None if the query
+        has no terms.
+        """
         field_result_scope_list = []
         scope_id = 0
 
@@ -205,7 +340,7 @@ class SearchInterpreterAdvanced(SearchInterpreter):
                 field_result_scope_list.append(scope_id - 1)
 
         if field_result_scope_list:
-            self.result_scope = self.do_scope_operators_add(
+            return self.do_scope_operators_add(
                 operator_text=inter_field_operator, result_scope=scope_id,
                 scope_id_list=field_result_scope_list,
                 scoped_query=scoped_query
@@ -241,24 +376,6 @@ class SearchInterpreterAdvanced(SearchInterpreter):
 
             return result_scope - 1
 
-    def do_query_cleanup(self):
-        result = {}
-
-        scoped_query = self.get_scoped_query_instance()
-
-        for key, value in self.query.items():
-            if value:
-                key = self.do_prefix_remove(prefix=self.prefix, value=key)
-
-                if key in scoped_query.search_model.search_field_name_list or key == MATCH_ALL_FIELD_NAME:
-                    result[key] = value
-
-        return result
-
-    def to_string(self):
-        scoped_query = self.do_query_decode()
-        return scoped_query.to_string()
-
 
 class SearchInterpreterScoped(SearchInterpreter):
     @classmethod
@@ -273,20 +390,7 @@ class SearchInterpreterScoped(SearchInterpreter):
         if result:
             return result
 
-    def _do_query_decode(self, query=None):
-        """
-        Converts a user scoped query into an internal scope query
-        collection.
-        """
-        query = query or self.query
-        scoped_query = self.get_scoped_query_instance()
-
-        for key, value in query.items():
-            scoped_query.do_scope_entry_init(key=key, value=value)
-
-        return scoped_query
-
-    def do_query_cleanup(self):
+    def _do_query_cleanup(self):
         result = {}
         scoped_query = self.get_scoped_query_instance()
 
@@ -305,9 +409,18 @@ class SearchInterpreterScoped(SearchInterpreter):
 
         return result
 
-    def to_string(self):
-        scoped_query = self.do_query_decode()
-        return scoped_query.to_string()
+    def _do_query_decode(self, query=None):
+        """
+        Converts a user scoped query into an internal scope query
+        collection.
+        """
+        query = query or self.query
+        scoped_query = self.get_scoped_query_instance()
+
+        for key, value in query.items():
+            scoped_query.do_scope_entry_init(key=key, value=value)
+
+        return scoped_query
 
 
 SearchInterpreter.register(klass=SearchInterpreterAdvanced, priority=1)
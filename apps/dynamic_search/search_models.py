@@ -299,23 +299,71 @@ class SearchModel(AppsModuleLoaderMixin):
 
     def populate(
         self, instance, search_backend, exclude_kwargs=None,
-        exclude_model=None
+        exclude_model=None, field_values=None
     ):
+        """
+        `field_values` is an optional dictionary of field values already
+        resolved for this instance, keyed by search field name.
+        """
+        field_values = field_values or {}
         instance_field_data = {}
 
         # Process the search fields by order of priority. This makes sure
         # that virtual fields are processed last.
         for search_field in self.search_fields_priority_sorted:
-            field_value = search_field.get_instance_value(
-                exclude_kwargs=exclude_kwargs, exclude_model=exclude_model,
-                instance=instance, instance_field_data=instance_field_data,
-                search_backend=search_backend
-            )
+            try:
+                field_value = field_values[search_field.field_name]
+            except KeyError:
+                field_value = search_field.get_instance_value(
+                    exclude_kwargs=exclude_kwargs,
+                    exclude_model=exclude_model, instance=instance,
+                    instance_field_data=instance_field_data,
+                    search_backend=search_backend
+                )
+
             if field_value is not None:
                 instance_field_data[search_field.field_name] = field_value
 
         return instance_field_data
 
+    def populate_bulk(self, queryset, search_backend):
+        """
+        Generator that yields each instance of the queryset with its index
+        data. Related search fields are resolved with one query per field
+        for all the instances instead of one query per field and instance.
+        """
+        instances = tuple(queryset)
+        id_list = [instance.pk for instance in instances]
+
+        field_values_per_field = {}
+
+        if id_list:
+            for search_field in self.search_fields:
+                try:
+                    get_instance_value_bulk = search_field.get_instance_value_bulk
+                except AttributeError:
+                    """
+                    Search field does not support bulk resolution. It will
+                    be resolved for each instance.
+                    """
+                else:
+                    field_values_per_field[
+                        search_field.field_name
+                    ] = get_instance_value_bulk(
+                        id_list=id_list, search_backend=search_backend
+                    )
+
+        for instance in instances:
+            field_values = {
+                field_name: values[instance.pk]
+                for field_name, values in field_values_per_field.items()
+            }
+
+            yield instance, self.populate(
+                field_values=field_values, instance=instance,
+                search_backend=search_backend
+            )
+
     @property
     def proxies(self):
         result = []
@@ -4,11 +4,17 @@ from mayan.apps.smart_settings.settings import setting_cluster
 
 from .literals import (
     DEFAULT_SEARCH_BACKEND, DEFAULT_SEARCH_BACKEND_ARGUMENTS,
+    DEFAULT_SEARCH_BACKEND_OPTIMIZE_INTERVAL,
     DEFAULT_SEARCH_DEFAULT_OPERATOR, DEFAULT_SEARCH_DISABLE_SIMPLE_SEARCH,
     DEFAULT_SEARCH_INDEXING_CHUNK_SIZE,
+    DEFAULT_SEARCH_INDEXING_COALESCE_WINDOW,
+    DEFAULT_SEARCH_INDEXING_QUEUE_CACHE_NAME,
     DEFAULT_SEARCH_MATCH_ALL_DEFAULT_VALUE,
     DEFAULT_SEARCH_MODEL_FIELD_DISABLE,
-    DEFAULT_SEARCH_QUERY_RESULTS_LIMIT, DEFAULT_SEARCH_RESULTS_LIMIT,
+    DEFAULT_SEARCH_QUERY_RESULTS_LIMIT, DEFAULT_SEARCH_REINDEX_CHUNK_SIZE,
+    DEFAULT_SEARCH_REINDEX_CONCURRENCY,
+    DEFAULT_SEARCH_RESULTS_CACHE_NAME,
+    DEFAULT_SEARCH_RESULTS_CACHE_TIME_TO_LIVE, DEFAULT_SEARCH_RESULTS_LIMIT,
     DEFAULT_SEARCH_SAVED_RESULTSET_RESULTS_LIMIT,
     DEFAULT_SEARCH_SAVED_RESULTSETS_PER_USER_LIMIT,
     DEFAULT_SEARCH_SAVED_RESULTSET_TIME_TO_LIVE,
@@ -32,6 +38,16 @@ setting_backend_arguments = setting_namespace.do_setting_add(
         'to change the behavior, host names, or authentication arguments.'
     )
 )
+setting_backend_optimize_interval = setting_namespace.do_setting_add(
+    default=DEFAULT_SEARCH_BACKEND_OPTIMIZE_INTERVAL,
+    global_name='SEARCH_BACKEND_OPTIMIZE_INTERVAL', help_text=_(
+        message='Time in seconds between each optimization of the search '
+        'backend indices, for backends that support it. For the Whoosh '
+        'backend this merges the index segments, use it when the '
+        '`writer_commit_merge` backend argument is disabled. Set to 0 to '
+        'disable the periodic optimization.'
+    )
+)
 setting_default_operator = setting_namespace.do_setting_add(
     choices=SCOPE_OPERATOR_CHOICES.keys(),
     global_name='SEARCH_DEFAULT_OPERATOR',
@@ -53,6 +69,24 @@ setting_indexing_chunk_size = setting_namespace.do_setting_add(
         message='Amount of objects to process when performing bulk indexing.'
     )
 )
+setting_indexing_coalesce_window = setting_namespace.do_setting_add(
+    default=DEFAULT_SEARCH_INDEXING_COALESCE_WINDOW,
+    global_name='SEARCH_INDEXING_COALESCE_WINDOW', help_text=_(
+        message='Time in seconds to accumulate index and deindex requests '
+        'before sending them to the search backend. Repeated requests for '
+        'the same object during this time are processed only once. '
+        'Set to 0 to index each object as soon as it is saved.'
+    )
+)
+setting_indexing_queue_cache_name = setting_namespace.do_setting_add(
+    default=DEFAULT_SEARCH_INDEXING_QUEUE_CACHE_NAME,
+    global_name='SEARCH_INDEXING_QUEUE_CACHE_NAME', help_text=_(
+        message='Name of the Django cache used to schedule the flushes of '
+        'the search index queue and to keep its counters. Use a cache '
+        'shared by all processes, like Redis, when the coalescing window '
+        'is enabled.'
+    )
+)
 setting_match_all_default_value = setting_namespace.do_setting_add(
     global_name='SEARCH_MATCH_ALL_DEFAULT_VALUE',
     default=DEFAULT_SEARCH_MATCH_ALL_DEFAULT_VALUE, help_text=_(
@@ -66,6 +100,43 @@ setting_query_results_limit = setting_namespace.do_setting_add(
         'search query unit.'
     )
 )
+setting_reindex_chunk_size = setting_namespace.do_setting_add(
+    default=DEFAULT_SEARCH_REINDEX_CHUNK_SIZE,
+    global_name='SEARCH_REINDEX_CHUNK_SIZE', help_text=_(
+        message='Amount of objects in each of the units of work of a full '
+        'reindex. Completed units are recorded and are not processed again '
+        'when an interrupted reindex is resumed.'
+    )
+)
+setting_reindex_concurrency = setting_namespace.do_setting_add(
+    default=DEFAULT_SEARCH_REINDEX_CONCURRENCY,
+    global_name='SEARCH_REINDEX_CONCURRENCY', help_text=_(
+        message='Maximum number of units of work of a full reindex that are '
+        'queued or executing at the same time.'
+    )
+)
+setting_results_cache_name = setting_namespace.do_setting_add(
+    default=DEFAULT_SEARCH_RESULTS_CACHE_NAME,
+    global_name='SEARCH_RESULTS_CACHE_NAME', help_text=_(
+        message='Name of the Django cache used to store the search results '
+        'and the index generations. Use a cache shared by all processes, '
+        'like Redis, for the indexing to invalidate the results of every '
+        'process.'
+    )
+)
+setting_results_cache_time_to_live = setting_namespace.do_setting_add(
+    default=DEFAULT_SEARCH_RESULTS_CACHE_TIME_TO_LIVE,
+    global_name='SEARCH_RESULTS_CACHE_TIME_TO_LIVE', help_text=_(
+        message='Time in seconds to keep the results of a search in the '
+        'cache. Repeated searches by users with the same roles are served '
+        'from the cache until the search model is indexed again or the '
+        'access controls change. Backends that make changes searchable '
+        'after a delay, like Elasticsearch with its refresh interval or '
+        'its bulk buffer, can have results of a search made during that '
+        'delay cached until they expire. Use a time to live adapted to '
+        'how stale the results can be. Set to 0 to disable the cache.'
+    )
+)
 setting_results_limit = setting_namespace.do_setting_add(
     default=DEFAULT_SEARCH_RESULTS_LIMIT, global_name='SEARCH_RESULTS_LIMIT',
     help_text=_(
@@ -3,17 +3,26 @@ import logging
 from django.apps import apps
 from django.core.exceptions import ObjectDoesNotExist
 
+from mayan.apps.lock_manager.backends.base import LockingBackend
 from mayan.apps.lock_manager.exceptions import LockError
 from mayan.celery import app
 
+from .classes import SearchResultCache
 from .exceptions import DynamicSearchException, DynamicSearchRetry
 from .literals import (
+    INDEX_QUEUE_FLUSH_LOCK_NAME, INDEX_QUEUE_FLUSH_LOCK_TIMEOUT,
+    REINDEX_DISPATCH_LOCK_NAME, REINDEX_DISPATCH_LOCK_TIMEOUT,
     TASK_DEINDEX_INSTANCE_MAX_RETRIES,
-    TASK_DEINDEX_INSTANCE_RETRY_BACKOFF_MAX, TASK_INDEX_INSTANCE_MAX_RETRIES,
+    TASK_DEINDEX_INSTANCE_RETRY_BACKOFF_MAX,
+    TASK_DEINDEX_INSTANCES_MAX_RETRIES,
+    TASK_DEINDEX_INSTANCES_RETRY_BACKOFF_MAX, TASK_INDEX_INSTANCE_MAX_RETRIES,
     TASK_INDEX_INSTANCE_RETRY_BACKOFF_MAX, TASK_INDEX_INSTANCES_MAX_RETRIES,
     TASK_INDEX_INSTANCES_RETRY_BACKOFF_MAX,
     TASK_INDEX_RELATED_INSTANCE_M2M_MAX_RETRIES,
-    TASK_INDEX_RELATED_INSTANCE_M2M_RETRY_BACKOFF_MAX
+    TASK_INDEX_RELATED_INSTANCE_M2M_RETRY_BACKOFF_MAX,
+    TASK_REINDEX_CHUNK_MAX_RETRIES, TASK_REINDEX_CHUNK_RETRY_BACKOFF_MAX,
+    TASK_REINDEX_DISPATCH_MAX_RETRIES,
+    TASK_REINDEX_DISPATCH_RETRY_BACKOFF_MAX
 )
 from .search_backends import SearchBackend
 from .search_models import SearchModel
@@ -21,6 +30,17 @@ from .search_models import SearchModel
 logger = logging.getLogger(name=__name__)
 
 
+@app.task(ignore_result=True)
+def task_backend_optimize():
+    search_backend = SearchBackend.get_instance()
+
+    try:
+        search_backend.optimize()
+    except (DynamicSearchRetry, LockError) as exception:
+        # Indices are being written, try again on the next schedule.
+        logger.info('Unable to optimize the search backend; %s', exception)
+
+
 @app.task(
     bind=True, ignore_result=True,
     max_retries=TASK_DEINDEX_INSTANCE_MAX_RETRIES, retry_backoff=True,
@@ -33,8 +53,8 @@ def task_deindex_instance(self, app_label, model_name, object_id):
     instance = Model._meta.default_manager.get(pk=object_id)
 
     try:
-        search_backend = SearchBackend.get_instance()
-        search_backend.deindex_instance(instance=instance)
+        for search_backend in SearchBackend.get_instance_list():
+            search_backend.deindex_instance(instance=instance)
     except (DynamicSearchRetry, LockError) as exception:
         raise self.retry(exc=exception)
     except ObjectDoesNotExist as exception:
@@ -43,6 +63,34 @@ def task_deindex_instance(self, app_label, model_name, object_id):
             str(exception)
         )
 
+    SearchResultCache.generation_increment(
+        name=SearchModel.get_for_model(instance=Model).full_name
+    )
+
+    logger.info('Finished')
+
+
+@app.task(
+    bind=True, ignore_result=True,
+    max_retries=TASK_DEINDEX_INSTANCES_MAX_RETRIES, retry_backoff=True,
+    retry_backoff_max=TASK_DEINDEX_INSTANCES_RETRY_BACKOFF_MAX
+)
+def task_deindex_instances(self, app_label, id_list, model_name):
+    logger.info('Executing')
+
+    Model = apps.get_model(app_label=app_label, model_name=model_name)
+    search_model = SearchModel.get_for_model(instance=Model)
+
+    try:
+        for search_backend in SearchBackend.get_instance_list():
+            search_backend.deindex_instances(
+                id_list=id_list, search_model=search_model
+            )
+    except (DynamicSearchRetry, LockError) as exception:
+        raise self.retry(exc=exception)
+
+    SearchResultCache.generation_increment(name=search_model.full_name)
+
     logger.info('Finished')
 
 
@@ -71,11 +119,11 @@ def task_index_instance(
         raise self.retry(exc=exception)
 
     try:
-        search_backend = SearchBackend.get_instance()
-        search_backend.index_instance(
-            exclude_kwargs=exclude_kwargs, exclude_model=ExcludeModel,
-            instance=instance
-        )
+        for search_backend in SearchBackend.get_instance_list():
+            search_backend.index_instance(
+                exclude_kwargs=exclude_kwargs, exclude_model=ExcludeModel,
+                instance=instance
+            )
     except (DynamicSearchRetry, LockError) as exception:
         raise self.retry(exc=exception)
     except ObjectDoesNotExist as exception:
@@ -102,6 +150,10 @@ def task_index_instance(
         logger.error(error_message)
         raise DynamicSearchException(error_message) from exception
     else:
+        SearchResultCache.generation_increment(
+            name=SearchModel.get_for_model(instance=Model).full_name
+        )
+
         logger.info('Finished')
 
 
@@ -118,8 +170,8 @@ def task_index_instances(self, search_model_full_name, id_list):
     }
 
     try:
-        search_backend = SearchBackend.get_instance()
-        search_backend.index_instances(**kwargs)
+        for search_backend in SearchBackend.get_instance_list():
+            search_backend.index_instances(**kwargs)
     except (DynamicSearchRetry, LockError) as exception:
         raise self.retry(exc=exception)
     except Exception as exception:
@@ -130,6 +182,31 @@ def task_index_instances(self, search_model_full_name, id_list):
 
         logger.error(error_message)
         raise DynamicSearchException(error_message) from exception
+    else:
+        SearchResultCache.generation_increment(name=search_model.full_name)
+
+
+@app.task(ignore_result=True)
+def task_index_queue_flush():
+    SearchIndexQueueEntry = apps.get_model(
+        app_label='dynamic_search', model_name='SearchIndexQueueEntry'
+    )
+
+    try:
+        lock = LockingBackend.get_backend().acquire_lock(
+            name=INDEX_QUEUE_FLUSH_LOCK_NAME,
+            timeout=INDEX_QUEUE_FLUSH_LOCK_TIMEOUT
+        )
+    except LockError:
+        logger.debug('Search index queue is already being flushed')
+    else:
+        logger.info('Starting search index queue flush')
+        try:
+            SearchIndexQueueEntry.objects.flush()
+        finally:
+            lock.release()
+
+        logger.info('Finished search index queue flush')
 
 
 @app.task(
@@ -168,18 +245,107 @@ def task_index_related_instance_m2m(
 
 
 @app.task(ignore_result=True)
-def task_reindex_backend():
-    search_backend = SearchBackend.get_instance()
-    search_backend.reset()
-
-    for search_model in SearchModel.all():
-        for id_list in search_model.get_id_groups():
-            task_index_instances.apply_async(
-                kwargs={
-                    'id_list': id_list,
-                    'search_model_full_name': search_model.full_name
-                }
-            )
+def task_reindex_backend(concurrency=None, shadow=False):
+    SearchReindex = apps.get_model(
+        app_label='dynamic_search', model_name='SearchReindex'
+    )
+
+    search_reindex = SearchReindex.objects.reindex_start(
+        concurrency=concurrency, shadow=shadow
+    )
+    search_reindex.do_plan()
+
+    task_reindex_dispatch.apply_async(
+        kwargs={'search_reindex_id': search_reindex.pk}
+    )
+
+
+@app.task(
+    bind=True, ignore_result=True,
+    max_retries=TASK_REINDEX_CHUNK_MAX_RETRIES, retry_backoff=True,
+    retry_backoff_max=TASK_REINDEX_CHUNK_RETRY_BACKOFF_MAX
+)
+def task_reindex_chunk(self, search_reindex_chunk_id):
+    SearchReindexChunk = apps.get_model(
+        app_label='dynamic_search', model_name='SearchReindexChunk'
+    )
+
+    search_reindex_chunk = SearchReindexChunk.objects.select_related(
+        'reindex'
+    ).get(pk=search_reindex_chunk_id)
+
+    try:
+        search_reindex_chunk.do_index()
+    except Exception as exception:
+        if isinstance(exception, (DynamicSearchRetry, LockError)):
+            if self.request.retries < self.max_retries:
+                raise self.retry(exc=exception)
+            else:
+                error_message = (
+                    'Retries exhausted indexing reindex chunk {}.'
+                ).format(search_reindex_chunk_id)
+        else:
+            error_message = (
+                'Unexpected error indexing reindex chunk {}.'
+            ).format(search_reindex_chunk_id)
+
+        # Record the failure and keep dispatching the other chunks.
+        search_reindex_chunk.do_error()
+
+        task_reindex_dispatch.apply_async(
+            kwargs={'search_reindex_id': search_reindex_chunk.reindex_id}
+        )
+
+        logger.error(error_message)
+        raise DynamicSearchException(error_message) from exception
+    else:
+        task_reindex_dispatch.apply_async(
+            kwargs={'search_reindex_id': search_reindex_chunk.reindex_id}
+        )
+
+
+@app.task(
+    bind=True, ignore_result=True,
+    max_retries=TASK_REINDEX_DISPATCH_MAX_RETRIES, retry_backoff=True,
+    retry_backoff_max=TASK_REINDEX_DISPATCH_RETRY_BACKOFF_MAX
+)
+def task_reindex_dispatch(self, search_reindex_id):
+    SearchReindex = apps.get_model(
+        app_label='dynamic_search', model_name='SearchReindex'
+    )
+
+    try:
+        lock = LockingBackend.get_backend().acquire_lock(
+            name=REINDEX_DISPATCH_LOCK_NAME.format(search_reindex_id),
+            timeout=REINDEX_DISPATCH_LOCK_TIMEOUT
+        )
+    except LockError as exception:
+        # Retry instead of skipping, the chunk that triggered this dispatch
+        # might have finished after the current dispatch counted the
+        # queued chunks.
+        raise self.retry(exc=exception)
+    else:
+        try:
+            search_reindex = SearchReindex.objects.get(pk=search_reindex_id)
+            search_reindex.do_dispatch()
+        except (DynamicSearchRetry, LockError) as exception:
+            raise self.retry(exc=exception)
+        finally:
+            lock.release()
+
+
+@app.task(ignore_result=True)
+def task_reindex_resume(search_reindex_id):
+    SearchReindex = apps.get_model(
+        app_label='dynamic_search', model_name='SearchReindex'
+    )
+
+    search_reindex = SearchReindex.objects.get(pk=search_reindex_id)
+    search_reindex.do_resume()
+
+    task_reindex_dispatch.apply_async(
+        kwargs={'search_reindex_id': search_reindex.pk}
+    )
 
 
 @app.task(ignore_result=True)
@@ -0,0 +1,31 @@
+TEST_BENCHMARK_BACKEND_PATH = 'mayan.apps.dynamic_search.backends.django.DjangoSearchBackend'
+TEST_BENCHMARK_BACKEND_PATH_INVALID = 'mayan.apps.dynamic_search.backends.invalid.InvalidSearchBackend'
+TEST_BENCHMARK_DOCUMENT_COUNT = 4
+TEST_BENCHMARK_PAGINATION_PAGE_COUNT = 2
+TEST_BENCHMARK_QUERY_TYPES = (
+    'exact', 'fuzzy', 'partial', 'range', 'regular_expression'
+)
+TEST_BENCHMARK_REPETITIONS = 2
+TEST_DOCUMENT_TYPE_LABEL = 'test document type'
+TEST_DOCUMENT_TYPE_LABEL_EDITED = 'other kind edited'
+TEST_DOCUMENT_TYPE_LABEL_OTHER = 'other kind'
+TEST_ELASTICSEARCH_BULK_BUFFER_FLUSH_INTERVAL = 60
+TEST_ELASTICSEARCH_BULK_BUFFER_SIZE = 4
+TEST_ELASTICSEARCH_INDEX_NAME = 'test-index'
+TEST_ELASTICSEARCH_MAX_RESULT_WINDOW = 100
+TEST_FULL_TEXT_ENTRY_VALUE_CHUNK_SIZE = 16
+TEST_FULL_TEXT_ENTRY_VALUE_LONG = 'alpha bravo charlie delta echo foxtrot golf hotel'
+TEST_SEARCH_BACKEND_OPTIMIZE_INTERVAL = 3600
+TEST_SEARCH_PAGE_BACKEND_PAGE_SIZE_MINIMUM = 2
+TEST_SEARCH_PAGE_DOCUMENT_TYPE_COUNT = 8
+TEST_SEARCH_PAGE_DOCUMENT_TYPE_LABEL = 'ranked {}'
+TEST_SEARCH_PAGE_QUERY = {'label': 'ranked'}
+TEST_SEARCH_INTERPRETER_CACHE_SIZE = 2
+TEST_SEARCH_INTERPRETER_PREFIX = 'q_'
+TEST_SEARCH_MODEL_DOCUMENT_FULL_NAME = 'documents.document'
+TEST_SEARCH_MODEL_FULL_NAME = 'documents.documenttype'
+TEST_SEARCH_MODEL_FULL_NAME_OTHER = 'tags.tag'
+TEST_SEARCH_POPULATE_DOCUMENT_COUNT = 2
+TEST_SEARCH_QUERY_STRING = 'label=test'
+TEST_SEARCH_RESULT_CACHE_TIME_TO_LIVE = 60
+TEST_TASK_REINDEX_CHUNK_MAX_RETRIES = 2
@@ -0,0 +1,78 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+
+from mayan.apps.acls.models import AccessControlList
+from mayan.apps.documents.models.document_type_models import DocumentType
+from mayan.apps.documents.permissions import permission_document_type_view
+from mayan.apps.permissions.classes import Permission
+from mayan.apps.permissions.models import Role
+from mayan.apps.storage.utils import TemporaryDirectory
+
+from ..backends.whoosh.backend import WhooshSearchBackend
+from ..search_models import SearchModel
+
+from .literals import (
+    TEST_SEARCH_MODEL_FULL_NAME, TEST_SEARCH_PAGE_BACKEND_PAGE_SIZE_MINIMUM,
+    TEST_SEARCH_PAGE_DOCUMENT_TYPE_COUNT,
+    TEST_SEARCH_PAGE_DOCUMENT_TYPE_LABEL
+)
+
+
+class SearchPageTestMixin:
+    """
+    Index document types in a Whoosh backend and give a user access to
+    every other document type. The backend page size is reduced to fetch
+    several backend pages per result page.
+    """
+    def setUp(self):
+        super().setUp()
+        temporary_directory = TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+
+        self.test_search_backend = WhooshSearchBackend(
+            index_path=temporary_directory.name
+        )
+        self.test_search_backend.initialize()
+
+        patcher = mock.patch(
+            new=TEST_SEARCH_PAGE_BACKEND_PAGE_SIZE_MINIMUM,
+            target='mayan.apps.dynamic_search.search_backends.SEARCH_PAGE_BACKEND_PAGE_SIZE_MINIMUM'
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.test_search_model = SearchModel.get(
+            name=TEST_SEARCH_MODEL_FULL_NAME
+        )
+
+        self.test_document_types = [
+            DocumentType.objects.create(
+                label=TEST_SEARCH_PAGE_DOCUMENT_TYPE_LABEL.format(index)
+            ) for index in range(TEST_SEARCH_PAGE_DOCUMENT_TYPE_COUNT)
+        ]
+        self.test_search_backend.index_instances(
+            id_list=[
+                document_type.pk for document_type in self.test_document_types
+            ], search_model=self.test_search_model
+        )
+
+        # The stored permissions of the previous tests were rolled back.
+        Permission.invalidate_cache()
+
+        self.test_user = get_user_model().objects.create_user(
+            password='test', username='test'
+        )
+        test_group = Group.objects.create(name='test')
+        test_group.user_set.add(self.test_user)
+        test_role = Role.objects.create(label='test')
+        test_role.groups.add(test_group)
+
+        self.test_document_types_visible = self.test_document_types[::2]
+
+        for document_type in self.test_document_types_visible:
+            AccessControlList.objects.grant(
+                obj=document_type, permission=permission_document_type_view,
+                role=test_role
+            )
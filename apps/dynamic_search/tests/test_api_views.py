@@ -0,0 +1,91 @@
+from unittest import mock
+
+from django.test import TestCase
+from django.urls import reverse
+
+from mayan.apps.rest_api.literals import DEFAULT_PAGE_SIZE_QUERY_PARAMETER
+
+from .literals import TEST_SEARCH_MODEL_FULL_NAME, TEST_SEARCH_PAGE_QUERY
+from .mixins import SearchPageTestMixin
+
+
+class APISearchRankedViewTestCase(SearchPageTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch(
+            return_value=self.test_search_backend,
+            target='mayan.apps.dynamic_search.api_views.search_api_views.SearchBackend.get_instance'
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.client.force_login(user=self.test_user)
+
+        self.test_result_id_list = [
+            document_type.pk for document_type in self.test_search_backend.search_page(
+                limit=len(self.test_document_types), offset=0,
+                query=TEST_SEARCH_PAGE_QUERY,
+                search_model=self.test_search_model, user=self.test_user
+            )
+        ]
+
+    def _request_test_search_ranked_api_view(self, page=None):
+        data = {DEFAULT_PAGE_SIZE_QUERY_PARAMETER: 1}
+        data.update(TEST_SEARCH_PAGE_QUERY)
+
+        if page:
+            data['page'] = page
+
+        return self.client.get(
+            data=data, path=reverse(
+                kwargs={'search_model_pk': TEST_SEARCH_MODEL_FULL_NAME},
+                viewname='rest_api:ranked-search-view'
+            )
+        )
+
+    def _get_test_response_id_list(self, response):
+        return [
+            result['id'] for result in response.json()['results']
+        ]
+
+    def test_first_page(self):
+        response = self._request_test_search_ranked_api_view()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            self._get_test_response_id_list(response=response),
+            self.test_result_id_list[:1]
+        )
+        self.assertIn('page=2', response.json()['next'])
+        self.assertEqual(response.json()['previous'], None)
+
+    def test_last_page(self):
+        page = len(self.test_result_id_list)
+
+        response = self._request_test_search_ranked_api_view(page=page)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            self._get_test_response_id_list(response=response),
+            self.test_result_id_list[page - 1:]
+        )
+        self.assertEqual(response.json()['next'], None)
+        self.assertIn(
+            'page={}'.format(page - 1), response.json()['previous']
+        )
+
+    def test_pages(self):
+        id_list = []
+
+        for page in range(1, len(self.test_result_id_list) + 1):
+            response = self._request_test_search_ranked_api_view(page=page)
+            id_list.extend(
+                self._get_test_response_id_list(response=response)
+            )
+
+        self.assertEqual(id_list, self.test_result_id_list)
+        self.assertEqual(
+            set(id_list), {
+                document_type.pk for document_type in self.test_document_types_visible
+            }
+        )
@@ -0,0 +1,424 @@
+from unittest import mock
+
+import elasticsearch
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+
+from mayan.apps.documents.models.document_type_models import DocumentType
+from mayan.apps.lock_manager.exceptions import LockError
+from mayan.apps.storage.utils import TemporaryDirectory
+
+from ..backends.django.backend import DjangoSearchBackend
+from ..backends.django.literals import FULL_TEXT_SEARCH_SQLITE_TABLE_NAME
+from ..backends.elasticsearch.backend import (
+    ElasticSearchBackend, ElasticSearchBulkBuffer
+)
+from ..backends.whoosh.backend import WhooshSearchBackend
+from ..exceptions import DynamicSearchRetry
+from ..models import SearchFullTextEntry
+from ..search_models import SearchModel
+
+from .literals import (
+    TEST_DOCUMENT_TYPE_LABEL, TEST_DOCUMENT_TYPE_LABEL_EDITED,
+    TEST_DOCUMENT_TYPE_LABEL_OTHER,
+    TEST_ELASTICSEARCH_BULK_BUFFER_FLUSH_INTERVAL,
+    TEST_ELASTICSEARCH_MAX_RESULT_WINDOW,
+    TEST_ELASTICSEARCH_BULK_BUFFER_SIZE, TEST_ELASTICSEARCH_INDEX_NAME,
+    TEST_SEARCH_MODEL_FULL_NAME, TEST_SEARCH_MODEL_FULL_NAME_OTHER
+)
+
+
+class DjangoSearchBackendFullTextSearchTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.test_search_backend = DjangoSearchBackend(
+            _test_mode=True, full_text_search=True
+        )
+        self.test_search_backend.reset()
+        self.addCleanup(self.test_search_backend.reset)
+
+        self.test_search_field = SearchModel.get(
+            name=TEST_SEARCH_MODEL_FULL_NAME
+        ).get_search_field(field_name='label')
+
+        patcher = mock.patch.object(
+            attribute='_get_full_text_search_vendor',
+            return_value=mock.Mock(), target=self.test_search_backend
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_field_enabled_populated(self):
+        SearchFullTextEntry.objects.create(
+            field_name='label', object_id=1,
+            search_model_name=TEST_SEARCH_MODEL_FULL_NAME,
+            value=TEST_DOCUMENT_TYPE_LABEL
+        )
+
+        self.assertTrue(
+            self.test_search_backend.get_full_text_search_field_enabled(
+                search_field=self.test_search_field
+            )
+        )
+
+    def test_field_enabled_unpopulated(self):
+        self.assertFalse(
+            self.test_search_backend.get_full_text_search_field_enabled(
+                search_field=self.test_search_field
+            )
+        )
+
+
+class DjangoSearchBackendFullTextSearchSQLiteTestCase(TestCase):
+    """
+    Search the FTS5 table of SQLite created by the migrations, without
+    mocking the full text search vendor.
+    """
+    def setUp(self):
+        super().setUp()
+
+        if connection.vendor != 'sqlite':
+            self.skipTest(reason='Requires SQLite.')
+
+        table_name_fts = FULL_TEXT_SEARCH_SQLITE_TABLE_NAME.format(
+            SearchFullTextEntry._meta.db_table
+        )
+        if table_name_fts not in connection.introspection.table_names():
+            self.skipTest(reason='Requires SQLite with FTS5.')
+
+        self.test_search_backend = DjangoSearchBackend(
+            _test_mode=True, full_text_search=True
+        )
+        self.test_search_backend.reset()
+        self.addCleanup(self.test_search_backend.reset)
+
+        self.test_search_model = SearchModel.get(
+            name=TEST_SEARCH_MODEL_FULL_NAME
+        )
+        self.test_user = get_user_model().objects.create_superuser(
+            email='test@example.com', password='test', username='test'
+        )
+
+        self.test_document_types = [
+            DocumentType.objects.create(label=label) for label in (
+                TEST_DOCUMENT_TYPE_LABEL, TEST_DOCUMENT_TYPE_LABEL_OTHER
+            )
+        ]
+
+        for document_type in self.test_document_types:
+            self.test_search_backend.index_instance(instance=document_type)
+
+    def _search(self, value):
+        saved_resultset, queryset = self.test_search_backend.search(
+            query={'label': value}, search_model=self.test_search_model,
+            user=self.test_user
+        )
+
+        return list(queryset)
+
+    def test_triggers(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT name FROM sqlite_master WHERE type = \'trigger\' '
+                'AND tbl_name = %s;', (SearchFullTextEntry._meta.db_table,)
+            )
+            trigger_names = {row[0] for row in cursor.fetchall()}
+
+        self.assertEqual(len(trigger_names), 3)
+
+    def test_search(self):
+        self.assertTrue(
+            self.test_search_backend.get_full_text_search_field_enabled(
+                search_field=self.test_search_model.get_search_field(
+                    field_name='label'
+                )
+            )
+        )
+        self.assertEqual(
+            self._search(value=TEST_DOCUMENT_TYPE_LABEL_OTHER),
+            [self.test_document_types[1]]
+        )
+
+    def test_search_after_update(self):
+        self.test_document_types[0].label = TEST_DOCUMENT_TYPE_LABEL_EDITED
+        self.test_document_types[0].save()
+        self.test_search_backend.index_instance(
+            instance=self.test_document_types[0]
+        )
+
+        self.assertEqual(
+            set(
+                self._search(value=TEST_DOCUMENT_TYPE_LABEL_OTHER)
+            ), set(self.test_document_types)
+        )
+
+    def test_search_after_delete(self):
+        self.test_search_backend.deindex_instance(
+            instance=self.test_document_types[1]
+        )
+
+        self.assertEqual(
+            self._search(value=TEST_DOCUMENT_TYPE_LABEL_OTHER), []
+        )
+
+
+class ElasticSearchBackendSearchPageTestCase(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.test_search_backend = ElasticSearchBackend(
+            _test_mode=True,
+            max_result_window=TEST_ELASTICSEARCH_MAX_RESULT_WINDOW
+        )
+
+        patcher = mock.patch(
+            target='mayan.apps.dynamic_search.backends.elasticsearch.backend.Search'
+        )
+        self.mock_search = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.mock_search_sliced = self.mock_search.return_value.query.return_value.source.return_value
+
+    def _search_page(self, limit, offset):
+        search_field = mock.Mock()
+        search_field.search_model.model_name = 'test'
+
+        with mock.patch.multiple(
+            _get_client=mock.DEFAULT, do_query_type_verify=mock.DEFAULT,
+            target=self.test_search_backend
+        ):
+            return self.test_search_backend._search_page(
+                limit=limit, offset=offset, query_type=mock.Mock(),
+                search_field=search_field, value='test'
+            )
+
+    def test_page_clamp(self):
+        self._search_page(
+            limit=10, offset=TEST_ELASTICSEARCH_MAX_RESULT_WINDOW - 5
+        )
+
+        self.mock_search_sliced.__getitem__.assert_called_once_with(
+            slice(
+                TEST_ELASTICSEARCH_MAX_RESULT_WINDOW - 5,
+                TEST_ELASTICSEARCH_MAX_RESULT_WINDOW
+            )
+        )
+
+    def test_page_past_maximum_result_window(self):
+        result = self._search_page(
+            limit=10, offset=TEST_ELASTICSEARCH_MAX_RESULT_WINDOW
+        )
+
+        self.assertEqual(result, [])
+        self.mock_search_sliced.__getitem__.assert_not_called()
+
+
+class ElasticSearchBulkBufferTestCase(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.test_bulk_buffer = ElasticSearchBulkBuffer(
+            client=mock.Mock(),
+            flush_interval=TEST_ELASTICSEARCH_BULK_BUFFER_FLUSH_INTERVAL,
+            size=TEST_ELASTICSEARCH_BULK_BUFFER_SIZE
+        )
+        self.addCleanup(
+            ElasticSearchBulkBuffer._registry.remove, self.test_bulk_buffer
+        )
+
+        patcher = mock.patch(
+            target='mayan.apps.dynamic_search.backends.elasticsearch.backend.helpers.streaming_bulk'
+        )
+        self.mock_streaming_bulk = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        with self.test_bulk_buffer.lock:
+            self.test_bulk_buffer._pop()
+
+        super().tearDown()
+
+    def _add_test_actions(self):
+        self.test_actions = [
+            {
+                '_id': object_id, '_index': TEST_ELASTICSEARCH_INDEX_NAME,
+                '_op_type': 'delete'
+            } for object_id in range(TEST_ELASTICSEARCH_BULK_BUFFER_SIZE - 1)
+        ]
+
+        for action in self.test_actions:
+            self.test_bulk_buffer.add(action=action)
+
+    def _get_test_item(self, object_id, status):
+        return (
+            False, {
+                'delete': {
+                    '_id': str(object_id),
+                    '_index': TEST_ELASTICSEARCH_INDEX_NAME, 'status': status
+                }
+            }
+        )
+
+    def test_add_action_error_transient(self):
+        self.mock_streaming_bulk.return_value = (
+            self._get_test_item(object_id=0, status=429),
+        )
+        self._add_test_actions()
+
+        test_action = {
+            '_id': TEST_ELASTICSEARCH_BULK_BUFFER_SIZE,
+            '_index': TEST_ELASTICSEARCH_INDEX_NAME, '_op_type': 'delete'
+        }
+
+        with self.assertLogs(
+            level='WARNING',
+            logger='mayan.apps.dynamic_search.backends.elasticsearch.backend'
+        ):
+            self.test_bulk_buffer.add(action=test_action)
+
+        self.assertEqual(
+            self.test_bulk_buffer.actions, [self.test_actions[0]]
+        )
+        self.assertNotEqual(self.test_bulk_buffer.timer, None)
+
+    def test_flush(self):
+        self.mock_streaming_bulk.return_value = ()
+        self._add_test_actions()
+
+        self.test_bulk_buffer.flush()
+
+        self.assertEqual(self.test_bulk_buffer.actions, [])
+        self.assertEqual(
+            self.mock_streaming_bulk.call_args.kwargs['actions'],
+            self.test_actions
+        )
+
+    def test_flush_action_error_permanent(self):
+        self.mock_streaming_bulk.return_value = (
+            self._get_test_item(object_id=0, status=400),
+        )
+        self._add_test_actions()
+
+        self.test_bulk_buffer.flush()
+
+        self.assertEqual(self.test_bulk_buffer.actions, [])
+
+    def test_flush_action_error_transient(self):
+        self.mock_streaming_bulk.return_value = (
+            self._get_test_item(object_id=0, status=429),
+        )
+        self._add_test_actions()
+
+        with self.assertRaises(expected_exception=DynamicSearchRetry):
+            self.test_bulk_buffer.flush()
+
+        self.assertEqual(
+            self.test_bulk_buffer.actions, [self.test_actions[0]]
+        )
+
+    def test_flush_transport_error(self):
+        self.mock_streaming_bulk.side_effect = elasticsearch.exceptions.ConnectionError(
+            'N/A', 'test', Exception()
+        )
+        self._add_test_actions()
+
+        with self.assertRaises(expected_exception=DynamicSearchRetry):
+            self.test_bulk_buffer.flush()
+
+        self.assertEqual(self.test_bulk_buffer.actions, self.test_actions)
+
+
+class WhooshSearchBackendTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+        temporary_directory = TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+
+        self.test_search_backend = WhooshSearchBackend(
+            index_path=temporary_directory.name, writer_commit_merge=False
+        )
+        self.test_search_backend.initialize()
+
+        self.test_search_model = SearchModel.get(
+            name=TEST_SEARCH_MODEL_FULL_NAME
+        )
+        self.test_document_types = [
+            DocumentType.objects.create(label=label) for label in (
+                TEST_DOCUMENT_TYPE_LABEL, TEST_DOCUMENT_TYPE_LABEL_OTHER
+            )
+        ]
+
+    def _get_test_index(self):
+        return self.test_search_backend._get_or_create_index(
+            search_model=self.test_search_model
+        )
+
+    def _index_test_document_types(self):
+        self.test_search_backend.index_instances(
+            id_list=[
+                document_type.pk for document_type in self.test_document_types
+            ], search_model=self.test_search_model
+        )
+
+    def test_deindex_instances(self):
+        self._index_test_document_types()
+
+        self.test_search_backend.deindex_instances(
+            id_list=(self.test_document_types[0].pk,),
+            search_model=self.test_search_model
+        )
+
+        with self._get_test_index().searcher() as searcher:
+            self.assertEqual(
+                [
+                    int(
+                        fields['id']
+                    ) for fields in searcher.all_stored_fields()
+                ], [self.test_document_types[1].pk]
+            )
+
+    def test_index_instance(self):
+        self.test_search_backend.index_instance(
+            instance=self.test_document_types[0]
+        )
+        self.test_search_backend.index_instance(
+            instance=self.test_document_types[0]
+        )
+
+        self.assertEqual(
+            self._get_test_index().doc_count(), 1
+        )
+
+    def test_optimize(self):
+        for document_type in self.test_document_types:
+            self.test_search_backend.index_instance(instance=document_type)
+
+        self.assertEqual(
+            len(
+                self._get_test_index()._segments()
+            ), 2
+        )
+
+        self.test_search_backend.optimize()
+
+        self.assertEqual(
+            len(
+                self._get_test_index()._segments()
+            ), 1
+        )
+        self.assertEqual(
+            self._get_test_index().doc_count(), 2
+        )
+
+    def test_writer_lock_per_search_model(self):
+        test_search_model_other = SearchModel.get(
+            name=TEST_SEARCH_MODEL_FULL_NAME_OTHER
+        )
+
+        with self.test_search_backend._get_writer(search_model=self.test_search_model):
+            with self.test_search_backend._get_writer(search_model=test_search_model_other):
+                """The index of another search model can be written."""
+
+            with self.assertRaises(expected_exception=LockError):
+                with self.test_search_backend._get_writer(search_model=self.test_search_model):
+                    """The index of the search model is locked."""
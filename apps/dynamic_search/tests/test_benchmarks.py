@@ -0,0 +1,107 @@
+import io
+import json
+
+from django.core import management
+from django.test import TestCase
+
+from mayan.apps.documents.models import Document
+from mayan.apps.storage.utils import NamedTemporaryFile
+
+from ..benchmarks import SearchBenchmark
+
+from .literals import (
+    TEST_BENCHMARK_BACKEND_PATH, TEST_BENCHMARK_BACKEND_PATH_INVALID,
+    TEST_BENCHMARK_DOCUMENT_COUNT, TEST_BENCHMARK_PAGINATION_PAGE_COUNT,
+    TEST_BENCHMARK_QUERY_TYPES, TEST_BENCHMARK_REPETITIONS
+)
+
+
+class SearchBenchmarkTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.test_search_benchmark = SearchBenchmark(
+            cabinet_count=1, document_count=TEST_BENCHMARK_DOCUMENT_COUNT,
+            metadata_type_count=1, ocr_word_count=5, page_count=1,
+            pagination_page_count=TEST_BENCHMARK_PAGINATION_PAGE_COUNT,
+            pagination_page_size=1, repetitions=TEST_BENCHMARK_REPETITIONS,
+            tag_count=1
+        )
+
+    def test_backend_invalid(self):
+        report = self.test_search_benchmark.execute(
+            backend_list=(TEST_BENCHMARK_BACKEND_PATH_INVALID,)
+        )
+
+        self.assertEqual(
+            report['backends'][TEST_BENCHMARK_BACKEND_PATH_INVALID]['status'],
+            'skipped'
+        )
+
+    def test_corpus_rollback(self):
+        document_count = Document.objects.count()
+
+        self.test_search_benchmark.execute(
+            backend_list=(TEST_BENCHMARK_BACKEND_PATH,)
+        )
+
+        self.assertEqual(Document.objects.count(), document_count)
+
+    def test_report(self):
+        report = self.test_search_benchmark.execute(
+            backend_list=(TEST_BENCHMARK_BACKEND_PATH,)
+        )
+
+        self.assertEqual(
+            report['corpus']['document_count'], TEST_BENCHMARK_DOCUMENT_COUNT
+        )
+        self.assertIn('seconds', report['corpus'])
+
+        result = report['backends'][TEST_BENCHMARK_BACKEND_PATH]
+
+        self.assertEqual(result['status'], 'ok')
+        self.assertEqual(
+            result['index']['count'], TEST_BENCHMARK_DOCUMENT_COUNT
+        )
+        self.assertEqual(
+            set(result['index']), {'count', 'objects_per_second', 'seconds'}
+        )
+        self.assertEqual(
+            tuple(
+                sorted(result['queries'])
+            ), TEST_BENCHMARK_QUERY_TYPES
+        )
+
+        for name, entry in result['queries'].items():
+            if 'error' not in entry:
+                self.assertEqual(entry['count'], TEST_BENCHMARK_REPETITIONS)
+                self.assertEqual(
+                    set(entry), {'count', 'p50', 'p95', 'results_p50'}
+                )
+
+        self.assertEqual(
+            result['queries']['exact']['results_p50'], 1
+        )
+        self.assertEqual(
+            result['pagination']['count'],
+            TEST_BENCHMARK_PAGINATION_PAGE_COUNT * TEST_BENCHMARK_REPETITIONS
+        )
+
+
+class SearchBenchmarkManagementCommandTestCase(TestCase):
+    def test_output(self):
+        with NamedTemporaryFile(mode='r') as file_object:
+            management.call_command(
+                'search_benchmark', '--backend', TEST_BENCHMARK_BACKEND_PATH,
+                '--document-count', str(TEST_BENCHMARK_DOCUMENT_COUNT),
+                '--ocr-word-count', '5', '--output', file_object.name,
+                '--page-count', '1', '--pagination-page-count', '1',
+                '--repetitions', '1', stdout=io.StringIO()
+            )
+            report = json.load(fp=file_object)
+
+        self.assertEqual(
+            report['backends'][TEST_BENCHMARK_BACKEND_PATH]['status'], 'ok'
+        )
+        self.assertEqual(
+            report['corpus']['document_count'], TEST_BENCHMARK_DOCUMENT_COUNT
+        )
@@ -0,0 +1,80 @@
+from unittest import mock
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import SimpleTestCase
+
+from ..classes import SearchResultCache
+from ..literals import SEARCH_RESULT_CACHE_GENERATION_ACL
+
+from .literals import (
+    TEST_SEARCH_MODEL_FULL_NAME, TEST_SEARCH_QUERY_STRING,
+    TEST_SEARCH_RESULT_CACHE_TIME_TO_LIVE
+)
+
+
+class SearchResultCacheTestCase(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.test_cache = LocMemCache(name='test_search_result', params={})
+        self.test_cache.clear()
+
+        self.test_search_model = mock.Mock(
+            full_name=TEST_SEARCH_MODEL_FULL_NAME
+        )
+
+        for patcher in (
+            mock.patch.object(
+                attribute='get_cache', return_value=self.test_cache,
+                target=SearchResultCache
+            ),
+            mock.patch(
+                new=mock.Mock(value=TEST_SEARCH_RESULT_CACHE_TIME_TO_LIVE),
+                target='mayan.apps.dynamic_search.classes.setting_results_cache_time_to_live'
+            )
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _get_test_key(self):
+        return SearchResultCache.get_key(
+            query_string=TEST_SEARCH_QUERY_STRING,
+            search_model=self.test_search_model, user=AnonymousUser()
+        )
+
+    def test_acl_generation_increment(self):
+        key = self._get_test_key()
+        SearchResultCache.generation_increment(
+            name=SEARCH_RESULT_CACHE_GENERATION_ACL
+        )
+
+        self.assertNotEqual(self._get_test_key(), key)
+
+    def test_disabled(self):
+        with mock.patch(
+            new=mock.Mock(value=0),
+            target='mayan.apps.dynamic_search.classes.setting_results_cache_time_to_live'
+        ):
+            self.assertEqual(self._get_test_key(), None)
+
+    def test_search_model_generation_increment(self):
+        key = self._get_test_key()
+        SearchResultCache.set(key=key, pk_list=[1])
+
+        SearchResultCache.generation_increment(
+            name=TEST_SEARCH_MODEL_FULL_NAME
+        )
+
+        key_new = self._get_test_key()
+        self.assertNotEqual(key_new, key)
+        self.assertEqual(SearchResultCache.get(key=key_new), None)
+
+    def test_set(self):
+        key = self._get_test_key()
+        SearchResultCache.set(key=key, pk_list=[1])
+
+        self.assertEqual(
+            SearchResultCache.get(
+                key=self._get_test_key()
+            ), [1]
+        )
@@ -0,0 +1,158 @@
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+
+from mayan.apps.documents.models import DocumentType
+
+from ..literals import INDEX_QUEUE_ACTION_DEINDEX, INDEX_QUEUE_ACTION_INDEX
+from ..models import SearchFullTextEntry, SearchIndexQueueEntry
+
+from .literals import (
+    TEST_DOCUMENT_TYPE_LABEL, TEST_FULL_TEXT_ENTRY_VALUE_CHUNK_SIZE,
+    TEST_FULL_TEXT_ENTRY_VALUE_LONG, TEST_SEARCH_MODEL_FULL_NAME
+)
+
+
+class SearchFullTextEntryManagerTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.test_search_model = mock.Mock(
+            full_name=TEST_SEARCH_MODEL_FULL_NAME
+        )
+
+        patcher = mock.patch(
+            new=TEST_FULL_TEXT_ENTRY_VALUE_CHUNK_SIZE,
+            target='mayan.apps.dynamic_search.managers.SEARCH_FULL_TEXT_ENTRY_VALUE_CHUNK_SIZE'
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_instances_update_chunks(self):
+        SearchFullTextEntry.objects.instances_update(
+            instance_values={
+                1: {'label': TEST_FULL_TEXT_ENTRY_VALUE_LONG}
+            }, search_model=self.test_search_model
+        )
+
+        queryset = SearchFullTextEntry.objects.filter(
+            object_id=1, search_model_name=TEST_SEARCH_MODEL_FULL_NAME
+        ).order_by('chunk_number')
+
+        self.assertEqual(
+            ' '.join(
+                queryset.values_list('value', flat=True)
+            ), TEST_FULL_TEXT_ENTRY_VALUE_LONG
+        )
+        for value in queryset.values_list('value', flat=True):
+            self.assertTrue(
+                len(value) <= TEST_FULL_TEXT_ENTRY_VALUE_CHUNK_SIZE
+            )
+
+    def test_value_split_no_separator(self):
+        value = 'x' * (TEST_FULL_TEXT_ENTRY_VALUE_CHUNK_SIZE + 1)
+
+        self.assertEqual(
+            list(
+                SearchFullTextEntry.objects.value_split(value=value)
+            ), [value[:-1], 'x']
+        )
+
+    def test_value_split_words(self):
+        chunks = list(
+            SearchFullTextEntry.objects.value_split(
+                value=TEST_FULL_TEXT_ENTRY_VALUE_LONG
+            )
+        )
+
+        self.assertEqual(
+            ' '.join(chunks).split(), TEST_FULL_TEXT_ENTRY_VALUE_LONG.split()
+        )
+        self.assertTrue(len(chunks) > 1)
+
+
+class SearchIndexQueueEntryManagerTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.test_document_type = DocumentType.objects.create(
+            label=TEST_DOCUMENT_TYPE_LABEL
+        )
+
+        for target in (
+            'mayan.apps.dynamic_search.tasks.task_deindex_instances.apply_async',
+            'mayan.apps.dynamic_search.tasks.task_index_instances.apply_async',
+            'mayan.apps.dynamic_search.tasks.task_index_queue_flush.apply_async'
+        ):
+            patcher = mock.patch(target=target)
+            setattr(
+                self, 'mock_{}'.format(
+                    target.split('.')[-2]
+                ), patcher.start()
+            )
+            self.addCleanup(patcher.stop)
+
+        SearchIndexQueueEntry.objects.all().delete()
+
+    def _request_add(self, action):
+        SearchIndexQueueEntry.objects.request_add(
+            action=action, instance=self.test_document_type
+        )
+
+    def _test_request_add_coalesce(self):
+        self._request_add(action=INDEX_QUEUE_ACTION_INDEX)
+        self._request_add(action=INDEX_QUEUE_ACTION_DEINDEX)
+
+        self.assertEqual(SearchIndexQueueEntry.objects.count(), 1)
+        self.assertEqual(
+            SearchIndexQueueEntry.objects.first().action,
+            INDEX_QUEUE_ACTION_DEINDEX
+        )
+
+    def test_flush(self):
+        self._request_add(action=INDEX_QUEUE_ACTION_INDEX)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            SearchIndexQueueEntry.objects.flush()
+
+        self.assertEqual(SearchIndexQueueEntry.objects.count(), 0)
+        self.mock_task_index_instances.assert_called_once_with(
+            kwargs={
+                'id_list': (self.test_document_type.pk,),
+                'search_model_full_name': 'documents.documenttype'
+            }
+        )
+
+    def test_flush_deletion_error(self):
+        self._request_add(action=INDEX_QUEUE_ACTION_INDEX)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with mock.patch(
+                side_effect=Exception,
+                target='django.db.models.query.QuerySet.delete'
+            ):
+                with self.assertRaises(expected_exception=Exception):
+                    SearchIndexQueueEntry.objects.flush()
+
+        self.assertEqual(SearchIndexQueueEntry.objects.count(), 1)
+        self.mock_task_index_instances.assert_not_called()
+
+    def test_index_request_no_coalesce_window(self):
+        with mock.patch(
+            target='mayan.apps.dynamic_search.tasks.task_index_instance.apply_async'
+        ) as mock_apply_async:
+            SearchIndexQueueEntry.objects.index_request(
+                instance=self.test_document_type
+            )
+
+        mock_apply_async.assert_called_once()
+        self.assertEqual(SearchIndexQueueEntry.objects.count(), 0)
+
+    def test_request_add(self):
+        self._test_request_add_coalesce()
+
+    def test_request_add_no_update_conflicts_with_target(self):
+        with mock.patch.object(
+            attribute='supports_update_conflicts_with_target',
+            new=False, target=connection.features
+        ):
+            self._test_request_add_coalesce()
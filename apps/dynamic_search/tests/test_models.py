@@ -0,0 +1,74 @@
+from unittest import mock
+
+from django.test import TestCase
+
+from ..literals import (
+    REINDEX_CHUNK_STATE_DONE, REINDEX_CHUNK_STATE_ERROR,
+    REINDEX_CHUNK_STATE_PENDING, REINDEX_CHUNK_STATE_QUEUED,
+    REINDEX_STATE_ERROR, REINDEX_STATE_RUNNING
+)
+from ..models import SearchReindex
+
+from .literals import TEST_SEARCH_MODEL_FULL_NAME
+
+
+class SearchReindexDispatchTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.test_search_reindex = SearchReindex.objects.create(
+            concurrency=1, state=REINDEX_STATE_RUNNING
+        )
+
+        patcher = mock.patch(
+            target='mayan.apps.dynamic_search.tasks.task_reindex_chunk.apply_async'
+        )
+        self.mock_apply_async = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _create_test_chunk(self, state):
+        return self.test_search_reindex.chunks.create(
+            id_end=1, id_start=1, object_count=1,
+            search_model_name=TEST_SEARCH_MODEL_FULL_NAME, state=state
+        )
+
+    def test_dispatch_after_chunk_error(self):
+        self._create_test_chunk(state=REINDEX_CHUNK_STATE_ERROR)
+        test_chunk = self._create_test_chunk(
+            state=REINDEX_CHUNK_STATE_PENDING
+        )
+
+        self.test_search_reindex.do_dispatch()
+
+        test_chunk.refresh_from_db()
+        self.assertEqual(test_chunk.state, REINDEX_CHUNK_STATE_QUEUED)
+        self.mock_apply_async.assert_called_once_with(
+            kwargs={'search_reindex_chunk_id': test_chunk.pk}
+        )
+
+    def test_dispatch_error_chunks_left(self):
+        self._create_test_chunk(state=REINDEX_CHUNK_STATE_DONE)
+        self._create_test_chunk(state=REINDEX_CHUNK_STATE_ERROR)
+
+        with mock.patch.object(
+            target=SearchReindex, attribute='do_finish'
+        ) as mock_do_finish:
+            self.test_search_reindex.do_dispatch()
+
+        mock_do_finish.assert_not_called()
+        self.test_search_reindex.refresh_from_db()
+        self.assertEqual(self.test_search_reindex.state, REINDEX_STATE_ERROR)
+
+    def test_resume_error_chunks(self):
+        test_chunk = self._create_test_chunk(
+            state=REINDEX_CHUNK_STATE_ERROR
+        )
+        self.test_search_reindex.do_dispatch()
+
+        self.test_search_reindex.do_resume()
+        self.test_search_reindex.do_dispatch()
+
+        test_chunk.refresh_from_db()
+        self.assertEqual(test_chunk.state, REINDEX_CHUNK_STATE_QUEUED)
+        self.assertEqual(
+            self.test_search_reindex.state, REINDEX_STATE_RUNNING
+        )
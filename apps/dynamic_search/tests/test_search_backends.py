@@ -0,0 +1,52 @@
+from unittest import mock
+
+from django.test import TestCase
+
+from .literals import TEST_SEARCH_PAGE_QUERY
+from .mixins import SearchPageTestMixin
+
+
+class SearchPageRankedTestCase(SearchPageTestMixin, TestCase):
+    def _search_page(self, limit, offset):
+        return self.test_search_backend.search_page(
+            limit=limit, offset=offset, query=TEST_SEARCH_PAGE_QUERY,
+            search_model=self.test_search_model, user=self.test_user
+        )
+
+    def test_access_control_pages(self):
+        result = self._search_page(
+            limit=len(self.test_document_types), offset=0
+        )
+
+        self.assertEqual(
+            set(result), set(self.test_document_types_visible)
+        )
+
+        for offset in range(len(result)):
+            self.assertEqual(
+                self._search_page(limit=1, offset=offset),
+                result[offset:offset + 1]
+            )
+
+        self.assertEqual(
+            self._search_page(limit=2, offset=1), result[1:3]
+        )
+
+    def test_access_control_pages_exhausted(self):
+        self.assertEqual(
+            self._search_page(
+                limit=1, offset=len(self.test_document_types_visible)
+            ), []
+        )
+
+    def test_ranked(self):
+        # The ranked pages do not resolve and slice the whole search.
+        with mock.patch.object(
+            attribute='search', side_effect=AssertionError,
+            target=self.test_search_backend
+        ):
+            self.assertEqual(
+                len(
+                    self._search_page(limit=1, offset=0)
+                ), 1
+            )
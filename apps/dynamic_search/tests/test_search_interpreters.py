@@ -0,0 +1,156 @@
+from collections import OrderedDict
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from ..search_interpreters import SearchInterpreter
+from ..search_models import SearchModel
+
+from .literals import (
+    TEST_DOCUMENT_TYPE_LABEL, TEST_DOCUMENT_TYPE_LABEL_OTHER,
+    TEST_SEARCH_INTERPRETER_CACHE_SIZE, TEST_SEARCH_INTERPRETER_PREFIX,
+    TEST_SEARCH_MODEL_FULL_NAME
+)
+
+
+class SearchInterpreterCacheTestCase(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.test_search_model = SearchModel.get(
+            name=TEST_SEARCH_MODEL_FULL_NAME
+        )
+
+        patcher = mock.patch.object(
+            attribute='_cache', new=OrderedDict(), target=SearchInterpreter
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _get_test_search_interpreter(self, label, prefix=''):
+        return SearchInterpreter.init(
+            prefix=prefix, query={'{}label'.format(prefix): label},
+            search_model=self.test_search_model
+        )
+
+    def test_cache_hit(self):
+        search_interpreter = self._get_test_search_interpreter(
+            label=TEST_DOCUMENT_TYPE_LABEL
+        )
+
+        self.assertTrue(
+            self._get_test_search_interpreter(
+                label=TEST_DOCUMENT_TYPE_LABEL
+            ) is search_interpreter
+        )
+        self.assertEqual(len(SearchInterpreter._cache), 1)
+
+    def test_cache_key_default_operator(self):
+        search_interpreter = self._get_test_search_interpreter(
+            label=TEST_DOCUMENT_TYPE_LABEL
+        )
+
+        with mock.patch(
+            new=mock.Mock(value='OR'),
+            target='mayan.apps.dynamic_search.search_interpreters.setting_default_operator'
+        ):
+            self.assertFalse(
+                self._get_test_search_interpreter(
+                    label=TEST_DOCUMENT_TYPE_LABEL
+                ) is search_interpreter
+            )
+
+    def test_cache_key_prefix(self):
+        search_interpreter = self._get_test_search_interpreter(
+            label=TEST_DOCUMENT_TYPE_LABEL
+        )
+
+        self.assertFalse(
+            self._get_test_search_interpreter(
+                label=TEST_DOCUMENT_TYPE_LABEL,
+                prefix=TEST_SEARCH_INTERPRETER_PREFIX
+            ) is search_interpreter
+        )
+
+    def test_cache_key_query(self):
+        search_interpreter = self._get_test_search_interpreter(
+            label=TEST_DOCUMENT_TYPE_LABEL
+        )
+
+        self.assertFalse(
+            self._get_test_search_interpreter(
+                label=TEST_DOCUMENT_TYPE_LABEL_OTHER
+            ) is search_interpreter
+        )
+
+    def test_cache_key_query_item_order(self):
+        query = {'_match_all': 'on', 'label': TEST_DOCUMENT_TYPE_LABEL}
+        query_reversed = dict(
+            reversed(
+                query.items()
+            )
+        )
+
+        self.assertEqual(
+            SearchInterpreter.get_cache_key(
+                query=query, search_model=self.test_search_model
+            ), SearchInterpreter.get_cache_key(
+                query=query_reversed, search_model=self.test_search_model
+            )
+        )
+
+    def test_cache_key_search_model(self):
+        test_search_model_other = mock.Mock(
+            full_name='{}_other'.format(TEST_SEARCH_MODEL_FULL_NAME)
+        )
+        query = {'label': TEST_DOCUMENT_TYPE_LABEL}
+
+        self.assertNotEqual(
+            SearchInterpreter.get_cache_key(
+                query=query, search_model=self.test_search_model
+            ), SearchInterpreter.get_cache_key(
+                query=query, search_model=test_search_model_other
+            )
+        )
+
+    def test_cache_lru_eviction(self):
+        with mock.patch(
+            new=TEST_SEARCH_INTERPRETER_CACHE_SIZE,
+            target='mayan.apps.dynamic_search.search_interpreters.SEARCH_INTERPRETER_CACHE_SIZE'
+        ):
+            search_interpreter_0 = self._get_test_search_interpreter(
+                label='0'
+            )
+            search_interpreter_1 = self._get_test_search_interpreter(
+                label='1'
+            )
+            # Use the first interpreter to make the second the least
+            # recently used.
+            self._get_test_search_interpreter(label='0')
+            self._get_test_search_interpreter(label='2')
+
+            self.assertEqual(
+                len(SearchInterpreter._cache),
+                TEST_SEARCH_INTERPRETER_CACHE_SIZE
+            )
+            self.assertTrue(
+                self._get_test_search_interpreter(
+                    label='0'
+                ) is search_interpreter_0
+            )
+            self.assertFalse(
+                self._get_test_search_interpreter(
+                    label='1'
+                ) is search_interpreter_1
+            )
+
+    def test_decode_instance_state(self):
+        search_interpreter = self._get_test_search_interpreter(
+            label=TEST_DOCUMENT_TYPE_LABEL
+        )
+        state = search_interpreter.__dict__.copy()
+
+        search_interpreter.do_query_decode(
+            query={'label': TEST_DOCUMENT_TYPE_LABEL_OTHER}
+        )
+
+        self.assertEqual(search_interpreter.__dict__, state)
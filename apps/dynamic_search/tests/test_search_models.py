@@ -0,0 +1,96 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from mayan.apps.documents.tests.mixins import DocumentTestMixin
+
+from ..backends.django import DjangoSearchBackend
+from ..search_fields import SearchFieldRelated
+from ..search_models import SearchModel
+
+from .literals import (
+    TEST_SEARCH_MODEL_DOCUMENT_FULL_NAME,
+    TEST_SEARCH_POPULATE_DOCUMENT_COUNT
+)
+
+
+class SearchModelPopulateBulkTestCase(DocumentTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.test_search_backend = DjangoSearchBackend(_test_mode=True)
+        self.test_search_model = SearchModel.get(
+            name=TEST_SEARCH_MODEL_DOCUMENT_FULL_NAME
+        )
+
+        # A document without files to have instances without related
+        # values.
+        self.test_document_type.documents.create()
+
+    def _get_test_queryset(self):
+        return self.test_search_model.model._meta.default_manager.order_by(
+            'pk'
+        )
+
+    def _populate_bulk_test_queries(self):
+        with CaptureQueriesContext(connection=connection) as queries:
+            tuple(
+                self.test_search_model.populate_bulk(
+                    queryset=self._get_test_queryset(),
+                    search_backend=self.test_search_backend
+                )
+            )
+
+        return len(queries)
+
+    def test_get_instance_value_bulk(self):
+        id_list = list(
+            self._get_test_queryset().values_list('pk', flat=True)
+        )
+
+        search_fields = [
+            search_field for search_field in self.test_search_model.search_fields
+            if isinstance(search_field, SearchFieldRelated)
+        ]
+        self.assertTrue(search_fields)
+
+        for search_field in search_fields:
+            values = search_field.get_instance_value_bulk(
+                id_list=id_list, search_backend=self.test_search_backend
+            )
+
+            for instance in self._get_test_queryset():
+                self.assertEqual(
+                    values[instance.pk], search_field.get_instance_value(
+                        instance=instance,
+                        search_backend=self.test_search_backend
+                    )
+                )
+
+    def test_populate_bulk(self):
+        result = list(
+            self.test_search_model.populate_bulk(
+                queryset=self._get_test_queryset(),
+                search_backend=self.test_search_backend
+            )
+        )
+
+        self.assertEqual(
+            [instance for instance, instance_field_data in result],
+            list(self._get_test_queryset())
+        )
+
+        for instance, instance_field_data in result:
+            self.assertEqual(
+                instance_field_data, self.test_search_model.populate(
+                    instance=instance,
+                    search_backend=self.test_search_backend
+                )
+            )
+
+    def test_populate_bulk_queries(self):
+        query_count = self._populate_bulk_test_queries()
+
+        for index in range(TEST_SEARCH_POPULATE_DOCUMENT_COUNT):
+            self._upload_test_document()
+
+        self.assertEqual(self._populate_bulk_test_queries(), query_count)
@@ -0,0 +1,209 @@
+from contextlib import ExitStack
+from datetime import timedelta
+import importlib
+import sys
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase
+
+from mayan.apps.documents.models import DocumentType
+from mayan.apps.lock_manager.exceptions import LockError
+from mayan.apps.task_manager.classes import CeleryQueue
+from mayan.apps.task_manager.workers import worker_e
+
+from ..classes import SearchResultCache
+from ..exceptions import DynamicSearchRetry
+from ..literals import (
+    REINDEX_CHUNK_STATE_ERROR, REINDEX_CHUNK_STATE_QUEUED,
+    REINDEX_STATE_RUNNING
+)
+from ..models import SearchReindex, SearchReindexChunk
+from ..tasks import (
+    task_backend_optimize, task_deindex_instances, task_index_instances,
+    task_reindex_chunk
+)
+
+from .literals import (
+    TEST_DOCUMENT_TYPE_LABEL, TEST_SEARCH_BACKEND_OPTIMIZE_INTERVAL,
+    TEST_SEARCH_MODEL_FULL_NAME, TEST_TASK_REINDEX_CHUNK_MAX_RETRIES
+)
+
+
+class BackendOptimizeTaskTestCase(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.mock_search_backend = mock.Mock()
+
+        patcher = mock.patch(
+            return_value=self.mock_search_backend,
+            target='mayan.apps.dynamic_search.tasks.SearchBackend.get_instance'
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _get_test_task_type_schedule(self, interval):
+        """
+        Import the queues module again with the optimize interval
+        setting patched.
+        """
+        module_name = 'mayan.apps.dynamic_search.queues'
+
+        with ExitStack() as stack:
+            for patcher in (
+                mock.patch.dict(in_dict=sys.modules),
+                mock.patch.object(
+                    attribute='_registry', new={}, target=CeleryQueue
+                ),
+                mock.patch.object(
+                    attribute='_registry_task_types', new={},
+                    target=CeleryQueue
+                ),
+                mock.patch.object(
+                    attribute='_queues', new=[], target=worker_e
+                ),
+                mock.patch(
+                    new=mock.Mock(value=interval),
+                    target='mayan.apps.dynamic_search.settings.setting_backend_optimize_interval'
+                )
+            ):
+                stack.enter_context(patcher)
+
+            sys.modules.pop(module_name)
+            module = importlib.import_module(name=module_name)
+
+        for task_type in module.queue_search_slow.task_types:
+            if task_type.name == 'task_backend_optimize':
+                return task_type.schedule
+
+    def test_optimize(self):
+        task_backend_optimize.apply()
+
+        self.mock_search_backend.optimize.assert_called_once_with()
+
+    def test_optimize_locked(self):
+        self.mock_search_backend.optimize.side_effect = LockError
+
+        with self.assertLogs(
+            level='INFO', logger='mayan.apps.dynamic_search.tasks'
+        ):
+            task_backend_optimize.apply(throw=True)
+
+    def test_schedule_interval(self):
+        self.assertEqual(
+            self._get_test_task_type_schedule(
+                interval=TEST_SEARCH_BACKEND_OPTIMIZE_INTERVAL
+            ), timedelta(seconds=TEST_SEARCH_BACKEND_OPTIMIZE_INTERVAL)
+        )
+
+    def test_schedule_interval_disabled(self):
+        self.assertEqual(
+            self._get_test_task_type_schedule(interval=0), None
+        )
+
+
+class ReindexChunkTaskTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+        test_search_reindex = SearchReindex.objects.create(
+            concurrency=1, state=REINDEX_STATE_RUNNING
+        )
+        self.test_search_reindex_chunk = test_search_reindex.chunks.create(
+            id_end=1, id_start=1, object_count=1,
+            search_model_name=TEST_SEARCH_MODEL_FULL_NAME,
+            state=REINDEX_CHUNK_STATE_QUEUED
+        )
+
+        self.mock_do_index = mock.Mock(side_effect=DynamicSearchRetry)
+
+        for patcher in (
+            mock.patch.object(
+                attribute='do_index', new=self.mock_do_index,
+                target=SearchReindexChunk
+            ),
+            mock.patch.object(
+                attribute='max_retries',
+                new=TEST_TASK_REINDEX_CHUNK_MAX_RETRIES,
+                target=task_reindex_chunk
+            )
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        patcher = mock.patch(
+            target='mayan.apps.dynamic_search.tasks.task_reindex_dispatch.apply_async'
+        )
+        self.mock_dispatch_apply_async = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _execute_task(self, retries=0):
+        task_reindex_chunk.apply(
+            kwargs={
+                'search_reindex_chunk_id': self.test_search_reindex_chunk.pk
+            }, retries=retries, throw=False
+        )
+        self.test_search_reindex_chunk.refresh_from_db()
+
+    def test_retry(self):
+        self.mock_do_index.side_effect = (DynamicSearchRetry, None)
+
+        self._execute_task()
+
+        self.assertEqual(self.mock_do_index.call_count, 2)
+        self.assertEqual(
+            self.test_search_reindex_chunk.state, REINDEX_CHUNK_STATE_QUEUED
+        )
+        self.assertEqual(self.mock_dispatch_apply_async.call_count, 1)
+
+    def test_retries_exhausted(self):
+        self._execute_task(retries=TEST_TASK_REINDEX_CHUNK_MAX_RETRIES)
+
+        self.assertEqual(self.mock_do_index.call_count, 1)
+        self.assertEqual(
+            self.test_search_reindex_chunk.state, REINDEX_CHUNK_STATE_ERROR
+        )
+        self.assertEqual(self.mock_dispatch_apply_async.call_count, 1)
+
+
+class SearchResultCacheInvalidationTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.test_document_type = DocumentType.objects.create(
+            label=TEST_DOCUMENT_TYPE_LABEL
+        )
+
+        patcher = mock.patch(
+            return_value=(),
+            target='mayan.apps.dynamic_search.tasks.SearchBackend.get_instance_list'
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _get_test_generation(self):
+        return SearchResultCache.get_generation(
+            name=TEST_SEARCH_MODEL_FULL_NAME
+        )
+
+    def test_deindex_instances(self):
+        generation = self._get_test_generation()
+
+        task_deindex_instances.apply(
+            kwargs={
+                'app_label': 'documents',
+                'id_list': (self.test_document_type.pk,),
+                'model_name': 'documenttype'
+            }
+        )
+
+        self.assertEqual(self._get_test_generation(), generation + 1)
+
+    def test_index_instances(self):
+        generation = self._get_test_generation()
+
+        task_index_instances.apply(
+            kwargs={
+                'id_list': (self.test_document_type.pk,),
+                'search_model_full_name': TEST_SEARCH_MODEL_FULL_NAME
+            }
+        )
+
+        self.assertEqual(self._get_test_generation(), generation + 1)
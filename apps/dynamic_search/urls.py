@@ -5,7 +5,8 @@ from .api_views.saved_resultset_api_views import (
     APISavedResultsetListView, APISavedResultsetResultListView
 )
 from .api_views.search_api_views import (
-    APISearchModelDetailView, APISearchModelList, APISearchView
+    APISearchModelDetailView, APISearchModelList, APISearchRankedView,
+    APISearchView
 )
 from .views.saved_resultset_views import (
     SavedResultsetDeleteView, SavedResultsetListView,
@@ -115,6 +116,10 @@ api_urls_search = [
         route=r'^search/advanced/(?P<search_model_pk>[\.\w]+)/$',
         name='advanced-search-view', view=APISearchView.as_view()
     ),
+    re_path(
+        route=r'^search/ranked/(?P<search_model_pk>[\.\w]+)/$',
+        name='ranked-search-view', view=APISearchRankedView.as_view()
+    ),
     re_path(
         route=r'^search_models/$', name='searchmodel-list',
         view=APISearchModelList.as_view()
@@ -1,3 +1,6 @@
+from celery.signals import task_postrun, worker_process_shutdown
+
+from django.core.signals import request_finished
 from django.utils.translation import gettext_lazy as _
 
 from mayan.apps.acls.classes import ModelPermission
@@ -18,6 +21,10 @@ from .dashboard_widgets import (
 from .events import (
     event_cache_edited, event_cache_partition_purged, event_cache_purged
 )
+from .handlers import (
+    handler_cache_partition_file_hit_buffer_flush,
+    handler_cache_partition_file_hit_buffer_flush_if_due
+)
 from .links import (
     link_cache_list, link_cache_purge_multiple,
     link_cache_purge_single, link_cache_tool
@@ -103,3 +110,21 @@ class FileCachingAppConfig(MayanAppConfig):
         menu_tools.bind_links(
             links=(link_cache_tool,)
         )
+
+        # Write the buffered hits of the cache files at the end of each
+        # task, and of the requests when the flush interval elapsed. The
+        # worker processes of Celery exit without running the `atexit`
+        # functions, flush them on shutdown too.
+        request_finished.connect(
+            dispatch_uid='file_caching_handler_cache_partition_file_hit_buffer_flush_if_due',
+            receiver=handler_cache_partition_file_hit_buffer_flush_if_due
+        )
+        # Celery signals take the receiver as a positional argument.
+        task_postrun.connect(
+            handler_cache_partition_file_hit_buffer_flush,
+            dispatch_uid='file_caching_handler_cache_partition_file_hit_buffer_flush'
+        )
+        worker_process_shutdown.connect(
+            handler_cache_partition_file_hit_buffer_flush,
+            dispatch_uid='file_caching_handler_cache_partition_file_hit_buffer_flush_shutdown'
+        )
@@ -0,0 +1,357 @@
+import atexit
+from collections import Counter, deque
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+
+from django.apps import apps
+from django.core.cache import caches
+from django.db.models import F
+
+from mayan.apps.common.utils import cache_counter_increment
+
+from .literals import (
+    CACHE_LOCAL_TIER_EVICTION_TARGET_RATIO, CACHE_LOCAL_TIER_SCAN_INTERVAL,
+    CACHE_PARTITION_FILE_HIT_BUFFER_MAXIMUM_SIZE,
+    CACHE_PARTITION_FILE_TEMPORARY_NAME, CACHE_TIER_LOCAL,
+    CACHE_TIER_STATISTICS_KEY, CACHE_TIER_STORAGE
+)
+from .settings import (
+    setting_hit_count_flush_interval, setting_local_tier_maximum_size,
+    setting_local_tier_path, setting_tier_statistics_cache_name
+)
+
+logger = logging.getLogger(name=__name__)
+
+
+class CachePartitionFileHitBuffer:
+    """
+    Accumulate the hits of the cache partition files in memory and write
+    them to the database in bulk when the flush interval elapses or when
+    the buffer reaches its maximum size, instead of updating the database
+    row on every read. The buffer is also flushed at the end of each task,
+    at the end of the requests once the flush interval elapsed and when
+    the process exits.
+    """
+    _counter = Counter()
+    _lock = threading.Lock()
+    _time_last_flush = time.monotonic()
+
+    @classmethod
+    def _is_flush_due(cls):
+        if len(cls._counter) >= CACHE_PARTITION_FILE_HIT_BUFFER_MAXIMUM_SIZE:
+            return True
+
+        time_elapsed = time.monotonic() - cls._time_last_flush
+        return time_elapsed >= setting_hit_count_flush_interval.value
+
+    @classmethod
+    def _pop(cls):
+        counter = cls._counter
+        cls._counter = Counter()
+        cls._time_last_flush = time.monotonic()
+        return counter
+
+    @classmethod
+    def add(cls, cache_partition_file_id):
+        with cls._lock:
+            cls._counter[cache_partition_file_id] += 1
+
+        cls.flush_if_due()
+
+    @classmethod
+    def flush(cls, counter=None):
+        """
+        Write the accumulated hits using one query per distinct hit count.
+        """
+        if counter is None:
+            with cls._lock:
+                counter = cls._pop()
+
+        if not counter:
+            return
+
+        CachePartitionFile = apps.get_model(
+            app_label='file_caching', model_name='CachePartitionFile'
+        )
+
+        hits_dictionary = {}
+        for cache_partition_file_id, hits in counter.items():
+            hits_dictionary.setdefault(hits, []).append(
+                cache_partition_file_id
+            )
+
+        for hits, id_list in hits_dictionary.items():
+            queryset_partition_files = CachePartitionFile.objects.filter(
+                pk__in=id_list
+            )
+            queryset_partition_files.update(
+                hits=F('hits') + hits
+            )
+
+    @classmethod
+    def flush_if_due(cls):
+        with cls._lock:
+            if not cls._counter or not cls._is_flush_due():
+                return
+
+            counter = cls._pop()
+
+        cls.flush(counter=counter)
+
+
+class CacheLocalTier:
+    """
+    Bounded local disk tier placed in front of the storage of the caches.
+    Files are stored using the cache ID, the combined filename of the
+    cache partition file and the ID of the cache partition file. The ID
+    changes when a cache file is recreated, which avoids serving stale
+    content from other hosts. The least recently used files are evicted
+    when the tier is over its maximum size.
+
+    The tier is shared by all the processes of the host. The size and the
+    eviction order are obtained by scanning the files of the tier at most
+    once per scan interval. In between, the size is updated as files are
+    stored, deleted and evicted by the process.
+    """
+    _eviction_queue = deque()
+    _lock = threading.Lock()
+    _size = None
+    _time_last_scan = None
+
+    @staticmethod
+    def get_path(cache_partition_file):
+        return os.path.join(
+            setting_local_tier_path.value,
+            str(cache_partition_file.partition.cache_id), '{}-{}'.format(
+                cache_partition_file.full_filename, cache_partition_file.pk
+            )
+        )
+
+    @staticmethod
+    def is_enabled():
+        return setting_local_tier_maximum_size.value > 0
+
+    @classmethod
+    def _get_file_list(cls):
+        file_list = []
+
+        for directory_path, directory_names, filenames in os.walk(top=setting_local_tier_path.value):
+            for filename in filenames:
+                path = os.path.join(directory_path, filename)
+                try:
+                    stat_result = os.stat(path=path)
+                except FileNotFoundError:
+                    """Deleted by another process."""
+                else:
+                    file_list.append(
+                        (stat_result.st_mtime, stat_result.st_size, path)
+                    )
+
+        return file_list
+
+    @classmethod
+    def _scan(cls):
+        """
+        Must be called with the class lock acquired.
+        """
+        file_list = cls._get_file_list()
+        file_list.sort()
+
+        cls._eviction_queue = deque(file_list)
+        cls._size = sum(
+            file_size for mtime, file_size, path in file_list
+        )
+        cls._time_last_scan = time.monotonic()
+
+    @classmethod
+    def _scan_if_due(cls):
+        """
+        Must be called with the class lock acquired.
+        """
+        if cls._time_last_scan is None:
+            cls._scan()
+        else:
+            time_elapsed = time.monotonic() - cls._time_last_scan
+            if time_elapsed >= CACHE_LOCAL_TIER_SCAN_INTERVAL:
+                cls._scan()
+
+    @classmethod
+    def delete(cls, cache_partition_file):
+        path = cls.get_path(cache_partition_file=cache_partition_file)
+
+        try:
+            file_size = os.stat(path=path).st_size
+            os.unlink(path=path)
+        except FileNotFoundError:
+            """Not in the local tier."""
+        else:
+            with cls._lock:
+                if cls._size is not None:
+                    cls._size = max(0, cls._size - file_size)
+
+    @classmethod
+    def evict(cls):
+        """
+        Delete the least recently used files until the size of the tier is
+        below the target. Files are taken from the eviction order of the
+        last scan. A new scan is performed only when the scan interval
+        elapsed or when the eviction order is exhausted.
+        """
+        target_size = setting_local_tier_maximum_size.value * CACHE_LOCAL_TIER_EVICTION_TARGET_RATIO
+
+        with cls._lock:
+            cls._scan_if_due()
+
+            is_rescanned = False
+
+            while cls._size > target_size:
+                if not cls._eviction_queue:
+                    if is_rescanned:
+                        break
+
+                    cls._scan()
+                    is_rescanned = True
+                    continue
+
+                mtime, file_size, path = cls._eviction_queue.popleft()
+
+                try:
+                    if os.stat(path=path).st_mtime > mtime:
+                        # Used after the scan, keep it. The next scan
+                        # places it at the recently used end.
+                        continue
+
+                    os.unlink(path=path)
+                except FileNotFoundError:
+                    """Deleted by another process."""
+                else:
+                    cls._size = max(0, cls._size - file_size)
+
+    @classmethod
+    def open(cls, cache_partition_file):
+        """
+        Return an open file object if the file is in the local tier or
+        None otherwise.
+        """
+        path = cls.get_path(cache_partition_file=cache_partition_file)
+
+        try:
+            file_object = open(file=path, mode='rb')
+        except FileNotFoundError:
+            return None
+        else:
+            # Update the modification time to keep the file in the recently
+            # used end of the eviction order.
+            try:
+                os.utime(path=path)
+            except OSError:
+                """Non fatal, file might have been just evicted."""
+
+            return file_object
+
+    @classmethod
+    def store(cls, cache_partition_file, file_object):
+        """
+        Copy the file object to the local tier, writing to a temporary file
+        which is renamed when complete.
+        """
+        path = cls.get_path(cache_partition_file=cache_partition_file)
+        os.makedirs(
+            name=os.path.dirname(path), exist_ok=True
+        )
+
+        temporary_path = CACHE_PARTITION_FILE_TEMPORARY_NAME.format(
+            path, uuid.uuid4().hex
+        )
+
+        try:
+            with open(file=temporary_path, mode='wb') as local_file_object:
+                shutil.copyfileobj(fsrc=file_object, fdst=local_file_object)
+                file_size = local_file_object.tell()
+
+            os.replace(src=temporary_path, dst=path)
+        except Exception:
+            try:
+                os.unlink(path=temporary_path)
+            except FileNotFoundError:
+                """Not created."""
+            raise
+
+        with cls._lock:
+            if cls._time_last_scan is None:
+                # The first scan includes the new file.
+                cls._scan()
+            else:
+                cls._size += file_size
+
+            is_evict_required = cls._size > setting_local_tier_maximum_size.value
+
+        if is_evict_required:
+            cls.evict()
+
+
+class CacheTierStatistics:
+    """
+    Hit and miss counters of each tier of a cache. The counters are only
+    updated when the local tier is enabled. A local tier hit avoids
+    reading the storage of the cache. A storage tier miss is a local tier
+    miss of a file no longer present in the storage of the cache.
+    """
+    def __init__(self, cache_id):
+        self.cache_id = cache_id
+
+    def get_cache(self):
+        return caches[setting_tier_statistics_cache_name.value]
+
+    def get_hit_ratio(self, tier):
+        hits = self.get_value(name='hits', tier=tier)
+        total = hits + self.get_value(name='misses', tier=tier)
+
+        if total:
+            return hits / total
+        else:
+            return 0
+
+    def get_key(self, name, tier):
+        return CACHE_TIER_STATISTICS_KEY.format(self.cache_id, tier, name)
+
+    def get_value(self, name, tier):
+        return self.get_cache().get(
+            default=0, key=self.get_key(name=name, tier=tier)
+        )
+
+    def hit(self, tier):
+        self.increment(name='hits', tier=tier)
+
+    def increment(self, name, tier):
+        cache_counter_increment(
+            cache=self.get_cache(), key=self.get_key(name=name, tier=tier)
+        )
+
+    def miss(self, tier):
+        self.increment(name='misses', tier=tier)
+
+    def reset(self):
+        self.get_cache().delete_many(
+            keys=[
+                self.get_key(name=name, tier=tier)
+                for name in ('hits', 'misses')
+                for tier in (CACHE_TIER_LOCAL, CACHE_TIER_STORAGE)
+            ]
+        )
+
+
+def flush_at_exit():
+    try:
+        CachePartitionFileHitBuffer.flush()
+    except Exception as exception:
+        logger.warning(
+            'Unable to flush cache partition file hits; %s', exception
+        )
+
+
+atexit.register(flush_at_exit)
@@ -25,6 +25,13 @@ class CacheDetailForm(forms.DetailForm):
             _(message='Objects'), {
                 'fields': ('get_partition_count', 'get_partition_file_count')
             }
+        ), (
+            _(message='Statistics'), {
+                'fields': (
+                    'get_local_tier_hit_ratio_display',
+                    'get_storage_tier_hit_ratio_display'
+                )
+            }
         )
     )
 
@@ -34,7 +41,9 @@ class CacheDetailForm(forms.DetailForm):
             {'field': 'get_maximum_size_display'},
             {'field': 'get_total_size_display'},
             {'field': 'get_partition_count'},
-            {'field': 'get_partition_file_count'}
+            {'field': 'get_partition_file_count'},
+            {'field': 'get_local_tier_hit_ratio_display'},
+            {'field': 'get_storage_tier_hit_ratio_display'}
         )
         fields = ('defined_storage_name',)
         model = Cache
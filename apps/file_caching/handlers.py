@@ -0,0 +1,23 @@
+import logging
+
+from .classes import CachePartitionFileHitBuffer
+
+logger = logging.getLogger(name=__name__)
+
+
+def handler_cache_partition_file_hit_buffer_flush(sender, **kwargs):
+    try:
+        CachePartitionFileHitBuffer.flush()
+    except Exception as exception:
+        logger.warning(
+            'Unable to flush cache partition file hits; %s', exception
+        )
+
+
+def handler_cache_partition_file_hit_buffer_flush_if_due(sender, **kwargs):
+    try:
+        CachePartitionFileHitBuffer.flush_if_due()
+    except Exception as exception:
+        logger.warning(
+            'Unable to flush cache partition file hits; %s', exception
+        )
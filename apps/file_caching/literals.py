@@ -1,2 +1,28 @@
+import os
+
+from django.conf import settings
+
+CACHE_LOCAL_TIER_EVICTION_TARGET_RATIO = 0.9
+CACHE_LOCAL_TIER_SCAN_INTERVAL = 60  # seconds
+
+CACHE_PARTITION_FILE_HIT_BUFFER_MAXIMUM_SIZE = 1000
+CACHE_PARTITION_FILE_TEMPORARY_NAME = '{}.tmp-{}'
+
+CACHE_PRUNE_LOCK_NAME = 'file_caching_cache_prune_{}'
+CACHE_PRUNE_LOCK_TIMEOUT = 600  # seconds
+
+CACHE_TIER_LOCAL = 'local'
+CACHE_TIER_STATISTICS_KEY = 'file_caching_tier_statistics_{}_{}_{}'
+CACHE_TIER_STORAGE = 'storage'
+
+DEFAULT_HIT_COUNT_FLUSH_INTERVAL = 60  # seconds
+DEFAULT_LOCAL_TIER_MAXIMUM_SIZE = 0
+DEFAULT_LOCAL_TIER_PATH = os.path.join(
+    settings.MEDIA_ROOT, 'file_caching_local_tier'
+)
+DEFAULT_LOCKED_READS = False
 DEFAULT_MAXIMUM_FAILED_PRUNE_ATTEMPTS = 100
 DEFAULT_MAXIMUM_NORMAL_PRUNE_ATTEMPTS = 100
+DEFAULT_PRUNE_BATCH_SIZE = 100
+DEFAULT_PRUNE_IN_BACKGROUND = False
+DEFAULT_TIER_STATISTICS_CACHE_NAME = 'default'
@@ -0,0 +1,48 @@
+from django.db import migrations, models
+from django.db.models import Sum
+
+
+def code_cache_total_size_calculate(apps, schema_editor):
+    Cache = apps.get_model(app_label='file_caching', model_name='Cache')
+    CachePartitionFile = apps.get_model(
+        app_label='file_caching', model_name='CachePartitionFile'
+    )
+
+    for cache in Cache.objects.using(alias=schema_editor.connection.alias).all():
+        queryset_files = CachePartitionFile.objects.using(
+            alias=schema_editor.connection.alias
+        ).filter(partition__cache=cache)
+
+        cache.total_size = queryset_files.aggregate(
+            file_size__sum=Sum('file_size')
+        )['file_size__sum'] or 0
+        cache.save(
+            update_fields=('total_size',)
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('file_caching', '0011_alter_cache_maximum_size')
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cache', name='total_size',
+            field=models.PositiveBigIntegerField(
+                default=0, editable=False, help_text='Current size of the '
+                'cache in bytes. Updated as files are added and removed.',
+                verbose_name='Total size'
+            )
+        ),
+        migrations.AddIndex(
+            model_name='cachepartitionfile', index=models.Index(
+                fields=['hits', 'datetime'],
+                name='cachepartitionfile_eviction'
+            )
+        ),
+        migrations.RunPython(
+            code=code_cache_total_size_calculate,
+            reverse_code=migrations.RunPython.noop
+        )
+    ]
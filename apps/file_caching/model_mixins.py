@@ -1,9 +1,12 @@
 from contextlib import contextmanager
 import logging
+import os
+import uuid
 
 from django.apps import apps
 from django.core.files.base import ContentFile
 from django.db.models import F, Sum
+from django.db.models.functions import Greatest
 from django.template.defaultfilters import filesizeformat
 from django.utils.functional import cached_property
 from django.utils.text import format_lazy
@@ -18,12 +21,20 @@ from mayan.apps.lock_manager.decorators import (
 from mayan.apps.lock_manager.exceptions import LockError
 from mayan.apps.storage.classes import DefinedStorage
 
+from .classes import (
+    CacheLocalTier, CachePartitionFileHitBuffer, CacheTierStatistics
+)
 from .events import event_cache_partition_purged, event_cache_purged
 from .exceptions import FileCachingException
+from .literals import (
+    CACHE_PARTITION_FILE_TEMPORARY_NAME, CACHE_TIER_LOCAL, CACHE_TIER_STORAGE
+)
 from .settings import (
     setting_maximum_failed_prune_attempts,
-    setting_maximum_normal_prune_attempts
+    setting_locked_reads, setting_maximum_normal_prune_attempts,
+    setting_prune_batch_size, setting_prune_in_background
 )
+from .tasks import task_cache_prune
 
 logger = logging.getLogger(name=__name__)
 
@@ -50,6 +61,20 @@ class CacheBusinessLogicMixin:
             partition__cache__id=self.pk
         )
 
+    def get_local_tier_hit_ratio_display(self):
+        return '{:0.1f}%'.format(
+            self.get_tier_statistics().get_hit_ratio(
+                tier=CACHE_TIER_LOCAL
+            ) * 100
+        )
+
+    get_local_tier_hit_ratio_display.help_text = _(
+        message='Percentage of the file reads served from the local tier.'
+    )
+    get_local_tier_hit_ratio_display.short_description = _(
+        message='Local tier hit ratio'
+    )
+
     def get_maximum_size_display(self):
         return filesizeformat(bytes_=self.maximum_size)
 
@@ -86,16 +111,36 @@ class CacheBusinessLogicMixin:
 
         return queryset_cache_partition_files_sorted
 
+    def get_storage_tier_hit_ratio_display(self):
+        return '{:0.1f}%'.format(
+            self.get_tier_statistics().get_hit_ratio(
+                tier=CACHE_TIER_STORAGE
+            ) * 100
+        )
+
+    get_storage_tier_hit_ratio_display.help_text = _(
+        message='Percentage of the local tier misses found in the cache '
+        'storage.'
+    )
+    get_storage_tier_hit_ratio_display.short_description = _(
+        message='Storage tier hit ratio'
+    )
+
+    def get_tier_statistics(self):
+        return CacheTierStatistics(cache_id=self.pk)
+
     def get_total_size(self):
         """
-        Return the actual usage of the cache.
+        Return the actual usage of the cache. The value is read from the
+        database since it is updated by other processes.
         """
-        queryset_files = self.get_files()
-        queryset_files_aggregated = queryset_files.aggregate(
-            file_size__sum=Sum('file_size')
-        )
+        Cache = apps.get_model(app_label='file_caching', model_name='Cache')
 
-        return queryset_files_aggregated['file_size__sum'] or 0
+        queryset_caches = Cache.objects.filter(pk=self.pk)
+
+        return queryset_caches.values_list(
+            'total_size', flat=True
+        ).first() or 0
 
     def get_total_size_display(self):
         total_size = self.get_total_size()
@@ -120,37 +165,98 @@ class CacheBusinessLogicMixin:
 
     label.short_description = _(message='Label')
 
+    def partitions_delete(self, name_list):
+        """
+        Delete the partitions of a list of names and their files with a
+        constant number of queries. Used when the objects that own the
+        partitions are deleted in bulk. Partition purge events are not
+        committed. Errors deleting the files from the storage are logged and
+        do not stop the deletion.
+        """
+        CachePartition = apps.get_model(
+            app_label='file_caching', model_name='CachePartition'
+        )
+        CachePartitionFile = apps.get_model(
+            app_label='file_caching', model_name='CachePartitionFile'
+        )
+
+        queryset_partitions = CachePartition.objects.filter(
+            cache=self, name__in=name_list
+        )
+        queryset_files = CachePartitionFile.objects.filter(
+            partition__in=queryset_partitions
+        ).select_related('partition')
+
+        is_local_tier_enabled = CacheLocalTier.is_enabled()
+        total_size = 0
+
+        for cache_partition_file in queryset_files.iterator():
+            # Reuse this instance to avoid initializing the storage for
+            # each file.
+            cache_partition_file.partition.cache = self
+
+            try:
+                self.storage.delete(name=cache_partition_file.full_filename)
+            except Exception as exception:
+                logger.error(
+                    'Unable to delete cache file "%s"; %s',
+                    cache_partition_file.full_filename, exception
+                )
+
+            if is_local_tier_enabled:
+                CacheLocalTier.delete(
+                    cache_partition_file=cache_partition_file
+                )
+
+            total_size += cache_partition_file.file_size
+
+        queryset_partitions.delete()
+
+        if total_size:
+            self.total_size_add(size=-total_size)
+
     def prune(self):
         """
         Deletes files until the total size of the cache is below the allowed
-        maximum size of the cache.
+        maximum size of the cache. Files are fetched in batches from the
+        eviction index, least used and oldest first.
         """
         failed_attempts = 0
         normal_attempts = 0
-        file_index = 0
+        skipped_id_list = []
 
         CachePartitionFile = apps.get_model(
             app_label='file_caching', model_name='CachePartitionFile'
         )
 
-        get_queryset_eviction = self.get_queryset_files_for_eviction()
+        total_size = self.get_total_size()
+
+        while total_size >= self.maximum_size:
+            queryset_eviction = self.get_queryset_files_for_eviction().exclude(
+                pk__in=skipped_id_list
+            ).select_related('partition')
+
+            cache_partition_files = tuple(
+                queryset_eviction[:setting_prune_batch_size.value]
+            )
+
+            if not cache_partition_files:
+                # No more files to delete but the size is still over the
+                # maximum. The size counter is out of sync, recalculate it.
+                self.total_size_update()
+                break
+
+            for cache_partition_file in cache_partition_files:
+                # Reuse this instance to avoid initializing the storage for
+                # each file.
+                cache_partition_file.partition.cache = self
 
-        while self.get_total_size() >= self.maximum_size:
-            try:
-                cache_partition_file = get_queryset_eviction[
-                    file_index
-                ]
-            except IndexError:
-                # Attempted to get a file beyond what the queryset provided.
-                file_index = 0
-                get_queryset_eviction = self.get_queryset_files_for_eviction()
-            else:
                 try:
                     cache_partition_file.delete()
                 except CachePartitionFile.DoesNotExist:
                     # The file selected from deletion was deleted by another
                     # process before the lock was acquired.
-                    file_index += 1
+                    skipped_id_list.append(cache_partition_file.pk)
                 except LockError:
                     logger.debug(
                         'Lock error trying to delete file "%s" for '
@@ -158,15 +264,18 @@ class CacheBusinessLogicMixin:
                         cache_partition_file
                     )
                     failed_attempts += 1
-                    file_index += 1
+                    skipped_id_list.append(cache_partition_file.pk)
 
                     if failed_attempts > setting_maximum_failed_prune_attempts.value:
                         raise FileCachingException(
                             'Too many cache prune attempts failed.'
                         )
                 else:
-                    file_index = 0
                     normal_attempts += 1
+                    total_size -= cache_partition_file.file_size
+
+                    if total_size < self.maximum_size:
+                        break
 
                     if normal_attempts > setting_maximum_normal_prune_attempts.value:
                         raise FileCachingException(
@@ -174,6 +283,21 @@ class CacheBusinessLogicMixin:
                             'single new file.'
                         )
 
+            total_size = self.get_total_size()
+
+    def prune_request(self):
+        """
+        Prune the cache only if it is over its maximum size. Depending on
+        the settings the prune is done inline or by a background task.
+        """
+        if self.get_total_size() >= self.maximum_size:
+            if setting_prune_in_background.value:
+                task_cache_prune.apply_async(
+                    kwargs={'cache_id': self.pk}
+                )
+            else:
+                self.prune()
+
     @method_event(
         event=event_cache_purged,
         event_manager_class=EventManagerMethodAfter,
@@ -215,6 +339,36 @@ class CacheBusinessLogicMixin:
 
         return defined_storage_instance
 
+    def total_size_add(self, size):
+        """
+        Update the size counter using a single atomic query that is safe
+        to execute concurrently.
+        """
+        Cache = apps.get_model(app_label='file_caching', model_name='Cache')
+
+        queryset_caches = Cache.objects.filter(pk=self.pk)
+        queryset_caches.update(
+            total_size=Greatest(
+                F('total_size') + size, 0
+            )
+        )
+
+    def total_size_update(self):
+        """
+        Recalculate the size counter from the size of the cache files.
+        """
+        Cache = apps.get_model(app_label='file_caching', model_name='Cache')
+
+        queryset_files = self.get_files()
+        queryset_files_aggregated = queryset_files.aggregate(
+            file_size__sum=Sum('file_size')
+        )
+
+        self.total_size = queryset_files_aggregated['file_size__sum'] or 0
+
+        queryset_caches = Cache.objects.filter(pk=self.pk)
+        queryset_caches.update(total_size=self.total_size)
+
 
 class CachePartitionBusinessLogicMixin:
     @staticmethod
@@ -224,8 +378,47 @@ class CachePartitionBusinessLogicMixin:
     def _lock_manager_get_lock_name(self, filename):
         return self.get_file_lock_name(filename=filename)
 
+    def _storage_file_publish(self, name, temporary_name):
+        """
+        Move the finished temporary file to its final name. For local
+        storages an atomic rename is used so readers never see a partially
+        written file.
+        """
+        storage = self.cache.storage
+
+        try:
+            path = storage.path(name=name)
+            temporary_path = storage.path(name=temporary_name)
+        except NotImplementedError:
+            # Storage without local paths. Object storages make a file
+            # visible only after it has been uploaded completely.
+            try:
+                storage.delete(name=name)
+            except Exception as exception:
+                """
+                Some S3 implementations like Google Cloud Storage throw
+                an error when attempting to delete a not existent file
+                key. Ignore this exception, any storage error of concern
+                will be triggered by the ``storage.save`` call below.
+                """
+                logger.debug(
+                    'cache.storage.delete exception: %s', exception
+                )
+
+            with storage.open(mode='rb', name=temporary_name) as file_object:
+                storage.save(content=file_object, name=name)
+
+            storage.delete(name=temporary_name)
+        else:
+            os.replace(src=temporary_path, dst=path)
+
     @contextmanager
     def create_file(self, filename):
+        """
+        The content is written to a temporary file that is moved to its
+        final name when complete. The database entry is created only
+        after that, which allows reading cache files without locking.
+        """
         lock_name = self.get_file_lock_name(filename=filename)
         try:
             logger.debug('trying to acquire lock: %s', lock_name)
@@ -233,54 +426,46 @@ class CachePartitionBusinessLogicMixin:
             lock = locking_backend_class.acquire_lock(name=lock_name)
             logger.debug('acquired lock: %s', lock_name)
             try:
-                self.cache.prune()
+                self.cache.prune_request()
+
+                full_filename = self.get_full_filename(filename=filename)
 
                 # Since open "wb+" doesn't create files, force the creation
                 # of an empty file.
-                try:
-                    self.cache.storage.delete(
-                        name=self.get_full_filename(filename=filename)
+                temporary_filename = self.cache.storage.save(
+                    content=ContentFile(content=b''),
+                    name=CACHE_PARTITION_FILE_TEMPORARY_NAME.format(
+                        full_filename, uuid.uuid4().hex
                     )
-                except Exception as exception:
-                    """
-                    Some S3 implementations like Google Cloud Storage throw
-                    an error when attempting to delete a not existent file
-                    key. Ignore this exception, any storage error of concern
-                    will be triggered by the ``storage.save`` call below.
-                    """
-                    logger.debug(
-                        'cache.storage.delete exception: %s', exception
-                    )
-
-                self.cache.storage.save(
-                    name=self.get_full_filename(filename=filename),
-                    content=ContentFile(content=b'')
                 )
 
-                partition_file = None
-
                 try:
-                    partition_file = self.files.create(filename=filename)
-                    yield partition_file._open_for_writing(
-                        _acquire_lock=False
+                    storage_object = self.cache.storage.open(
+                        mode='wb', name=temporary_filename
+                    )
+                    try:
+                        yield storage_object
+                    finally:
+                        storage_object.close()
+
+                    self._storage_file_publish(
+                        name=full_filename, temporary_name=temporary_filename
                     )
                 except Exception as exception:
                     logger.error(
                         'Unexpected exception while trying to save new '
                         'cache file; %s', exception, exc_info=True
                     )
-                    if partition_file:
-                        partition_file.delete(_acquire_lock=False)
-                    else:
-                        # If the CachePartitionFile entry was not created
-                        # do manual clean up of the empty storage file
-                        # created with the previous`self.cache.storage.save`.
-                        self.cache.storage.delete(
-                            name=self.get_full_filename(filename=filename)
+                    # Manual clean up of the temporary file.
+                    try:
+                        self.cache.storage.delete(name=temporary_filename)
+                    except Exception as exception:
+                        logger.debug(
+                            'cache.storage.delete exception: %s', exception
                         )
                     raise
                 else:
-                    partition_file.close(_acquire_lock=False)
+                    partition_file = self.files.create(filename=filename)
                     partition_file._update_size(_acquire_lock=False)
             finally:
                 lock.release()
@@ -371,16 +556,69 @@ class CachePartitionFileBusinessLogicMixin:
             )
             raise
 
+    def _open_tiered(self):
+        """
+        Open the file from the local tier when enabled and available.
+        Otherwise open it from the cache storage, copying it to the local
+        tier when enabled.
+        """
+        storage_instance = self.partition.cache.storage
+
+        if not CacheLocalTier.is_enabled():
+            return storage_instance.open(mode='rb', name=self.full_filename)
+
+        tier_statistics = self.partition.cache.get_tier_statistics()
+
+        file_object = CacheLocalTier.open(cache_partition_file=self)
+
+        if file_object:
+            tier_statistics.hit(tier=CACHE_TIER_LOCAL)
+            return file_object
+
+        tier_statistics.miss(tier=CACHE_TIER_LOCAL)
+
+        try:
+            file_object = storage_instance.open(
+                mode='rb', name=self.full_filename
+            )
+        except Exception:
+            tier_statistics.miss(tier=CACHE_TIER_STORAGE)
+            raise
+
+        tier_statistics.hit(tier=CACHE_TIER_STORAGE)
+
+        try:
+            with file_object:
+                CacheLocalTier.store(
+                    cache_partition_file=self, file_object=file_object
+                )
+        except Exception as exception:
+            logger.warning(
+                'Unable to copy cache file "%s" to the local tier; %s',
+                self.full_filename, exception
+            )
+        else:
+            file_object = CacheLocalTier.open(cache_partition_file=self)
+
+            if file_object:
+                return file_object
+
+        return storage_instance.open(mode='rb', name=self.full_filename)
+
     @locked_class_method
     def _update_size(self):
         """
         Called after creation and initial write only.
         """
         storage_instance = self.partition.cache.storage
+        previous_file_size = self.file_size
         self.file_size = storage_instance.size(name=self.full_filename)
         self.save(
             update_fields=('file_size',)
         )
+        self.partition.cache.total_size_add(
+            size=self.file_size - previous_file_size
+        )
         if self.file_size > self.partition.cache.maximum_size:
             raise FileCachingException(
                 'Cache partition file %s is bigger than the maximum cache '
@@ -406,44 +644,60 @@ class CachePartitionFileBusinessLogicMixin:
     @contextmanager
     def open(self):
         """
-        Open the file for reading only.
+        Open the file for reading only. Cache files are written atomically
+        so the lock is only acquired when configured.
         """
-        CachePartitionFile = apps.get_model(
-            app_label='file_caching', model_name='CachePartitionFile'
-        )
+        self._lock = None
 
-        lock_name = self._lock_manager_get_lock_name()
-        try:
-            logger.debug('trying to acquire lock: %s', lock_name)
-            locking_backend_class = LockingBackend.get_backend()
+        if setting_locked_reads.value:
+            lock_name = self._lock_manager_get_lock_name()
+            try:
+                logger.debug('trying to acquire lock: %s', lock_name)
+                locking_backend_class = LockingBackend.get_backend()
 
-            self._lock = locking_backend_class.acquire_lock(name=lock_name)
+                self._lock = locking_backend_class.acquire_lock(
+                    name=lock_name
+                )
+                logger.debug('acquired lock: %s', lock_name)
+            except LockError:
+                logger.debug('unable to obtain lock: %s', lock_name)
+                raise
 
-            queryset_partition_files = CachePartitionFile.objects.filter(
-                pk=self.pk
-            )
+        CachePartitionFileHitBuffer.add(cache_partition_file_id=self.pk)
 
-            queryset_partition_files.update(
-                hits=F('hits') + 1
+        self._storage_object = None
+        try:
+            self._storage_object = self._open_tiered()
+        except FileNotFoundError:
+            # Without the read lock, the file can be pruned or deleted
+            # between the lookup and the opening. Remove the stale entry
+            # and handle it as a cache miss.
+            logger.debug(
+                'Cache file "%s" removed before opening it.',
+                self.full_filename
             )
-            logger.debug('acquired lock: %s', lock_name)
-            self._storage_object = None
             try:
-                storage_instance = self.partition.cache.storage
-                self._storage_object = storage_instance.open(
-                    mode='rb', name=self.full_filename
-                )
+                self.delete()
             except Exception as exception:
-                logger.error(
-                    'Unexpected exception opening the cache file; %s',
-                    exception, exc_info=True
+                logger.debug(
+                    'Unable to delete stale cache partition file ID: %d; '
+                    '%s', self.pk, exception
                 )
-                raise
-            else:
-                yield self._storage_object
-            finally:
-                self.close(_acquire_lock=False)
-                self._lock.release()
-        except LockError:
-            logger.debug('unable to obtain lock: %s', lock_name)
+
+            raise self.DoesNotExist(
+                'Cache partition file "{}" no longer exists.'.format(
+                    self.full_filename
+                )
+            )
+        except Exception as exception:
+            logger.error(
+                'Unexpected exception opening the cache file; %s',
+                exception, exc_info=True
+            )
             raise
+        else:
+            yield self._storage_object
+        finally:
+            self.close(_acquire_lock=False)
+            if self._lock:
+                self._lock.release()
@@ -8,6 +8,7 @@ from mayan.apps.events.decorators import method_event
 from mayan.apps.events.event_managers import EventManagerSave
 from mayan.apps.lock_manager.decorators import locked_class_method
 
+from .classes import CacheLocalTier
 from .events import event_cache_created, event_cache_edited
 from .model_mixins import (
     CacheBusinessLogicMixin, CachePartitionBusinessLogicMixin,
@@ -30,6 +31,12 @@ class Cache(CacheBusinessLogicMixin, ValueChangeModelMixin, models.Model):
             validators.MinValueValidator(limit_value=1)
         ], verbose_name=_(message='Maximum size')
     )
+    total_size = models.PositiveBigIntegerField(
+        default=0, editable=False, help_text=_(
+            message='Current size of the cache in bytes. Updated as files '
+            'are added and removed.'
+        ), verbose_name=_(message='Total size')
+    )
 
     class Meta:
         ordering = ('id',)
@@ -61,6 +68,14 @@ class Cache(CacheBusinessLogicMixin, ValueChangeModelMixin, models.Model):
             field='maximum_size'
         )
 
+        if not self._state.adding and 'update_fields' not in kwargs:
+            # The total size is updated using atomic queries, avoid
+            # overwriting it with the value loaded with the instance.
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'total_size'
+            ]
+
         result = super().save(*args, **kwargs)
 
         if self.maximum_size < old_maximum_size:
@@ -121,6 +136,12 @@ class CachePartitionFile(CachePartitionFileBusinessLogicMixin, models.Model):
 
     class Meta:
         get_latest_by = 'datetime'
+        indexes = (
+            models.Index(
+                fields=('hits', 'datetime'),
+                name='cachepartitionfile_eviction'
+            ),
+        )
         unique_together = ('partition', 'filename')
         verbose_name = _(message='Cache partition file')
         verbose_name_plural = _(message='Cache partition files')
@@ -129,4 +150,13 @@ class CachePartitionFile(CachePartitionFileBusinessLogicMixin, models.Model):
     def delete(self, *args, **kwargs):
         storage_instance = self.partition.cache.storage
         storage_instance.delete(name=self.full_filename)
-        return super().delete(*args, **kwargs)
+        result = super().delete(*args, **kwargs)
+
+        deleted_count, deleted_per_model = result
+        if deleted_count:
+            self.partition.cache.total_size_add(size=-self.file_size)
+
+        if CacheLocalTier.is_enabled():
+            CacheLocalTier.delete(cache_partition_file=self)
+
+        return result
@@ -14,6 +14,10 @@ queue_file_caching.add_task_type(
     dotted_path='mayan.apps.file_caching.tasks.task_cache_partition_purge',
     label=_(message='Purge a file cache partition')
 )
+queue_file_caching.add_task_type(
+    dotted_path='mayan.apps.file_caching.tasks.task_cache_prune',
+    label=_(message='Prune a file cache')
+)
 
 queue_file_caching_slow.add_task_type(
     dotted_path='mayan.apps.file_caching.tasks.task_cache_purge',
@@ -3,14 +3,49 @@ from django.utils.translation import gettext_lazy as _
 from mayan.apps.smart_settings.settings import setting_cluster
 
 from .literals import (
+    DEFAULT_HIT_COUNT_FLUSH_INTERVAL, DEFAULT_LOCAL_TIER_MAXIMUM_SIZE,
+    DEFAULT_LOCAL_TIER_PATH, DEFAULT_LOCKED_READS,
     DEFAULT_MAXIMUM_FAILED_PRUNE_ATTEMPTS,
-    DEFAULT_MAXIMUM_NORMAL_PRUNE_ATTEMPTS
+    DEFAULT_MAXIMUM_NORMAL_PRUNE_ATTEMPTS, DEFAULT_PRUNE_BATCH_SIZE,
+    DEFAULT_PRUNE_IN_BACKGROUND, DEFAULT_TIER_STATISTICS_CACHE_NAME
 )
 
 setting_namespace = setting_cluster.do_namespace_add(
     label=_(message='File caching'), name='file_caching'
 )
 
+setting_hit_count_flush_interval = setting_namespace.do_setting_add(
+    default=DEFAULT_HIT_COUNT_FLUSH_INTERVAL,
+    global_name='FILE_CACHING_HIT_COUNT_FLUSH_INTERVAL', help_text=_(
+        message='Time in seconds during which the hits of the cache files '
+        'are accumulated in memory before being written to the database. '
+        'A value of 0 writes the hit count on every read.'
+    )
+)
+setting_local_tier_maximum_size = setting_namespace.do_setting_add(
+    default=DEFAULT_LOCAL_TIER_MAXIMUM_SIZE,
+    global_name='FILE_CACHING_LOCAL_TIER_MAXIMUM_SIZE', help_text=_(
+        message='Maximum size in bytes of the local disk tier placed in '
+        'front of the storage of the file caches. Files read from the '
+        'cache storage are copied to the local tier and served from it '
+        'afterwards. Useful when the cache storage is a network storage. '
+        'A value of 0 disables the local tier.'
+    )
+)
+setting_local_tier_path = setting_namespace.do_setting_add(
+    default=DEFAULT_LOCAL_TIER_PATH,
+    global_name='FILE_CACHING_LOCAL_TIER_PATH', help_text=_(
+        message='Local directory used to store the files of the local '
+        'cache tier.'
+    )
+)
+setting_locked_reads = setting_namespace.do_setting_add(
+    default=DEFAULT_LOCKED_READS,
+    global_name='FILE_CACHING_LOCKED_READS', help_text=_(
+        message='Acquire the exclusive lock of a cache file when reading it. '
+        'Not required since cache files are written atomically.'
+    )
+)
 setting_maximum_failed_prune_attempts = setting_namespace.do_setting_add(
     default=DEFAULT_MAXIMUM_FAILED_PRUNE_ATTEMPTS,
     global_name='FILE_CACHING_MAXIMUM_FAILED_PRUNE_ATTEMPTS', help_text=_(
@@ -26,3 +61,25 @@ setting_maximum_normal_prune_attempts = setting_namespace.do_setting_add(
         'space for new a file being requested, before giving up.'
     )
 )
+setting_prune_batch_size = setting_namespace.do_setting_add(
+    default=DEFAULT_PRUNE_BATCH_SIZE,
+    global_name='FILE_CACHING_PRUNE_BATCH_SIZE', help_text=_(
+        message='Number of files fetched at once from the eviction index '
+        'when pruning a cache.'
+    )
+)
+setting_prune_in_background = setting_namespace.do_setting_add(
+    default=DEFAULT_PRUNE_IN_BACKGROUND,
+    global_name='FILE_CACHING_PRUNE_IN_BACKGROUND', help_text=_(
+        message='When enabled, caches over their maximum size are pruned by '
+        'a background task instead of during the creation of the new file.'
+    )
+)
+setting_tier_statistics_cache_name = setting_namespace.do_setting_add(
+    default=DEFAULT_TIER_STATISTICS_CACHE_NAME,
+    global_name='FILE_CACHING_TIER_STATISTICS_CACHE_NAME', help_text=_(
+        message='Name of the Django cache used to keep the hit and miss '
+        'counters of the cache tiers. Use a cache shared by all processes, '
+        'like Redis, to get installation wide values.'
+    )
+)
@@ -3,9 +3,13 @@ import logging
 from django.apps import apps
 from django.contrib.auth import get_user_model
 
+from mayan.apps.lock_manager.backends.base import LockingBackend
 from mayan.apps.lock_manager.exceptions import LockError
 from mayan.celery import app
 
+from .exceptions import FileCachingException
+from .literals import CACHE_PRUNE_LOCK_NAME, CACHE_PRUNE_LOCK_TIMEOUT
+
 logger = logging.getLogger(name=__name__)
 
 
@@ -46,6 +50,35 @@ def task_cache_partition_purge(
         logger.info('Finished cache partition id %s purge', cache_partition)
 
 
+@app.task(ignore_result=True)
+def task_cache_prune(cache_id):
+    Cache = apps.get_model(
+        app_label='file_caching', model_name='Cache'
+    )
+
+    cache = Cache.objects.get(pk=cache_id)
+
+    try:
+        lock = LockingBackend.get_backend().acquire_lock(
+            name=CACHE_PRUNE_LOCK_NAME.format(cache.pk),
+            timeout=CACHE_PRUNE_LOCK_TIMEOUT
+        )
+    except LockError:
+        logger.debug('Cache id %s is already being pruned', cache)
+    else:
+        logger.info('Starting cache id %s prune', cache)
+        try:
+            cache.prune()
+        except FileCachingException as exception:
+            logger.warning(
+                'Unable to finish cache id %s prune; %s', cache, exception
+            )
+        else:
+            logger.info('Finished cache id %s prune', cache)
+        finally:
+            lock.release()
+
+
 @app.task(bind=True, ignore_result=True)
 def task_cache_purge(self, cache_id, user_id=None):
     Cache = apps.get_model(
@@ -0,0 +1,9 @@
+TEST_CACHE_LOCAL_TIER_MAXIMUM_SIZE = 100
+TEST_CACHE_MAXIMUM_SIZE = 2 ** 20
+TEST_CACHE_PARTITION_FILE_CONTENT = b'test cache partition file content'
+TEST_CACHE_PARTITION_FILE_COUNT = 4
+TEST_CACHE_PARTITION_FILE_FILENAME = 'test_cache_partition_file'
+TEST_CACHE_PARTITION_NAME = 'test_cache_partition'
+TEST_CACHE_PRUNE_BATCH_SIZE = 1
+TEST_DEFINED_STORAGE_LABEL = 'Test cache storage'
+TEST_DEFINED_STORAGE_NAME = 'file_caching__test_cache_storage'
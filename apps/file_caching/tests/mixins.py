@@ -0,0 +1,47 @@
+import shutil
+from tempfile import mkdtemp
+
+from mayan.apps.storage.classes import DefinedStorage
+
+from ..models import Cache
+
+from .literals import (
+    TEST_CACHE_MAXIMUM_SIZE, TEST_CACHE_PARTITION_FILE_CONTENT,
+    TEST_CACHE_PARTITION_FILE_FILENAME, TEST_CACHE_PARTITION_NAME,
+    TEST_DEFINED_STORAGE_LABEL, TEST_DEFINED_STORAGE_NAME
+)
+
+
+class CacheTestMixin:
+    def setUp(self):
+        super().setUp()
+        self.test_storage_path = mkdtemp()
+
+        DefinedStorage(
+            dotted_path='django.core.files.storage.FileSystemStorage',
+            kwargs={'location': self.test_storage_path},
+            label=TEST_DEFINED_STORAGE_LABEL, name=TEST_DEFINED_STORAGE_NAME
+        )
+
+        self.test_cache = Cache.objects.create(
+            defined_storage_name=TEST_DEFINED_STORAGE_NAME,
+            maximum_size=TEST_CACHE_MAXIMUM_SIZE
+        )
+        self.test_cache_partition = self.test_cache.partitions.create(
+            name=TEST_CACHE_PARTITION_NAME
+        )
+
+    def tearDown(self):
+        shutil.rmtree(path=self.test_storage_path)
+        super().tearDown()
+
+    def _create_test_cache_partition_file(
+        self, content=TEST_CACHE_PARTITION_FILE_CONTENT,
+        filename=TEST_CACHE_PARTITION_FILE_FILENAME
+    ):
+        with self.test_cache_partition.create_file(filename=filename) as file_object:
+            file_object.write(content)
+
+        self.test_cache_partition_file = self.test_cache_partition.get_file(
+            filename=filename
+        )
@@ -0,0 +1,144 @@
+import os
+import shutil
+from tempfile import mkdtemp
+from unittest import mock
+
+from celery.signals import task_postrun
+
+from django.test import TestCase
+
+from ..classes import CacheLocalTier, CachePartitionFileHitBuffer
+
+from .literals import TEST_CACHE_LOCAL_TIER_MAXIMUM_SIZE
+from .mixins import CacheTestMixin
+
+
+class CacheLocalTierTestCase(CacheTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.test_local_tier_path = mkdtemp()
+
+        for target, value in (
+            (
+                'mayan.apps.file_caching.classes.setting_local_tier_maximum_size',
+                TEST_CACHE_LOCAL_TIER_MAXIMUM_SIZE
+            ),
+            (
+                'mayan.apps.file_caching.classes.setting_local_tier_path',
+                self.test_local_tier_path
+            )
+        ):
+            patcher = mock.patch(
+                new=mock.Mock(value=value), target=target
+            )
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        CacheLocalTier._time_last_scan = None
+
+        self._create_test_cache_partition_file()
+
+    def tearDown(self):
+        CacheLocalTier._time_last_scan = None
+        shutil.rmtree(path=self.test_local_tier_path)
+        super().tearDown()
+
+    def _store_test_file(self, size):
+        with open(file=os.path.join(self.test_storage_path, 'source'), mode='w+b') as file_object:
+            file_object.write(b'0' * size)
+            file_object.seek(0)
+            CacheLocalTier.store(
+                cache_partition_file=self.test_cache_partition_file,
+                file_object=file_object
+            )
+
+    def test_delete_size(self):
+        self._store_test_file(size=10)
+        self.assertEqual(CacheLocalTier._size, 10)
+
+        CacheLocalTier.delete(
+            cache_partition_file=self.test_cache_partition_file
+        )
+        self.assertEqual(CacheLocalTier._size, 0)
+
+    def test_evict(self):
+        self._store_test_file(size=10)
+
+        self.test_cache_partition_file.pk += 1
+        self._store_test_file(size=TEST_CACHE_LOCAL_TIER_MAXIMUM_SIZE)
+
+        self.assertTrue(
+            CacheLocalTier._size <= TEST_CACHE_LOCAL_TIER_MAXIMUM_SIZE
+        )
+
+    def test_evict_no_tree_walk(self):
+        self._store_test_file(size=30)
+        self.test_cache_partition_file.pk += 1
+
+        with mock.patch.object(
+            target=CacheLocalTier, attribute='_get_file_list',
+            wraps=CacheLocalTier._get_file_list
+        ) as mock_get_file_list:
+            self._store_test_file(size=80)
+
+        mock_get_file_list.assert_not_called()
+        self.assertEqual(CacheLocalTier._size, 80)
+
+
+class CachePartitionFileHitBufferTestCase(CacheTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self._create_test_cache_partition_file()
+        CachePartitionFileHitBuffer._pop()
+
+    def tearDown(self):
+        CachePartitionFileHitBuffer._pop()
+        super().tearDown()
+
+    def test_add_buffered(self):
+        CachePartitionFileHitBuffer.add(
+            cache_partition_file_id=self.test_cache_partition_file.pk
+        )
+
+        self.test_cache_partition_file.refresh_from_db()
+        self.assertEqual(self.test_cache_partition_file.hits, 0)
+
+    def test_add_maximum_size(self):
+        with mock.patch(
+            new=1, target='mayan.apps.file_caching.classes.CACHE_PARTITION_FILE_HIT_BUFFER_MAXIMUM_SIZE'
+        ):
+            CachePartitionFileHitBuffer.add(
+                cache_partition_file_id=self.test_cache_partition_file.pk
+            )
+
+        self.test_cache_partition_file.refresh_from_db()
+        self.assertEqual(self.test_cache_partition_file.hits, 1)
+
+    def test_flush(self):
+        CachePartitionFileHitBuffer.add(
+            cache_partition_file_id=self.test_cache_partition_file.pk
+        )
+        CachePartitionFileHitBuffer.add(
+            cache_partition_file_id=self.test_cache_partition_file.pk
+        )
+        CachePartitionFileHitBuffer.flush()
+
+        self.test_cache_partition_file.refresh_from_db()
+        self.assertEqual(self.test_cache_partition_file.hits, 2)
+
+    def test_flush_empty(self):
+        with mock.patch(
+            target='mayan.apps.file_caching.classes.apps.get_model'
+        ) as mock_get_model:
+            CachePartitionFileHitBuffer.flush()
+
+        mock_get_model.assert_not_called()
+
+    def test_flush_task_postrun(self):
+        CachePartitionFileHitBuffer.add(
+            cache_partition_file_id=self.test_cache_partition_file.pk
+        )
+        task_postrun.send(sender=None, task=None, task_id='test')
+
+        self.test_cache_partition_file.refresh_from_db()
+        self.assertEqual(self.test_cache_partition_file.hits, 1)
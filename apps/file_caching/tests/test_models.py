@@ -0,0 +1,259 @@
+import shutil
+from tempfile import mkdtemp
+from unittest import mock
+
+from django.test import TestCase
+
+from ..classes import CacheLocalTier
+from ..literals import CACHE_TIER_LOCAL, CACHE_TIER_STORAGE
+from ..models import Cache, CachePartitionFile
+
+from .literals import (
+    TEST_CACHE_LOCAL_TIER_MAXIMUM_SIZE, TEST_CACHE_PARTITION_FILE_CONTENT,
+    TEST_CACHE_PARTITION_FILE_COUNT, TEST_CACHE_PARTITION_FILE_FILENAME,
+    TEST_CACHE_PRUNE_BATCH_SIZE
+)
+from .mixins import CacheTestMixin
+
+
+class CachePartitionFileTestCase(CacheTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self._create_test_cache_partition_file()
+
+    def test_open(self):
+        with self.test_cache_partition_file.open() as file_object:
+            self.assertEqual(
+                file_object.read(), TEST_CACHE_PARTITION_FILE_CONTENT
+            )
+
+    def test_open_removed_file(self):
+        self.test_cache.storage.delete(
+            name=self.test_cache_partition_file.full_filename
+        )
+
+        with self.assertRaises(expected_exception=CachePartitionFile.DoesNotExist):
+            with self.test_cache_partition_file.open():
+                """Must raise before opening."""
+
+        self.assertFalse(
+            self.test_cache_partition.files.filter(
+                filename=TEST_CACHE_PARTITION_FILE_FILENAME
+            ).exists()
+        )
+
+        # The cache file can be created again.
+        self._create_test_cache_partition_file()
+
+
+class CacheSizeTestCase(CacheTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.test_prune_in_background = mock.Mock(value=False)
+
+        for target, new in (
+            (
+                'mayan.apps.file_caching.model_mixins.setting_prune_batch_size',
+                mock.Mock(value=TEST_CACHE_PRUNE_BATCH_SIZE)
+            ),
+            (
+                'mayan.apps.file_caching.model_mixins.setting_prune_in_background',
+                self.test_prune_in_background
+            )
+        ):
+            patcher = mock.patch(new=new, target=target)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.test_file_size = len(TEST_CACHE_PARTITION_FILE_CONTENT)
+        self.test_filenames = [
+            '{}_{}'.format(TEST_CACHE_PARTITION_FILE_FILENAME, index)
+            for index in range(TEST_CACHE_PARTITION_FILE_COUNT)
+        ]
+
+        for filename in self.test_filenames:
+            self._create_test_cache_partition_file(filename=filename)
+
+    def _get_test_cache_filenames(self):
+        return sorted(
+            self.test_cache_partition.files.values_list(
+                'filename', flat=True
+            )
+        )
+
+    def _set_test_cache_maximum_size(self, file_count):
+        # Update the field without saving the instance. Saving a lower
+        # maximum size prunes the cache.
+        self.test_cache.maximum_size = int(self.test_file_size * file_count)
+        Cache.objects.filter(pk=self.test_cache.pk).update(
+            maximum_size=self.test_cache.maximum_size
+        )
+
+    def test_total_size(self):
+        self.assertEqual(
+            self.test_cache.get_total_size(),
+            self.test_file_size * TEST_CACHE_PARTITION_FILE_COUNT
+        )
+
+        self.test_cache_partition.get_file(
+            filename=self.test_filenames[0]
+        ).delete()
+
+        self.assertEqual(
+            self.test_cache.get_total_size(),
+            self.test_file_size * (TEST_CACHE_PARTITION_FILE_COUNT - 1)
+        )
+
+    def test_prune(self):
+        # The first files are the most used and must be kept.
+        self.test_cache_partition.files.filter(
+            filename__in=self.test_filenames[:2]
+        ).update(hits=1)
+
+        self._set_test_cache_maximum_size(file_count=2.5)
+
+        self.test_cache.prune()
+
+        self.assertEqual(
+            self._get_test_cache_filenames(), self.test_filenames[:2]
+        )
+        self.assertEqual(
+            self.test_cache.get_total_size(), self.test_file_size * 2
+        )
+
+    def test_prune_total_size_drift(self):
+        Cache.objects.filter(pk=self.test_cache.pk).update(
+            total_size=self.test_cache.maximum_size
+        )
+        self.test_cache.partitions.all().delete()
+
+        self.test_cache.prune()
+
+        self.assertEqual(self.test_cache.get_total_size(), 0)
+
+    def test_prune_request_background(self):
+        self.test_prune_in_background.value = True
+        self._set_test_cache_maximum_size(file_count=2.5)
+
+        with mock.patch(
+            target='mayan.apps.file_caching.model_mixins.task_cache_prune.apply_async'
+        ) as mock_apply_async:
+            self.test_cache.prune_request()
+
+        mock_apply_async.assert_called_once_with(
+            kwargs={'cache_id': self.test_cache.pk}
+        )
+        self.assertEqual(
+            self._get_test_cache_filenames(), sorted(self.test_filenames)
+        )
+
+    def test_prune_request_under_maximum_size(self):
+        with mock.patch.object(
+            attribute='prune', target=Cache
+        ) as mock_prune:
+            self.test_cache.prune_request()
+
+        self.assertFalse(mock_prune.called)
+
+
+class CacheTierStatisticsTestCase(CacheTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.test_local_tier_path = mkdtemp()
+
+        self.test_local_tier_maximum_size = mock.Mock(
+            value=TEST_CACHE_LOCAL_TIER_MAXIMUM_SIZE
+        )
+
+        for target, new in (
+            (
+                'mayan.apps.file_caching.classes.setting_local_tier_maximum_size',
+                self.test_local_tier_maximum_size
+            ),
+            (
+                'mayan.apps.file_caching.classes.setting_local_tier_path',
+                mock.Mock(value=self.test_local_tier_path)
+            )
+        ):
+            patcher = mock.patch(new=new, target=target)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        CacheLocalTier._time_last_scan = None
+
+        self.test_tier_statistics = self.test_cache.get_tier_statistics()
+        self.test_tier_statistics.reset()
+        self.addCleanup(self.test_tier_statistics.reset)
+
+        self._create_test_cache_partition_file()
+
+    def tearDown(self):
+        CacheLocalTier._time_last_scan = None
+        shutil.rmtree(path=self.test_local_tier_path)
+        super().tearDown()
+
+    def _get_test_tier_statistics_values(self):
+        return {
+            (tier, name): self.test_tier_statistics.get_value(
+                name=name, tier=tier
+            ) for name in ('hits', 'misses')
+            for tier in (CACHE_TIER_LOCAL, CACHE_TIER_STORAGE)
+        }
+
+    def _open_test_cache_partition_file(self):
+        with self.test_cache_partition_file.open() as file_object:
+            return file_object.read()
+
+    def test_local_tier_disabled(self):
+        self.test_local_tier_maximum_size.value = 0
+
+        self._open_test_cache_partition_file()
+
+        self.assertEqual(
+            set(
+                self._get_test_tier_statistics_values().values()
+            ), {0}
+        )
+
+    def test_lookup_miss(self):
+        with self.assertRaises(expected_exception=CachePartitionFile.DoesNotExist):
+            self.test_cache_partition.get_file(filename='missing')
+
+        self.assertEqual(
+            set(
+                self._get_test_tier_statistics_values().values()
+            ), {0}
+        )
+
+    def test_open(self):
+        self._open_test_cache_partition_file()
+        self.assertEqual(
+            self._open_test_cache_partition_file(),
+            TEST_CACHE_PARTITION_FILE_CONTENT
+        )
+
+        self.assertEqual(
+            self._get_test_tier_statistics_values(), {
+                (CACHE_TIER_LOCAL, 'hits'): 1,
+                (CACHE_TIER_LOCAL, 'misses'): 1,
+                (CACHE_TIER_STORAGE, 'hits'): 1,
+                (CACHE_TIER_STORAGE, 'misses'): 0
+            }
+        )
+
+    def test_open_removed_file(self):
+        self.test_cache.storage.delete(
+            name=self.test_cache_partition_file.full_filename
+        )
+
+        with self.assertRaises(expected_exception=CachePartitionFile.DoesNotExist):
+            self._open_test_cache_partition_file()
+
+        self.assertEqual(
+            self._get_test_tier_statistics_values(), {
+                (CACHE_TIER_LOCAL, 'hits'): 0,
+                (CACHE_TIER_LOCAL, 'misses'): 1,
+                (CACHE_TIER_STORAGE, 'hits'): 0,
+                (CACHE_TIER_STORAGE, 'misses'): 1
+            }
+        )
@@ -5,7 +5,7 @@ from .models import DocumentTypeOCRSettings, DocumentVersionPageOCRContent
 
 @admin.register(DocumentTypeOCRSettings)
 class DocumentTypeOCRSettingsAdmin(admin.ModelAdmin):
-    list_display = ('document_type', 'auto_ocr')
+    list_display = ('document_type', 'auto_ocr', 'page_batch_size')
 
 
 @admin.register(DocumentVersionPageOCRContent)
@@ -5,10 +5,15 @@ import sh
 
 from django.utils.translation import gettext_lazy as _
 
+from mayan.apps.storage.utils import NamedTemporaryFile
+
 from ..classes import OCRBackendBase
 from ..exceptions import OCRError
 
-from .literals import DEFAULT_TESSERACT_BINARY_PATH, DEFAULT_TESSERACT_TIMEOUT
+from .literals import (
+    DEFAULT_TESSERACT_BINARY_PATH, DEFAULT_TESSERACT_TIMEOUT,
+    TESSERACT_PAGE_SEPARATOR
+)
 
 logger = logging.getLogger(name=__name__)
 
@@ -21,61 +26,100 @@ class Tesseract(OCRBackendBase):
         if kwargs.get('auto_initialize', True):
             self.initialize()
 
-    def _execute(self, image_file_object):
-        """
-        Execute the command line binary of tesseract.
-        """
-        if self.command_tesseract:
-            arguments = ['-', '-']
-
-            keyword_arguments = {
-                '_in': image_file_object,
-                '_timeout': self.command_timeout
-            }
+    def _command_call(self, arguments, keyword_arguments):
+        if self.language:
+            keyword_arguments['l'] = self.language
 
-            if self.language:
-                keyword_arguments['l'] = self.language
+        environment = os.environ.copy()
+        environment.update(self.command_environment)
+        keyword_arguments['_env'] = environment
 
-            environment = os.environ.copy()
-            environment.update(self.command_environment)
-            keyword_arguments['_env'] = environment
+        arguments.extend(self.tesseract_arguments_extra)
 
-            arguments.extend(self.tesseract_arguments_extra)
+        logger.debug(
+            'Calling Tesseract with arguments %s, %s', arguments,
+            keyword_arguments
+        )
 
-            logger.debug(
-                'Calling Tesseract with arguments %s, %s', arguments,
-                keyword_arguments
+        try:
+            return self.command_tesseract(*arguments, **keyword_arguments)
+        except Exception as exception:
+            error_message_list = []
+            error_message_list.append(
+                'Exception calling Tesseract with language option: {}; {}'.format(
+                    self.language, exception
+                )
             )
 
-            try:
-                output = self.command_tesseract(
-                    *arguments, **keyword_arguments
-                )
-            except Exception as exception:
-                error_message_list = []
+            if self.language not in self.languages:
                 error_message_list.append(
-                    'Exception calling Tesseract with language option: {}; {}'.format(
-                        self.language, exception
+                    'The requested OCR language "{}" is not '
+                    'available and needs to be installed.'.format(
+                        self.language
                     )
                 )
 
-                if self.language not in self.languages:
-                    error_message_list.append(
-                        'The requested OCR language "{}" is not '
-                        'available and needs to be installed.'.format(
-                            self.language
-                        )
-                    )
+            error_message = '/n'.join(error_message_list)
 
-                error_message = '/n'.join(error_message_list)
+            logger.error(error_message, exc_info=True)
+            raise OCRError(error_message)
 
-                logger.error(error_message, exc_info=True)
-                raise OCRError(error_message)
-            else:
-                return output
+    def _execute(self, image_file_object):
+        """
+        Execute the command line binary of tesseract.
+        """
+        if self.command_tesseract:
+            return self._command_call(
+                arguments=['-', '-'], keyword_arguments={
+                    '_in': image_file_object,
+                    '_timeout': self.command_timeout
+                }
+            )
         else:
             return ''
 
+    def _execute_many(self, image_file_objects):
+        """
+        Pass a list file with the image filenames to a single Tesseract
+        process. Tesseract terminates the text of each image with a page
+        separator character.
+        """
+        if not self.command_tesseract:
+            return [''] * len(image_file_objects)
+
+        with NamedTemporaryFile(mode='w') as list_file_object:
+            for image_file_object in image_file_objects:
+                list_file_object.write(
+                    '{}\n'.format(image_file_object.name)
+                )
+            list_file_object.flush()
+
+            output = self._command_call(
+                arguments=[list_file_object.name, '-'], keyword_arguments={
+                    '_timeout': self.command_timeout * len(
+                        image_file_objects
+                    )
+                }
+            )
+
+        result = str(output).split(TESSERACT_PAGE_SEPARATOR)
+
+        # The last page separator produces an empty trailing entry.
+        if len(result) == len(image_file_objects) + 1 and not result[-1].strip():
+            result.pop()
+
+        if len(result) != len(image_file_objects):
+            logger.warning(
+                'Tesseract returned %d pages for %d images. Falling back '
+                'to processing one image at a time.', len(result),
+                len(image_file_objects)
+            )
+            return super()._execute_many(
+                image_file_objects=image_file_objects
+            )
+
+        return result
+
     def initialize(self):
         self.languages = ()
 
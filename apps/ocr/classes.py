@@ -1,20 +1,50 @@
+from contextlib import ExitStack
+import copy
 import shutil
+import threading
 
 from django.utils.encoding import force_str
 from django.utils.module_loading import import_string
 
 from mayan.apps.converter.classes import ConverterBase
-from mayan.apps.storage.utils import TemporaryFile
+from mayan.apps.storage.utils import NamedTemporaryFile, TemporaryFile
 
 from .settings import setting_ocr_backend, setting_ocr_backend_arguments
 
 
 class OCRBackendBase:
+    _instance_cache = {}
+    _instance_cache_lock = threading.Lock()
+
     @staticmethod
     def get_instance():
-        return import_string(
-            dotted_path=setting_ocr_backend.value
-        )(**setting_ocr_backend_arguments.value)
+        """
+        Return an initialized backend instance. Initialized instances are
+        cached per process, keyed by the backend path and arguments, to
+        avoid probing the OCR engine for every page. A shallow copy is
+        returned to keep the state of each call, like the language,
+        separate between threads.
+        """
+        key = (
+            setting_ocr_backend.value,
+            repr(setting_ocr_backend_arguments.value)
+        )
+
+        with OCRBackendBase._instance_cache_lock:
+            instance = OCRBackendBase._instance_cache.get(key)
+
+            if instance is None:
+                instance = import_string(
+                    dotted_path=setting_ocr_backend.value
+                )(**setting_ocr_backend_arguments.value)
+                OCRBackendBase._instance_cache[key] = instance
+
+        return copy.copy(instance)
+
+    @staticmethod
+    def invalidate_instance_cache():
+        with OCRBackendBase._instance_cache_lock:
+            OCRBackendBase._instance_cache.clear()
 
     def __init__(self, *args, **kwargs):
         self.args = args
@@ -30,15 +60,65 @@ class OCRBackendBase:
             file_object=file_object
         )
 
-        for transformation in transformations:
-            self.converter.transform(transformation=transformation)
+        try:
+            for transformation in transformations:
+                self.converter.transform(transformation=transformation)
+
+            image = self.converter.get_page()
 
-        image = self.converter.get_page()
+            with TemporaryFile() as temporary_image_file:
+                shutil.copyfileobj(fsrc=image, fdst=temporary_image_file)
+                temporary_image_file.seek(0)
 
-        with TemporaryFile() as temporary_image_file:
-            shutil.copyfileobj(fsrc=image, fdst=temporary_image_file)
-            temporary_image_file.seek(0)
+                return force_str(
+                    s=self._execute(image_file_object=temporary_image_file)
+                )
+        finally:
+            # Do not keep the converter and its file objects alive
+            # between calls.
+            self.converter = None
 
-            return force_str(
-                s=self._execute(image_file_object=temporary_image_file)
+    def execute_many(self, file_objects, language=None):
+        """
+        Process several page images with a single backend call when the
+        backend supports it. Return a list with the text content of each
+        image in the same order as the file objects.
+        """
+        self.language = language
+
+        with ExitStack() as stack:
+            temporary_image_files = []
+
+            for file_object in file_objects:
+                converter = ConverterBase.get_converter_class()(
+                    file_object=file_object
+                )
+                image = converter.get_page()
+
+                temporary_image_file = stack.enter_context(
+                    NamedTemporaryFile()
+                )
+                shutil.copyfileobj(fsrc=image, fdst=temporary_image_file)
+                temporary_image_file.flush()
+                temporary_image_file.seek(0)
+                temporary_image_files.append(temporary_image_file)
+
+            return [
+                force_str(s=content) for content in self._execute_many(
+                    image_file_objects=temporary_image_files
+                )
+            ]
+
+    def _execute_many(self, image_file_objects):
+        """
+        Optional method for backends that can process several images in
+        a single call. Defaults to processing one image at a time.
+        """
+        result = []
+
+        for image_file_object in image_file_objects:
+            result.append(
+                self._execute(image_file_object=image_file_object)
             )
+
+        return result
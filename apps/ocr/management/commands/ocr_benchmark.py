@@ -0,0 +1,89 @@
+import time
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare the OCR throughput in pages per second of the per page '
+        'mode against the batch mode for a document version. The pages '
+        'are processed synchronously in the current process.'
+    )
+    missing_args_message = 'You must provide a document version ID.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            dest='document_version_id', help='ID of the document version '
+            'to process.', metavar='<document version ID>', type=int
+        )
+        parser.add_argument(
+            '--batch-size', action='append', dest='batch_size_list',
+            help='Page batch size to benchmark. Can be specified multiple '
+            'times. Defaults to 10.', type=int
+        )
+
+    def handle(self, document_version_id, **options):
+        DocumentVersion = apps.get_model(
+            app_label='documents', model_name='DocumentVersion'
+        )
+        DocumentVersionPageOCRContent = apps.get_model(
+            app_label='ocr', model_name='DocumentVersionPageOCRContent'
+        )
+
+        try:
+            document_version = DocumentVersion.objects.get(
+                pk=document_version_id
+            )
+        except DocumentVersion.DoesNotExist:
+            self.stderr.write(
+                msg='Unknown document version ID `{}`'.format(
+                    document_version_id
+                )
+            )
+            exit(1)
+
+        document_version_pages = list(
+            document_version.pages.all()
+        )
+        page_count = len(document_version_pages)
+
+        if not page_count:
+            self.stderr.write(msg='Document version has no pages.')
+            exit(1)
+
+        # Generate the page images first to only measure the OCR.
+        for document_version_page in document_version_pages:
+            document_version_page.generate_image()
+
+        time_start = time.monotonic()
+        for document_version_page in document_version_pages:
+            DocumentVersionPageOCRContent.objects.process_document_version_page(
+                document_version_page=document_version_page
+            )
+        self.write_result(
+            label='Per page', page_count=page_count,
+            time_elapsed=time.monotonic() - time_start
+        )
+
+        for batch_size in options['batch_size_list'] or (10,):
+            time_start = time.monotonic()
+            for index in range(0, page_count, batch_size):
+                DocumentVersionPageOCRContent.objects.process_document_version_pages(
+                    document_version_pages=document_version_pages[
+                        index:index + batch_size
+                    ]
+                )
+            self.write_result(
+                label='Batch size {}'.format(batch_size),
+                page_count=page_count,
+                time_elapsed=time.monotonic() - time_start
+            )
+
+    def write_result(self, label, page_count, time_elapsed):
+        self.stdout.write(
+            msg='{}: {} pages in {:0.2f} seconds, {:0.2f} pages/second.'.format(
+                label, page_count, time_elapsed,
+                page_count / time_elapsed if time_elapsed else 0
+            )
+        )
@@ -1,7 +1,8 @@
+from contextlib import ExitStack
 import logging
 
 from django.apps import apps
-from django.db import models
+from django.db import models, transaction
 
 from mayan.apps.converter.settings import setting_image_generation_timeout
 from mayan.apps.lock_manager.backends.base import LockingBackend
@@ -101,6 +102,148 @@ class DocumentVersionPageOCRContentManager(models.Manager):
             finally:
                 document_version_page_lock.release()
 
+    def process_document_version_pages(
+        self, document_version_pages, user=None
+    ):
+        """
+        Process several pages of the same document version with a single
+        OCR backend call and store the results with bulk queries.
+        """
+        SearchIndexQueueEntry = apps.get_model(
+            app_label='dynamic_search', model_name='SearchIndexQueueEntry'
+        )
+
+        document_version_pages = list(document_version_pages)
+
+        if not document_version_pages:
+            return
+
+        document_version = document_version_pages[0].document_version
+
+        logger.info(
+            'Processing %d pages of document version: %s',
+            len(document_version_pages), document_version
+        )
+
+        ContentType = apps.get_model(
+            app_label='contenttypes', model_name='ContentType'
+        )
+        DocumentVersionPageOCRContent = apps.get_model(
+            app_label='ocr', model_name='DocumentVersionPageOCRContent'
+        )
+        ErrorLogPartitionEntry = apps.get_model(
+            app_label='logging', model_name='ErrorLogPartitionEntry'
+        )
+
+        with ExitStack() as stack:
+            for document_version_page in document_version_pages:
+                lock_name = document_version_page.get_lock_name(user=user)
+
+                try:
+                    document_version_page_lock = LockingBackend.get_backend().acquire_lock(
+                        name=lock_name,
+                        timeout=setting_image_generation_timeout.value * 2
+                    )
+                except Exception as exception:
+                    logger.error(
+                        'Error attempting to lock document version page: '
+                        '%d; %s', document_version_page.pk, exception,
+                        exc_info=True
+                    )
+                    raise
+                else:
+                    stack.callback(document_version_page_lock.release)
+
+            try:
+                file_objects = []
+
+                for document_version_page in document_version_pages:
+                    cache_filename = document_version_page.generate_image(
+                        _acquire_lock=False, user=user
+                    )
+                    cache_file = document_version_page.cache_partition.get_file(
+                        filename=cache_filename
+                    )
+                    file_objects.append(
+                        stack.enter_context(
+                            cache_file.open()
+                        )
+                    )
+
+                try:
+                    ocr_content_list = OCRBackendBase.get_instance().execute_many(
+                        file_objects=file_objects,
+                        language=document_version.document.language
+                    )
+                except OCRError as exception:
+                    for document_version_page in document_version_pages:
+                        document_version_page.error_log.create(
+                            domain_name=ERROR_LOG_DOMAIN_NAME,
+                            text=str(exception)
+                        )
+                    return
+            except Exception as exception:
+                logger.error(
+                    'OCR error for document version: %d; %s',
+                    document_version.pk, exception, exc_info=True
+                )
+                raise
+
+        content_map = {
+            document_version_page.pk: ocr_content for document_version_page, ocr_content in zip(
+                document_version_pages, ocr_content_list
+            )
+        }
+
+        with transaction.atomic():
+            queryset_existing = DocumentVersionPageOCRContent.objects.filter(
+                document_version_page_id__in=content_map.keys()
+            )
+
+            instances_existing = []
+            for instance in queryset_existing:
+                instance.content = content_map.pop(
+                    instance.document_version_page_id
+                )
+                instances_existing.append(instance)
+
+            DocumentVersionPageOCRContent.objects.bulk_update(
+                fields=('content',), objs=instances_existing
+            )
+            DocumentVersionPageOCRContent.objects.bulk_create(
+                objs=[
+                    DocumentVersionPageOCRContent(
+                        content=ocr_content,
+                        document_version_page_id=document_version_page_id
+                    ) for document_version_page_id, ocr_content in content_map.items()
+                ]
+            )
+
+            content_type = ContentType.objects.get_for_model(
+                model=document_version_pages[0]
+            )
+
+            queryset_error_logs = ErrorLogPartitionEntry.objects.filter(
+                domain_name=ERROR_LOG_DOMAIN_NAME,
+                error_log_partition__content_type=content_type,
+                error_log_partition__object_id__in=[
+                    document_version_page.pk for document_version_page in document_version_pages
+                ]
+            )
+            queryset_error_logs.delete()
+
+        # Bulk queries don't send the model signals. Request the update of
+        # the search index explicitly.
+        for instance in document_version_pages + [
+            document_version, document_version.document
+        ]:
+            SearchIndexQueueEntry.objects.index_request(instance=instance)
+
+        logger.info(
+            'Finished processing %d pages of document version: %s',
+            len(document_version_pages), document_version
+        )
+
 
 class DocumentTypeSettingsManager(models.Manager):
     def get_by_natural_key(self, document_type_natural_key):
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('ocr', '0012_alter_documenttypeocrsettings_auto_ocr')
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='documenttypeocrsettings', name='page_batch_size',
+            field=models.PositiveIntegerField(
+                default=0, help_text='Number of pages processed together '
+                'by a single OCR task and OCR engine call. A value of 0 '
+                'processes each page in its own task.',
+                verbose_name='Page batch size'
+            )
+        )
+    ]
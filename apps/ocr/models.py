@@ -28,6 +28,13 @@ class DocumentTypeOCRSettings(ExtraDataModelMixin, models.Model):
             message='Automatically queue newly created documents for OCR.'
         ), verbose_name=_(message='Auto OCR')
     )
+    page_batch_size = models.PositiveIntegerField(
+        default=0, help_text=_(
+            message='Number of pages processed together by a single OCR '
+            'task and OCR engine call. A value of 0 processes each page '
+            'in its own task.'
+        ), verbose_name=_(message='Page batch size')
+    )
 
     objects = DocumentTypeSettingsManager()
 
@@ -12,6 +12,6 @@ class DocumentVersionPageOCRContentSerializer(serializers.ModelSerializer):
 
 class DocumentTypeOCRSettingsSerializer(serializers.ModelSerializer):
     class Meta:
-        fields = ('auto_ocr',)
+        fields = ('auto_ocr', 'page_batch_size')
         model = DocumentTypeOCRSettings
         read_only_fields = ()
@@ -0,0 +1,5 @@
+def callback_ocr_backend_instance_invalidate(setting):
+    # Import here to avoid a circular import with the settings module.
+    from .classes import OCRBackendBase
+
+    OCRBackendBase.invalidate_instance_cache()
@@ -5,6 +5,7 @@ from mayan.apps.smart_settings.settings import setting_cluster
 from .literals import (
     DEFAULT_OCR_AUTO_OCR, DEFAULT_OCR_BACKEND, DEFAULT_OCR_BACKEND_ARGUMENTS
 )
+from .setting_callbacks import callback_ocr_backend_instance_invalidate
 from .setting_migrations import OCRSettingMigration
 
 setting_namespace = setting_cluster.do_namespace_add(
@@ -21,9 +22,10 @@ setting_auto_ocr = setting_namespace.do_setting_add(
 setting_ocr_backend = setting_namespace.do_setting_add(
     default=DEFAULT_OCR_BACKEND, global_name='OCR_BACKEND', help_text=_(
         message='Full path to the backend to be used to do OCR.'
-    )
+    ), post_edit_function=callback_ocr_backend_instance_invalidate
 )
 setting_ocr_backend_arguments = setting_namespace.do_setting_add(
     default=DEFAULT_OCR_BACKEND_ARGUMENTS,
-    global_name='OCR_BACKEND_ARGUMENTS'
+    global_name='OCR_BACKEND_ARGUMENTS',
+    post_edit_function=callback_ocr_backend_instance_invalidate
 )
@@ -27,15 +27,32 @@ def task_document_version_ocr_process(
         pk=document_version_id
     )
 
+    page_batch_size = document_version.document.document_type.ocr_settings.page_batch_size
+
     document_version_page_tasks = []
-    for document_version_page in document_version.pages.all():
-        document_version_page_tasks.append(
-            task_document_version_page_ocr_process.s(
-                document_version_page_id=document_version_page.pk,
-                user_id=user_id
-            )
+
+    if page_batch_size:
+        document_version_page_id_list = list(
+            document_version.pages.values_list('pk', flat=True)
         )
 
+        for index in range(0, len(document_version_page_id_list), page_batch_size):
+            document_version_page_tasks.append(
+                task_document_version_page_ocr_batch_process.s(
+                    document_version_page_id_list=document_version_page_id_list[
+                        index:index + page_batch_size
+                    ], user_id=user_id
+                )
+            )
+    else:
+        for document_version_page in document_version.pages.all():
+            document_version_page_tasks.append(
+                task_document_version_page_ocr_process.s(
+                    document_version_page_id=document_version_page.pk,
+                    user_id=user_id
+                )
+            )
+
     chord(document_version_page_tasks)(
         task_document_version_ocr_finished.s(
             document_version_id=document_version.pk, user_id=user_id
@@ -84,6 +101,47 @@ def task_document_version_page_ocr_process(
         raise self.retry(exc=exception)
 
 
+@app.task(bind=True, retry_backoff=True)
+def task_document_version_page_ocr_batch_process(
+    self, document_version_page_id_list, user_id=None
+):
+    CachePartitionFile = apps.get_model(
+        app_label='file_caching', model_name='CachePartitionFile'
+    )
+    DocumentVersionPageOCRContent = apps.get_model(
+        app_label='ocr', model_name='DocumentVersionPageOCRContent'
+    )
+    DocumentVersionPage = apps.get_model(
+        app_label='documents', model_name='DocumentVersionPage'
+    )
+    queryset_document_version_pages = DocumentVersionPage.objects.filter(
+        pk__in=document_version_page_id_list
+    ).order_by('page_number')
+
+    User = get_user_model()
+
+    if user_id:
+        user = User.objects.get(pk=user_id)
+    else:
+        user = None
+
+    try:
+        DocumentVersionPageOCRContent.objects.process_document_version_pages(
+            document_version_pages=queryset_document_version_pages,
+            user=user
+        )
+    except CachePartitionFile.DoesNotExist as exception:
+        logger.info(
+            'Document version page image not found. Possible cause '
+            'overloaded system or cache size too small. Retrying task.',
+        )
+        raise self.retry(exc=exception)
+    except LockError as exception:
+        raise self.retry(exc=exception)
+    except OperationalError as exception:
+        raise self.retry(exc=exception)
+
+
 @app.task(bind=True, ignore_result=True)
 def task_document_version_ocr_finished(
     self, results, document_version_id, user_id=None
@@ -0,0 +1,6 @@
+TEST_OCR_BACKEND_ARGUMENTS = {'test': 'test'}
+TEST_OCR_BACKEND_ARGUMENTS_OTHER = {'test': 'other'}
+TEST_OCR_BACKEND_CONTENT = 'test OCR backend content'
+TEST_OCR_BACKEND_DOTTED_PATH = 'mayan.apps.ocr.tests.mocks.TestOCRBackend'
+TEST_OCR_BACKEND_LANGUAGE = 'eng'
+TEST_OCR_BACKEND_LANGUAGE_OTHER = 'deu'
@@ -0,0 +1,14 @@
+from ..classes import OCRBackendBase
+
+from .literals import TEST_OCR_BACKEND_CONTENT
+
+
+class TestOCRBackend(OCRBackendBase):
+    initialization_count = 0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        TestOCRBackend.initialization_count += 1
+
+    def _execute(self, image_file_object):
+        return TEST_OCR_BACKEND_CONTENT
@@ -0,0 +1,102 @@
+from io import BytesIO
+import threading
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from ..classes import OCRBackendBase
+
+from .literals import (
+    TEST_OCR_BACKEND_ARGUMENTS, TEST_OCR_BACKEND_ARGUMENTS_OTHER,
+    TEST_OCR_BACKEND_CONTENT, TEST_OCR_BACKEND_DOTTED_PATH,
+    TEST_OCR_BACKEND_LANGUAGE, TEST_OCR_BACKEND_LANGUAGE_OTHER
+)
+from .mocks import TestOCRBackend
+
+
+class OCRBackendInstanceCacheTestCase(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch(
+            new=mock.Mock(value=TEST_OCR_BACKEND_DOTTED_PATH),
+            target='mayan.apps.ocr.classes.setting_ocr_backend'
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self._set_test_ocr_backend_arguments(
+            arguments=TEST_OCR_BACKEND_ARGUMENTS
+        )
+
+        OCRBackendBase.invalidate_instance_cache()
+        self.addCleanup(OCRBackendBase.invalidate_instance_cache)
+
+        TestOCRBackend.initialization_count = 0
+
+    def _set_test_ocr_backend_arguments(self, arguments):
+        patcher = mock.patch(
+            new=mock.Mock(value=arguments),
+            target='mayan.apps.ocr.classes.setting_ocr_backend_arguments'
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_get_instance_cached(self):
+        instance = OCRBackendBase.get_instance()
+        instance_other = OCRBackendBase.get_instance()
+
+        self.assertEqual(TestOCRBackend.initialization_count, 1)
+        self.assertTrue(isinstance(instance, TestOCRBackend))
+        self.assertEqual(instance.kwargs, TEST_OCR_BACKEND_ARGUMENTS)
+        self.assertIsNot(instance, instance_other)
+
+    def test_get_instance_call_state(self):
+        instance = OCRBackendBase.get_instance()
+        instance.language = TEST_OCR_BACKEND_LANGUAGE
+
+        instance_other = OCRBackendBase.get_instance()
+        instance_other.language = TEST_OCR_BACKEND_LANGUAGE_OTHER
+
+        self.assertEqual(instance.language, TEST_OCR_BACKEND_LANGUAGE)
+
+    def test_get_instance_arguments_change(self):
+        OCRBackendBase.get_instance()
+
+        self._set_test_ocr_backend_arguments(
+            arguments=TEST_OCR_BACKEND_ARGUMENTS_OTHER
+        )
+        instance = OCRBackendBase.get_instance()
+
+        self.assertEqual(TestOCRBackend.initialization_count, 2)
+        self.assertEqual(instance.kwargs, TEST_OCR_BACKEND_ARGUMENTS_OTHER)
+
+    def test_get_instance_invalidate(self):
+        OCRBackendBase.get_instance()
+        OCRBackendBase.invalidate_instance_cache()
+        OCRBackendBase.get_instance()
+
+        self.assertEqual(TestOCRBackend.initialization_count, 2)
+
+    def test_get_instance_threads(self):
+        OCRBackendBase.get_instance()
+
+        thread = threading.Thread(target=OCRBackendBase.get_instance)
+        thread.start()
+        thread.join()
+
+        self.assertEqual(TestOCRBackend.initialization_count, 1)
+
+    def test_execute_converter_release(self):
+        mock_converter_class = mock.Mock()
+        mock_converter_class.return_value.get_page.return_value = BytesIO()
+
+        instance = OCRBackendBase.get_instance()
+
+        with mock.patch(
+            new=mock.Mock(return_value=mock_converter_class),
+            target='mayan.apps.ocr.classes.ConverterBase.get_converter_class'
+        ):
+            result = instance.execute(file_object=BytesIO())
+
+        self.assertEqual(result, TEST_OCR_BACKEND_CONTENT)
+        self.assertIsNone(instance.converter)
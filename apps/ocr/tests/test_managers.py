@@ -0,0 +1,104 @@
+from unittest import mock
+
+from django.test import TestCase
+
+from mayan.apps.documents.tests.mixins import DocumentTestMixin
+
+from ..literals import ERROR_LOG_DOMAIN_NAME
+from ..models import DocumentVersionPageOCRContent
+
+TEST_OCR_CONTENT = 'test OCR content {}'
+
+
+class DocumentVersionPageOCRContentManagerTestCase(
+    DocumentTestMixin, TestCase
+):
+    def setUp(self):
+        super().setUp()
+        self.test_document_version_pages = list(
+            self.test_document_version.pages.all()
+        )
+
+    def _create_test_cache_file(self, document_version_page, **kwargs):
+        filename = 'test_image'
+
+        with document_version_page.cache_partition.create_file(filename=filename) as file_object:
+            file_object.write(b'test')
+
+        return filename
+
+    def _process_document_version_pages(self):
+        test_ocr_backend = mock.Mock()
+        test_ocr_backend.execute_many.return_value = [
+            TEST_OCR_CONTENT.format(document_version_page.pk)
+            for document_version_page in self.test_document_version_pages
+        ]
+
+        with mock.patch.object(
+            attribute='generate_image', autospec=True,
+            side_effect=self._create_test_cache_file,
+            target=self.test_document_version_pages[0].__class__
+        ):
+            with mock.patch(
+                new=mock.Mock(return_value=test_ocr_backend),
+                target='mayan.apps.ocr.managers.OCRBackendBase.get_instance'
+            ):
+                with mock.patch(
+                    target='mayan.apps.dynamic_search.managers.SearchIndexQueueEntryManager.index_request'
+                ) as mock_index_request:
+                    DocumentVersionPageOCRContent.objects.process_document_version_pages(
+                        document_version_pages=self.test_document_version_pages
+                    )
+
+        return mock_index_request
+
+    def test_process_document_version_pages(self):
+        mock_index_request = self._process_document_version_pages()
+
+        for document_version_page in self.test_document_version_pages:
+            self.assertEqual(
+                document_version_page.ocr_content.content,
+                TEST_OCR_CONTENT.format(document_version_page.pk)
+            )
+
+        self.assertEqual(
+            [
+                call.kwargs['instance'] for call in mock_index_request.call_args_list
+            ], self.test_document_version_pages + [
+                self.test_document_version, self.test_document
+            ]
+        )
+
+    def test_process_document_version_pages_clear_error_log(self):
+        for document_version_page in self.test_document_version_pages:
+            document_version_page.error_log.create(
+                domain_name=ERROR_LOG_DOMAIN_NAME, text='test error'
+            )
+
+        self._process_document_version_pages()
+
+        for document_version_page in self.test_document_version_pages:
+            self.assertFalse(
+                document_version_page.error_log.filter(
+                    domain_name=ERROR_LOG_DOMAIN_NAME
+                ).exists()
+            )
+
+    def test_process_document_version_pages_update(self):
+        DocumentVersionPageOCRContent.objects.create(
+            content='old content',
+            document_version_page=self.test_document_version_pages[0]
+        )
+
+        self._process_document_version_pages()
+
+        self.assertEqual(
+            DocumentVersionPageOCRContent.objects.filter(
+                document_version_page__in=self.test_document_version_pages
+            ).count(), len(self.test_document_version_pages)
+        )
+        self.test_document_version_pages[0].ocr_content.refresh_from_db()
+        self.assertEqual(
+            self.test_document_version_pages[0].ocr_content.content,
+            TEST_OCR_CONTENT.format(self.test_document_version_pages[0].pk)
+        )
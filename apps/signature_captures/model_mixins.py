@@ -40,9 +40,7 @@ class SignatureCaptureBusinessLogicMixin:
         # The parameters 'maximum_layer_order',
         # `transformation_instance_list`, `user` are not used, but added
         # to retain interface compatibility.
-        cache_filename = '{}'.format(
-            self.get_hash()
-        )
+        cache_filename = self.get_combined_cache_filename()
 
         try:
             self.cache_partition.get_file(filename=cache_filename)
@@ -80,6 +78,16 @@ class SignatureCaptureBusinessLogicMixin:
 
         return final_url.tostr()
 
+    def get_combined_cache_filename(
+        self, maximum_layer_order=None, transformation_instance_list=None,
+        user=None
+    ):
+        # The arguments are not used, but added to retain interface
+        # compatibility.
+        return '{}'.format(
+            self.get_hash()
+        )
+
     def get_date_time_created(self):
         return Template(
             template_string='{{ instance.date_time_created }}'
@@ -1,17 +1,110 @@
+import os
+import shutil
+import struct
 import zipfile
 
 try:
-    import zlib  # NOQA
+    import zlib
     COMPRESSION = zipfile.ZIP_DEFLATED
 except ImportError:
+    zlib = None
     COMPRESSION = zipfile.ZIP_STORED
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 from django.core.files.base import ContentFile
 from django.utils.encoding import force_str
 
-from ..classes import BufferedFile, PassthroughStorage
+from ..classes import BufferedFile, ChunkedFile, PassthroughStorage
+from ..utils import TemporaryFile
+
+from .literals import (
+    COMPRESSION_CONTAINER_CHUNK_SIZE, COMPRESSION_CONTAINER_FOOTER_FORMAT,
+    COMPRESSION_CONTAINER_HEADER_FORMAT,
+    COMPRESSION_CONTAINER_INDEX_ENTRY_FORMAT, COMPRESSION_CONTAINER_MAGIC,
+    COMPRESSION_CONTAINER_VERSION, COMPRESSION_LEVEL_ZLIB,
+    COMPRESSION_LEVEL_ZSTANDARD, ZIP_CHUNK_SIZE, ZIP_MEMBER_FILENAME
+)
+
+
+class CompressionCodec:
+    """
+    Compress and decompress the chunks of the compressed container. The
+    codec identifier is stored in the header of every container and must
+    never change. Storage instances are shared between threads, codecs
+    must not keep compression state between calls.
+    """
+    _registry = {}
+    codec_id = None
+    level_default = None
+    name = None
+
+    @classmethod
+    def get(cls, name):
+        return cls._registry[name]
+
+    @classmethod
+    def get_by_id(cls, codec_id):
+        for codec in cls._registry.values():
+            if codec.codec_id == codec_id:
+                return codec
+
+        raise KeyError(
+            'Unknown compression codec identifier: {}'.format(codec_id)
+        )
+
+    @classmethod
+    def register(cls, codec):
+        cls._registry[codec.name] = codec
+
+    def __init__(self, level=None):
+        if level is None:
+            level = self.level_default
+
+        self.level = level
+
+    def compress(self, data):
+        raise NotImplementedError
+
+    def decompress(self, data):
+        raise NotImplementedError
+
+
+class CompressionCodecZlib(CompressionCodec):
+    codec_id = 1
+    level_default = COMPRESSION_LEVEL_ZLIB
+    name = 'zlib'
 
-from .literals import ZIP_CHUNK_SIZE, ZIP_MEMBER_FILENAME
+    def compress(self, data):
+        return zlib.compress(data, self.level)
+
+    def decompress(self, data):
+        return zlib.decompress(data)
+
+
+class CompressionCodecZstandard(CompressionCodec):
+    codec_id = 2
+    level_default = COMPRESSION_LEVEL_ZSTANDARD
+    name = 'zstd'
+
+    def compress(self, data):
+        return zstandard.ZstdCompressor(level=self.level).compress(data)
+
+    def decompress(self, data):
+        return zstandard.ZstdDecompressor().decompress(data)
+
+
+if zlib:
+    CompressionCodec.register(codec=CompressionCodecZlib)
+
+if zstandard:
+    CompressionCodec.register(codec=CompressionCodecZstandard)
+    COMPRESSION_CODEC_DEFAULT = CompressionCodecZstandard.name
+else:
+    COMPRESSION_CODEC_DEFAULT = CompressionCodecZlib.name
 
 
 class BufferedZipFile(BufferedFile):
@@ -46,6 +139,25 @@ class BufferedZipFile(BufferedFile):
         self.zip_container_file_object.close()
         self.file_object.close()
 
+    def read(self, size=None):
+        # Read from the member directly instead of accumulating the
+        # decompressed content in the buffer.
+        if size is None:
+            size = -1
+
+        data = self.zip_file_object.read(size)
+
+        if self.binary_mode:
+            return data
+        else:
+            return force_str(s=data)
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        return self.zip_file_object.seek(offset, whence)
+
+    def seekable(self):
+        return self.zip_file_object.seekable()
+
     def tell(self):
         return self.zip_file_object.tell()
 
@@ -53,6 +165,247 @@ class BufferedZipFile(BufferedFile):
         return self.zip_file_object.write(data=data)
 
 
+class CompressedContainerFile(ChunkedFile):
+    """
+    Compressed container format. The header holds a magic string, the
+    format version, the codec identifier and the chunk size. Each chunk is
+    compressed independently and is followed by the others. The content
+    ends with an index of the offset of every compressed chunk and a
+    footer with the offset of the index, the size of the content and the
+    magic string. Reading any position only requires decompressing the
+    chunk that holds it.
+    """
+    footer_size = struct.calcsize(COMPRESSION_CONTAINER_FOOTER_FORMAT)
+    header_size = struct.calcsize(COMPRESSION_CONTAINER_HEADER_FORMAT)
+
+    @staticmethod
+    def check(file_object):
+        """
+        Return True if the file object is a compressed container. The
+        position of the file object is restored.
+        """
+        position = file_object.tell()
+        magic = file_object.read(
+            len(COMPRESSION_CONTAINER_MAGIC)
+        )
+        file_object.seek(position)
+
+        return magic == COMPRESSION_CONTAINER_MAGIC
+
+    def __init__(self, *args, **kwargs):
+        codec = kwargs.pop('codec', None)
+
+        super().__init__(*args, **kwargs)
+
+        if self.is_write_mode:
+            self.chunk_offsets = []
+            self.chunk_size = COMPRESSION_CONTAINER_CHUNK_SIZE
+            self.codec = codec
+
+            self.file_object.write(
+                struct.pack(
+                    COMPRESSION_CONTAINER_HEADER_FORMAT,
+                    COMPRESSION_CONTAINER_MAGIC,
+                    COMPRESSION_CONTAINER_VERSION, self.codec.codec_id,
+                    self.chunk_size
+                )
+            )
+            self.offset = self.header_size
+        else:
+            try:
+                magic, version, codec_id, self.chunk_size = struct.unpack(
+                    COMPRESSION_CONTAINER_HEADER_FORMAT,
+                    self.file_object.read(self.header_size)
+                )
+            except struct.error as exception:
+                raise ValueError(
+                    'Compressed container header is truncated.'
+                ) from exception
+
+            if version != COMPRESSION_CONTAINER_VERSION:
+                raise ValueError(
+                    'Unsupported compressed container version: {}'.format(
+                        version
+                    )
+                )
+
+            self.codec = CompressionCodec.get_by_id(codec_id=codec_id)()
+
+            self.file_object.seek(-self.footer_size, os.SEEK_END)
+            footer_offset = self.file_object.tell()
+
+            index_offset, self._size, magic = struct.unpack(
+                COMPRESSION_CONTAINER_FOOTER_FORMAT,
+                self.file_object.read(self.footer_size)
+            )
+
+            if magic != COMPRESSION_CONTAINER_MAGIC:
+                raise ValueError('Compressed container footer is invalid.')
+
+            self.file_object.seek(index_offset)
+            index = self.file_object.read(footer_offset - index_offset)
+
+            # The offset of the index marks the end of the last chunk.
+            self.chunk_offsets = [
+                offset for offset, in struct.iter_unpack(
+                    COMPRESSION_CONTAINER_INDEX_ENTRY_FORMAT, index
+                )
+            ]
+            self.chunk_offsets.append(index_offset)
+
+    def _chunk_read(self, index):
+        if index >= len(self.chunk_offsets) - 1:
+            return b''
+
+        offset_start = self.chunk_offsets[index]
+        offset_end = self.chunk_offsets[index + 1]
+
+        self.file_object.seek(offset_start)
+
+        return self.codec.decompress(
+            data=self.file_object.read(offset_end - offset_start)
+        )
+
+    def _chunk_write(self, data, index, is_final):
+        if data:
+            compressed_data = self.codec.compress(data=data)
+
+            self.chunk_offsets.append(self.offset)
+            self.file_object.write(compressed_data)
+            self.offset += len(compressed_data)
+
+        if is_final:
+            for offset in self.chunk_offsets:
+                self.file_object.write(
+                    struct.pack(
+                        COMPRESSION_CONTAINER_INDEX_ENTRY_FORMAT, offset
+                    )
+                )
+
+            self.file_object.write(
+                struct.pack(
+                    COMPRESSION_CONTAINER_FOOTER_FORMAT, self.offset,
+                    self.position, COMPRESSION_CONTAINER_MAGIC
+                )
+            )
+
+
+class ChunkedCompressedPassthroughStorage(PassthroughStorage):
+    """
+    Compress files using the compressed container format. Files are read
+    and written in chunks, memory usage does not depend on the size of the
+    files. Files of the `ZipCompressedPassthroughStorage` are read and can
+    be converted using the `upgrade` method.
+    """
+    def __init__(self, *args, **kwargs):
+        codec_name = kwargs.pop('codec', None) or COMPRESSION_CODEC_DEFAULT
+        level = kwargs.pop('level', None)
+
+        super().__init__(*args, **kwargs)
+
+        self.codec = CompressionCodec.get(name=codec_name)(level=level)
+
+    def open(self, name, mode='rb', _direct=False):
+        next_kwargs = {'name': name}
+
+        if _direct:
+            next_kwargs['mode'] = mode
+
+            if issubclass(self.next_storage_class, PassthroughStorage):
+                next_kwargs.update(
+                    {'_direct': _direct}
+                )
+
+            return self._call_backend_method(
+                method_name='open', kwargs=next_kwargs
+            )
+        elif 'w' in mode:
+            storage_file = self._open_next(mode='wb', name=name)
+
+            return CompressedContainerFile(
+                codec=self.codec, file_object=storage_file, mode=mode,
+                name=name
+            )
+        else:
+            storage_file = self._open_next(mode='rb', name=name)
+
+            if CompressedContainerFile.check(file_object=storage_file):
+                return CompressedContainerFile(
+                    file_object=storage_file, mode=mode, name=name
+                )
+            else:
+                return BufferedZipFile(
+                    file_object=storage_file,
+                    member_name=ZIP_MEMBER_FILENAME, mode=mode
+                )
+
+    def save(self, name, content, max_length=None, _direct=False):
+        next_kwargs = {'max_length': max_length, 'name': name}
+        if _direct:
+            next_kwargs['content'] = content
+
+            if issubclass(self.next_storage_class, PassthroughStorage):
+                next_kwargs.update(
+                    {'_direct': _direct}
+                )
+
+            return self._call_backend_method(
+                method_name='save', kwargs=next_kwargs
+            )
+        else:
+            if not self._call_backend_method(
+                method_name='exists', kwargs={'name': name}
+            ):
+                name = self._call_backend_method(
+                    method_name='save', kwargs={
+                        'content': ContentFile(content=b''), 'name': name
+                    }
+                )
+
+            storage_file = self._open_next(mode='wb', name=name)
+
+            compressed_file = CompressedContainerFile(
+                codec=self.codec, file_object=storage_file, mode='wb'
+            )
+
+            with compressed_file:
+                while True:
+                    chunk = content.read(COMPRESSION_CONTAINER_CHUNK_SIZE)
+
+                    if chunk:
+                        compressed_file.write(chunk)
+                    else:
+                        break
+
+            return name
+
+    def upgrade(self, name):
+        """
+        Compress a file of the ZIP format using the container format.
+        Returns True if the file was upgraded. The file is decompressed to a
+        temporary file and compressed again under a temporary name which
+        replaces the original file once verified.
+        """
+        file_object = self.open(name=name, mode='rb')
+
+        try:
+            if isinstance(file_object, CompressedContainerFile):
+                return False
+
+            temporary_file = TemporaryFile()
+            shutil.copyfileobj(fsrc=file_object, fdst=temporary_file)
+        finally:
+            file_object.close()
+
+        with temporary_file:
+            self._upgrade_write(
+                file_class=CompressedContainerFile,
+                file_object=temporary_file, name=name
+            )
+
+        return True
+
+
 class ZipCompressedPassthroughStorage(PassthroughStorage):
     def open(self, name, mode='rb', _direct=False):
         next_kwargs = {'name': name}
@@ -1,102 +1,225 @@
+import functools
+import os
+import shutil
+import struct
+
 from Crypto.Cipher import AES
 from Crypto.Hash import SHA256
-from Crypto.Protocol.KDF import PBKDF2
-from Crypto.Util.Padding import pad, unpad
+from Crypto.Protocol.KDF import HKDF, PBKDF2
+from Crypto.Random import get_random_bytes
+from Crypto.Util.Padding import unpad
 
 from django.conf import settings
 from django.core.files.base import ContentFile
-from django.utils.encoding import force_str
 
-from ..classes import BufferedFile, PassthroughStorage
+from ..classes import ChunkedFile, PassthroughStorage
+from ..utils import TemporaryFile
 
 from .literals import (
-    ENCRYPTION_FILE_CHUNK_SIZE, ENCRYPTION_KEY_DERIVATION_ITERATIONS,
-    ENCRYPTION_KEY_SIZE
+    ENCRYPTION_CONTAINER_CHUNK_SIZE, ENCRYPTION_CONTAINER_HEADER_FORMAT,
+    ENCRYPTION_CONTAINER_KEY_CONTEXT, ENCRYPTION_CONTAINER_MAGIC,
+    ENCRYPTION_CONTAINER_NONCE_FORMAT, ENCRYPTION_CONTAINER_SALT_SIZE,
+    ENCRYPTION_CONTAINER_TAG_SIZE, ENCRYPTION_CONTAINER_VERSION,
+    ENCRYPTION_FILE_CHUNK_SIZE, ENCRYPTION_KEY_CACHE_SIZE,
+    ENCRYPTION_KEY_DERIVATION_ITERATIONS, ENCRYPTION_KEY_SIZE
 )
 
 
-class BufferedEncryptedFile(BufferedFile):
+@functools.lru_cache(maxsize=ENCRYPTION_KEY_CACHE_SIZE)
+def get_key(password, salt):
+    """
+    Derive the encryption key of a password. The derivation is slow by
+    design, keys are cached per process.
+    """
+    return PBKDF2(
+        count=ENCRYPTION_KEY_DERIVATION_ITERATIONS,
+        dkLen=ENCRYPTION_KEY_SIZE,
+        hmac_hash_module=SHA256,
+        password=password,
+        salt=salt
+    )
+
+
+class EncryptedContainerFile(ChunkedFile):
+    """
+    Encrypted container format. The header holds a magic string, the
+    format version, the chunk size and a random salt used to derive a file
+    specific key. Each chunk is encrypted with AES-GCM using the chunk
+    index as the nonce and stored followed by its authentication tag. The
+    header and a flag marking the last chunk are authenticated with every
+    chunk which detects chunks that were reordered, modified, removed or
+    appended.
+    """
+    header_size = struct.calcsize(ENCRYPTION_CONTAINER_HEADER_FORMAT)
+
+    @staticmethod
+    def check(file_object):
+        """
+        Return True if the file object is an encrypted container. The
+        position of the file object is restored.
+        """
+        position = file_object.tell()
+        magic = file_object.read(
+            len(ENCRYPTION_CONTAINER_MAGIC)
+        )
+        file_object.seek(position)
+
+        return magic == ENCRYPTION_CONTAINER_MAGIC
+
     def __init__(self, *args, **kwargs):
-        self.key = kwargs.pop('key')
+        key = kwargs.pop('key')
 
         super().__init__(*args, **kwargs)
 
-        self.initial_vector = self.file_object.read(16)
-        self.cipher = AES.new(
-            key=self.key, mode=AES.MODE_CBC, iv=self.initial_vector
+        if self.is_write_mode:
+            self.chunk_size = ENCRYPTION_CONTAINER_CHUNK_SIZE
+            salt = get_random_bytes(ENCRYPTION_CONTAINER_SALT_SIZE)
+
+            self.header = struct.pack(
+                ENCRYPTION_CONTAINER_HEADER_FORMAT,
+                ENCRYPTION_CONTAINER_MAGIC, ENCRYPTION_CONTAINER_VERSION,
+                self.chunk_size, salt
+            )
+            self.file_object.write(self.header)
+        else:
+            self.header = self.file_object.read(self.header_size)
+
+            try:
+                magic, version, self.chunk_size, salt = struct.unpack(
+                    ENCRYPTION_CONTAINER_HEADER_FORMAT, self.header
+                )
+            except struct.error as exception:
+                raise ValueError(
+                    'Encrypted container header is truncated.'
+                ) from exception
+
+            if version != ENCRYPTION_CONTAINER_VERSION:
+                raise ValueError(
+                    'Unsupported encrypted container version: {}'.format(
+                        version
+                    )
+                )
+
+            self.file_object.seek(0, os.SEEK_END)
+            body_size = self.file_object.tell() - self.header_size
+            unit_size = self.chunk_size + ENCRYPTION_CONTAINER_TAG_SIZE
+
+            # Ceiling division. Every container has at least one chunk,
+            # even when empty.
+            self.chunk_count = -(-body_size // unit_size)
+
+            if not self.chunk_count:
+                raise ValueError('Encrypted container has no chunks.')
+
+            self._size = body_size - (
+                self.chunk_count * ENCRYPTION_CONTAINER_TAG_SIZE
+            )
+
+        self.file_key = HKDF(
+            context=ENCRYPTION_CONTAINER_KEY_CONTEXT, hashmod=SHA256,
+            key_len=ENCRYPTION_KEY_SIZE, master=key, salt=salt
         )
-        self.binary_mode = 'b' in self.mode
-        self.position = 0
 
-    def _get_file_object_chunk(self):
-        chunk = self.file_object.read(ENCRYPTION_FILE_CHUNK_SIZE)
+    def _chunk_read(self, index):
+        if index >= self.chunk_count:
+            return b''
+
+        unit_size = self.chunk_size + ENCRYPTION_CONTAINER_TAG_SIZE
+
+        self.file_object.seek(self.header_size + index * unit_size)
+        data = self.file_object.read(unit_size)
+
+        cipher = self._get_cipher(
+            index=index, is_final=index == self.chunk_count - 1
+        )
 
-        if chunk:
-            data = unpad(
-                padded_data=self.cipher.decrypt(chunk),
-                block_size=AES.block_size
+        try:
+            return cipher.decrypt_and_verify(
+                ciphertext=data[:-ENCRYPTION_CONTAINER_TAG_SIZE],
+                received_mac_tag=data[-ENCRYPTION_CONTAINER_TAG_SIZE:]
             )
+        except ValueError as exception:
+            raise ValueError(
+                'Encrypted container chunk {} failed authentication.'.format(
+                    index
+                )
+            ) from exception
 
-            if self.binary_mode:
-                return data
-            else:
-                return force_str(s=data)
+    def _chunk_write(self, data, index, is_final):
+        cipher = self._get_cipher(index=index, is_final=is_final)
+        ciphertext, tag = cipher.encrypt_and_digest(plaintext=data)
 
-    def seek(self, pos, whence=0):
-        if whence == 0:
-            self.position = pos
-            self.file_object.seek(pos, whence)
+        self.file_object.write(ciphertext + tag)
 
-        if whence == 2:
-            raise AttributeError('Only whence 0 is supported.')
+    def _get_cipher(self, index, is_final):
+        cipher = AES.new(
+            key=self.file_key, mode=AES.MODE_GCM,
+            nonce=struct.pack(ENCRYPTION_CONTAINER_NONCE_FORMAT, index),
+            mac_len=ENCRYPTION_CONTAINER_TAG_SIZE
+        )
+        cipher.update(
+            self.header + bytes((is_final,))
+        )
 
-    def tell(self):
-        return self.position
+        return cipher
 
-    def write(self, data):
-        if self.position == 0:
-            self.cipher = AES.new(key=self.key, mode=AES.MODE_CBC)
-            self.file_object.write(self.cipher.iv)
 
-        content = ContentFile(content=data)
+class EncryptedLegacyFile(ChunkedFile):
+    """
+    Read only access to the original encrypted format. The file starts
+    with the initialization vector followed by the content encrypted with
+    AES-CBC. Every chunk of content was padded before encryption. The
+    ciphertext of the previous chunk is the initialization vector of each
+    chunk which allows decrypting them in any order.
+    """
+    chunk_size = ENCRYPTION_FILE_CHUNK_SIZE
+    unit_size = ENCRYPTION_FILE_CHUNK_SIZE + AES.block_size
 
-        count = 0
-        while True:
-            chunk = content.read(ENCRYPTION_FILE_CHUNK_SIZE)
+    def __init__(self, *args, **kwargs):
+        self.key = kwargs.pop('key')
 
-            try:
-                chunk = chunk.encode('utf-8')
-            except AttributeError:
-                """Already a byte string."""
-
-            count = count + len(chunk)
-            if chunk:
-                chunk = pad(
-                    data_to_pad=chunk, block_size=AES.block_size
-                )
-            else:
-                break
+        super().__init__(*args, **kwargs)
 
-            self.file_object.write(
-                self.cipher.encrypt(chunk)
+        if self.is_write_mode:
+            raise ValueError(
+                'The legacy encrypted format is read only.'
             )
 
-        self.position = self.position + count
-        return count
+        self.file_object.seek(0, os.SEEK_END)
+        body_size = self.file_object.tell() - AES.block_size
+        self.chunk_count = -(-max(body_size, 0) // self.unit_size)
+
+    def _chunk_read(self, index):
+        if index >= self.chunk_count:
+            return b''
+
+        self.file_object.seek(index * self.unit_size)
+        initial_vector = self.file_object.read(AES.block_size)
+        data = self.file_object.read(self.unit_size)
+
+        cipher = AES.new(
+            iv=initial_vector, key=self.key, mode=AES.MODE_CBC
+        )
+
+        return unpad(
+            block_size=AES.block_size,
+            padded_data=cipher.decrypt(data)
+        )
+
+    def _get_size(self):
+        if self.chunk_count:
+            last_chunk = self._get_chunk(index=self.chunk_count - 1)
+
+            return (self.chunk_count - 1) * self.chunk_size + len(last_chunk)
+        else:
+            return 0
 
 
 class EncryptedPassthroughStorage(PassthroughStorage):
     def __init__(self, *args, **kwargs):
         password = kwargs.pop('password')
         super().__init__(*args, **kwargs)
-        self.key = PBKDF2(
-            count=ENCRYPTION_KEY_DERIVATION_ITERATIONS,
-            dkLen=ENCRYPTION_KEY_SIZE,
-            hmac_hash_module=SHA256,
-            password=password,
-            salt=settings.SECRET_KEY
-        )
-        self.position = 0
+        self.key = get_key(password=password, salt=settings.SECRET_KEY)
 
     def open(self, name, mode='rb', _direct=False):
         next_kwargs = {'name': name}
@@ -111,14 +234,24 @@ class EncryptedPassthroughStorage(PassthroughStorage):
             return self._call_backend_method(
                 method_name='open', kwargs=next_kwargs
             )
-        else:
-            # Mode is always 'rb' when reading the encrypted file
-            next_kwargs['mode'] = 'rb+'
-            storage_file = self._call_backend_method(
-                method_name='open', kwargs=next_kwargs
+        elif 'w' in mode:
+            storage_file = self._open_next(mode='wb', name=name)
+
+            return EncryptedContainerFile(
+                file_object=storage_file, key=self.key, mode=mode,
+                name=name
             )
-            return BufferedEncryptedFile(
+        else:
+            storage_file = self._open_next(mode='rb', name=name)
+
+            if EncryptedContainerFile.check(file_object=storage_file):
+                file_class = EncryptedContainerFile
+            else:
+                file_class = EncryptedLegacyFile
+
+            return file_class(
                 file_object=storage_file, key=self.key, mode=mode,
+                name=name
             )
 
     def save(self, name, content, max_length=None, _direct=False):
@@ -135,7 +268,6 @@ class EncryptedPassthroughStorage(PassthroughStorage):
                 method_name='save', kwargs=next_kwargs
             )
         else:
-            cipher = AES.new(key=self.key, mode=AES.MODE_CBC)
             if not self._call_backend_method(
                 method_name='exists', kwargs={'name': name}
             ):
@@ -145,30 +277,45 @@ class EncryptedPassthroughStorage(PassthroughStorage):
                     }
                 )
 
-            with self._call_backend_method(
-                method_name='open', kwargs={
-                    'name': name, 'mode': 'wb'
-                }
-            ) as file_object:
-                file_object.write(cipher.iv)
+            storage_file = self._open_next(mode='wb', name=name)
 
-                while True:
-                    chunk = content.read(ENCRYPTION_FILE_CHUNK_SIZE)
+            encrypted_file = EncryptedContainerFile(
+                file_object=storage_file, key=self.key, mode='wb'
+            )
 
-                    try:
-                        chunk = chunk.encode('utf-8')
-                    except AttributeError:
-                        """Already a byte string."""
+            with encrypted_file:
+                while True:
+                    chunk = content.read(ENCRYPTION_CONTAINER_CHUNK_SIZE)
 
                     if chunk:
-                        chunk = pad(
-                            data_to_pad=chunk, block_size=AES.block_size
-                        )
+                        encrypted_file.write(chunk)
                     else:
                         break
 
-                    file_object.write(
-                        cipher.encrypt(chunk)
-                    )
-
             return name
+
+    def upgrade(self, name):
+        """
+        Encrypt a file of the legacy format using the container format.
+        Returns True if the file was upgraded. The file is decrypted to a
+        temporary file and encrypted again under a temporary name which
+        replaces the original file once verified.
+        """
+        file_object = self.open(name=name, mode='rb')
+
+        try:
+            if isinstance(file_object, EncryptedContainerFile):
+                return False
+
+            temporary_file = TemporaryFile()
+            shutil.copyfileobj(fsrc=file_object, fdst=temporary_file)
+        finally:
+            file_object.close()
+
+        with temporary_file:
+            self._upgrade_write(
+                file_class=EncryptedContainerFile,
+                file_object=temporary_file, name=name
+            )
+
+        return True
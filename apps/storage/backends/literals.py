@@ -1,4 +1,23 @@
+COMPRESSION_CONTAINER_CHUNK_SIZE = 256 * 1024  # 256K
+COMPRESSION_CONTAINER_FOOTER_FORMAT = '>QQ8s'
+COMPRESSION_CONTAINER_HEADER_FORMAT = '>8sBBI'
+COMPRESSION_CONTAINER_INDEX_ENTRY_FORMAT = '>Q'
+COMPRESSION_CONTAINER_MAGIC = b'MAYANCMP'
+COMPRESSION_CONTAINER_VERSION = 1
+COMPRESSION_LEVEL_ZLIB = 6
+COMPRESSION_LEVEL_ZSTANDARD = 3
+
+ENCRYPTION_CONTAINER_CHUNK_SIZE = 64 * 1024  # 64K
+ENCRYPTION_CONTAINER_HEADER_FORMAT = '>8sBI16s'
+ENCRYPTION_CONTAINER_KEY_CONTEXT = b'mayan-encrypted-storage'
+ENCRYPTION_CONTAINER_MAGIC = b'MAYANENC'
+ENCRYPTION_CONTAINER_NONCE_FORMAT = '>4xQ'
+ENCRYPTION_CONTAINER_SALT_SIZE = 16
+ENCRYPTION_CONTAINER_TAG_SIZE = 16
+ENCRYPTION_CONTAINER_VERSION = 2
+
 ENCRYPTION_FILE_CHUNK_SIZE = 64 * 1024  # 64K
+ENCRYPTION_KEY_CACHE_SIZE = 32
 ENCRYPTION_KEY_DERIVATION_ITERATIONS = 100000
 ENCRYPTION_KEY_SIZE = 32
 
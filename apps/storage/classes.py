@@ -1,5 +1,12 @@
+import codecs
+import hashlib
 from io import BytesIO, StringIO
 import logging
+import os
+import posixpath
+import re
+import shutil
+import uuid
 
 from django.core.files.base import File
 from django.core.files.storage import Storage
@@ -9,7 +16,10 @@ from django.utils.translation import gettext_lazy as _
 
 from mayan.apps.common.class_mixins import AppsModuleLoaderMixin
 
-from .literals import DEFAULT_STORAGE_BACKEND
+from .literals import (
+    DEFAULT_STORAGE_BACKEND, STORAGE_UPGRADE_CHUNK_SIZE,
+    STORAGE_UPGRADE_TEMPORARY_NAME, STORAGE_UPGRADE_TEMPORARY_NAME_REGEX
+)
 
 logger = logging.getLogger(name=__name__)
 
@@ -58,15 +68,203 @@ class BufferedFile(File):
 
         return self.stream.read(read_size)
 
+    def seekable(self):
+        return False
+
+
+class ChunkedFile(File):
+    """
+    Base class for file formats that store the content as a sequence of
+    chunks that can be decoded independently. All chunks except the last
+    hold `chunk_size` bytes of content. Only the chunk of the current
+    position is kept in memory which allows random access and reading
+    files of any size with bounded memory. Files are opened either for
+    reading or for writing. Writing is sequential and the last chunk is
+    written when the file is closed.
+    """
+    chunk_size = None
+
+    def __init__(self, file_object, mode, name=None):
+        super().__init__(file=file_object, name=name)
+        self._chunk_cache = (None, None)
+        self._is_closed = False
+        self._size = None
+        self.binary_mode = 'b' in mode
+        self.decoder = codecs.getincrementaldecoder(encoding='utf-8')()
+        self.file_object = file_object
+        self.is_write_mode = 'w' in mode
+        self.mode = mode
+        self.position = 0
+
+        if self.is_write_mode:
+            self._write_buffer = bytearray()
+            self._write_chunk_index = 0
+
+    def _chunk_read(self, index):
+        """
+        Return the content of the chunk `index` or an empty byte string if
+        the chunk does not exist.
+        """
+        raise NotImplementedError
+
+    def _chunk_write(self, data, index, is_final):
+        raise NotImplementedError
+
+    def _get_chunk(self, index):
+        cache_index, data = self._chunk_cache
+
+        if cache_index != index:
+            data = self._chunk_read(index=index)
+            self._chunk_cache = (index, data)
+
+        return data
+
+    def _get_size(self):
+        raise NotImplementedError
+
+    def close(self):
+        if not self.closed:
+            try:
+                if self.is_write_mode:
+                    self._chunk_write(
+                        data=bytes(self._write_buffer),
+                        index=self._write_chunk_index, is_final=True
+                    )
+                    self._write_buffer = bytearray()
+            finally:
+                self._is_closed = True
+                self.file_object.close()
+
+    @property
+    def closed(self):
+        return self._is_closed
+
+    def flush(self):
+        return self.file_object.flush()
+
+    def read(self, size=None):
+        remaining = max(self.size - self.position, 0)
+
+        if size is None or size < 0:
+            size = remaining
+        else:
+            size = min(size, remaining)
+
+        result = []
+
+        while size:
+            index, offset = divmod(self.position, self.chunk_size)
+            data = self._get_chunk(index=index)[offset:offset + size]
+
+            if not data:
+                break
+
+            result.append(data)
+            self.position += len(data)
+            size -= len(data)
+
+        data = b''.join(result)
+
+        if self.binary_mode:
+            return data
+        else:
+            # Use an incremental decoder to support multi-byte characters
+            # split across reads.
+            return self.decoder.decode(
+                data, final=self.position >= self.size
+            )
+
+    def readable(self):
+        return not self.is_write_mode
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if self.is_write_mode:
+            raise OSError('Files opened for writing are not seekable.')
+
+        if whence == os.SEEK_SET:
+            position = offset
+        elif whence == os.SEEK_CUR:
+            position = self.position + offset
+        elif whence == os.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(
+                'Invalid whence value: {}'.format(whence)
+            )
+
+        if position < 0:
+            raise ValueError(
+                'Negative seek position: {}'.format(position)
+            )
+
+        self.decoder.reset()
+        self.position = position
+
+        return self.position
+
+    def seekable(self):
+        return not self.is_write_mode
+
+    @property
+    def size(self):
+        if self.is_write_mode:
+            return self.position
+
+        if self._size is None:
+            self._size = self._get_size()
+
+        return self._size
+
+    def tell(self):
+        return self.position
+
+    def writable(self):
+        return self.is_write_mode
+
+    def write(self, data):
+        if not self.is_write_mode:
+            raise OSError('File not opened for writing.')
+
+        try:
+            data = data.encode('utf-8')
+        except AttributeError:
+            """Already a byte string."""
+
+        self._write_buffer.extend(data)
+        self.position += len(data)
+
+        # Keep at least one chunk of data in the buffer. The last chunk
+        # is only known when the file is closed.
+        while len(self._write_buffer) > self.chunk_size:
+            self._chunk_write(
+                data=bytes(self._write_buffer[:self.chunk_size]),
+                index=self._write_chunk_index, is_final=False
+            )
+            del self._write_buffer[:self.chunk_size]
+            self._write_chunk_index += 1
+
+        return len(data)
+
 
 class DefinedStorage(AppsModuleLoaderMixin):
     _loader_module_name = 'storages'
     _registry = {}
+    _storage_instance_cache_generation = 0
+
+    @classmethod
+    def all(cls):
+        return cls._registry.values()
 
     @classmethod
     def get(cls, name):
         return cls._registry[name]
 
+    @staticmethod
+    def invalidate_storage_instance_cache():
+        # Changing the generation invalidates the instances of all the
+        # defined storages.
+        DefinedStorage._storage_instance_cache_generation += 1
+
     def __init__(
         self, dotted_path, label, name, kwargs=None, error_message=None
     ):
@@ -75,24 +273,51 @@ class DefinedStorage(AppsModuleLoaderMixin):
         self.label = label
         self.name = name
         self.kwargs = kwargs or {}
+        self._storage_instance_cache = None
+        self._storage_subclass_cache = None
         self.__class__._registry[name] = self
 
     def __eq__(self, other):
         return True
 
+    def _get_error_message(self):
+        return self.error_message or _(
+            message='Unable to initialize storage: %(name)s. Check the storage '
+            'backend dotted path and arguments.'
+        ) % {
+            'name': self.name
+        }
+
     def get_storage_instance(self):
+        """
+        Return the storage instance. Instances are cached per process and
+        reused while the dotted path and the arguments of the storage
+        remain the same. This avoids expensive initializations like key
+        derivations or client connections on every file operation.
+        """
+        key = (
+            DefinedStorage._storage_instance_cache_generation,
+            self.dotted_path, repr(self.kwargs)
+        )
+
+        # Read the key and the instance together to avoid a race with
+        # other threads.
+        cache_entry = self._storage_instance_cache
+
+        if cache_entry and cache_entry[0] == key:
+            return cache_entry[1]
+
         try:
-            return self.get_storage_subclass()(**self.kwargs)
+            storage_instance = self.get_storage_subclass()(**self.kwargs)
         except Exception as exception:
-            message = self.error_message or _(
-                message='Unable to initialize storage: %(name)s. Check the storage '
-                'backend dotted path and arguments.'
-            ) % {
-                'name': self.name
-            }
+            message = self._get_error_message()
 
             logger.fatal(message)
             raise TypeError(message) from exception
+        else:
+            self._storage_instance_cache = (key, storage_instance)
+
+            return storage_instance
 
     def get_storage_subclass(self):
         """
@@ -100,17 +325,17 @@ class DefinedStorage(AppsModuleLoaderMixin):
         return eq True to avoid creating a new migration when for runtime
         storage class changes.
         """
+        cache_entry = self._storage_subclass_cache
+
+        if cache_entry and cache_entry[0] == self.dotted_path:
+            return cache_entry[1]
+
         try:
             imported_storage_class = import_string(
                 dotted_path=self.dotted_path
             )
         except Exception as exception:
-            message = self.error_message or _(
-                message='Unable to initialize storage: %(name)s. Check the storage '
-                'backend dotted path and arguments.'
-            ) % {
-                'name': self.name
-            }
+            message = self._get_error_message()
 
             logger.fatal(message)
             raise TypeError(message) from exception
@@ -127,6 +352,10 @@ class DefinedStorage(AppsModuleLoaderMixin):
                     'mayan.apps.storage.classes.FakeStorageSubclass', (), {}
                 )
 
+        self._storage_subclass_cache = (
+            self.dotted_path, DynamicStorageSubclass
+        )
+
         return DynamicStorageSubclass
 
 
@@ -190,14 +419,184 @@ class PassthroughStorage(Storage):
     def _call_backend_method(self, method_name, kwargs):
         return getattr(self.next_storage_backend, method_name)(**kwargs)
 
+    def _open_next(self, name, mode):
+        """
+        Open a file of the next storage. Files opened for reading are
+        copied to a temporary file if the next storage does not provide
+        random access.
+        """
+        # Hidden import.
+        from .utils import TemporaryFile
+
+        file_object = self._call_backend_method(
+            method_name='open', kwargs={'mode': mode, 'name': name}
+        )
+
+        if 'r' in mode and not file_object.seekable():
+            temporary_file = TemporaryFile()
+
+            with file_object:
+                shutil.copyfileobj(fsrc=file_object, fdst=temporary_file)
+
+            temporary_file.seek(0)
+
+            file_object = File(file=temporary_file, name=name)
+
+        return file_object
+
+    def _replace(self, name, name_temporary):
+        """
+        Replace a file with another file of the next storage. The file is
+        renamed when the next storage is local. Otherwise the content is
+        copied and the other file is deleted only after the copy
+        completes.
+        """
+        try:
+            path = self.path(name=name)
+            path_temporary = self.path(name=name_temporary)
+        except NotImplementedError:
+            file_object_source = self._call_backend_method(
+                method_name='open', kwargs={
+                    'mode': 'rb', 'name': name_temporary
+                }
+            )
+            with file_object_source:
+                file_object_destination = self._call_backend_method(
+                    method_name='open', kwargs={'mode': 'wb', 'name': name}
+                )
+                with file_object_destination:
+                    shutil.copyfileobj(
+                        fsrc=file_object_source,
+                        fdst=file_object_destination
+                    )
+
+            self.delete(name=name_temporary)
+        else:
+            os.replace(src=path_temporary, dst=path)
+
+    def _upgrade_write(self, file_class, file_object, name):
+        """
+        Write the content of a file object in the current format of the
+        storage under a temporary name, verify that it reads back as an
+        instance of the file class with the same content and then replace
+        the original file with it. The original file is left untouched if
+        any of the steps fail.
+        """
+        hash_object = hashlib.sha256()
+
+        file_object.seek(0)
+        while True:
+            chunk = file_object.read(STORAGE_UPGRADE_CHUNK_SIZE)
+            if not chunk:
+                break
+
+            hash_object.update(chunk)
+
+        file_object.seek(0)
+        name_temporary = self.save(
+            content=File(file=file_object),
+            name=STORAGE_UPGRADE_TEMPORARY_NAME.format(name, uuid.uuid4().hex)
+        )
+
+        try:
+            self._upgrade_verify(
+                digest=hash_object.digest(), file_class=file_class,
+                name=name_temporary
+            )
+        except Exception:
+            self.delete(name=name_temporary)
+            raise
+
+        self._replace(name=name, name_temporary=name_temporary)
+
+    def _upgrade_verify(self, digest, file_class, name):
+        hash_object = hashlib.sha256()
+
+        with self.open(name=name, mode='rb') as file_object:
+            if not isinstance(file_object, file_class):
+                raise ValueError(
+                    'Upgraded file `{}` is not of the expected format.'.format(
+                        name
+                    )
+                )
+
+            while True:
+                chunk = file_object.read(STORAGE_UPGRADE_CHUNK_SIZE)
+                if not chunk:
+                    break
+
+                hash_object.update(chunk)
+
+        if hash_object.digest() != digest:
+            raise ValueError(
+                'Upgraded file `{}` content does not match the '
+                'original.'.format(name)
+            )
+
     def delete(self, *args, **kwargs):
         return self.next_storage_backend.delete(*args, **kwargs)
 
     def exists(self, *args, **kwargs):
         return self.next_storage_backend.exists(*args, **kwargs)
 
+    def get_file_names(self, path=''):
+        """
+        Generate the names of all the files of the storage.
+        """
+        directories, files = self.listdir(path)
+
+        for file_name in files:
+            yield posixpath.join(path, file_name)
+
+        for directory in directories:
+            yield from self.get_file_names(
+                path=posixpath.join(path, directory)
+            )
+
+    def listdir(self, *args, **kwargs):
+        return self.next_storage_backend.listdir(*args, **kwargs)
+
     def path(self, *args, **kwargs):
         return self.next_storage_backend.path(*args, **kwargs)
 
     def size(self, *args, **kwargs):
         return self.next_storage_backend.size(*args, **kwargs)
+
+    def upgrade(self, name):
+        """
+        Optional method to convert a file of a previous format to the
+        current format of the storage. Returns True if the file was
+        converted.
+        """
+        return False
+
+    def upgrade_all(self):
+        """
+        Upgrade all the files of the storage. Errors are logged and do not
+        stop the upgrade of the other files. Temporary files left behind by
+        an interrupted upgrade are deleted instead of upgraded. Returns the
+        number of files upgraded.
+        """
+        count = 0
+
+        for name in self.get_file_names():
+            is_temporary = re.search(
+                pattern=STORAGE_UPGRADE_TEMPORARY_NAME_REGEX, string=name
+            )
+            if is_temporary:
+                logger.info(
+                    'Deleting leftover upgrade temporary file `%s`.', name
+                )
+                self.delete(name=name)
+                continue
+
+            try:
+                if self.upgrade(name=name):
+                    count += 1
+            except Exception as exception:
+                logger.error(
+                    'Unable to upgrade the file `%s`; %s', name, exception,
+                    exc_info=True
+                )
+
+        return count
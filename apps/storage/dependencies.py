@@ -20,3 +20,6 @@ PythonDependency(
 PythonDependency(
     module=__name__, name='pycryptodome', version_string='==3.21.0'
 )
+PythonDependency(
+    module=__name__, name='zstandard', version_string='==0.23.0'
+)
@@ -5,6 +5,9 @@ from django.conf import settings
 
 COMMAND_NAME_STORAGE_PROCESS = 'storage_process'
 
+DOWNLOAD_RANGE_CHUNK_SIZE = 64 * 1024
+DOWNLOAD_RANGE_REGEX = r'^bytes=(\d*)-(\d*)$'
+
 DEFAULT_STORAGE_BACKEND = 'django.core.files.storage.FileSystemStorage'
 DEFAULT_STORAGE_DOWNLOAD_FILE_STORAGE = 'django.core.files.storage.FileSystemStorage'
 DEFAULT_STORAGE_DOWNLOAD_FILE_STORAGE_ARGUMENTS = {
@@ -23,7 +26,53 @@ MSG_MIME_TYPES = (
     'application/vnd.ms-outlook', 'application/vnd.ms-office',
     'application/x-ole-storage'
 )
+STORAGE_BENCHMARK_CHAIN_LIST = (
+    ('Filesystem', ()),
+    (
+        'Compressed', (
+            (
+                'mayan.apps.storage.backends.compressedstorage.ZipCompressedPassthroughStorage',
+                {}
+            ),
+        )
+    ),
+    (
+        'Compressed, chunked', (
+            (
+                'mayan.apps.storage.backends.compressedstorage.ChunkedCompressedPassthroughStorage',
+                {}
+            ),
+        )
+    ),
+    (
+        'Encrypted', (
+            (
+                'mayan.apps.storage.backends.encryptedstorage.EncryptedPassthroughStorage',
+                {'password': 'benchmark'}
+            ),
+        )
+    ),
+    (
+        'Encrypted, compressed', (
+            (
+                'mayan.apps.storage.backends.encryptedstorage.EncryptedPassthroughStorage',
+                {'password': 'benchmark'}
+            ),
+            (
+                'mayan.apps.storage.backends.compressedstorage.ZipCompressedPassthroughStorage',
+                {}
+            )
+        )
+    )
+)
+STORAGE_BENCHMARK_FILE_SIZE = 64 * 1024  # 64K
+STORAGE_BENCHMARK_ITERATIONS = 100
+STORAGE_BENCHMARK_NAME = 'storage__benchmark'
+STORAGE_BENCHMARK_UNCACHED_ITERATIONS = 10
 STORAGE_NAME_DOWNLOAD_FILE = 'storage__downloadfile'
 STORAGE_NAME_SHARED_UPLOADED_FILE = 'storage__shareduploadedfile'
+STORAGE_UPGRADE_CHUNK_SIZE = 64 * 1024  # 64K
+STORAGE_UPGRADE_TEMPORARY_NAME = '{}.upgrade-{}'
+STORAGE_UPGRADE_TEMPORARY_NAME_REGEX = r'\.upgrade-[0-9a-f]{32}'
 TASK_DOWNLOAD_FILE_STALE_INTERVAL = 60 * 10  # 10 minutes
 TASK_SHARED_UPLOADS_STALE_INTERVAL = 60 * 10  # 10 minutes
@@ -0,0 +1,137 @@
+import time
+
+from django.core import management
+from django.core.files.base import ContentFile
+
+from ...backends.encryptedstorage import get_key
+from ...classes import DefinedStorage, DefinedStorageLazy
+from ...literals import (
+    DEFAULT_STORAGE_BACKEND, STORAGE_BENCHMARK_CHAIN_LIST,
+    STORAGE_BENCHMARK_FILE_SIZE, STORAGE_BENCHMARK_ITERATIONS,
+    STORAGE_BENCHMARK_NAME, STORAGE_BENCHMARK_UNCACHED_ITERATIONS
+)
+from ...utils import TemporaryDirectory
+
+
+class Command(management.BaseCommand):
+    help = (
+        'Measure the per operation overhead of the storage chains. Each '
+        'chain is a filesystem storage with zero or more passthrough '
+        'storages in front of it. Files are created in a temporary '
+        'directory.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--iterations', action='store',
+            default=STORAGE_BENCHMARK_ITERATIONS, dest='iterations',
+            help='Number of times each operation is executed.', type=int
+        )
+        parser.add_argument(
+            '--size', action='store', default=STORAGE_BENCHMARK_FILE_SIZE,
+            dest='size', help='Size in bytes of the files.', type=int
+        )
+        parser.add_argument(
+            '--uncached-iterations', action='store',
+            default=STORAGE_BENCHMARK_UNCACHED_ITERATIONS,
+            dest='uncached_iterations', help='Number of times a storage '
+            'instance is initialized without the instance and key caches.',
+            type=int
+        )
+
+    def handle(self, *args, **options):
+        content = b'\0' * options['size']
+        iterations = options['iterations']
+
+        for label, chain in STORAGE_BENCHMARK_CHAIN_LIST:
+            with TemporaryDirectory() as location:
+                defined_storage = self.get_defined_storage(
+                    chain=chain, location=location
+                )
+                storage = DefinedStorageLazy(name=STORAGE_BENCHMARK_NAME)
+
+                name_list = [
+                    'benchmark-{}'.format(index) for index in range(iterations)
+                ]
+
+                def instance_cached():
+                    for index in range(iterations):
+                        defined_storage.get_storage_instance()
+
+                def instance_uncached():
+                    for index in range(options['uncached_iterations']):
+                        DefinedStorage.invalidate_storage_instance_cache()
+                        get_key.cache_clear()
+                        defined_storage.get_storage_instance()
+
+                def delete():
+                    for name in name_list:
+                        storage.delete(name=name)
+
+                def exists():
+                    for name in name_list:
+                        storage.exists(name=name)
+
+                def read():
+                    for name in name_list:
+                        with storage.open(name=name, mode='rb') as file_object:
+                            file_object.read()
+
+                def save():
+                    for name in name_list:
+                        storage.save(
+                            content=ContentFile(content=content), name=name
+                        )
+
+                def size():
+                    for name in name_list:
+                        storage.size(name=name)
+
+                # The order matters, files are deleted last.
+                benchmarks = (
+                    (
+                        'Instance, uncached', instance_uncached,
+                        options['uncached_iterations']
+                    ),
+                    ('Instance, cached', instance_cached, iterations),
+                    ('Save', save, iterations),
+                    ('Exists', exists, iterations),
+                    ('Size', size, iterations),
+                    ('Open and read', read, iterations),
+                    ('Delete', delete, iterations)
+                )
+
+                try:
+                    for operation, function, count in benchmarks:
+                        time_start = time.monotonic()
+                        function()
+                        time_elapsed = time.monotonic() - time_start
+
+                        self.stdout.write(
+                            msg='{}: {}: {:0.3f} ms/operation.'.format(
+                                label, operation,
+                                time_elapsed * 1000 / count if count else 0
+                            )
+                        )
+                finally:
+                    DefinedStorage._registry.pop(STORAGE_BENCHMARK_NAME)
+
+    def get_defined_storage(self, chain, location):
+        """
+        Wrap a filesystem storage with the passthrough storages of the
+        chain. The first passthrough storage is the outermost.
+        """
+        dotted_path = DEFAULT_STORAGE_BACKEND
+        kwargs = {'location': location}
+
+        for passthrough_dotted_path, passthrough_kwargs in reversed(chain):
+            kwargs = dict(
+                next_storage_backend=dotted_path,
+                next_storage_backend_arguments=kwargs, **passthrough_kwargs
+            )
+            dotted_path = passthrough_dotted_path
+
+        return DefinedStorage(
+            dotted_path=dotted_path, kwargs=kwargs,
+            label=STORAGE_BENCHMARK_NAME, name=STORAGE_BENCHMARK_NAME
+        )
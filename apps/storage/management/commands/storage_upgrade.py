@@ -0,0 +1,51 @@
+from django.core import management
+from django.utils.translation import gettext_lazy as _
+
+from ...classes import DefinedStorage
+from ...tasks import task_storage_upgrade
+
+
+class Command(management.BaseCommand):
+    help = (
+        'Queue the background upgrade of the files of the passthrough '
+        'storages, like the encrypted and compressed storages, from '
+        'previous formats to the current format.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--storage_name', action='store', dest='defined_storage_name',
+            help=_(
+                message='Name of the storage to upgrade. Defaults to all '
+                'storages.'
+            )
+        )
+
+    def handle(self, *args, **options):
+        if options['defined_storage_name']:
+            try:
+                defined_storage_list = (
+                    DefinedStorage.get(
+                        name=options['defined_storage_name']
+                    ),
+                )
+            except KeyError:
+                self.stderr.write(
+                    msg='Unknown storage `{}`'.format(
+                        options['defined_storage_name']
+                    )
+                )
+                exit(1)
+        else:
+            defined_storage_list = DefinedStorage.all()
+
+        for defined_storage in defined_storage_list:
+            task_storage_upgrade.apply_async(
+                kwargs={'defined_storage_name': defined_storage.name}
+            )
+
+            self.stdout.write(
+                msg='Queued the upgrade of storage: {}'.format(
+                    defined_storage.name
+                )
+            )
@@ -21,6 +21,11 @@ queue_storage.add_task_type(
     dotted_path='mayan.apps.storage.tasks.task_shared_upload_delete',
     label=_(message='Delete a shared upload'), name='task_shared_upload_delete'
 )
+queue_storage.add_task_type(
+    dotted_path='mayan.apps.storage.tasks.task_storage_upgrade',
+    label=_(message='Upgrade the files of a storage'),
+    name='task_storage_upgrade'
+)
 
 queue_storage_periodic.add_task_type(
     dotted_path='mayan.apps.storage.tasks.task_shared_upload_stale_delete',
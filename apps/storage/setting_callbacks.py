@@ -0,0 +1,5 @@
+def callback_defined_storage_instance_invalidate(setting):
+    # Hidden import.
+    from .classes import DefinedStorage
+
+    DefinedStorage.invalidate_storage_instance_cache()
@@ -10,6 +10,7 @@ from .literals import (
     DEFAULT_STORAGE_SHARED_STORAGE, DEFAULT_STORAGE_SHARED_STORAGE_ARGUMENTS,
     DEFAULT_STORAGE_TEMPORARY_DIRECTORY
 )
+from .setting_callbacks import callback_defined_storage_instance_invalidate
 
 setting_namespace = setting_cluster.do_namespace_add(
     label=_(message='Storage'), name='storage'
@@ -26,21 +27,23 @@ setting_download_file_storage = setting_namespace.do_setting_add(
     global_name='STORAGE_DOWNLOAD_FILE_STORAGE', help_text=_(
         message='A storage backend that all workers can use to generate and hold '
         'files for download.'
-    )
+    ), post_edit_function=callback_defined_storage_instance_invalidate
 )
 setting_download_file_storage_arguments = setting_namespace.do_setting_add(
     default=DEFAULT_STORAGE_DOWNLOAD_FILE_STORAGE_ARGUMENTS,
     global_name='STORAGE_DOWNLOAD_FILE_STORAGE_ARGUMENTS',
+    post_edit_function=callback_defined_storage_instance_invalidate
 )
 setting_shared_storage = setting_namespace.do_setting_add(
     default=DEFAULT_STORAGE_SHARED_STORAGE,
     global_name='STORAGE_SHARED_STORAGE', help_text=_(
         message='A storage backend that all workers can use to share files.'
-    )
+    ), post_edit_function=callback_defined_storage_instance_invalidate
 )
 setting_shared_storage_arguments = setting_namespace.do_setting_add(
     default=DEFAULT_STORAGE_SHARED_STORAGE_ARGUMENTS,
-    global_name='STORAGE_SHARED_STORAGE_ARGUMENTS'
+    global_name='STORAGE_SHARED_STORAGE_ARGUMENTS',
+    post_edit_function=callback_defined_storage_instance_invalidate
 )
 setting_temporary_directory = setting_namespace.do_setting_add(
     default=DEFAULT_STORAGE_TEMPORARY_DIRECTORY,
@@ -5,6 +5,8 @@ from django.db import OperationalError
 
 from mayan.celery import app
 
+from .classes import DefinedStorage, PassthroughStorage
+
 logger = logging.getLogger(name=__name__)
 
 
@@ -56,3 +58,31 @@ def task_shared_upload_delete(self, shared_uploaded_file_id):
             '%s; %s. Retrying.', shared_uploaded_file, exception
         )
         raise self.retry(exc=exception)
+
+
+@app.task(ignore_result=True)
+def task_storage_upgrade(defined_storage_name):
+    """
+    Convert the files of the passthrough storages of a defined storage
+    chain from previous formats to the current format of each storage.
+    Converted files are skipped, the task can be executed again after an
+    interruption.
+    """
+    storage_instance = DefinedStorage.get(
+        name=defined_storage_name
+    ).get_storage_instance()
+
+    while isinstance(storage_instance, PassthroughStorage):
+        logger.info(
+            'Starting file upgrade of storage: %s, backend: %s',
+            defined_storage_name, storage_instance.__class__.__name__
+        )
+
+        count = storage_instance.upgrade_all()
+
+        logger.info(
+            'Upgraded %d files of storage: %s, backend: %s', count,
+            defined_storage_name, storage_instance.__class__.__name__
+        )
+
+        storage_instance = storage_instance.next_storage_backend
@@ -0,0 +1,13 @@
+TEST_DEFINED_STORAGE_DOTTED_PATH = 'django.core.files.storage.FileSystemStorage'
+TEST_DEFINED_STORAGE_LABEL = 'Test storage'
+TEST_DEFINED_STORAGE_NAME = 'storage__test_storage'
+TEST_STORAGE_CODEC_NAME = 'zlib'
+TEST_STORAGE_FILE_CONTENT = bytes(range(256)) * 2400
+TEST_STORAGE_FILE_NAME = 'test_storage_file'
+TEST_STORAGE_PASSWORD = 'test storage password'
+TEST_STORAGE_SALT = b'test storage salt'
+TEST_STORAGE_SEEK_OFFSET = 300000
+TEST_STORAGE_SEEK_SIZE = 1000
+TEST_STORAGE_TEXT_CONTENT = 'Ñandú ☃ 𝄞 ' * 1000
+TEST_STORAGE_TEXT_READ_SIZE = 7
+TEST_STORAGE_UPGRADE_TEMPORARY_NAME_SUFFIX = '0' * 32
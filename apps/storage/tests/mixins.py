@@ -0,0 +1,160 @@
+import shutil
+from tempfile import mkdtemp
+from unittest import mock
+
+from django.core.files.base import ContentFile
+
+from ..literals import STORAGE_UPGRADE_TEMPORARY_NAME
+
+from .literals import (
+    TEST_STORAGE_FILE_CONTENT, TEST_STORAGE_FILE_NAME,
+    TEST_STORAGE_SEEK_OFFSET, TEST_STORAGE_SEEK_SIZE,
+    TEST_STORAGE_TEXT_CONTENT, TEST_STORAGE_TEXT_READ_SIZE,
+    TEST_STORAGE_UPGRADE_TEMPORARY_NAME_SUFFIX
+)
+
+
+class PassthroughStorageTestMixin:
+    """
+    Tests shared by the passthrough storages that upgrade the files of a
+    previous format. Subclasses define `_create_test_storage`, which
+    returns the storage to test, `_create_test_legacy_file`, which stores
+    `TEST_STORAGE_FILE_CONTENT` using the previous format, and the file
+    classes returned when opening the files of the current and previous
+    formats.
+    """
+    storage_container_class = None
+    storage_legacy_file_class = None
+
+    def setUp(self):
+        super().setUp()
+        self.test_storage_path = mkdtemp()
+        self.addCleanup(shutil.rmtree, self.test_storage_path)
+
+        self.test_storage = self._create_test_storage()
+
+    def _create_test_legacy_file(self):
+        raise NotImplementedError
+
+    def _create_test_storage(self):
+        raise NotImplementedError
+
+    def _read_test_file(self, _direct=False):
+        with self.test_storage.open(
+            name=TEST_STORAGE_FILE_NAME, mode='rb', _direct=_direct
+        ) as file_object:
+            return file_object.read()
+
+    def _save_test_file(self):
+        self.test_storage.save(
+            content=ContentFile(content=TEST_STORAGE_FILE_CONTENT),
+            name=TEST_STORAGE_FILE_NAME
+        )
+
+    def test_legacy_read(self):
+        self._create_test_legacy_file()
+
+        with self.test_storage.open(name=TEST_STORAGE_FILE_NAME) as file_object:
+            self.assertTrue(
+                isinstance(file_object, self.storage_legacy_file_class)
+            )
+            self.assertEqual(file_object.read(), TEST_STORAGE_FILE_CONTENT)
+
+    def test_legacy_upgrade(self):
+        self._create_test_legacy_file()
+
+        self.assertTrue(
+            self.test_storage.upgrade(name=TEST_STORAGE_FILE_NAME)
+        )
+
+        with self.test_storage.open(name=TEST_STORAGE_FILE_NAME) as file_object:
+            self.assertTrue(
+                isinstance(file_object, self.storage_container_class)
+            )
+            self.assertEqual(file_object.read(), TEST_STORAGE_FILE_CONTENT)
+
+        self.assertEqual(
+            self.test_storage.listdir(path=''),
+            ([], [TEST_STORAGE_FILE_NAME])
+        )
+        self.assertFalse(
+            self.test_storage.upgrade(name=TEST_STORAGE_FILE_NAME)
+        )
+
+    def test_legacy_upgrade_verify_error(self):
+        self._create_test_legacy_file()
+        test_file_content = self._read_test_file(_direct=True)
+
+        with mock.patch.object(
+            attribute='_upgrade_verify', side_effect=ValueError,
+            target=self.test_storage.__class__
+        ):
+            with self.assertRaises(expected_exception=ValueError):
+                self.test_storage.upgrade(name=TEST_STORAGE_FILE_NAME)
+
+        self.assertEqual(
+            self._read_test_file(_direct=True), test_file_content
+        )
+        self.assertEqual(
+            self.test_storage.listdir(path=''),
+            ([], [TEST_STORAGE_FILE_NAME])
+        )
+
+    def test_legacy_upgrade_all_temporary_file(self):
+        self._create_test_legacy_file()
+        self.test_storage.save(
+            content=ContentFile(content=TEST_STORAGE_FILE_CONTENT),
+            name=STORAGE_UPGRADE_TEMPORARY_NAME.format(
+                TEST_STORAGE_FILE_NAME,
+                TEST_STORAGE_UPGRADE_TEMPORARY_NAME_SUFFIX
+            )
+        )
+
+        self.assertEqual(self.test_storage.upgrade_all(), 1)
+
+        self.assertEqual(
+            self.test_storage.listdir(path=''),
+            ([], [TEST_STORAGE_FILE_NAME])
+        )
+        self.assertEqual(self._read_test_file(), TEST_STORAGE_FILE_CONTENT)
+
+    def test_read_text_mode(self):
+        self.test_storage.save(
+            content=ContentFile(content=TEST_STORAGE_TEXT_CONTENT),
+            name=TEST_STORAGE_FILE_NAME
+        )
+
+        result = []
+
+        with self.test_storage.open(
+            name=TEST_STORAGE_FILE_NAME, mode='r'
+        ) as file_object:
+            while True:
+                data = file_object.read(TEST_STORAGE_TEXT_READ_SIZE)
+                if not data:
+                    break
+
+                result.append(data)
+
+        self.assertEqual(''.join(result), TEST_STORAGE_TEXT_CONTENT)
+
+    def test_roundtrip(self):
+        self._save_test_file()
+
+        self.assertNotEqual(
+            self._read_test_file(_direct=True), TEST_STORAGE_FILE_CONTENT
+        )
+        self.assertEqual(self._read_test_file(), TEST_STORAGE_FILE_CONTENT)
+
+    def test_seek(self):
+        self._save_test_file()
+
+        with self.test_storage.open(name=TEST_STORAGE_FILE_NAME) as file_object:
+            file_object.seek(TEST_STORAGE_SEEK_OFFSET)
+
+            self.assertEqual(
+                file_object.read(TEST_STORAGE_SEEK_SIZE),
+                TEST_STORAGE_FILE_CONTENT[
+                    TEST_STORAGE_SEEK_OFFSET:TEST_STORAGE_SEEK_OFFSET + TEST_STORAGE_SEEK_SIZE
+                ]
+            )
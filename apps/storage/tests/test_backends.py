@@ -0,0 +1,118 @@
+from unittest import mock
+
+from Crypto.Cipher import AES
+from Crypto.Random import get_random_bytes
+from Crypto.Util.Padding import pad
+
+from django.core.files.base import ContentFile
+from django.test import SimpleTestCase
+
+from ..backends.compressedstorage import (
+    BufferedZipFile, ChunkedCompressedPassthroughStorage,
+    CompressedContainerFile, ZipCompressedPassthroughStorage
+)
+from ..backends.encryptedstorage import (
+    EncryptedContainerFile, EncryptedLegacyFile,
+    EncryptedPassthroughStorage, get_key
+)
+from ..backends.literals import ENCRYPTION_FILE_CHUNK_SIZE
+
+from .literals import (
+    TEST_STORAGE_CODEC_NAME, TEST_STORAGE_FILE_CONTENT,
+    TEST_STORAGE_FILE_NAME, TEST_STORAGE_PASSWORD, TEST_STORAGE_SALT
+)
+from .mixins import PassthroughStorageTestMixin
+
+
+class ChunkedCompressedPassthroughStorageTestCase(
+    PassthroughStorageTestMixin, SimpleTestCase
+):
+    storage_container_class = CompressedContainerFile
+    storage_legacy_file_class = BufferedZipFile
+
+    def _create_test_legacy_file(self):
+        test_storage_legacy = ZipCompressedPassthroughStorage(
+            next_storage_backend_arguments={
+                'location': self.test_storage_path
+            }
+        )
+        test_storage_legacy.save(
+            content=ContentFile(content=TEST_STORAGE_FILE_CONTENT),
+            name=TEST_STORAGE_FILE_NAME
+        )
+
+    def _create_test_storage(self):
+        return ChunkedCompressedPassthroughStorage(
+            codec=TEST_STORAGE_CODEC_NAME, next_storage_backend_arguments={
+                'location': self.test_storage_path
+            }
+        )
+
+    def test_compression(self):
+        self._save_test_file()
+
+        self.assertTrue(
+            len(self._read_test_file(_direct=True)) < len(TEST_STORAGE_FILE_CONTENT)
+        )
+
+
+class EncryptedPassthroughStorageTestCase(
+    PassthroughStorageTestMixin, SimpleTestCase
+):
+    storage_container_class = EncryptedContainerFile
+    storage_legacy_file_class = EncryptedLegacyFile
+
+    def _create_test_legacy_file(self):
+        initial_vector = get_random_bytes(AES.block_size)
+        cipher = AES.new(
+            iv=initial_vector, key=self.test_storage.key, mode=AES.MODE_CBC
+        )
+
+        data = initial_vector
+        for offset in range(0, len(TEST_STORAGE_FILE_CONTENT), ENCRYPTION_FILE_CHUNK_SIZE):
+            data += cipher.encrypt(
+                plaintext=pad(
+                    block_size=AES.block_size,
+                    data_to_pad=TEST_STORAGE_FILE_CONTENT[
+                        offset:offset + ENCRYPTION_FILE_CHUNK_SIZE
+                    ]
+                )
+            )
+
+        self.test_storage.save(
+            content=ContentFile(content=data), name=TEST_STORAGE_FILE_NAME,
+            _direct=True
+        )
+
+    def _create_test_storage(self):
+        return EncryptedPassthroughStorage(
+            next_storage_backend_arguments={
+                'location': self.test_storage_path
+            }, password=TEST_STORAGE_PASSWORD
+        )
+
+
+class EncryptionKeyTestCase(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        get_key.cache_clear()
+        self.addCleanup(get_key.cache_clear)
+
+    def test_get_key_cached(self):
+        with mock.patch(
+            autospec=True,
+            target='mayan.apps.storage.backends.encryptedstorage.PBKDF2'
+        ) as mock_pbkdf2:
+            key = get_key(password=TEST_STORAGE_PASSWORD, salt=TEST_STORAGE_SALT)
+
+            self.assertTrue(
+                get_key(password=TEST_STORAGE_PASSWORD, salt=TEST_STORAGE_SALT) is key
+            )
+            self.assertEqual(mock_pbkdf2.call_count, 1)
+
+            get_key(
+                password=TEST_STORAGE_PASSWORD,
+                salt=TEST_STORAGE_SALT + TEST_STORAGE_SALT
+            )
+
+            self.assertEqual(mock_pbkdf2.call_count, 2)
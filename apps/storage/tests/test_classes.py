@@ -0,0 +1,62 @@
+import shutil
+from tempfile import mkdtemp
+
+from django.test import SimpleTestCase
+
+from ..classes import DefinedStorage
+from ..settings import setting_shared_storage
+
+from .literals import (
+    TEST_DEFINED_STORAGE_DOTTED_PATH, TEST_DEFINED_STORAGE_LABEL,
+    TEST_DEFINED_STORAGE_NAME
+)
+
+
+class DefinedStorageInstanceCacheTestCase(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.test_storage_path = mkdtemp()
+        self.addCleanup(shutil.rmtree, self.test_storage_path)
+
+        self.test_defined_storage = DefinedStorage(
+            dotted_path=TEST_DEFINED_STORAGE_DOTTED_PATH,
+            kwargs={'location': self.test_storage_path},
+            label=TEST_DEFINED_STORAGE_LABEL, name=TEST_DEFINED_STORAGE_NAME
+        )
+        self.addCleanup(
+            DefinedStorage._registry.pop, TEST_DEFINED_STORAGE_NAME
+        )
+
+        self.test_storage_instance = self.test_defined_storage.get_storage_instance()
+
+    def test_cached(self):
+        self.assertTrue(
+            self.test_defined_storage.get_storage_instance() is self.test_storage_instance
+        )
+
+    def test_generation_increment(self):
+        DefinedStorage.invalidate_storage_instance_cache()
+
+        self.assertFalse(
+            self.test_defined_storage.get_storage_instance() is self.test_storage_instance
+        )
+
+    def test_kwargs_change(self):
+        test_storage_path_other = mkdtemp()
+        self.addCleanup(shutil.rmtree, test_storage_path_other)
+
+        self.test_defined_storage.kwargs = {
+            'location': test_storage_path_other
+        }
+
+        storage_instance = self.test_defined_storage.get_storage_instance()
+
+        self.assertFalse(storage_instance is self.test_storage_instance)
+        self.assertEqual(storage_instance.location, test_storage_path_other)
+
+    def test_setting_post_edit_function(self):
+        setting_shared_storage.do_post_edit_function_call()
+
+        self.assertFalse(
+            self.test_defined_storage.get_storage_instance() is self.test_storage_instance
+        )
@@ -1,10 +1,14 @@
+import re
+
 from django.core.exceptions import ImproperlyConfigured
-from django.http.response import FileResponse
+from django.http.response import FileResponse, HttpResponse
+from django.utils.cache import get_conditional_response
 from django.utils.decorators import classonlymethod
 
 from mayan.apps.mime_types.classes import MIMETypeBackend
 
 from ..download_backends.base import DownloadBackend
+from ..literals import DOWNLOAD_RANGE_CHUNK_SIZE, DOWNLOAD_RANGE_REGEX
 
 
 class ViewMixinBackendDownload:
@@ -69,9 +73,50 @@ class ViewMixinBackendDownload:
 class ViewMixinDownload:
     as_attachment = True
 
+    @staticmethod
+    def get_range_iterator(file_object, start, end):
+        if file_object.seekable():
+            file_object.seek(start)
+        else:
+            # Stream wrappers like the encrypted and compressed files
+            # can only be read sequentially.
+            remaining = start
+            while remaining:
+                chunk = file_object.read(
+                    min(remaining, DOWNLOAD_RANGE_CHUNK_SIZE)
+                )
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+
+        remaining = end - start + 1
+        while remaining:
+            chunk = file_object.read(
+                min(remaining, DOWNLOAD_RANGE_CHUNK_SIZE)
+            )
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
     def get_as_attachment(self):
         return self.as_attachment
 
+    def get_download_etag(self):
+        """
+        Return a quoted, strong entity tag for the content of the file.
+        Returning `None` disables the conditional and the range requests
+        support.
+        """
+        return None
+
+    def get_download_file_size(self):
+        """
+        Return the size of the file in bytes. Required to serve range
+        requests.
+        """
+        return None
+
     def get_download_file_object(self):
         raise ImproperlyConfigured(
             'View `{}` must provide a `get_download_file_object` method '
@@ -90,7 +135,65 @@ class ViewMixinDownload:
 
         return (mime_type, encoding)
 
+    def get_download_range(self, etag, size):
+        """
+        Parse the HTTP Range header. Return a (start, end) tuple for a
+        single satisfiable range, `False` for an unsatisfiable range or
+        `None` to serve the entire file. Multiple ranges are not supported
+        and cause the entire file to be served.
+        """
+        http_range = self.request.META.get('HTTP_RANGE')
+
+        if not http_range or not etag or size is None:
+            return None
+
+        if_range = self.request.META.get('HTTP_IF_RANGE')
+        if if_range and if_range != etag:
+            return None
+
+        match = re.match(pattern=DOWNLOAD_RANGE_REGEX, string=http_range)
+        if not match:
+            return None
+
+        start, end = match.groups()
+
+        if not start and not end:
+            return None
+        elif not start:
+            # Suffix range, the last N bytes.
+            start = max(size - int(end), 0)
+            end = size - 1
+        else:
+            start = int(start)
+            if end:
+                end = min(int(end), size - 1)
+            else:
+                end = size - 1
+
+        if start >= size or start > end:
+            return False
+
+        return (start, end)
+
     def render_to_response(self):
+        etag = self.get_download_etag()
+
+        if etag:
+            response = get_conditional_response(
+                request=self.request, etag=etag
+            )
+            if response is not None:
+                response.headers['ETag'] = etag
+                return response
+
+        size = self.get_download_file_size()
+        download_range = self.get_download_range(etag=etag, size=size)
+
+        if download_range is False:
+            response = HttpResponse(status=416)
+            response.headers['Content-Range'] = 'bytes */{}'.format(size)
+            return response
+
         response = FileResponse(
             as_attachment=self.get_as_attachment(),
             filename=self.get_download_filename(),
@@ -114,6 +217,30 @@ class ViewMixinDownload:
         else:
             response.headers['Content-Type'] = 'application/octet-stream'
 
+        if etag:
+            response.headers['ETag'] = etag
+
+            if response.file_to_stream and size is not None:
+                response.headers['Accept-Ranges'] = 'bytes'
+
+                if download_range:
+                    start, end = download_range
+
+                    # Rewind in case the MIME type detection moved the
+                    # file pointer.
+                    file_object = response.file_to_stream
+                    if file_object.seekable():
+                        file_object.seek(0)
+
+                    response.streaming_content = self.get_range_iterator(
+                        end=end, file_object=file_object, start=start
+                    )
+                    response.status_code = 206
+                    response.headers['Content-Length'] = end - start + 1
+                    response.headers['Content-Range'] = 'bytes {}-{}/{}'.format(
+                        start, end, size
+                    )
+
         return response
 
 
@@ -133,13 +260,17 @@ class ViewMixinDownloadEvent:
         return self.download_event_type
 
     def render_to_response(self):
+        response = super().render_to_response()
+
         event_type = self.get_download_event_type()
 
-        if event_type:
+        # Not modified and partial responses are continuations of a
+        # download already recorded.
+        if event_type and response.status_code == 200:
             event_type.commit(
                 action_object=self.get_download_event_action_object(),
                 actor=self.get_download_event_actor(),
                 target=self.get_download_event_target()
             )
 
-        return super().render_to_response()
+        return response